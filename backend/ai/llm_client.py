@@ -0,0 +1,304 @@
+"""
+Shared OpenAI client and per-stage LLM call metrics.
+
+Pipelines used to build ``OpenAI(api_key=...)`` for every chat completion: a fresh
+connection pool, and a fresh TLS handshake, per call. :func:`get_openai_client` returns one
+client per process (rebuilt when ``OPENAI_API_KEY`` changes). Its httpx pool holds up to
+``OPENAI_MAX_CONNECTIONS`` keep-alive connections and is safe to share across threads.
+
+:func:`chat_completion` wraps ``client.chat.completions.create``. Inside a
+:func:`collect_llm_metrics` block it records each call's latency and token usage under a
+stage name (``classify``, ``universal``, ...). The collector is carried by a context
+variable, so calls made on worker threads count as long as they run in a copied context
+(see :func:`submit_in_context`).
+
+Call sites that pass a ``prompt_version`` are answered from the durable
+``services.llm_response_store`` cache when the same request was made before; hits are
+recorded as ``cache_hits`` / ``saved_tokens`` on the stage. A fresh answer is only stored
+once the call site has parsed it and calls :meth:`ChatCompletion.remember`, and only when
+the model finished normally (``finish_reason == "stop"``): truncated or unparseable replies
+must not be replayed to every retry.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import re
+import threading
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from services.llm_response_store import StoredLlmResponse
+
+T = TypeVar("T")
+
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+
+_client: Any = None
+_client_key: str | None = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> Any | None:
+    """Process-wide OpenAI client, or None when the SDK or ``OPENAI_API_KEY`` is missing."""
+    global _client, _client_key
+    try:
+        from config import settings
+        from openai import OpenAI
+    except ImportError:
+        return None
+
+    api_key = getattr(settings, "openai_api_key", None)
+    if not api_key:
+        return None
+
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            _client = OpenAI(api_key=api_key, http_client=_pooled_http_client())
+            _client_key = api_key
+        return _client
+
+
+def _pooled_http_client() -> Any | None:
+    """httpx client with the SDK's defaults (timeouts, redirects) and our pool size."""
+    try:
+        import httpx
+        from openai import DefaultHttpxClient
+    except ImportError:
+        return None
+
+    from config import settings
+
+    connections = max(1, int(settings.openai_max_connections))
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+        )
+    )
+
+
+def reset_openai_client() -> None:
+    global _client, _client_key
+    with _client_lock:
+        _client = None
+        _client_key = None
+
+
+class LlmMetrics:
+    """Latency and token totals per pipeline stage (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, float | int]] = {}
+
+    def record(
+        self,
+        stage: str,
+        *,
+        latency_ms: float,
+        usage: Any = None,
+        saved_tokens: int | None = None,
+    ) -> None:
+        """One call; ``saved_tokens`` set means it was answered from the response cache."""
+        with self._lock:
+            entry = self._stages.setdefault(
+                stage,
+                {
+                    "calls": 0,
+                    "latency_ms": 0.0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                    "cache_hits": 0,
+                    "saved_tokens": 0,
+                },
+            )
+            entry["calls"] = int(entry["calls"]) + 1
+            entry["latency_ms"] = round(float(entry["latency_ms"]) + latency_ms, 1)
+            if saved_tokens is not None:
+                entry["cache_hits"] = int(entry["cache_hits"]) + 1
+                entry["saved_tokens"] = int(entry["saved_tokens"]) + saved_tokens
+                return
+            for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+                entry[key] = int(entry[key]) + int(getattr(usage, key, 0) or 0)
+
+    def to_json(self) -> dict[str, dict[str, float | int]]:
+        with self._lock:
+            return {stage: dict(entry) for stage, entry in self._stages.items()}
+
+
+_active_metrics: contextvars.ContextVar[LlmMetrics | None] = contextvars.ContextVar(
+    "llm_metrics", default=None
+)
+
+
+@contextlib.contextmanager
+def collect_llm_metrics() -> Iterator[LlmMetrics]:
+    """Record :func:`chat_completion` calls made in this context into a new collector."""
+    metrics = LlmMetrics()
+    token = _active_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _active_metrics.reset(token)
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., T], *args: Any) -> Future[T]:
+    """``executor.submit`` that runs ``fn`` in a copy of the caller's context (metrics, ...)."""
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args)
+
+
+def json_object_from_reply(content: str | None) -> dict[str, Any] | None:
+    """The JSON object in a model reply (bare or in a fenced block); None when there is none."""
+    trimmed = (content or "").strip()
+    if not trimmed:
+        return None
+
+    candidates = [trimmed]
+    block_match = _JSON_BLOCK_RE.search(trimmed)
+    if block_match:
+        candidates.insert(0, block_match.group(1))
+
+    for candidate in candidates:
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+@dataclass(frozen=True)
+class _CachedMessage:
+    content: str
+
+
+@dataclass(frozen=True)
+class _CachedChoice:
+    message: _CachedMessage
+    finish_reason: str = "stop"
+
+
+@dataclass(frozen=True)
+class _PendingCacheWrite:
+    cache_key: str
+    model: str
+    stage: str
+    prompt_version: int
+
+
+class ChatCompletion:
+    """
+    :func:`chat_completion` result, shaped like the SDK response (``choices``, ``usage``).
+
+    ``cached`` is True when the answer came from the response cache. Call :meth:`remember`
+    once the content has been parsed and validated to store a fresh answer.
+    """
+
+    def __init__(
+        self,
+        choices: list[Any],
+        usage: Any,
+        *,
+        cached: bool = False,
+        pending: _PendingCacheWrite | None = None,
+    ) -> None:
+        self.choices = choices
+        self.usage = usage
+        self.cached = cached
+        self._pending = pending
+
+    @classmethod
+    def from_stored(cls, stored: StoredLlmResponse) -> ChatCompletion:
+        return cls([_CachedChoice(_CachedMessage(stored.text))], stored, cached=True)
+
+    def remember(self) -> None:
+        """Store this answer in the durable cache (no-op for hits, uncacheable replies)."""
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        from services.llm_response_store import save_llm_response
+
+        save_llm_response(
+            pending.cache_key,
+            model=pending.model,
+            stage=pending.stage,
+            prompt_version=pending.prompt_version,
+            text=self.choices[0].message.content or "",
+            usage=self.usage,
+        )
+
+
+def chat_completion(
+    *,
+    stage: str,
+    prompt_version: int | None = None,
+    **create_kwargs: Any,
+) -> ChatCompletion:
+    """
+    ``chat.completions.create`` on the shared client, recorded under ``stage``.
+
+    With a ``prompt_version`` (bump it whenever the call site's prompt template changes)
+    identical requests are served from the durable response cache; the caller stores a
+    fresh answer with :meth:`ChatCompletion.remember` after parsing it. Raises
+    ``RuntimeError`` when no client is configured; API errors propagate so each caller
+    keeps its own fallback, and are never cached.
+    """
+    client = get_openai_client()
+    if client is None:
+        raise RuntimeError("OpenAI client is not configured (OPENAI_API_KEY)")
+
+    metrics = _active_metrics.get()
+    started = time.perf_counter()
+
+    cache_key: str | None = None
+    if prompt_version is not None:
+        from services.llm_response_store import (
+            llm_cache_key,
+            llm_response_cache_enabled,
+            load_llm_response,
+        )
+
+        if llm_response_cache_enabled():
+            cache_key = llm_cache_key(
+                stage=stage, prompt_version=prompt_version, request=create_kwargs
+            )
+            stored = load_llm_response(cache_key)
+            if stored is not None:
+                if metrics is not None:
+                    metrics.record(
+                        stage,
+                        latency_ms=(time.perf_counter() - started) * 1000.0,
+                        saved_tokens=stored.total_tokens,
+                    )
+                return ChatCompletion.from_stored(stored)
+
+    response = client.chat.completions.create(**create_kwargs)
+    usage = getattr(response, "usage", None)
+    if metrics is not None:
+        metrics.record(
+            stage,
+            latency_ms=(time.perf_counter() - started) * 1000.0,
+            usage=usage,
+        )
+    pending: _PendingCacheWrite | None = None
+    if (
+        cache_key is not None
+        and prompt_version is not None
+        and getattr(response.choices[0], "finish_reason", None) == "stop"
+    ):
+        pending = _PendingCacheWrite(
+            cache_key=cache_key,
+            model=str(create_kwargs.get("model", "")),
+            stage=stage,
+            prompt_version=prompt_version,
+        )
+    return ChatCompletion(response.choices, usage, pending=pending)
@@ -0,0 +1,178 @@
+"""
+Cache of prepared candidate tile pages (see ``candidate_tile_selector``).
+
+Every ``inspection_match`` job loads the candidate tiles of the master drawing and each
+auxiliary drawing: all text elements and regions on the page, search text rebuilt with
+legend expansions, bboxes parsed, overlaps deduplicated. A batch of inspections against
+the same master repeats that identical full-page load per job. Tile pages are keyed by
+drawing, page and ``drawings.index_version`` (see ``services.drawing_index_version``), so
+reindexing or editing a region makes the next lookup miss everywhere.
+
+Two tiers, like ``extracted_document_cache``:
+
+- In-memory LRU (``CANDIDATE_TILE_CACHE_SIZE`` pages, per process).
+- Optional on-disk JSON tier (``CANDIDATE_TILE_CACHE_DIR``) shared by worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+from config import settings
+
+if TYPE_CHECKING:
+    from ai.pipelines.candidate_tile_selector import CandidateTile
+
+logger = logging.getLogger(__name__)
+
+_DISK_FORMAT_VERSION = 1
+
+
+def candidate_tile_cache_key(drawing_id: int, page: int, index_version: int) -> str:
+    return f"{drawing_id}-{page}-v{index_version}"
+
+
+def tiles_to_json(tiles: Sequence[CandidateTile]) -> dict[str, Any]:
+    return {
+        "version": _DISK_FORMAT_VERSION,
+        "tiles": [
+            [
+                tile.drawing_id,
+                tile.page,
+                tile.text,
+                tile.confidence,
+                list(tile.bbox_normalized) if tile.bbox_normalized is not None else None,
+                tile.region_id,
+                tile.text_element_id,
+            ]
+            for tile in tiles
+        ],
+    }
+
+
+def tiles_from_json(payload: dict[str, Any]) -> tuple[CandidateTile, ...]:
+    from ai.pipelines.candidate_tile_selector import CandidateTile
+
+    if payload.get("version") != _DISK_FORMAT_VERSION:
+        raise ValueError("unsupported candidate tile cache format")
+    return tuple(
+        CandidateTile(
+            drawing_id=str(drawing_id),
+            page=int(page),
+            text=str(text),
+            confidence=float(confidence),
+            bbox_normalized=(
+                (float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3]))
+                if bbox is not None
+                else None
+            ),
+            region_id=int(region_id) if region_id is not None else None,
+            text_element_id=int(text_element_id) if text_element_id is not None else None,
+        )
+        for drawing_id, page, text, confidence, bbox, region_id, text_element_id in payload["tiles"]
+    )
+
+
+class CandidateTileCache:
+    """Thread-safe LRU of candidate tile pages with an optional on-disk tier."""
+
+    def __init__(self, max_entries: int, disk_dir: str | Path | None = None) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, tuple[CandidateTile, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.disk_dir is not None
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.json"
+
+    def _remember(self, key: str, tiles: tuple[CandidateTile, ...]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = tiles
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> tuple[CandidateTile, ...] | None:
+        with self._lock:
+            tiles = self._entries.get(key)
+            if tiles is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return tiles
+
+        disk_path = self._disk_path(key)
+        if disk_path is not None and disk_path.exists():
+            try:
+                tiles = tiles_from_json(json.loads(disk_path.read_text("utf-8")))
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning("candidate_tile_cache_read_failed", exc_info=True)
+            else:
+                self._remember(key, tiles)
+                with self._lock:
+                    self.hits += 1
+                return tiles
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, tiles: Sequence[CandidateTile]) -> None:
+        self._remember(key, tuple(tiles))
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file.
+            fd, tmp_name = tempfile.mkstemp(dir=disk_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(tiles_to_json(tiles), fh)
+            os.replace(tmp_name, disk_path)
+        except OSError:
+            logger.warning("candidate_tile_cache_write_failed", exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache: CandidateTileCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_candidate_tile_cache() -> CandidateTileCache:
+    """Process-wide cache built from settings on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CandidateTileCache(
+                settings.candidate_tile_cache_size,
+                settings.candidate_tile_cache_dir or None,
+            )
+        return _cache
+
+
+def reset_candidate_tile_cache() -> None:
+    """Drop the process-wide cache (re-reads settings on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -5,20 +5,34 @@ backend-only and used only for ranking.
 
 Candidate tiles are loaded from ``drawing_text_elements`` first (fine OCR/token
 match), then ``drawing_regions`` (coarse tagged clusters). Overlapping tiles are
-deduplicated with text-element matches preferred.
+deduplicated with text-element matches preferred, using a grid over the kept tiles'
+boxes (:class:`~services.box_overlap.OverlapGrid`) rather than a pairwise scan. The
+prepared page is cached per ``drawings.index_version`` (``candidate_tile_cache``), so a
+batch of inspections against one master loads it once.
+
+Matching is the hot loop of inspection matching. :class:`ClueMatcher` expands each
+location clue once (built-in synonyms + legend codes), compiles every expansion into
+one Aho-Corasick automaton, and scans each tile's text in a single pass; top-k tiles
+are picked with a heap.
 """
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from typing import Any, Sequence, cast
 
 from sqlalchemy.orm import Session
 
+from ai.pipelines.candidate_tile_cache import candidate_tile_cache_key, get_candidate_tile_cache
 from ai.pipelines.clue_expander import expand_clue_value
 from models.drawing_region import DrawingRegion
 from models.drawing_text_element import DrawingTextElement
+from services.box_overlap import OverlapGrid, bbox_from_json
+from services.drawing_index_version import drawing_index_version
+from services.legend_index import LegendIndex, get_legend_index
 from services.region_index_loader import geometry_to_bounding_box
+from services.term_automaton import TermAutomaton
 
 _BBOX_OVERLAP_THRESHOLD = 0.5
 
@@ -57,85 +71,101 @@ def _is_location_relevant(clue: Any) -> bool:
     return bool(getattr(clue, "location_relevant", False))
 
 
-def _clue_matches_row(
-    clue: Any,
-    row_text: str,
-    *,
-    session: Session | None = None,
-    project_id: int | None = None,
-) -> bool:
-    value = _clue_value(clue)
-    if value is None:
-        return False
-    for expanded in expand_clue_value(value, session=session, project_id=project_id):
-        if expanded.lower() in row_text:
-            return True
-    return False
-
-
-def _bbox_from_json(bbox_json: object) -> tuple[float, float, float, float] | None:
-    if not isinstance(bbox_json, dict):
-        return None
-    if all(key in bbox_json for key in ("x0", "y0", "x1", "y1")):
-        return (
-            float(bbox_json["x0"]),
-            float(bbox_json["y0"]),
-            float(bbox_json["x1"]),
-            float(bbox_json["y1"]),
-        )
-    if all(key in bbox_json for key in ("x", "y", "width", "height")):
-        x = float(bbox_json["x"])
-        y = float(bbox_json["y"])
-        width = float(bbox_json["width"])
-        height = float(bbox_json["height"])
-        return x, y, x + width, y + height
-    return None
-
-
-def _bbox_overlap_ratio(
-    left: tuple[float, float, float, float] | None,
-    right: tuple[float, float, float, float] | None,
-) -> float:
-    if left is None or right is None:
-        return 0.0
+class ClueMatcher:
+    """Location clues expanded once and compiled into one multi-pattern automaton."""
 
-    lx0, ly0, lx1, ly1 = left
-    rx0, ry0, rx1, ry1 = right
-    ix0 = max(lx0, rx0)
-    iy0 = max(ly0, ry0)
-    ix1 = min(lx1, rx1)
-    iy1 = min(ly1, ry1)
-    if ix1 <= ix0 or iy1 <= iy0:
-        return 0.0
+    def __init__(
+        self,
+        clues: Sequence[Any],
+        *,
+        legend_index: LegendIndex | None = None,
+    ) -> None:
+        self.clues = [
+            clue for clue in clues if _is_location_relevant(clue) and _clue_value(clue)
+        ]
+        self._confidences = [_clue_confidence(clue) for clue in self.clues]
+
+        pattern_ids: dict[str, int] = {}
+        self._pattern_clues: list[list[int]] = []
+        for clue_index, clue in enumerate(self.clues):
+            for expanded in expand_clue_value(
+                cast(str, _clue_value(clue)), legend_index=legend_index
+            ):
+                pattern = expanded.lower()
+                pattern_id = pattern_ids.get(pattern)
+                if pattern_id is None:
+                    pattern_id = len(self._pattern_clues)
+                    pattern_ids[pattern] = pattern_id
+                    self._pattern_clues.append([])
+                if clue_index not in self._pattern_clues[pattern_id]:
+                    self._pattern_clues[pattern_id].append(clue_index)
+        self._automaton = TermAutomaton(pattern_ids)
+
+    @classmethod
+    def for_session(
+        cls,
+        clues: Sequence[Any],
+        *,
+        session: Session | None,
+        project_id: int | None = None,
+    ) -> ClueMatcher:
+        has_location_clue = any(
+            _is_location_relevant(clue) and _clue_value(clue) for clue in clues
+        )
+        legend_index = (
+            get_legend_index(session, project_id)
+            if session is not None and has_location_clue
+            else None
+        )
+        return cls(clues, legend_index=legend_index)
 
-    intersection = (ix1 - ix0) * (iy1 - iy0)
-    left_area = max((lx1 - lx0) * (ly1 - ly0), 1e-9)
-    right_area = max((rx1 - rx0) * (ry1 - ry0), 1e-9)
-    return intersection / min(left_area, right_area)
+    def __bool__(self) -> bool:
+        return bool(self.clues)
 
+    def matched_clue_indexes(self, text: str) -> set[int]:
+        """Indexes into :attr:`clues` whose value or any expansion occurs in ``text``."""
+        matched: set[int] = set()
+        for pattern_id in self._automaton.find(text.lower()):
+            matched.update(self._pattern_clues[pattern_id])
+        return matched
 
-def _overlaps_existing_tile(
-    tile: CandidateTile,
-    kept: Sequence[CandidateTile],
-    *,
-    threshold: float = _BBOX_OVERLAP_THRESHOLD,
-) -> bool:
-    for existing in kept:
-        if _bbox_overlap_ratio(tile.bbox_normalized, existing.bbox_normalized) >= threshold:
-            return True
-    return False
+    def score(self, tile: CandidateTile) -> float:
+        """Tile confidence plus the strongest matching clue's confidence; 0.0 if none match."""
+        matched = self.matched_clue_indexes(tile.text)
+        if not matched:
+            return 0.0
+        return tile.confidence + max(self._confidences[index] for index in matched)
+
+
+def score_candidate_tiles(
+    tiles: Sequence[CandidateTile],
+    matcher: ClueMatcher,
+    limit: int,
+) -> list[tuple[float, CandidateTile]]:
+    """Top ``limit`` ``(score, tile)`` pairs, best first; ties keep tile order."""
+    scored = (
+        (score, tile) for tile in tiles if (score := matcher.score(tile)) > 0.0
+    )
+    return heapq.nlargest(limit, scored, key=lambda item: item[0])
 
 
 def _merge_candidate_tiles(
     text_element_tiles: Sequence[CandidateTile],
     region_tiles: Sequence[CandidateTile],
+    *,
+    threshold: float = _BBOX_OVERLAP_THRESHOLD,
 ) -> list[CandidateTile]:
-    """Prefer OCR text-element tiles; skip overlapping region tiles."""
+    """Prefer OCR text-element tiles; skip region tiles overlapping any tile already kept."""
     merged = list(text_element_tiles)
+    kept = OverlapGrid(
+        (tile.bbox_normalized for tile in merged),
+        expected=len(merged) + len(region_tiles),
+    )
     for tile in region_tiles:
-        if _overlaps_existing_tile(tile, merged):
+        if kept.overlaps(tile.bbox_normalized, threshold):
             continue
         merged.append(tile)
+        kept.add(tile.bbox_normalized)
     return merged
 
 
@@ -192,7 +222,7 @@ def _load_text_element_tiles(
                 page=page,
                 text=text,
                 confidence=_text_element_confidence(row),
-                bbox_normalized=_bbox_from_json(row.bbox_json),
+                bbox_normalized=bbox_from_json(row.bbox_json),
                 text_element_id=getattr(row, "id", None),
             )
         )
@@ -270,50 +300,63 @@ def _load_candidate_tiles(
     drawing_id: str | int,
     page: int,
 ) -> list[CandidateTile]:
+    """Deduplicated tiles for the page, served from the candidate tile cache when current."""
+    cache = get_candidate_tile_cache()
+    key: str | None = None
+    if cache.enabled:
+        version = drawing_index_version(session, int(drawing_id))
+        if version is not None:
+            key = candidate_tile_cache_key(int(drawing_id), page, version)
+            cached = cache.get(key)
+            if cached is not None:
+                return list(cached)
+
     text_element_tiles = _load_text_element_tiles(session, drawing_id, page)
     region_tiles = _load_region_tiles(session, drawing_id, page)
-    return _merge_candidate_tiles(text_element_tiles, region_tiles)
+    tiles = _merge_candidate_tiles(text_element_tiles, region_tiles)
+    if key is not None:
+        cache.put(key, tiles)
+    return tiles
 
 
-def find_candidate_tiles_from_clues(
+def load_candidate_tiles(
     session: Session,
     drawing_id: str | int,
     page: int,
-    clues: Sequence[Any],
-    limit: int = 20,
-    project_id: int | None = None,
 ) -> list[CandidateTile]:
-    location_clues = [
-        clue
-        for clue in clues
-        if _is_location_relevant(clue) and _clue_value(clue)
-    ]
+    """Prepared tiles for one drawing page, for callers scoring them against many matchers."""
+    return _load_candidate_tiles(session, drawing_id, page)
 
-    if not location_clues:
-        return []
 
+def select_candidate_tiles(
+    session: Session,
+    drawing_id: str | int,
+    page: int,
+    matcher: ClueMatcher,
+    limit: int = 20,
+) -> list[tuple[float, CandidateTile]]:
+    """Scored top ``limit`` tiles for one drawing page; reuse ``matcher`` across drawings."""
+    if not matcher:
+        return []
     tiles = _load_candidate_tiles(session, drawing_id, page)
     if not tiles:
         return []
+    return score_candidate_tiles(tiles, matcher, limit)
 
-    scored: list[tuple[float, CandidateTile]] = []
 
-    for tile in tiles:
-        row_text = tile.text.lower()
-        matched = [
-            clue
-            for clue in location_clues
-            if _clue_matches_row(clue, row_text, session=session, project_id=project_id)
-        ]
-        if not matched:
-            continue
-
-        strongest_clue_confidence = max(_clue_confidence(clue) for clue in matched)
-        internal_score = tile.confidence + strongest_clue_confidence
-        scored.append((internal_score, tile))
-
-    scored.sort(key=lambda item: -item[0])
-    return [tile for _, tile in scored[:limit]]
+def find_candidate_tiles_from_clues(
+    session: Session,
+    drawing_id: str | int,
+    page: int,
+    clues: Sequence[Any],
+    limit: int = 20,
+    project_id: int | None = None,
+) -> list[CandidateTile]:
+    matcher = ClueMatcher.for_session(clues, session=session, project_id=project_id)
+    return [
+        tile
+        for _, tile in select_candidate_tiles(session, drawing_id, page, matcher, limit)
+    ]
 
 
 def compute_tile_match_score(
@@ -324,22 +367,4 @@ def compute_tile_match_score(
     project_id: int | None = None,
 ) -> float:
     """Backend-only score used to choose matched vs needs_review."""
-    location_clues = [
-        clue
-        for clue in clues
-        if _is_location_relevant(clue) and _clue_value(clue)
-    ]
-    if not location_clues:
-        return 0.0
-
-    row_text = tile.text.lower()
-    matched = [
-        clue
-        for clue in location_clues
-        if _clue_matches_row(clue, row_text, session=session, project_id=project_id)
-    ]
-    if not matched:
-        return 0.0
-
-    strongest_clue_confidence = max(_clue_confidence(clue) for clue in matched)
-    return tile.confidence + strongest_clue_confidence
+    return ClueMatcher.for_session(clues, session=session, project_id=project_id).score(tile)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+    from services.legend_index import LegendIndex
+
 EXPANSIONS = {
     "sanitary sewerage": ["sanitary sewer", "sanitary", "sewer", "SS", "SAN", "sewer lateral"],
     "sanitary sewer": ["SS", "SAN", "sewer lateral", "cleanout", "manhole"],
@@ -25,7 +27,14 @@ def expand_clue_value(
     *,
     session: Session | None = None,
     project_id: int | None = None,
+    legend_index: LegendIndex | None = None,
 ) -> list[str]:
+    """
+    ``value`` plus built-in synonyms and legend codes / expansions.
+
+    Legend terms come from ``legend_index`` when given, else from the cached index for
+    ``project_id`` when a ``session`` is available.
+    """
     if not value:
         return []
 
@@ -36,13 +45,16 @@ def expand_clue_value(
         if key in normalized:
             expanded.extend(terms)
 
-    if session is not None:
-        from services.legend_lookup import expand_abbreviation, find_codes_for_term
+    if legend_index is None and session is not None:
+        from services.legend_index import get_legend_index
+
+        legend_index = get_legend_index(session, project_id)
 
+    if legend_index is not None:
         if len(value.split()) > 1:
-            expanded.extend(find_codes_for_term(session, value, project_id))
+            expanded.extend(legend_index.find_codes_for_term(value))
         else:
-            expansion = expand_abbreviation(session, value, project_id)
+            expansion = legend_index.expand_abbreviation(value)
             if expansion:
                 expanded.append(expansion)
 
@@ -71,13 +71,14 @@ def _append_legend_abbreviation_clues(
     session: Session,
     project_id: int | None = None,
 ) -> List[Clue]:
-    from services.legend_lookup import find_codes_for_term
+    from services.legend_index import get_legend_index
 
+    legend_index = get_legend_index(session, project_id)
     expanded_clues: List[Clue] = []
     existing_values = {clue.value.strip().lower() for clue in clues if clue.value.strip()}
 
     for clue in clues:
-        codes = find_codes_for_term(session, clue.value, project_id)
+        codes = legend_index.find_codes_for_term(clue.value)
         for code in codes:
             if code.strip().lower() in existing_values:
                 continue
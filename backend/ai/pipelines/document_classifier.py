@@ -6,17 +6,19 @@ does not run.
 
 from __future__ import annotations
 
-import json
 import logging
-import re
 from typing import Any
 
+from ai.llm_client import chat_completion, get_openai_client, json_object_from_reply
 from ai.schemas.document_extraction_schemas import DocumentClassification, DocumentType
 
 logger = logging.getLogger(__name__)
 
 CLASSIFICATION_CONFIDENCE_THRESHOLD = 0.60
 
+#: Bump when ``CLASSIFY_PROMPT`` changes so cached responses are not reused.
+CLASSIFY_PROMPT_VERSION = 1
+
 CLASSIFY_PROMPT = """
 Classify this construction document into exactly one type:
 
@@ -36,7 +38,6 @@ Respond as JSON:
 """
 
 _SUPPORTED_TYPES = {t.value for t in DocumentType}
-_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
 
 
 def normalize_classification(
@@ -49,7 +50,17 @@ def normalize_classification(
 
 
 def classify_document(document_text_or_description: str) -> DocumentClassification:
-    raw = _call_classifier_llm(document_text_or_description)
+    return classification_from_payload(_call_classifier_llm(document_text_or_description))
+
+
+def classification_from_payload(
+    raw: dict[str, Any],
+    *,
+    sanitize: bool = False,
+) -> DocumentClassification:
+    """Validate and threshold a classifier payload (``sanitize`` for raw model JSON)."""
+    if sanitize:
+        raw = _sanitize_classifier_dict(raw)
     try:
         classification = DocumentClassification(**raw)
     except Exception as exc:
@@ -65,24 +76,10 @@ def classify_document(document_text_or_description: str) -> DocumentClassificati
 
 
 def _parse_classifier_payload(content: str) -> dict[str, Any]:
-    trimmed = (content or "").strip()
-    if not trimmed:
+    parsed = json_object_from_reply(content)
+    if parsed is None:
         return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
-
-    candidates = [trimmed]
-    block_match = _JSON_BLOCK_RE.search(trimmed)
-    if block_match:
-        candidates.insert(0, block_match.group(1))
-
-    for candidate in candidates:
-        try:
-            parsed = json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
-            return _sanitize_classifier_dict(parsed)
-
-    return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
+    return _sanitize_classifier_dict(parsed)
 
 
 def _sanitize_classifier_dict(raw: dict[str, Any]) -> dict[str, Any]:
@@ -108,31 +105,34 @@ def _call_classifier_llm(content: str) -> dict[str, Any]:
     """
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
 
     preview = (content or "").strip()
     if not preview:
         return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
 
-    client = OpenAI(api_key=settings.openai_api_key)
     prompt = (
         f"{CLASSIFY_PROMPT.strip()}\n\n"
         f"Document content or description:\n{preview[:4000]}"
     )
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="classify",
+            prompt_version=CLASSIFY_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=128,
         )
         message = (resp.choices[0].message.content or "").strip()
-        return _parse_classifier_payload(message)
+        payload = _parse_classifier_payload(message)
+        if json_object_from_reply(message) is not None:
+            resp.remember()
+        return payload
     except Exception as exc:
         logger.warning("document_classifier_llm_failed", extra={"error": str(exc)})
         return {"document_type": DocumentType.UNKNOWN.value, "confidence": 0.0}
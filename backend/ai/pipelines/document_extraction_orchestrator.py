@@ -1,26 +1,97 @@
 """Document extraction orchestrator.
 
 Runs:
-classification -> universal extraction -> type-specific extraction -> clue generation -> DB persistence
+classification + universal extraction -> type-specific extraction -> clue generation -> DB persistence
+
+Classification and universal extraction do not depend on each other. ``DOCUMENT_EXTRACTION_LLM_MODE``
+picks how they reach the model:
+
+- ``sequential``: one call after the other.
+- ``concurrent`` (default): both calls in flight at once on the shared OpenAI client.
+- ``combined``: one JSON-mode request returning both (only when classification and
+  extraction read the same text; otherwise falls back to ``concurrent``).
+
+Type-specific extraction needs the classification, so it always runs afterwards. Per-stage
+latency and token usage are stored on ``DocumentExtraction.llm_metrics_json``.
 """
 
 from __future__ import annotations
 
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from ai.llm_client import (
+    chat_completion,
+    collect_llm_metrics,
+    get_openai_client,
+    submit_in_context,
+)
 from ai.pipelines.clue_extractor import build_clues, supplement_location_clues_from_content
-from ai.pipelines.document_classifier import classify_document
+from ai.pipelines.document_classifier import (
+    CLASSIFY_PROMPT,
+    classification_from_payload,
+    classify_document,
+)
 from ai.pipelines.type_specific_extractor import extract_type_specific_fields
-from ai.pipelines.universal_field_extractor import extract_universal_fields
-from ai.schemas.document_extraction_schemas import DocumentType
+from ai.pipelines.universal_field_extractor import (
+    UNIVERSAL_EXTRACTION_PROMPT,
+    extract_universal_fields,
+    universal_fields_from_payload,
+)
+from ai.schemas.document_extraction_schemas import (
+    DocumentClassification,
+    DocumentType,
+    UniversalFields,
+)
+from config import settings
 from models.document_clue import DocumentClue
 from models.document_extraction import DocumentExtraction
 from models.models import EvidenceRecord
 from services.review_queue import add_to_review_queue
 
+logger = logging.getLogger(__name__)
+
+#: Bump when ``COMBINED_PROMPT`` (or a prompt it embeds) changes.
+COMBINED_PROMPT_VERSION = 1
+
+COMBINED_PROMPT = f"""
+Answer two tasks about the same construction document.
+
+Task "classification":
+{CLASSIFY_PROMPT.strip()}
+
+Task "universal_fields":
+{UNIVERSAL_EXTRACTION_PROMPT.strip()}
+
+Respond as one JSON object:
+{{
+  "classification": {{...}},
+  "universal_fields": {{...}}
+}}
+"""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _llm_executor() -> ThreadPoolExecutor:
+    """Threads for independent LLM calls (the shared client pool bounds connections)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(settings.openai_max_connections)),
+                thread_name_prefix="document-extraction-llm",
+            )
+        return _executor
+
 
 def _model_dump(model: BaseModel | None) -> dict[str, Any] | None:
     if model is None:
@@ -28,6 +99,69 @@ def _model_dump(model: BaseModel | None) -> dict[str, Any] | None:
     return model.model_dump()
 
 
+def _call_combined_llm(content: str) -> dict[str, Any] | None:
+    """One request for classification + universal fields; None when it cannot be used."""
+    preview = (content or "").strip()
+    if not preview or get_openai_client() is None:
+        return None
+
+    prompt = (
+        f"{COMBINED_PROMPT.strip()}\n\n"
+        f"Document content or description:\n{preview[:4000]}"
+    )
+    try:
+        resp = chat_completion(
+            stage="combined",
+            prompt_version=COMBINED_PROMPT_VERSION,
+            model=settings.openai_chat_model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            max_tokens=384,
+        )
+        parsed = json.loads((resp.choices[0].message.content or "").strip())
+    except Exception as exc:
+        logger.warning("document_extraction_combined_llm_failed", extra={"error": str(exc)})
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    resp.remember()
+    return parsed
+
+
+def _classify_and_extract_universal(
+    content: str,
+    classification_content: str | None,
+    mode: str,
+) -> tuple[DocumentClassification, UniversalFields]:
+    classification_text = classification_content or content
+
+    if mode == "combined" and classification_text == content:
+        payload = _call_combined_llm(content)
+        if payload is not None:
+            classification_raw = payload.get("classification")
+            universal_raw = payload.get("universal_fields")
+            return (
+                classification_from_payload(
+                    classification_raw if isinstance(classification_raw, dict) else {},
+                    sanitize=True,
+                ),
+                universal_fields_from_payload(
+                    universal_raw if isinstance(universal_raw, dict) else {},
+                    sanitize=True,
+                ),
+            )
+        mode = "concurrent"
+
+    if mode == "sequential":
+        return classify_document(classification_text), extract_universal_fields(content)
+
+    classification_future = submit_in_context(
+        _llm_executor(), classify_document, classification_text
+    )
+    universal = extract_universal_fields(content)
+    return classification_future.result(), universal
+
+
 def run_document_extraction(
     session: Session,
     file_id: str,
@@ -41,7 +175,21 @@ def run_document_extraction(
     followed hyperlink supplements), classification uses that slice so linked
     install drawings do not override ``inspection_report`` typing.
     """
-    classification = classify_document(classification_content or content)
+    mode = settings.document_extraction_llm_mode
+    started = time.perf_counter()
+    with collect_llm_metrics() as metrics:
+        classification, universal = _classify_and_extract_universal(
+            content, classification_content, mode
+        )
+
+        type_specific = None
+        if classification.document_type != DocumentType.UNKNOWN:
+            type_specific = extract_type_specific_fields(
+                document_type=classification.document_type,
+                content=content,
+                session=session,
+                file_id=file_id,
+            )
 
     if classification.document_type == DocumentType.UNKNOWN:
         add_to_review_queue(
@@ -53,23 +201,17 @@ def run_document_extraction(
             commit=False,
         )
 
-    universal = extract_universal_fields(content)
-
-    type_specific = None
-    if classification.document_type != DocumentType.UNKNOWN:
-        type_specific = extract_type_specific_fields(
-            document_type=classification.document_type,
-            content=content,
-            session=session,
-            file_id=file_id,
-        )
-
     extraction = DocumentExtraction(
         file_id=file_id,
         document_type=classification.document_type.value,
         classification_confidence=classification.confidence,
         universal_fields_json=_model_dump(universal),
         type_specific_fields_json=_model_dump(type_specific),
+        llm_metrics_json={
+            "mode": mode,
+            "total_ms": round((time.perf_counter() - started) * 1000.0, 1),
+            "stages": metrics.to_json(),
+        },
     )
 
     session.add(extraction)
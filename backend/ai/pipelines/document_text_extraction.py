@@ -13,11 +13,16 @@ Source-format handling
 -----------------------
 - Native PDF (has a real text layer): extract words + boxes directly from
   the PDF's text layer. No OCR needed, highest position accuracy.
-- Scanned PDF (text layer empty/garbage): each page is rasterized in memory
-  via PyMuPDF and OCR'd through ``ocr_engine.ocr_pdf_page_in_memory`` — no
+- Scanned PDF (text layer empty/garbage): pages are rasterized in memory via
+  PyMuPDF and OCR'd in page order through ``ocr_engine.ocr_pdf_pages`` (one
+  open document per worker, raw pixmap samples, page-parallel process pool) — no
   temp PNG files or poppler/pdf2image.
 - Image/photo: OCR directly via ``ocr_engine.ocr_image``.
 
+OCR output is persisted per page in ``ocr_results`` (``services.ocr_result_store``),
+keyed by file checksum, OCR backend and DPI, and read back before any OCR runs. A pass
+that recognised no words is not stored, so it is retried rather than served forever.
+
 This module defines the interfaces and orchestration; OCR and PDF rasterization
 are delegated to ``ocr_engine.py`` (Tesseract, OpenAI vision, PyMuPDF render).
 """
@@ -27,9 +32,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Callable, Collection, Mapping, Sequence
 
 import fitz  # PyMuPDF
 
+#: Raster DPI for OCR of scanned PDF pages (``ocr_results.dpi``).
+SCANNED_PDF_OCR_DPI = 200
+#: ``ocr_results.dpi`` for standalone images, OCR'd at their native resolution.
+NATIVE_IMAGE_OCR_DPI = 0
+
 
 class SourceFormat(str, Enum):
     NATIVE_PDF = "native_pdf"  # PDF with an extractable text layer
@@ -206,24 +217,34 @@ def _ocr_scanned_pdf(
     file_path: str | Path,
     *,
     max_pages: int | None = None,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+    page_indexes: Collection[int] | None = None,
 ) -> ExtractedDocument:
-    """OCR PDF pages in memory (PyMuPDF render + ocr_engine)."""
-    from ai.pipelines.ocr_engine import ocr_pdf_page_in_memory
+    """OCR PDF pages in memory (PyMuPDF render + ocr_engine batch OCR).
 
-    doc = fitz.open(str(file_path))
-    try:
-        page_count = doc.page_count
-    finally:
-        doc.close()
+    ``rendered_pages`` (page index → image rendered at :data:`SCANNED_PDF_OCR_DPI`) skips
+    rasterizing those pages again. ``page_indexes`` OCRs only those pages; ``page_count``
+    then stays the document's page count.
+    """
+    from ai.pipelines.ocr_engine import ocr_pdf_pages
 
+    page_count = _pdf_page_count(file_path)
     if max_pages is not None and max_pages > 0:
         pages_to_scan = min(page_count, max_pages)
     else:
         pages_to_scan = page_count
+    if page_indexes is not None:
+        to_scan: Sequence[int] = sorted(i for i in set(page_indexes) if 0 <= i < pages_to_scan)
+    else:
+        to_scan = range(pages_to_scan)
 
     all_words: list[PositionedWord] = []
-    for page_index in range(pages_to_scan):
-        words, _, _ = ocr_pdf_page_in_memory(file_path, page_index=page_index)
+    for words, _, _ in ocr_pdf_pages(
+        file_path,
+        to_scan,
+        dpi=SCANNED_PDF_OCR_DPI,
+        rendered_pages=rendered_pages,
+    ):
         all_words.extend(words)
 
     return ExtractedDocument(
@@ -233,32 +254,164 @@ def _ocr_scanned_pdf(
     )
 
 
+def _pdf_page_count(file_path: str | Path) -> int:
+    doc = fitz.open(str(file_path))
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def _stored_ocr(
+    file_path: str | Path,
+    *,
+    dpi: int,
+    max_pages: int | None,
+    ocr: Callable[[], ExtractedDocument],
+) -> ExtractedDocument:
+    """Serve ``ocr()`` from the durable ``ocr_results`` store, recording non-empty passes."""
+    from ai.pipelines.extracted_document_cache import file_content_hash
+    from config import settings
+    from services.ocr_result_store import (
+        load_stored_ocr_document,
+        ocr_result_store_enabled,
+        save_ocr_document,
+    )
+
+    checksum = file_content_hash(file_path) if ocr_result_store_enabled() else None
+    if checksum is None:
+        return ocr()
+
+    backend = str(settings.ocr_backend)
+    stored = load_stored_ocr_document(
+        checksum, ocr_backend=backend, dpi=dpi, max_pages=max_pages
+    )
+    if stored is not None:
+        return stored
+
+    document = ocr()
+    if not document.words:
+        # Nothing recognised (OCR backend missing or failing): keep it out of the
+        # durable store so the next run tries again.
+        return document
+    total_pages = (
+        _pdf_page_count(file_path)
+        if document.source_format == SourceFormat.SCANNED_PDF
+        else document.page_count
+    )
+    save_ocr_document(
+        checksum, document, ocr_backend=backend, dpi=dpi, total_page_count=total_pages
+    )
+    return document
+
+
+def _ocr_image_document(file_path: str | Path) -> ExtractedDocument:
+    def _ocr() -> ExtractedDocument:
+        words, _, _ = _ocr_image(file_path, page_index=0)
+        return ExtractedDocument(source_format=SourceFormat.IMAGE, page_count=1, words=words)
+
+    return _stored_ocr(file_path, dpi=NATIVE_IMAGE_OCR_DPI, max_pages=None, ocr=_ocr)
+
+
 # ---------------------------------------------------------------------------
 # Public orchestration
 # ---------------------------------------------------------------------------
 
-def extract_document(file_path: str | Path) -> ExtractedDocument:
+def _cached_extraction(
+    file_path: str | Path,
+    variant: str,
+    extract: Callable[[], ExtractedDocument],
+) -> ExtractedDocument:
+    """Serve ``extract()`` through the content-hash cache (see extracted_document_cache)."""
+    from ai.pipelines.extracted_document_cache import (
+        extracted_document_cache_key,
+        get_extracted_document_cache,
+    )
+
+    cache = get_extracted_document_cache()
+    key = extracted_document_cache_key(file_path, variant) if cache.enabled else None
+    if key is None:
+        return extract()
+    document = cache.get(key)
+    if document is None:
+        document = extract()
+        cache.put(key, document)
+    return document
+
+
+def extract_document(
+    file_path: str | Path,
+    *,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+) -> ExtractedDocument:
     """Main entry point: take any supported evidence file and return its
     normalized, positioned text — the single function inspection_mapping.py
     calls regardless of what kind of file came in.
+
+    Results are cached by file content hash, so repeat calls for the same
+    bytes (within a match job or across jobs) skip the PDF parse / OCR pass.
+    ``rendered_pages`` lets scanned PDFs reuse page images already rendered at
+    the OCR DPI; the output is the same, so it shares the cache entry.
     """
+    return _cached_extraction(
+        file_path,
+        "auto",
+        lambda: _extract_document_uncached(file_path, rendered_pages=rendered_pages),
+    )
+
+
+def _extract_document_uncached(
+    file_path: str | Path,
+    *,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+) -> ExtractedDocument:
     fmt = detect_source_format(file_path)
 
     if fmt == SourceFormat.NATIVE_PDF:
         return _pdf_text_layer(file_path)
 
     if fmt == SourceFormat.IMAGE:
-        words, page_w, page_h = _ocr_image(file_path, page_index=0)
-        return ExtractedDocument(
-            source_format=fmt, page_count=1, words=words
-        )
+        return _ocr_image_document(file_path)
 
     if fmt == SourceFormat.SCANNED_PDF:
-        return _ocr_scanned_pdf(file_path)
+        return _stored_ocr(
+            file_path,
+            dpi=SCANNED_PDF_OCR_DPI,
+            max_pages=None,
+            ocr=lambda: _ocr_scanned_pdf(file_path, rendered_pages=rendered_pages or None),
+        )
 
     raise AssertionError(f"unhandled format: {fmt}")  # exhaustiveness guard
 
 
+def extract_document_pages(
+    file_path: str | Path,
+    page_indexes: Collection[int],
+    *,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+) -> ExtractedDocument:
+    """:func:`extract_document` restricted to ``page_indexes`` (0-based).
+
+    Scanned PDFs OCR only those pages (bypassing the whole-document caches, whose entries
+    cover every page); text-layer PDFs and images are extracted as usual and filtered.
+    ``page_count`` is the document's page count.
+    """
+    wanted = set(page_indexes)
+    if detect_source_format(file_path) == SourceFormat.SCANNED_PDF:
+        return _ocr_scanned_pdf(
+            file_path,
+            rendered_pages=rendered_pages,
+            page_indexes=wanted,
+        )
+
+    document = extract_document(file_path, rendered_pages=rendered_pages)
+    return ExtractedDocument(
+        source_format=document.source_format,
+        page_count=document.page_count,
+        words=[word for word in document.words if word.page_index in wanted],
+    )
+
+
 def extract_document_via_ocr(
     file_path: str | Path,
     *,
@@ -267,8 +420,16 @@ def extract_document_via_ocr(
     """Force OCR for PDFs and images — for link-fetched files with unreliable text layers."""
     suffix = Path(file_path).suffix.lower()
     if suffix == ".pdf":
-        return _ocr_scanned_pdf(file_path, max_pages=max_pages)
+        return _cached_extraction(
+            file_path,
+            f"ocr-{max_pages or 0}",
+            lambda: _stored_ocr(
+                file_path,
+                dpi=SCANNED_PDF_OCR_DPI,
+                max_pages=max_pages,
+                ocr=lambda: _ocr_scanned_pdf(file_path, max_pages=max_pages),
+            ),
+        )
     if suffix in {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".webp"}:
-        words, _, _ = _ocr_image(file_path, page_index=0)
-        return ExtractedDocument(source_format=SourceFormat.IMAGE, page_count=1, words=words)
+        return _cached_extraction(file_path, "ocr-0", lambda: _ocr_image_document(file_path))
     raise ValueError(f"OCR extraction unsupported for file type: {suffix!r}")
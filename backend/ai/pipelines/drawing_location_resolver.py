@@ -45,6 +45,7 @@ from enum import Enum
 from ai.pipelines.coordinate_frame import rotate_bbox
 from ai.pipelines.document_text_extraction import BoundingBox
 from ai.pipelines.positioned_term_extractor import PositionedTerm
+from services.box_overlap import OverlapGrid
 from services.inspection_vocabulary import VocabCategory
 
 
@@ -195,11 +196,12 @@ def _resolve_via_alignment(
     master_drawing_id: str,
     transform: RegistrationTransform,
     region_index: list[MasterRegion],
+    region_grid: OverlapGrid | None = None,
 ) -> ResolvedLocation:
     x0, y0, x1, y1 = term.bbox.to_fractional()
     master_bbox = transform.apply(x0, y0, x1, y1)
 
-    matched_region = _best_overlapping_region(master_bbox, region_index)
+    matched_region = _best_overlapping_region(master_bbox, region_index, region_grid)
 
     return ResolvedLocation(
         master_drawing_id=master_drawing_id,
@@ -214,36 +216,25 @@ def _resolve_via_alignment(
     )
 
 
+def _region_grid(region_index: list[MasterRegion]) -> OverlapGrid:
+    """Grid over the regions' master bboxes, in ``region_index`` order."""
+    return OverlapGrid(region.bbox_on_master.to_fractional() for region in region_index)
+
+
 def _best_overlapping_region(
     bbox_fractional: tuple[float, float, float, float],
     region_index: list[MasterRegion],
+    region_grid: OverlapGrid | None = None,
 ) -> MasterRegion | None:
     """Find the master region whose own bbox overlaps the resolved
     location most, if any — lets an alignment-resolved overlay still pick
-    up a region's metadata (location labels) for display.
+    up a region's metadata (location labels) for display. Ties go to the
+    earlier region. Pass ``region_grid`` (from :func:`_region_grid`) when
+    resolving many boxes against the same index.
     """
-    best: MasterRegion | None = None
-    best_overlap = 0.0
-    x0, y0, x1, y1 = bbox_fractional
-    for region in region_index:
-        rx0, ry0, rx1, ry1 = region.bbox_on_master.to_fractional()
-        overlap = _box_overlap_area((x0, y0, x1, y1), (rx0, ry0, rx1, ry1))
-        if overlap > best_overlap:
-            best_overlap = overlap
-            best = region
-    return best if best_overlap > 0 else None
-
-
-def _box_overlap_area(
-    a: tuple[float, float, float, float], b: tuple[float, float, float, float]
-) -> float:
-    ax0, ay0, ax1, ay1 = a
-    bx0, by0, bx1, by1 = b
-    ix0, iy0 = max(ax0, bx0), max(ay0, by0)
-    ix1, iy1 = min(ax1, bx1), min(ay1, by1)
-    if ix1 <= ix0 or iy1 <= iy0:
-        return 0.0
-    return (ix1 - ix0) * (iy1 - iy0)
+    grid = region_grid if region_grid is not None else _region_grid(region_index)
+    position = grid.best_overlap(bbox_fractional)
+    return region_index[position] if position is not None else None
 
 
 def _resolve_via_reference_lookup(
@@ -393,12 +384,17 @@ def resolve_locations_per_term(
 
     if case == ResolutionMethod.ALIGNMENT:
         assert registration_transform is not None
+        region_grid = _region_grid(region_index)
         for term in terms:
             results.append(
                 (
                     term,
                     _resolve_via_alignment(
-                        term, master_drawing_id, registration_transform, region_index
+                        term,
+                        master_drawing_id,
+                        registration_transform,
+                        region_index,
+                        region_grid,
                     ),
                 )
             )
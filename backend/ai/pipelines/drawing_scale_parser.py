@@ -7,6 +7,7 @@ import logging
 import re
 from typing import Any
 
+from ai.llm_client import chat_completion, get_openai_client, json_object_from_reply
 from ai.pipelines.document_text_extraction import PositionedWord
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,9 @@ TITLE_BLOCK_Y_MIN = 0.75
 SCALE_LLM_CONFIDENCE_THRESHOLD = 0.60
 SCALE_LLM_MAX_CONFIDENCE = 0.85
 
+#: Bump when ``SCALE_PARSE_PROMPT`` changes so cached responses are not reused.
+SCALE_PARSE_PROMPT_VERSION = 1
+
 SCALE_PARSE_PROMPT = """
 Extract the drawing scale from this construction sheet title-block OCR text.
 
@@ -42,7 +46,6 @@ paper_inches and real_feet must express the horizontal scale as:
 paper_inches inches on the drawing equals real_feet feet in the field.
 """
 
-_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
 
 POINTS_PER_INCH = 72.0
 
@@ -370,24 +373,10 @@ def parse_scale_from_text(
 
 
 def _parse_scale_llm_payload(content: str) -> dict[str, Any]:
-    trimmed = (content or "").strip()
-    if not trimmed:
+    parsed = json_object_from_reply(content)
+    if parsed is None:
         return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
-
-    candidates = [trimmed]
-    block_match = _JSON_BLOCK_RE.search(trimmed)
-    if block_match:
-        candidates.insert(0, block_match.group(1))
-
-    for candidate in candidates:
-        try:
-            parsed = json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
-            return _sanitize_scale_llm_dict(parsed)
-
-    return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
+    return _sanitize_scale_llm_dict(parsed)
 
 
 def _sanitize_scale_llm_dict(raw: dict[str, Any]) -> dict[str, Any]:
@@ -426,31 +415,34 @@ def _call_scale_llm(content: str) -> dict[str, Any]:
     """Send title-block OCR text to the chat model when regex parsing misses."""
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
 
     preview = (content or "").strip()
     if not preview:
         return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
 
-    client = OpenAI(api_key=settings.openai_api_key)
     prompt = (
         f"{SCALE_PARSE_PROMPT.strip()}\n\n"
         f"Title-block OCR text:\n{preview[:4000]}"
     )
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="scale",
+            prompt_version=SCALE_PARSE_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=128,
         )
         message = (resp.choices[0].message.content or "").strip()
-        return _parse_scale_llm_payload(message)
+        payload = _parse_scale_llm_payload(message)
+        if json_object_from_reply(message) is not None:
+            resp.remember()
+        return payload
     except Exception as exc:
         logger.warning("drawing_scale_llm_failed", extra={"error": str(exc)})
         return {"found": False, "raw_text": "", "paper_inches": 0.0, "real_feet": 0.0, "confidence": 0.0}
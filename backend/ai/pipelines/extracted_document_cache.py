@@ -0,0 +1,205 @@
+"""
+Content-hash keyed cache for :class:`ExtractedDocument` results.
+
+``extract_document`` is called several times per evidence file during one location match
+(evidence-kind probe, reference lookup, alignment lookup), and for scanned PDFs each call
+is a full OCR pass. Results are keyed by the SHA-256 of the file bytes plus the
+extraction variant (auto vs forced OCR, page cap) and ``OCR_BACKEND``, so renamed or
+re-uploaded copies of the same file hit too.
+
+Two tiers:
+
+- In-memory LRU (``EXTRACTED_DOCUMENT_CACHE_SIZE`` entries, per process).
+- Optional on-disk JSON tier (``EXTRACTED_DOCUMENT_CACHE_DIR``) shared by worker
+  processes and surviving restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ai.pipelines.document_text_extraction import (
+    BoundingBox,
+    ExtractedDocument,
+    PositionedWord,
+    SourceFormat,
+)
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+_DISK_FORMAT_VERSION = 1
+
+
+def file_content_hash(file_path: str | Path) -> str | None:
+    """SHA-256 hex digest of the file, or None when it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def document_to_json(document: ExtractedDocument) -> dict[str, Any]:
+    return {
+        "version": _DISK_FORMAT_VERSION,
+        "source_format": document.source_format.value,
+        "page_count": document.page_count,
+        "words": [
+            [
+                w.text,
+                w.page_index,
+                w.ocr_confidence,
+                w.bbox.x,
+                w.bbox.y,
+                w.bbox.width,
+                w.bbox.height,
+                w.bbox.page_width,
+                w.bbox.page_height,
+            ]
+            for w in document.words
+        ],
+    }
+
+
+def document_from_json(payload: dict[str, Any]) -> ExtractedDocument:
+    words = [
+        PositionedWord(
+            text=str(text),
+            bbox=BoundingBox(
+                x=float(x),
+                y=float(y),
+                width=float(width),
+                height=float(height),
+                page_width=float(page_width),
+                page_height=float(page_height),
+            ),
+            page_index=int(page_index),
+            ocr_confidence=float(confidence),
+        )
+        for text, page_index, confidence, x, y, width, height, page_width, page_height in payload[
+            "words"
+        ]
+    ]
+    return ExtractedDocument(
+        source_format=SourceFormat(payload["source_format"]),
+        page_count=int(payload["page_count"]),
+        words=words,
+    )
+
+
+class ExtractedDocumentCache:
+    """Thread-safe LRU of extracted documents with an optional on-disk tier."""
+
+    def __init__(self, max_entries: int, disk_dir: str | Path | None = None) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, ExtractedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.disk_dir is not None
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, document: ExtractedDocument) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = document
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> ExtractedDocument | None:
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return document
+
+        disk_path = self._disk_path(key)
+        if disk_path is not None and disk_path.exists():
+            try:
+                document = document_from_json(json.loads(disk_path.read_text("utf-8")))
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning("extracted_document_cache_read_failed", exc_info=True)
+            else:
+                self._remember(key, document)
+                with self._lock:
+                    self.hits += 1
+                return document
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, document: ExtractedDocument) -> None:
+        self._remember(key, document)
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file.
+            fd, tmp_name = tempfile.mkstemp(dir=disk_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(document_to_json(document), fh)
+            os.replace(tmp_name, disk_path)
+        except OSError:
+            logger.warning("extracted_document_cache_write_failed", exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache: ExtractedDocumentCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_extracted_document_cache() -> ExtractedDocumentCache:
+    """Process-wide cache built from settings on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExtractedDocumentCache(
+                settings.extracted_document_cache_size,
+                settings.extracted_document_cache_dir or None,
+            )
+        return _cache
+
+
+def reset_extracted_document_cache() -> None:
+    """Drop the process-wide cache (re-reads settings on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def extracted_document_cache_key(file_path: str | Path, variant: str) -> str | None:
+    content_hash = file_content_hash(file_path)
+    if content_hash is None:
+        return None
+    return f"{content_hash}-{variant}-{settings.ocr_backend}"
@@ -44,6 +44,7 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 from typing import Any, Dict, List, Optional, cast
 
+from ai.llm_client import chat_completion, get_openai_client
 from ai.pipelines.document_text_extraction import ExtractedDocument, extract_document
 from ai.pipelines.date_extractor import extract_inspection_date, extract_primary_date
 from ai.pipelines.drawing_location_resolver import (
@@ -575,6 +576,10 @@ OUTCOMES = ("pass", "fail", "mixed", "unknown")
 
 FINDING_CONFIDENCE_THRESHOLD = 0.70
 
+#: Bump when the inspection type / outcome prompts change so cached responses are not reused.
+INSPECTION_TYPE_PROMPT_VERSION = 1
+INSPECTION_OUTCOME_PROMPT_VERSION = 1
+
 KNOWN_INSPECTION_TYPES: List[str] = [
     "hvac",
     "electrical",
@@ -645,14 +650,12 @@ def _classify_inspection_type_llm(
     """
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return "unknown"
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return "unknown"
 
-    client = OpenAI(api_key=settings.openai_api_key)
     types_str = ", ".join(KNOWN_INSPECTION_TYPES)
     hint = []
     if trade:
@@ -670,7 +673,9 @@ Metadata: {hint_str}
 Respond with only the type, e.g. hvac or electrical."""
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="inspection_type",
+            prompt_version=INSPECTION_TYPE_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=32,
@@ -678,6 +683,7 @@ Respond with only the type, e.g. hvac or electrical."""
         raw = (resp.choices[0].message.content or "").strip().lower()
         for t in KNOWN_INSPECTION_TYPES:
             if t in raw or raw == t:
+                resp.remember()
                 return t
         return "unknown"
     except Exception as e:
@@ -696,14 +702,12 @@ def _extract_outcomes_llm(
     """
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return "unknown", ""
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return "unknown", ""
 
-    client = OpenAI(api_key=settings.openai_api_key)
     text_preview = (text_content or "")[:2000]
 
     prompt = f"""Analyze this inspection document and determine the overall outcome.
@@ -719,7 +723,9 @@ OUTCOME: <pass|fail|mixed|unknown>
 NOTES: <short summary, 1-2 sentences>"""
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="inspection_outcome",
+            prompt_version=INSPECTION_OUTCOME_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=256,
@@ -733,6 +739,8 @@ NOTES: <short summary, 1-2 sentences>"""
         notes = ""
         if "notes:" in raw:
             notes = raw.split("notes:")[-1].strip().split("\n")[0].strip()[:500]
+        if "outcome:" in raw:
+            resp.remember()
         return outcome, notes
     except Exception as e:
         logger.warning("extract_outcomes_llm_failed", extra={"error": str(e)})
@@ -812,7 +820,7 @@ def _attach_finding_to_overlays(
     finding: Optional[Finding],
 ) -> None:
     """
-    Store finding linkage in drawing_overlays.meta.
+    Link overlays to the finding via ``finding_id`` (also mirrored into ``meta``).
     """
     if not overlays:
         return
@@ -825,6 +833,7 @@ def _attach_finding_to_overlays(
         current_meta["finding_created"] = finding is not None
         if finding is not None:
             current_meta["finding_id"] = getattr(finding, "id", None)
+            overlay.finding_id = getattr(finding, "id", None)
 
         overlay.meta = current_meta
 
@@ -1,10 +1,20 @@
-"""Unified location-match orchestrator for inspection evidence on master drawings."""
+"""
+Unified location-match orchestrator for inspection evidence on master drawings.
+
+:func:`resolve_evidence_location` matches one evidence record.
+:func:`resolve_evidence_locations_batch` matches many records against one master in a
+single pass. It loads the master-side artifacts once through a shared
+:class:`MasterResolutionContext`: survey points, regions, landmarks and candidate tiles.
+It also extracts the evidence files on a thread pool. Both paths score candidates the
+same way.
+"""
 
 from __future__ import annotations
 
 import logging
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Sequence, cast
@@ -13,12 +23,14 @@ from sqlalchemy.orm import Session
 
 from ai.pipelines.candidate_tile_selector import (
     CandidateTile,
-    compute_tile_match_score,
-    find_candidate_tiles_from_clues,
+    ClueMatcher,
+    load_candidate_tiles,
+    score_candidate_tiles,
 )
 from ai.pipelines.coordinate_frame import normalize_to_true_north
-from ai.pipelines.document_text_extraction import extract_document
+from ai.pipelines.document_text_extraction import ExtractedDocument, extract_document
 from ai.pipelines.drawing_location_resolver import (
+    MasterRegion,
     RegistrationTransform,
     ResolutionMethod,
     resolve_document_location,
@@ -32,7 +44,7 @@ from ai.pipelines.evidence_kind_classifier import (
 from ai.pipelines.resolution_vocab import RESOLUTION_VOCAB_CATEGORIES
 from ai.pipelines.landmark_extractor import LandmarkRecord
 from ai.pipelines.landmark_matcher import run_landmark_matcher
-from ai.pipelines.positioned_term_extractor import extract_positioned_terms
+from ai.pipelines.positioned_term_extractor import PositionedTerm, extract_positioned_terms
 from ai.pipelines.survey_point_extractor import SurveyPointRecord
 from ai.pipelines.survey_point_matcher import (
     COORD_MATCH_TOLERANCE_FT,
@@ -40,6 +52,7 @@ from ai.pipelines.survey_point_matcher import (
     euclidean_survey_distance_ft,
     match_survey_points,
 )
+from config import settings
 from models.document_clue import DocumentClue
 from models.document_extraction import DocumentExtraction
 from models.drawing_landmark import DrawingLandmark
@@ -389,39 +402,26 @@ def _station_lookup_candidates(
 
 def _clue_tile_candidates(
     session: Session,
+    master: MasterResolutionContext,
     *,
     drawing_ids: Sequence[int],
     page: int,
     clues: Sequence[DocumentClue],
     project_id: int | None,
 ) -> list[MethodCandidate]:
+    # Expand and compile the clues once for every auxiliary drawing.
+    matcher = ClueMatcher.for_session(clues, session=session, project_id=project_id)
+    if not matcher:
+        return []
+
     candidates: list[MethodCandidate] = []
     for drawing_id in drawing_ids:
-        tiles = find_candidate_tiles_from_clues(
-            session=session,
-            drawing_id=drawing_id,
-            page=page,
-            clues=clues,
-            limit=20,
-            project_id=project_id,
-        )
-        if not tiles:
+        scored = score_candidate_tiles(master.candidate_tiles(drawing_id, page), matcher, limit=20)
+        if not scored:
             continue
 
-        best_score = 0.0
-        best_tile: CandidateTile | None = None
-        for tile in tiles:
-            score = compute_tile_match_score(
-                tile,
-                clues,
-                session=session,
-                project_id=project_id,
-            )
-            if score > best_score:
-                best_score = score
-                best_tile = tile
-
-        if best_tile is None or best_score <= 0 or best_tile.bbox_normalized is None:
+        best_score, best_tile = scored[0]
+        if best_score <= 0 or best_tile.bbox_normalized is None:
             continue
 
         candidates.append(
@@ -438,31 +438,129 @@ def _clue_tile_candidates(
     return candidates
 
 
+class MasterResolutionContext:
+    """
+    Drawing-side artifacts memoized across the evidence records of one match pass.
+
+    Survey points, region indexes, landmarks and candidate tile pages depend only on the
+    drawings. A batch against one master loads each of them once, not once per evidence
+    record.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self._survey_points: dict[int, list[_ScopedSurveyPoint]] = {}
+        self._region_indexes: dict[int, list[MasterRegion]] = {}
+        self._landmarks: dict[tuple[int, int], list[LandmarkRecord]] = {}
+        self._candidate_tiles: dict[tuple[int, int], list[CandidateTile]] = {}
+
+    def survey_points(self, drawing_ids: Sequence[int]) -> list[_ScopedSurveyPoint]:
+        """Points of ``drawing_ids``, ordered by drawing id then row id."""
+        wanted = sorted({int(drawing_id) for drawing_id in drawing_ids})
+        missing = [drawing_id for drawing_id in wanted if drawing_id not in self._survey_points]
+        if missing:
+            loaded: dict[int, list[_ScopedSurveyPoint]] = {drawing_id: [] for drawing_id in missing}
+            for point in _load_scoped_survey_points(self.session, missing):
+                loaded[point.drawing_id].append(point)
+            self._survey_points.update(loaded)
+        return [point for drawing_id in wanted for point in self._survey_points[drawing_id]]
+
+    def region_index(self, master_drawing_id: int) -> list[MasterRegion]:
+        if master_drawing_id not in self._region_indexes:
+            self._region_indexes[master_drawing_id] = build_region_index(
+                self.session, master_drawing_id
+            ).regions
+        return self._region_indexes[master_drawing_id]
+
+    def landmarks(self, drawing_id: int, page: int) -> list[LandmarkRecord]:
+        key = (int(drawing_id), page)
+        if key not in self._landmarks:
+            self._landmarks[key] = _load_master_landmarks(self.session, key[0], page)
+        return self._landmarks[key]
+
+    def candidate_tiles(self, drawing_id: int, page: int) -> list[CandidateTile]:
+        key = (int(drawing_id), page)
+        if key not in self._candidate_tiles:
+            self._candidate_tiles[key] = load_candidate_tiles(self.session, key[0], page)
+        return self._candidate_tiles[key]
+
+
+class EvidenceResolutionContext:
+    """
+    Evidence-file artifacts memoized for one :func:`resolve_evidence_location` call.
+
+    The evidence-kind probe, reference lookup, and alignment lookup all need the same
+    extracted document; this makes sure the file is parsed / OCR'd at most once per match
+    job (on top of the content-hash cache in ``extract_document``). Drawing-side lookups
+    go through ``master``, which a batch shares between evidence records.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        evidence: EvidenceRecord,
+        master: MasterResolutionContext | None = None,
+    ) -> None:
+        self.session = session
+        self.evidence = evidence
+        self.master = master if master is not None else MasterResolutionContext(session)
+        self._document: ExtractedDocument | None = None
+        self._document_loaded = False
+        self._positioned_terms: list[PositionedTerm] | None = None
+
+    @property
+    def file_path(self) -> Path | None:
+        storage_key = cast(str | None, self.evidence.storage_key)
+        if not storage_key:
+            return None
+        file_path = get_file_path(storage_key)
+        return file_path if file_path.exists() else None
+
+    def document(self) -> ExtractedDocument | None:
+        """Extracted evidence text; None when the evidence file is missing."""
+        if not self._document_loaded:
+            file_path = self.file_path
+            self._document = extract_document(file_path) if file_path is not None else None
+            self._document_loaded = True
+        return self._document
+
+    def positioned_terms(self) -> list[PositionedTerm]:
+        if self._positioned_terms is None:
+            document = self.document()
+            self._positioned_terms = (
+                extract_positioned_terms(document, categories=RESOLUTION_VOCAB_CATEGORIES)
+                if document is not None
+                else []
+            )
+        return self._positioned_terms
+
+    def set_extracted(
+        self,
+        document: ExtractedDocument | None,
+        positioned_terms: list[PositionedTerm],
+    ) -> None:
+        """Use a document and its terms extracted elsewhere (e.g. on a worker thread)."""
+        self._document = document
+        self._document_loaded = True
+        self._positioned_terms = positioned_terms
+
+    def region_index(self, master_drawing_id: int) -> list[MasterRegion]:
+        return self.master.region_index(master_drawing_id)
+
+
 def _reference_lookup_candidate(
-    session: Session,
+    context: EvidenceResolutionContext,
     *,
-    evidence: EvidenceRecord,
     master_drawing_id: int,
     registration_transform: RegistrationTransform | None,
 ) -> MethodCandidate | None:
-    storage_key = cast(str | None, evidence.storage_key)
-    if not storage_key:
-        return None
-
-    file_path = get_file_path(storage_key)
-    if not file_path.exists():
+    if context.document() is None:
         return None
 
-    document = extract_document(file_path)
-    positioned_terms = extract_positioned_terms(
-        document,
-        categories=RESOLUTION_VOCAB_CATEGORIES,
-    )
-    region_index = build_region_index(session, master_drawing_id).regions
     resolved = resolve_document_location(
-        positioned_terms,
+        context.positioned_terms(),
         str(master_drawing_id),
-        region_index,
+        context.region_index(master_drawing_id),
         registration_transform=registration_transform,
     )
     if resolved.bbox_fractional is None or resolved.confidence_score <= 0:
@@ -548,7 +646,7 @@ def _evidence_rendition_png(
 
 
 def _contour_match_candidate(
-    session: Session,
+    master: MasterResolutionContext,
     *,
     evidence: EvidenceRecord,
     master_drawing_id: int,
@@ -562,7 +660,7 @@ def _contour_match_candidate(
     if not file_path.exists():
         return None
 
-    master_landmarks = _load_master_landmarks(session, master_drawing_id, page)
+    master_landmarks = master.landmarks(master_drawing_id, page)
     if not master_landmarks:
         return None
 
@@ -591,10 +689,10 @@ def _contour_match_candidate(
 
 
 def _load_evidence_kind(
-    session: Session,
-    evidence: EvidenceRecord,
+    context: EvidenceResolutionContext,
     extraction: DocumentExtraction | None,
 ) -> EvidenceKind:
+    session, evidence = context.session, context.evidence
     meta = cast(dict[str, Any] | None, evidence.meta)
     if isinstance(meta, dict):
         raw_kind = meta.get("evidence_kind")
@@ -606,21 +704,17 @@ def _load_evidence_kind(
 
     document_type = str(getattr(extraction, "document_type", "") or "unknown")
     native_words = 0
-    storage_key = cast(str | None, evidence.storage_key)
-    if storage_key:
-        file_path = get_file_path(storage_key)
-        if file_path.exists():
-            try:
-                native_words = sum(
-                    1
-                    for word in extract_document(file_path).words
-                    if word.page_index == 0 and word.text.strip()
-                )
-            except Exception:
-                logger.exception(
-                    "evidence_kind_native_word_count_failed",
-                    extra={"evidence_id": evidence.id},
-                )
+    try:
+        document = context.document()
+        if document is not None:
+            native_words = sum(
+                1 for word in document.words if word.page_index == 0 and word.text.strip()
+            )
+    except Exception:
+        logger.exception(
+            "evidence_kind_native_word_count_failed",
+            extra={"evidence_id": evidence.id},
+        )
 
     return classify_evidence_kind(
         document_type,
@@ -671,30 +765,52 @@ def _load_document_extraction(
     return extraction, clues
 
 
-def resolve_evidence_location(
+def _extract_evidence_terms(file_path: Path) -> tuple[ExtractedDocument, list[PositionedTerm]]:
+    """Session-free evidence extraction, safe to run on a worker thread."""
+    document = extract_document(file_path)
+    return document, extract_positioned_terms(document, categories=RESOLUTION_VOCAB_CATEGORIES)
+
+
+@dataclass
+class _EvidenceMatchInputs:
+    context: EvidenceResolutionContext
+    scope: MatchScope
+    extraction: DocumentExtraction | None
+    clues: list[DocumentClue]
+
+
+def _load_evidence_match_inputs(
     session: Session,
-    evidence_id: int,
+    evidence: EvidenceRecord,
     master_drawing_id: int,
-    page: int = 1,
-) -> LocationMatchResult:
-    """Run all location matchers and return the best resolved pin on the master drawing."""
-    evidence = session.get(EvidenceRecord, evidence_id)
-    if evidence is None:
-        return LocationMatchResult.unresolved(
-            master_drawing_id,
-            notes=f"Evidence {evidence_id} not found.",
-        )
-
+    master: MasterResolutionContext | None,
+) -> _EvidenceMatchInputs:
+    evidence_id = cast(int, evidence.id)
     scope: MatchScope = build_match_scope(
         session,
         evidence_id=evidence_id,
         master_drawing_id=master_drawing_id,
     )
     extraction, clues = _load_document_extraction(session, evidence_id)
-    evidence_kind = _load_evidence_kind(session, evidence, extraction)
+    return _EvidenceMatchInputs(
+        context=EvidenceResolutionContext(session, evidence, master),
+        scope=scope,
+        extraction=extraction,
+        clues=clues,
+    )
+
+
+def _resolve_with_inputs(
+    inputs: _EvidenceMatchInputs,
+    master_drawing_id: int,
+    page: int,
+) -> LocationMatchResult:
+    context, scope = inputs.context, inputs.scope
+    session, evidence, master = context.session, context.evidence, context.master
+    evidence_kind = _load_evidence_kind(context, inputs.extraction)
 
     drawing_ids = (scope.master_drawing_id, *scope.auxiliary_drawing_ids)
-    scoped_points = _load_scoped_survey_points(session, drawing_ids)
+    scoped_points = master.survey_points(drawing_ids)
     evidence_points = _meta_survey_points(evidence)
     project_id = cast(int | None, evidence.project_id)
     registration_transform = _load_registration_transform(evidence)
@@ -720,16 +836,16 @@ def resolve_evidence_location(
     candidates.extend(
         _clue_tile_candidates(
             session,
+            master,
             drawing_ids=drawing_ids,
             page=page,
-            clues=clues,
+            clues=inputs.clues,
             project_id=project_id,
         )
     )
 
     reference = _reference_lookup_candidate(
-        session,
-        evidence=evidence,
+        context,
         master_drawing_id=master_drawing_id,
         registration_transform=None,
     )
@@ -738,8 +854,7 @@ def resolve_evidence_location(
 
     if registration_transform is not None:
         alignment = _reference_lookup_candidate(
-            session,
-            evidence=evidence,
+            context,
             master_drawing_id=master_drawing_id,
             registration_transform=registration_transform,
         )
@@ -757,7 +872,7 @@ def resolve_evidence_location(
         )
 
     contour = _contour_match_candidate(
-        session,
+        master,
         evidence=evidence,
         master_drawing_id=master_drawing_id,
         page=page,
@@ -766,3 +881,116 @@ def resolve_evidence_location(
         return LocationMatchResult.from_candidate(master_drawing_id, contour)
 
     return LocationMatchResult.unresolved(master_drawing_id)
+
+
+def resolve_evidence_location(
+    session: Session,
+    evidence_id: int,
+    master_drawing_id: int,
+    page: int = 1,
+) -> LocationMatchResult:
+    """Run all location matchers and return the best resolved pin on the master drawing."""
+    evidence = session.get(EvidenceRecord, evidence_id)
+    if evidence is None:
+        return LocationMatchResult.unresolved(
+            master_drawing_id,
+            notes=f"Evidence {evidence_id} not found.",
+        )
+
+    inputs = _load_evidence_match_inputs(session, evidence, master_drawing_id, None)
+    return _resolve_with_inputs(inputs, master_drawing_id, page)
+
+
+def _log_batch_evidence_failure(evidence_id: int, master_drawing_id: int) -> None:
+    logger.exception(
+        "inspection_match_batch_evidence_failed",
+        extra={"evidence_id": evidence_id, "drawing_id": master_drawing_id},
+    )
+
+
+def resolve_evidence_locations_batch(
+    session: Session,
+    evidence_ids: Sequence[int],
+    master_drawing_id: int,
+    page: int = 1,
+    *,
+    max_workers: int | None = None,
+) -> dict[int, LocationMatchResult]:
+    """
+    :func:`resolve_evidence_location` for many evidence records against one master drawing.
+
+    The work happens in three phases:
+
+    1. The session loads every evidence row, match scope and stored extraction.
+    2. A pool of ``max_workers`` threads extracts the evidence files. The default is
+       ``INSPECTION_MATCH_BATCH_WORKERS``. Extraction does not use the session.
+    3. The matchers run serially on the session, sharing one
+       :class:`MasterResolutionContext`.
+
+    Each result equals what :func:`resolve_evidence_location` returns for that record. A
+    record whose input loading, file lookup, extraction or matching raises is logged and
+    left out of the result, so one bad record does not fail the batch; loading and
+    matching run in savepoints so a database error for one record does not poison the
+    session for the rest.
+    """
+    results: dict[int, LocationMatchResult] = {}
+    master = MasterResolutionContext(session)
+    pending: list[tuple[int, _EvidenceMatchInputs]] = []
+    for evidence_id in dict.fromkeys(int(value) for value in evidence_ids):
+        evidence = session.get(EvidenceRecord, evidence_id)
+        if evidence is None:
+            results[evidence_id] = LocationMatchResult.unresolved(
+                master_drawing_id,
+                notes=f"Evidence {evidence_id} not found.",
+            )
+            continue
+        try:
+            with session.begin_nested():
+                inputs = _load_evidence_match_inputs(
+                    session, evidence, master_drawing_id, master
+                )
+        except Exception:
+            _log_batch_evidence_failure(evidence_id, master_drawing_id)
+            continue
+        pending.append((evidence_id, inputs))
+
+    failed: set[int] = set()
+    files: list[tuple[int, EvidenceResolutionContext, Path]] = []
+    for evidence_id, inputs in pending:
+        try:
+            file_path = inputs.context.file_path
+        except Exception:
+            # e.g. HTTPException(400) from get_file_path for a bad storage key.
+            _log_batch_evidence_failure(evidence_id, master_drawing_id)
+            failed.add(evidence_id)
+            continue
+        if file_path is None:
+            inputs.context.set_extracted(None, [])
+        else:
+            files.append((evidence_id, inputs.context, file_path))
+
+    workers = max(1, max_workers if max_workers is not None else settings.inspection_match_batch_workers)
+    if files:
+        with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            futures = [
+                (evidence_id, context, pool.submit(_extract_evidence_terms, file_path))
+                for evidence_id, context, file_path in files
+            ]
+            for evidence_id, context, future in futures:
+                try:
+                    document, terms = future.result()
+                except Exception:
+                    _log_batch_evidence_failure(evidence_id, master_drawing_id)
+                    failed.add(evidence_id)
+                    continue
+                context.set_extracted(document, terms)
+
+    for evidence_id, inputs in pending:
+        if evidence_id in failed:
+            continue
+        try:
+            with session.begin_nested():
+                results[evidence_id] = _resolve_with_inputs(inputs, master_drawing_id, page)
+        except Exception:
+            _log_batch_evidence_failure(evidence_id, master_drawing_id)
+    return results
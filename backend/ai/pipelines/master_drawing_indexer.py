@@ -3,25 +3,34 @@
 Phase 2: extract positioned words from the drawing file and persist
 ``DrawingTextElement`` rows. Scale parsing and region building follow in
 later phases.
+
+Each ``page_meta_json`` entry carries a content ``fingerprint`` of its page. An
+incremental reindex (``index_master_drawing(..., pages=...)``) re-runs OCR, legend
+tagging, region building, survey point and landmark extraction only for the pages whose
+fingerprint changed; rows on the other pages are left in place.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Collection, Sequence, cast
 
 import fitz  # PyMuPDF
 from sqlalchemy.orm import Session
 
 from ai.pipelines.document_text_extraction import (
+    SCANNED_PDF_OCR_DPI,
     ExtractedDocument,
     PositionedWord,
     SourceFormat,
     extract_document,
+    extract_document_pages,
 )
 from ai.pipelines.drawing_scale_parser import page_size_inches_from_points, parse_scale_from_words
+from ai.pipelines.extracted_document_cache import file_content_hash
 from ai.pipelines.landmark_extractor import LandmarkRecord, extract_landmarks_from_page
 from ai.pipelines.master_drawing_region_builder import build_auto_regions_from_text_elements
 from ai.pipelines.sheet_orientation_detector import (
@@ -33,11 +42,15 @@ from config import settings
 from models.drawing_text_element import DrawingTextElement
 from models.models import Drawing, DrawingRendition
 from services.landmark_storage import persist_landmarks
-from services.master_drawing_legend_tagger import enrich_text_elements_with_legend
+from services.master_drawing_legend_tagger import enrich_text_element_records
 from services.storage import open_storage_path
 from services.survey_point_storage import persist_survey_points
+from services.text_element_storage import TextElementRecord, persist_text_element_records
 
 _WHITESPACE_RE = re.compile(r"\s+")
+#: Part of every page fingerprint; bump it when the recipe changes so stored
+#: fingerprints stop matching and the next incremental reindex covers every page.
+_PAGE_FINGERPRINT_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -50,9 +63,11 @@ class IndexResult:
     scale_found: bool = False
     scale_json: dict[str, Any] | None = None
     page_meta_json: list[dict[str, Any]] | None = None
+    #: 1-based pages an incremental run re-indexed; ``None`` for a full index.
+    pages_reindexed: list[int] | None = None
 
     def to_stats_json(self) -> dict[str, Any]:
-        return {
+        stats: dict[str, Any] = {
             "pages": self.pages,
             "text_elements": self.text_elements,
             "regions": self.regions,
@@ -60,6 +75,9 @@ class IndexResult:
             "landmarks": self.landmarks,
             "scale_found": self.scale_found,
         }
+        if self.pages_reindexed is not None:
+            stats["pages_reindexed"] = self.pages_reindexed
+        return stats
 
 
 def normalize_token_text(text: str) -> str:
@@ -99,8 +117,113 @@ def _limit_extracted_document(
     )
 
 
-def extract_drawing_document(file_path: Path) -> ExtractedDocument:
-    document = extract_document(file_path)
+def rendered_ocr_pages(session: Session, drawing_id: int) -> dict[int, Path]:
+    """Page index → stored render PNG for pages rendered at the scanned-PDF OCR DPI."""
+    renditions = (
+        session.query(DrawingRendition)
+        .filter(
+            DrawingRendition.drawing_id == drawing_id,
+            DrawingRendition.render_status == "ready",
+            DrawingRendition.dpi == SCANNED_PDF_OCR_DPI,
+        )
+        .all()
+    )
+    pages: dict[int, Path] = {}
+    for rendition in renditions:
+        path = open_storage_path(cast(str, rendition.image_storage_key))
+        if path.exists():
+            pages[cast(int, rendition.page_number) - 1] = path
+    return pages
+
+
+def pdf_page_fingerprint(doc: fitz.Document, page: fitz.Page) -> str:
+    """
+    SHA-256 over what a page draws: its size and rotation, content streams, the raw
+    streams of the images / form XObjects it uses, and its font names. No rasterizing.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"v{_PAGE_FINGERPRINT_VERSION}|{tuple(page.rect)}|{page.rotation}".encode()
+    )
+    digest.update(page.read_contents())
+    xrefs: set[int] = set()
+    for image in page.get_images(full=True):
+        xrefs.update(xref for xref in (image[0], image[1]) if xref)
+    xrefs.update(xobject[0] for xobject in page.get_xobjects())
+    for xref in sorted(xrefs):
+        digest.update(doc.xref_stream_raw(xref) or b"")
+    for font in page.get_fonts(full=True):
+        digest.update(str(font[3]).encode())
+    return digest.hexdigest()
+
+
+def _image_fingerprint(file_path: Path) -> str | None:
+    content_hash = file_content_hash(file_path)
+    if content_hash is None:
+        return None
+    return f"v{_PAGE_FINGERPRINT_VERSION}-{content_hash}"
+
+
+def page_fingerprints(file_path: Path) -> list[str | None]:
+    """Fingerprint of every indexed page (honours ``DRAWING_INDEX_OCR_MAX_PAGES``)."""
+    max_pages = _index_max_pages()
+    if file_path.suffix.lower() != ".pdf":
+        return [_image_fingerprint(file_path)]
+    doc = fitz.open(str(file_path))
+    try:
+        page_count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+        return [
+            pdf_page_fingerprint(doc, doc.load_page(page_index))
+            for page_index in range(page_count)
+        ]
+    finally:
+        doc.close()
+
+
+def changed_pages(
+    previous_page_meta: list[dict[str, Any]] | None,
+    fingerprints: Sequence[str | None],
+) -> set[int] | None:
+    """
+    1-based pages whose fingerprint differs from the last index, plus pages that no longer
+    exist. ``None`` when the last index has no usable fingerprints (index everything).
+    """
+    if not previous_page_meta:
+        return None
+    previous: dict[int, str] = {}
+    for entry in previous_page_meta:
+        fingerprint = entry.get("fingerprint") if isinstance(entry, dict) else None
+        if not fingerprint:
+            return None
+        previous[int(entry["page"])] = str(fingerprint)
+
+    changed = {
+        page_number
+        for page_number, fingerprint in enumerate(fingerprints, start=1)
+        if fingerprint is None or previous.get(page_number) != fingerprint
+    }
+    changed.update(page for page in previous if page > len(fingerprints))
+    return changed
+
+
+def extract_drawing_document(
+    file_path: Path,
+    rendered_pages: dict[int, Path] | None = None,
+    pages: Collection[int] | None = None,
+) -> ExtractedDocument:
+    """
+    Extract the drawing's words; scanned pages are OCR'd from ``rendered_pages`` when given.
+
+    ``pages`` (1-based) limits extraction — and for scanned drawings, OCR — to those pages.
+    """
+    if pages is None:
+        document = extract_document(file_path, rendered_pages=rendered_pages)
+    else:
+        document = extract_document_pages(
+            file_path,
+            {page - 1 for page in pages},
+            rendered_pages=rendered_pages,
+        )
     return _limit_extracted_document(document, _index_max_pages())
 
 
@@ -110,7 +233,13 @@ def build_page_meta_json(
     file_path: Path,
     *,
     page_count: int,
+    fingerprints: Sequence[str | None] | None = None,
 ) -> list[dict[str, Any]]:
+    """
+    Size, rendition and fingerprint of every page. ``fingerprints`` (from
+    :func:`page_fingerprints`, already computed to pick the pages to reindex) are reused
+    instead of hashing the pages again.
+    """
     renditions = (
         session.query(DrawingRendition)
         .filter(DrawingRendition.drawing_id == drawing_id)
@@ -143,6 +272,11 @@ def build_page_meta_json(
                         "width_px": cast(int | None, rendition.width_px if rendition else None),
                         "height_px": cast(int | None, rendition.height_px if rendition else None),
                         "rotation": int(page.rotation),
+                        "fingerprint": (
+                            fingerprints[page_index]
+                            if fingerprints is not None and page_index < len(fingerprints)
+                            else pdf_page_fingerprint(doc, page)
+                        ),
                     }
                 )
             return page_meta
@@ -158,6 +292,7 @@ def build_page_meta_json(
             "width_px": cast(int | None, rendition.width_px if rendition else None),
             "height_px": cast(int | None, rendition.height_px if rendition else None),
             "rotation": 0,
+            "fingerprint": fingerprints[0] if fingerprints else _image_fingerprint(file_path),
         }
     ]
 
@@ -166,7 +301,7 @@ def enrich_page_meta_json_with_orientation(
     session: Session,
     drawing_id: int,
     page_meta_json: list[dict[str, Any]],
-    text_elements: list[DrawingTextElement],
+    text_elements: Sequence[DrawingTextElement | TextElementRecord],
 ) -> list[dict[str, Any]]:
     renditions = (
         session.query(DrawingRendition)
@@ -238,21 +373,18 @@ def extract_landmarks_from_drawing_renditions(
     return records
 
 
-def persist_text_elements(
-    session: Session,
-    drawing_id: int,
+def build_text_element_records(
     words: list[PositionedWord],
     source_format: SourceFormat,
-) -> int:
+) -> list[TextElementRecord]:
     source = element_source(source_format)
-    rows: list[DrawingTextElement] = []
+    records: list[TextElementRecord] = []
     for word in words:
         text = word.text.strip()
         if not text:
             continue
-        rows.append(
-            DrawingTextElement(
-                master_drawing_id=drawing_id,
+        records.append(
+            TextElementRecord(
                 page=word.page_index + 1,
                 text=text,
                 text_normalized=normalize_token_text(text),
@@ -261,15 +393,40 @@ def persist_text_elements(
                 source=source,
             )
         )
+    return records
+
 
-    if rows:
-        session.add_all(rows)
-        session.flush()
-    return len(rows)
+def _merge_page_meta(
+    fresh: list[dict[str, Any]],
+    reindexed: list[dict[str, Any]],
+    previous: list[dict[str, Any]] | None,
+) -> list[dict[str, Any]]:
+    """Reindexed pages take their new entry; unchanged pages keep the entry (orientation
+    included) from the last index."""
+    by_page: dict[int, dict[str, Any]] = {
+        int(entry["page"]): entry for entry in previous or [] if isinstance(entry, dict)
+    }
+    by_page.update((int(entry["page"]), entry) for entry in reindexed)
+    return [by_page.get(int(entry["page"]), entry) for entry in fresh]
 
 
-def index_master_drawing(drawing_id: int, session: Session) -> IndexResult:
-    """Extract positioned OCR/text-layer words and persist drawing index rows."""
+def index_master_drawing(
+    drawing_id: int,
+    session: Session,
+    *,
+    pages: Collection[int] | None = None,
+    fingerprints: Sequence[str | None] | None = None,
+) -> IndexResult:
+    """
+    Extract positioned OCR/text-layer words and persist drawing index rows.
+
+    ``pages`` (1-based) runs an incremental index: only those pages are extracted, tagged,
+    clustered into regions and scanned for survey points and landmarks. The caller clears
+    their previous rows (``clear_drawing_index_artifacts(..., pages=...)``); the other
+    pages keep theirs, and their ``page_meta_json`` entries carry over. Counts in the
+    result then cover the re-indexed pages only. ``fingerprints`` are the page fingerprints
+    the caller already computed to choose ``pages``.
+    """
     drawing = session.get(Drawing, drawing_id)
     if drawing is None:
         raise ValueError(f"Drawing {drawing_id} not found")
@@ -282,48 +439,64 @@ def index_master_drawing(drawing_id: int, session: Session) -> IndexResult:
     if not source_path.exists():
         raise FileNotFoundError(f"Drawing source file not found: {source_path}")
 
-    extracted = extract_drawing_document(source_path)
+    reindex_pages = set(pages) if pages is not None else None
+
+    # The render job already rasterized each page at the OCR DPI; OCR those PNGs.
+    extracted = extract_drawing_document(
+        source_path,
+        rendered_ocr_pages(session, drawing_id),
+        reindex_pages,
+    )
     page_meta_json = build_page_meta_json(
         session,
         drawing_id,
         source_path,
         page_count=extracted.page_count,
+        fingerprints=fingerprints,
     )
-    text_elements = persist_text_elements(
-        session,
-        drawing_id,
-        extracted.words,
-        extracted.source_format,
-    )
+    if reindex_pages is None:
+        pages_meta_to_index = page_meta_json
+    else:
+        pages_meta_to_index = [
+            entry for entry in page_meta_json if int(entry["page"]) in reindex_pages
+        ]
+
+    # Tag legend fields before the bulk write; the records then stand in for the rows
+    # for the rest of the run instead of reloading them.
+    text_elements = build_text_element_records(extracted.words, extracted.source_format)
+    enrich_text_element_records(session, text_elements, cast(int, drawing.project_id))
+    persist_text_element_records(session, drawing_id, text_elements)
+
+    regions = build_auto_regions_from_text_elements(session, drawing_id, text_elements)
+
+    if reindex_pages is None or 1 in reindex_pages:
+        first_page_meta = page_meta_json[0] if page_meta_json else None
+        scale_json = parse_scale_from_words(
+            extracted.words,
+            page=1,
+            page_meta=first_page_meta,
+        )
+    else:
+        # The scale is read from page 1, which did not change.
+        scale_json = cast(dict[str, Any] | None, drawing.scale_json)
 
-    enrich_text_elements_with_legend(
+    oriented_pages = enrich_page_meta_json_with_orientation(
         session,
         drawing_id,
-        cast(int, drawing.project_id),
-    )
-
-    regions = build_auto_regions_from_text_elements(session, drawing_id)
-
-    first_page_meta = page_meta_json[0] if page_meta_json else None
-    scale_json = parse_scale_from_words(
-        extracted.words,
-        page=1,
-        page_meta=first_page_meta,
+        pages_meta_to_index,
+        text_elements,
     )
+    if reindex_pages is None:
+        page_meta_json = oriented_pages
+    else:
+        page_meta_json = _merge_page_meta(
+            page_meta_json,
+            oriented_pages,
+            cast(list[dict[str, Any]] | None, drawing.page_meta_json),
+        )
 
-    indexed_text_elements = (
-        session.query(DrawingTextElement)
-        .filter(DrawingTextElement.master_drawing_id == drawing_id)
-        .all()
-    )
-    page_meta_json = enrich_page_meta_json_with_orientation(
-        session,
-        drawing_id,
-        page_meta_json,
-        indexed_text_elements,
-    )
     survey_point_records = extract_survey_points_from_elements(
-        indexed_text_elements,
+        text_elements,
         scale_json=scale_json,
         page_meta_json=page_meta_json,
         scale_source="master_index",
@@ -333,27 +506,30 @@ def index_master_drawing(drawing_id: int, session: Session) -> IndexResult:
         drawing_id,
         survey_point_records,
         source="auto_index",
+        pages=reindex_pages,
     )
 
     landmark_records = extract_landmarks_from_drawing_renditions(
         session,
         drawing_id,
-        page_meta_json,
+        oriented_pages,
     )
     landmarks = persist_landmarks(
         session,
         drawing_id,
         landmark_records,
         source="auto_index",
+        pages=reindex_pages,
     )
 
     return IndexResult(
         pages=extracted.page_count,
-        text_elements=text_elements,
+        text_elements=len(text_elements),
         regions=regions,
         survey_points=survey_points,
         landmarks=landmarks,
         scale_found=scale_json is not None,
         scale_json=scale_json,
         page_meta_json=page_meta_json,
+        pages_reindexed=sorted(reindex_pages) if reindex_pages is not None else None,
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -12,7 +12,9 @@ from ai.pipelines.drawing_scale_parser import TITLE_BLOCK_X_MIN, TITLE_BLOCK_Y_M
 from config import settings
 from models.drawing_region import DrawingRegion
 from models.drawing_text_element import DrawingTextElement
+from services.box_overlap import bbox_from_json, grid_bucket
 from services.master_drawing_legend_tagger import legend_tags_for_text_element
+from services.text_element_storage import TextElementRecord
 
 AUTO_INDEX_REGION_SOURCE = "auto_index"
 _MIN_OCR_CONFIDENCE = 0.5
@@ -37,7 +39,7 @@ _TRADE_PHRASES: tuple[tuple[str, str], ...] = (
 
 @dataclass(frozen=True)
 class IndexedElement:
-    row: DrawingTextElement
+    row: DrawingTextElement | TextElementRecord
     x0: float
     y0: float
     x1: float
@@ -54,26 +56,7 @@ class GridCell:
     bucket_size: float
 
 
-def _bbox_from_json(bbox_json: object) -> tuple[float, float, float, float] | None:
-    if not isinstance(bbox_json, dict):
-        return None
-    if all(key in bbox_json for key in ("x0", "y0", "x1", "y1")):
-        return (
-            float(bbox_json["x0"]),
-            float(bbox_json["y0"]),
-            float(bbox_json["x1"]),
-            float(bbox_json["y1"]),
-        )
-    if all(key in bbox_json for key in ("x", "y", "width", "height")):
-        x = float(bbox_json["x"])
-        y = float(bbox_json["y"])
-        width = float(bbox_json["width"])
-        height = float(bbox_json["height"])
-        return x, y, x + width, y + height
-    return None
-
-
-def is_junk_text_element(row: DrawingTextElement) -> bool:
+def is_junk_text_element(row: DrawingTextElement | TextElementRecord) -> bool:
     text = str(row.text).strip()
     if not text:
         return True
@@ -86,8 +69,8 @@ def is_junk_text_element(row: DrawingTextElement) -> bool:
     return False
 
 
-def _indexed_element(row: DrawingTextElement) -> IndexedElement | None:
-    bbox = _bbox_from_json(row.bbox_json)
+def _indexed_element(row: DrawingTextElement | TextElementRecord) -> IndexedElement | None:
+    bbox = bbox_from_json(row.bbox_json)
     if bbox is None:
         return None
     x0, y0, x1, y1 = bbox
@@ -102,14 +85,6 @@ def _indexed_element(row: DrawingTextElement) -> IndexedElement | None:
     )
 
 
-def _grid_bucket(value: float, bucket_size: float) -> int:
-    if bucket_size <= 0:
-        raise ValueError("bucket_size must be positive")
-    bucket = int(value / bucket_size)
-    max_bucket = max(0, int(round(1 / bucket_size)) - 1)
-    return max(0, min(bucket, max_bucket))
-
-
 def cluster_elements_by_grid(
     elements: list[IndexedElement],
     *,
@@ -120,8 +95,8 @@ def cluster_elements_by_grid(
         page = int(element.row.page)
         key = (
             page,
-            _grid_bucket(element.centroid_x, bucket_size),
-            _grid_bucket(element.centroid_y, bucket_size),
+            grid_bucket(element.centroid_x, bucket_size),
+            grid_bucket(element.centroid_y, bucket_size),
         )
         buckets.setdefault(key, []).append(element)
     return list(buckets.values())
@@ -136,8 +111,8 @@ def cluster_elements_by_fixed_grid(
     buckets: dict[tuple[int, int, int], list[IndexedElement]] = {}
     for element in elements:
         page = int(element.row.page)
-        column = _grid_bucket(element.centroid_x, bucket_size)
-        row = _grid_bucket(element.centroid_y, bucket_size)
+        column = grid_bucket(element.centroid_x, bucket_size)
+        row = grid_bucket(element.centroid_y, bucket_size)
         key = (page, column, row)
         buckets.setdefault(key, []).append(element)
 
@@ -307,13 +282,9 @@ def _create_region(
     )
 
 
-def _load_indexed_elements(session: Session, drawing_id: int) -> list[IndexedElement]:
-    rows = (
-        session.query(DrawingTextElement)
-        .filter(DrawingTextElement.master_drawing_id == drawing_id)
-        .order_by(DrawingTextElement.page.asc(), DrawingTextElement.id.asc())
-        .all()
-    )
+def _indexed_elements(
+    rows: Sequence[DrawingTextElement | TextElementRecord],
+) -> list[IndexedElement]:
     return [
         element
         for row in rows
@@ -323,6 +294,16 @@ def _load_indexed_elements(session: Session, drawing_id: int) -> list[IndexedEle
     ]
 
 
+def _load_indexed_elements(session: Session, drawing_id: int) -> list[IndexedElement]:
+    rows = (
+        session.query(DrawingTextElement)
+        .filter(DrawingTextElement.master_drawing_id == drawing_id)
+        .order_by(DrawingTextElement.page.asc(), DrawingTextElement.id.asc())
+        .all()
+    )
+    return _indexed_elements(rows)
+
+
 def _build_cluster_regions(
     session: Session,
     drawing_id: int,
@@ -382,7 +363,7 @@ def _build_hybrid_regions(
             session,
             drawing_id,
             title_block,
-            page=1,
+            page=int(title_block[0].row.page),
             geometry=_union_rect_geometry(title_block, meta={"zone": "title_block"}),
             label="Title block",
         )
@@ -393,7 +374,7 @@ def _build_hybrid_regions(
             session,
             drawing_id,
             legend_block,
-            page=1,
+            page=int(legend_block[0].row.page),
             geometry=_union_rect_geometry(legend_block, meta={"zone": "legend_block"}),
             label="Legend",
         )
@@ -413,9 +394,19 @@ def _build_hybrid_regions(
 def build_auto_regions_from_text_elements(
     session: Session,
     drawing_id: int,
+    elements: Sequence[TextElementRecord] | None = None,
 ) -> int:
-    """Build auto-generated drawing regions using the configured strategy."""
-    indexed = _load_indexed_elements(session, drawing_id)
+    """
+    Build auto-generated drawing regions using the configured strategy.
+
+    ``elements`` are the records the index run just wrote (insertion order); without them
+    the drawing's text elements are loaded from the database.
+    """
+    if elements is None:
+        indexed = _load_indexed_elements(session, drawing_id)
+    else:
+        # Stable sort keeps insertion (= id) order within a page, like the query.
+        indexed = _indexed_elements(sorted(elements, key=lambda record: record.page))
     mode = settings.drawing_index_auto_region_mode
 
     if mode == "grid":
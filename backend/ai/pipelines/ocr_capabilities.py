@@ -0,0 +1,200 @@
+"""
+Process-level registry of which OCR backends this process can use.
+
+``tesseract_is_available`` used to call ``pytesseract.get_tesseract_version()`` (a
+``tesseract --version`` subprocess) on every ``ocr_image`` call in ``auto`` mode, again
+inside ``ocr_image_tesseract``, and on every ``/health`` probe — two extra processes per
+OCR'd page. :class:`OcrCapabilityRegistry` probes once and trusts the answer for
+``OCR_CAPABILITY_TTL_SECONDS`` (an installed or removed binary is picked up on the next
+probe after that). It also caches the ``TESSERACT_CMD`` → ``pytesseract`` wiring and the
+OpenAI-key check, and counts probes vs. cache hits for the health endpoint.
+
+Each process (including spawned OCR pool workers) has its own registry.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TesseractProbe:
+    """Result of one Tesseract probe."""
+
+    available: bool
+    version: str | None
+    cmd: str
+
+
+def _configured_tesseract_cmd() -> str | None:
+    try:
+        from config import settings
+    except ImportError:
+        return None
+    return settings.tesseract_cmd
+
+
+def _apply_tesseract_cmd(cmd: str | None) -> None:
+    """Point pytesseract at ``TESSERACT_CMD`` when one is configured."""
+    if not cmd:
+        return
+    try:
+        import pytesseract
+    except ImportError:
+        return
+    pytesseract.pytesseract.tesseract_cmd = cmd
+
+
+def probe_tesseract() -> TesseractProbe:
+    """Uncached check: pytesseract importable and the tesseract binary runs (or is on PATH)."""
+    configured = _configured_tesseract_cmd()
+    cmd = configured or "tesseract"
+    try:
+        import pytesseract
+    except ImportError:
+        return TesseractProbe(available=False, version=None, cmd=cmd)
+
+    _apply_tesseract_cmd(configured)
+
+    try:
+        version = pytesseract.get_tesseract_version()
+        return TesseractProbe(available=True, version=str(version), cmd=cmd)
+    except Exception:
+        pass
+
+    return TesseractProbe(available=shutil.which(cmd) is not None, version=None, cmd=cmd)
+
+
+def probe_openai_vision() -> bool:
+    try:
+        from config import settings
+    except ImportError:
+        return False
+    return bool(getattr(settings, "openai_api_key", None))
+
+
+def _default_ttl_seconds() -> float:
+    try:
+        from config import settings
+    except ImportError:
+        return 300.0
+    return float(settings.ocr_capability_ttl_seconds)
+
+
+class OcrCapabilityRegistry:
+    """TTL cache over :func:`probe_tesseract`, :func:`probe_openai_vision` and the cmd wiring."""
+
+    def __init__(self, ttl_seconds: float | None = None) -> None:
+        """``ttl_seconds`` ``None`` reads ``OCR_CAPABILITY_TTL_SECONDS``; ``<= 0`` never re-probes."""
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._tesseract: TesseractProbe | None = None
+        self._tesseract_probed_at = 0.0
+        self._openai_vision: bool | None = None
+        self._openai_vision_probed_at = 0.0
+        self._applied_cmd: str | None = None
+        self.tesseract_probes = 0
+        self.openai_vision_probes = 0
+        self.hits = 0
+
+    def _ttl(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else _default_ttl_seconds()
+
+    def _fresh(self, probed_at: float, now: float) -> bool:
+        ttl = self._ttl()
+        return ttl <= 0 or now - probed_at < ttl
+
+    def tesseract(self) -> TesseractProbe:
+        now = time.monotonic()
+        with self._lock:
+            if self._tesseract is not None and self._fresh(self._tesseract_probed_at, now):
+                self.hits += 1
+                return self._tesseract
+            # Probe under the lock: concurrent OCR threads wait for one subprocess
+            # instead of each starting their own.
+            probe = probe_tesseract()
+            self._tesseract = probe
+            self._tesseract_probed_at = time.monotonic()
+            self._applied_cmd = _configured_tesseract_cmd()
+            self.tesseract_probes += 1
+        logger.info(
+            "ocr_tesseract_probed",
+            extra={"tesseract_available": probe.available, "tesseract_version": probe.version},
+        )
+        return probe
+
+    def tesseract_available(self) -> bool:
+        return self.tesseract().available
+
+    def configure_tesseract_cmd(self) -> None:
+        """Apply ``TESSERACT_CMD`` to pytesseract unless this process already did."""
+        cmd = _configured_tesseract_cmd()
+        with self._lock:
+            if self._applied_cmd == cmd:
+                return
+            _apply_tesseract_cmd(cmd)
+            self._applied_cmd = cmd
+
+    def openai_vision_available(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._openai_vision is not None and self._fresh(
+                self._openai_vision_probed_at, now
+            ):
+                self.hits += 1
+                return self._openai_vision
+            self._openai_vision = probe_openai_vision()
+            self._openai_vision_probed_at = now
+            self.openai_vision_probes += 1
+            return self._openai_vision
+
+    def refresh(self) -> None:
+        """Forget cached probes; the next lookup probes again."""
+        with self._lock:
+            self._tesseract = None
+            self._openai_vision = None
+            self._applied_cmd = None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Cached availability plus probe/hit counters, for ``/health``.
+
+        Never probes: an availability is ``None`` until OCR (or startup) first asks for it.
+        """
+        with self._lock:
+            return {
+                "tesseract_available": (
+                    self._tesseract.available if self._tesseract is not None else None
+                ),
+                "openai_vision_available": self._openai_vision,
+                "tesseract_probes": self.tesseract_probes,
+                "openai_vision_probes": self.openai_vision_probes,
+                "hits": self.hits,
+            }
+
+
+_registry: OcrCapabilityRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_ocr_capabilities() -> OcrCapabilityRegistry:
+    """Process-wide registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = OcrCapabilityRegistry()
+        return _registry
+
+
+def reset_ocr_capabilities() -> None:
+    """Drop the process registry (tests, or after changing ``TESSERACT_CMD`` at runtime)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
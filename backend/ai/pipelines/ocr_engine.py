@@ -2,21 +2,33 @@
 OCR backends for scanned evidence: Tesseract (positioned words) and OpenAI
 vision (plain text → synthetic word boxes). PDF pages are rasterized in-process
 via PyMuPDF — no poppler/pdf2image dependency.
+
+Multi-page scanned PDFs go through :func:`ocr_pdf_pages`: the document is opened once
+(per worker process), each page's pixmap samples are wrapped as a PIL image directly
+(no PNG encode/decode), and pages fan out to a process pool of ``OCR_WORKERS``. Pages
+that already have a render at the OCR DPI (drawing renditions) are read from that image
+instead of being rasterized again.
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
-import shutil
+import multiprocessing
+import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Mapping, Sequence
 
 import fitz  # PyMuPDF
 
 from ai.pipelines.document_text_extraction import BoundingBox, PositionedWord
+from ai.pipelines.ocr_capabilities import get_ocr_capabilities
 from ai.pipelines.openai_vision import extract_plain_text_from_image
+from services.job_execution import reserve_pool_workers
 
 logger = logging.getLogger(__name__)
 
@@ -24,41 +36,21 @@ OcrBackend = Literal["auto", "tesseract", "openai_vision"]
 
 _DEFAULT_DPI = 200
 _SYNTHETIC_OCR_CONFIDENCE = 0.75
+#: Below this many pages the pool start-up costs more than it saves.
+OCR_PARALLEL_MIN_PAGES = 4
 
 
 def tesseract_is_available() -> bool:
-    """Return True when pytesseract is importable and the tesseract binary runs."""
-    try:
-        import pytesseract
-    except ImportError:
-        return False
-
-    _configure_tesseract_cmd()
-
-    try:
-        pytesseract.get_tesseract_version()
-        return True
-    except Exception:
-        pass
-
-    try:
-        from config import settings
-    except ImportError:
-        return shutil.which("tesseract") is not None
+    """Return True when pytesseract is importable and the tesseract binary runs.
 
-    cmd = settings.tesseract_cmd or "tesseract"
-    return shutil.which(cmd) is not None
+    Answered from the process :class:`OcrCapabilityRegistry`; the binary is probed at
+    most once per ``OCR_CAPABILITY_TTL_SECONDS``.
+    """
+    return get_ocr_capabilities().tesseract_available()
 
 
 def _configure_tesseract_cmd() -> None:
-    try:
-        from config import settings
-        import pytesseract
-    except ImportError:
-        return
-
-    if settings.tesseract_cmd:
-        pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
+    get_ocr_capabilities().configure_tesseract_cmd()
 
 
 def _resolve_backend(backend: OcrBackend | None) -> OcrBackend:
@@ -72,20 +64,20 @@ def _resolve_backend(backend: OcrBackend | None) -> OcrBackend:
 
 
 def _openai_vision_is_available() -> bool:
-    try:
-        from config import settings
-    except ImportError:
-        return False
-    return bool(getattr(settings, "openai_api_key", None))
+    return get_ocr_capabilities().openai_vision_available()
 
 
 def _load_pil_image(
     *,
     file_path: str | Path | None = None,
     image_bytes: bytes | None = None,
+    image=None,
 ):
     from PIL import Image
 
+    if image is not None:
+        # Caller owns an in-memory image (e.g. a pixmap wrapper); do not close it here.
+        return contextlib.nullcontext(image)
     if image_bytes is not None:
         return Image.open(BytesIO(image_bytes))
     if file_path is not None:
@@ -93,6 +85,12 @@ def _load_pil_image(
     raise ValueError("Provide file_path or image_bytes")
 
 
+def _png_bytes(image) -> bytes:
+    buf = BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
 def _plain_text_to_positioned_words(
     text: str,
     *,
@@ -143,6 +141,7 @@ def ocr_image_tesseract(
     *,
     file_path: str | Path | None = None,
     image_bytes: bytes | None = None,
+    image=None,
     page_index: int = 0,
 ) -> tuple[list[PositionedWord], float, float]:
     """Run Tesseract ``image_to_data`` and map rows into ``PositionedWord`` list."""
@@ -153,9 +152,9 @@ def ocr_image_tesseract(
 
     _configure_tesseract_cmd()
 
-    with _load_pil_image(file_path=file_path, image_bytes=image_bytes) as image:
-        page_width, page_height = float(image.width), float(image.height)
-        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+    with _load_pil_image(file_path=file_path, image_bytes=image_bytes, image=image) as pil_image:
+        page_width, page_height = float(pil_image.width), float(pil_image.height)
+        data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
 
     words: list[PositionedWord] = []
     count = len(data.get("text", []))
@@ -197,11 +196,15 @@ def ocr_image_openai_vision(
     *,
     file_path: str | Path | None = None,
     image_bytes: bytes | None = None,
+    image=None,
     page_index: int = 0,
 ) -> tuple[list[PositionedWord], float, float]:
     """Use OpenAI vision OCR and synthesize approximate word positions."""
-    with _load_pil_image(file_path=file_path, image_bytes=image_bytes) as image:
-        page_width, page_height = float(image.width), float(image.height)
+    with _load_pil_image(file_path=file_path, image_bytes=image_bytes, image=image) as pil_image:
+        page_width, page_height = float(pil_image.width), float(pil_image.height)
+        if file_path is None and image_bytes is None:
+            # The vision API takes an encoded image.
+            image_bytes = _png_bytes(pil_image)
 
     plain_text = extract_plain_text_from_image(
         file_path=file_path,
@@ -220,16 +223,17 @@ def ocr_image(
     file_path: str | Path | None = None,
     *,
     image_bytes: bytes | None = None,
+    image=None,
     page_index: int = 0,
     backend: OcrBackend | None = None,
 ) -> tuple[list[PositionedWord], float, float]:
     """
     Dispatch OCR to the configured backend.
 
-    ``auto`` tries Tesseract first, then falls back to OpenAI vision when
-    Tesseract is missing or raises.
+    ``image`` is an already-decoded PIL image (used for PDF pixmaps). ``auto`` tries
+    Tesseract first, then falls back to OpenAI vision when Tesseract is missing or raises.
     """
-    if file_path is None and image_bytes is None:
+    if file_path is None and image_bytes is None and image is None:
         raise ValueError("Provide file_path or image_bytes")
 
     mode = _resolve_backend(backend)
@@ -238,6 +242,7 @@ def ocr_image(
         return ocr_image_tesseract(
             file_path=file_path,
             image_bytes=image_bytes,
+            image=image,
             page_index=page_index,
         )
 
@@ -247,6 +252,7 @@ def ocr_image(
         return ocr_image_openai_vision(
             file_path=file_path,
             image_bytes=image_bytes,
+            image=image,
             page_index=page_index,
         )
 
@@ -256,6 +262,7 @@ def ocr_image(
             return ocr_image_tesseract(
                 file_path=file_path,
                 image_bytes=image_bytes,
+                image=image,
                 page_index=page_index,
             )
         except Exception as exc:
@@ -265,6 +272,7 @@ def ocr_image(
         return ocr_image_openai_vision(
             file_path=file_path,
             image_bytes=image_bytes,
+            image=image,
             page_index=page_index,
         )
 
@@ -367,3 +375,192 @@ def ocr_pdf_page_in_memory(
         for w in words
     ]
     return fixed_words, page_width, page_height
+
+
+# ---------------------------------------------------------------------------
+# Batch OCR for multi-page PDFs
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PageRaster:
+    """Raw pixmap samples for one rendered PDF page (no encoded image in between)."""
+
+    page_index: int
+    width: int
+    height: int
+    mode: str
+    samples: bytes
+
+    def to_pil(self):
+        from PIL import Image
+
+        return Image.frombytes(self.mode, (self.width, self.height), self.samples)
+
+
+def render_pdf_page_raster(
+    doc: fitz.Document,
+    page_index: int,
+    *,
+    dpi: int = _DEFAULT_DPI,
+) -> PageRaster:
+    """Render one page of an open document to raw RGB / grayscale samples."""
+    if page_index < 0 or page_index >= doc.page_count:
+        raise IndexError(f"page_index {page_index} out of range (pages={doc.page_count})")
+    zoom = dpi / 72.0
+    pixmap = doc.load_page(page_index).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return PageRaster(
+        page_index=page_index,
+        width=pixmap.width,
+        height=pixmap.height,
+        mode="L" if pixmap.n == 1 else "RGB",
+        samples=bytes(pixmap.samples),
+    )
+
+
+def load_page_raster(image_path: str | Path, page_index: int) -> PageRaster:
+    """Read an already-rendered page image (e.g. a ``DrawingRendition`` PNG) as a raster."""
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        mode = "L" if image.mode == "L" else "RGB"
+        converted = image.convert(mode)
+        return PageRaster(
+            page_index=page_index,
+            width=converted.width,
+            height=converted.height,
+            mode=mode,
+            samples=converted.tobytes(),
+        )
+
+
+def ocr_page_raster(
+    raster: PageRaster,
+    *,
+    backend: OcrBackend | None = None,
+) -> tuple[list[PositionedWord], float, float]:
+    """OCR a rendered page; words carry the pixmap size, as ``ocr_pdf_page_in_memory`` does."""
+    page_width, page_height = float(raster.width), float(raster.height)
+    words, _, _ = ocr_image(
+        image=raster.to_pil(),
+        page_index=raster.page_index,
+        backend=backend,
+    )
+    fixed_words = [
+        PositionedWord(
+            text=w.text,
+            bbox=BoundingBox(
+                x=w.bbox.x,
+                y=w.bbox.y,
+                width=w.bbox.width,
+                height=w.bbox.height,
+                page_width=page_width,
+                page_height=page_height,
+            ),
+            page_index=w.page_index,
+            ocr_confidence=w.ocr_confidence,
+        )
+        for w in words
+    ]
+    return fixed_words, page_width, page_height
+
+
+def ocr_worker_count(page_count: int) -> int:
+    """Processes to OCR ``page_count`` pages with (1 = serial, in-process)."""
+    if page_count < OCR_PARALLEL_MIN_PAGES:
+        return 1
+    try:
+        from config import settings
+
+        configured = int(settings.ocr_workers)
+    except ImportError:
+        configured = 0
+    workers = configured if configured > 0 else (os.cpu_count() or 1)
+    return max(1, min(workers, page_count))
+
+
+# Per-process document opened by the pool initializer (one ``fitz.Document`` per worker).
+_worker_doc: fitz.Document | None = None
+
+
+def _open_worker_doc(source_path: str) -> None:
+    global _worker_doc
+    _worker_doc = fitz.open(source_path)
+
+
+def _page_raster(
+    doc: fitz.Document | None,
+    page_index: int,
+    dpi: int,
+    image_path: str | None,
+) -> PageRaster:
+    if image_path is not None:
+        return load_page_raster(image_path, page_index)
+    if doc is None:
+        raise RuntimeError("OCR worker document not initialized")
+    return render_pdf_page_raster(doc, page_index, dpi=dpi)
+
+
+def _ocr_page_in_worker(
+    page_index: int, dpi: int, backend: OcrBackend, image_path: str | None
+) -> tuple[list[PositionedWord], float, float]:
+    return ocr_page_raster(_page_raster(_worker_doc, page_index, dpi, image_path), backend=backend)
+
+
+def ocr_pdf_pages(
+    file_path: str | Path,
+    page_indexes: Sequence[int],
+    *,
+    dpi: int = _DEFAULT_DPI,
+    backend: OcrBackend | None = None,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+) -> list[tuple[list[PositionedWord], float, float]]:
+    """
+    OCR ``page_indexes`` of a PDF; results are returned in ``page_indexes`` order.
+
+    ``rendered_pages`` maps a page index to an image already rasterized at ``dpi`` (the
+    drawing's render PNG); those pages are OCR'd from the image instead of re-rendered.
+
+    Serial runs open the document once in-process. Larger batches use a ``spawn`` process
+    pool (:func:`ocr_worker_count`, capped by ``reserve_pool_workers``) whose workers each
+    open the document once; inside a CPU job process the pages are OCR'd inline.
+    """
+    pages = list(page_indexes)
+    if not pages:
+        return []
+    # Resolve in the parent: spawned workers do not see runtime settings overrides.
+    mode = _resolve_backend(backend)
+    image_paths = [
+        str(rendered_pages[page_index])
+        if rendered_pages and page_index in rendered_pages
+        else None
+        for page_index in pages
+    ]
+
+    with reserve_pool_workers(ocr_worker_count(len(pages))) as workers:
+        if workers == 1:
+            doc = fitz.open(str(file_path)) if None in image_paths else None
+            try:
+                return [
+                    ocr_page_raster(_page_raster(doc, page_index, dpi, image_path), backend=mode)
+                    for page_index, image_path in zip(pages, image_paths)
+                ]
+            finally:
+                if doc is not None:
+                    doc.close()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_open_worker_doc,
+            initargs=(str(file_path),),
+        ) as pool:
+            return list(
+                pool.map(
+                    _ocr_page_in_worker,
+                    pages,
+                    [dpi] * len(pages),
+                    [mode] * len(pages),
+                    image_paths,
+                )
+            )
@@ -12,6 +12,8 @@ import base64
 import logging
 from pathlib import Path
 
+from ai.llm_client import chat_completion, get_openai_client
+
 logger = logging.getLogger(__name__)
 
 OCR_PROMPT = """Extract all readable text from this image exactly as it appears.
@@ -68,16 +70,15 @@ def _vision_chat_completion(
 ) -> str:
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return ""
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return ""
 
-    client = OpenAI(api_key=settings.openai_api_key)
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="vision",
             model=settings.openai_vision_model,
             messages=[
                 {
@@ -2,10 +2,14 @@
 
 Phase 4: external URL fetch wired via services.safe_url_fetch.
 See Notes/Cursor Implementation Plan (Phase 0) for v1 limits.
+
+Allowed external links (up to ``PDF_LINK_FOLLOW_MAX_EXTERNAL``) are fetched concurrently
+on the shared link-fetch event loop; results are merged in link order.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
@@ -20,8 +24,10 @@ from ai.pipelines.linked_attachment_merge import (
 from config import settings
 from services.procore_url_parser import build_procore_cross_ref, parse_procore_url
 from services.safe_url_fetch import (
-    fetch_url_attachment_with_error,
+    UrlAttachmentFetch,
+    fetch_url_attachment_async,
     is_allowed_external_url,
+    run_link_fetch,
 )
 
 MAX_SUPPLEMENTAL_TEXT_CHARS = 2_000_000
@@ -165,7 +171,7 @@ def _follow_links(file_path: Path, links: list[PdfHyperlink]) -> LinkFollowResul
     external_links = [
         link for link in links if link.kind == PdfLinkKind.EXTERNAL_URI and link.uri
     ]
-    external_fetches = 0
+    to_fetch: list[PdfHyperlink] = []
     for link in external_links:
         uri = link.uri
         if not uri:
@@ -173,12 +179,19 @@ def _follow_links(file_path: Path, links: list[PdfHyperlink]) -> LinkFollowResul
         if not is_allowed_external_url(uri):
             result.skipped_count += 1
             continue
-        if external_fetches >= settings.pdf_link_follow_max_external:
+        if len(to_fetch) >= settings.pdf_link_follow_max_external:
+            result.skipped_count += 1
+            continue
+        to_fetch.append(link)
+
+    fetch_results = run_link_fetch(_fetch_external_links(to_fetch)) if to_fetch else []
+    for link, fetched in zip(to_fetch, fetch_results):
+        uri = link.uri or ""
+        if isinstance(fetched, BaseException):
+            result.errors.append(str(fetched))
             result.skipped_count += 1
             continue
         try:
-            fetched = fetch_url_attachment_with_error(uri)
-            external_fetches += 1
             if fetched.text.strip():
                 word_count = len(fetched.text.split())
                 attachments.append(
@@ -195,7 +208,7 @@ def _follow_links(file_path: Path, links: list[PdfHyperlink]) -> LinkFollowResul
                     extra={
                         "pages": fetched.pages,
                         "words": word_count,
-                        "filename": fetched.filename,
+                        "attachment": fetched.filename,
                     },
                 )
                 result.followed_count += 1
@@ -241,6 +254,16 @@ def _follow_links(file_path: Path, links: list[PdfHyperlink]) -> LinkFollowResul
     return result
 
 
+async def _fetch_external_links(
+    links: list[PdfHyperlink],
+) -> list[UrlAttachmentFetch | BaseException]:
+    """Fetch ``links`` concurrently; callers cap them at ``PDF_LINK_FOLLOW_MAX_EXTERNAL``."""
+    return await asyncio.gather(
+        *(fetch_url_attachment_async(link.uri or "") for link in links),
+        return_exceptions=True,
+    )
+
+
 def _collect_internal_attachments(
     doc: fitz.Document,
     internal_links: list[PdfHyperlink],
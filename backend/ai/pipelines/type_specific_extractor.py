@@ -5,14 +5,13 @@ Validation failures route to review queue instead of crashing or silently storin
 
 from __future__ import annotations
 
-import json
 import logging
-import re
 from typing import Any
 
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from ai.llm_client import chat_completion, get_openai_client, json_object_from_reply
 from ai.schemas.document_extraction_schemas import (
     DocumentType,
     FieldPhotoFields,
@@ -26,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 TypeSpecificFields = InspectionReportFields | FieldPhotoFields | MasterDrawingFields
 
+#: Bump when any ``TYPE_SPECIFIC_PROMPTS`` entry changes so cached responses are not reused.
+TYPE_SPECIFIC_PROMPT_VERSION = 1
+
 TYPE_SPECIFIC_PROMPTS = {
     DocumentType.INSPECTION_REPORT: """
 Extract:
@@ -62,7 +64,6 @@ Return JSON only.
 """,
 }
 
-_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
 
 
 def extract_type_specific_fields(
@@ -100,24 +101,10 @@ def extract_type_specific_fields(
 
 
 def _parse_extraction_payload(content: str) -> dict[str, Any]:
-    trimmed = (content or "").strip()
-    if not trimmed:
+    parsed = json_object_from_reply(content)
+    if parsed is None:
         return {}
-
-    candidates = [trimmed]
-    block_match = _JSON_BLOCK_RE.search(trimmed)
-    if block_match:
-        candidates.insert(0, block_match.group(1))
-
-    for candidate in candidates:
-        try:
-            parsed = json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
-            return parsed
-
-    return {}
+    return parsed
 
 
 def _call_extraction_llm(content: str, prompt: str) -> dict[str, Any]:
@@ -129,31 +116,34 @@ def _call_extraction_llm(content: str, prompt: str) -> dict[str, Any]:
     """
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return {}
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return {}
 
     preview = (content or "").strip()
     if not preview:
         return {}
 
-    client = OpenAI(api_key=settings.openai_api_key)
     full_prompt = (
         f"{prompt.strip()}\n\n"
         f"Document content or description:\n{preview[:4000]}"
     )
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="type_specific",
+            prompt_version=TYPE_SPECIFIC_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": full_prompt}],
             max_tokens=512,
         )
         message = (resp.choices[0].message.content or "").strip()
-        return _parse_extraction_payload(message)
+        payload = _parse_extraction_payload(message)
+        if json_object_from_reply(message) is not None:
+            resp.remember()
+        return payload
     except Exception as exc:
         logger.warning("type_specific_extractor_llm_failed", extra={"error": str(exc)})
         return {}
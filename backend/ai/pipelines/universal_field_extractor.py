@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import re
 from typing import Any
 
+from ai.llm_client import chat_completion, get_openai_client, json_object_from_reply
 from ai.schemas.document_extraction_schemas import UniversalFields
 
 logger = logging.getLogger(__name__)
 
+#: Bump when ``UNIVERSAL_EXTRACTION_PROMPT`` changes so cached responses are not reused.
+UNIVERSAL_EXTRACTION_PROMPT_VERSION = 1
+
 UNIVERSAL_EXTRACTION_PROMPT = """
 Extract these fields if present in the document:
 
@@ -45,11 +47,20 @@ _UNIVERSAL_FIELD_KEYS = (
     "contractor",
     "document_title",
 )
-_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
 
 
 def extract_universal_fields(document_text_or_description: str) -> UniversalFields:
-    raw = _call_extraction_llm(document_text_or_description)
+    return universal_fields_from_payload(_call_extraction_llm(document_text_or_description))
+
+
+def universal_fields_from_payload(
+    raw: dict[str, Any],
+    *,
+    sanitize: bool = False,
+) -> UniversalFields:
+    """Validate a universal-fields payload (``sanitize`` for raw model JSON)."""
+    if sanitize:
+        raw = _sanitize_universal_fields_dict(raw)
     try:
         return UniversalFields(**raw)
     except Exception as exc:
@@ -65,24 +76,10 @@ def _empty_universal_fields_dict() -> dict[str, None]:
 
 
 def _parse_extraction_payload(content: str) -> dict[str, Any]:
-    trimmed = (content or "").strip()
-    if not trimmed:
+    parsed = json_object_from_reply(content)
+    if parsed is None:
         return _empty_universal_fields_dict()
-
-    candidates = [trimmed]
-    block_match = _JSON_BLOCK_RE.search(trimmed)
-    if block_match:
-        candidates.insert(0, block_match.group(1))
-
-    for candidate in candidates:
-        try:
-            parsed = json.loads(candidate)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
-            return _sanitize_universal_fields_dict(parsed)
-
-    return _empty_universal_fields_dict()
+    return _sanitize_universal_fields_dict(parsed)
 
 
 def _coerce_optional_str(value: Any) -> str | None:
@@ -110,31 +107,34 @@ def _call_extraction_llm(content: str) -> dict[str, Any]:
     """
     try:
         from config import settings
-        from openai import OpenAI
     except ImportError:
         return _empty_universal_fields_dict()
 
-    if not getattr(settings, "openai_api_key", None):
+    if get_openai_client() is None:
         return _empty_universal_fields_dict()
 
     preview = (content or "").strip()
     if not preview:
         return _empty_universal_fields_dict()
 
-    client = OpenAI(api_key=settings.openai_api_key)
     prompt = (
         f"{UNIVERSAL_EXTRACTION_PROMPT.strip()}\n\n"
         f"Document content or description:\n{preview[:4000]}"
     )
 
     try:
-        resp = client.chat.completions.create(
+        resp = chat_completion(
+            stage="universal",
+            prompt_version=UNIVERSAL_EXTRACTION_PROMPT_VERSION,
             model=settings.openai_chat_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=256,
         )
         message = (resp.choices[0].message.content or "").strip()
-        return _parse_extraction_payload(message)
+        payload = _parse_extraction_payload(message)
+        if json_object_from_reply(message) is not None:
+            resp.remember()
+        return payload
     except Exception as exc:
         logger.warning("universal_field_extractor_llm_failed", extra={"error": str(exc)})
         return _empty_universal_fields_dict()
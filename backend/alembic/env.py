@@ -17,6 +17,11 @@ import models.document_clue  # noqa: F401
 import models.drawing_match_candidate  # noqa: F401
 import models.drawing_text_element  # noqa: F401
 import models.legend_reference  # noqa: F401
+import models.ocr_result  # noqa: F401
+import models.llm_response  # noqa: F401
+import models.linked_url_fetch  # noqa: F401
+import models.procore_sync_cursor  # noqa: F401
+import models.drawing_spatial_index  # noqa: F401
 import models.models  # noqa: F401 — register ORM tables on Base.metadata
 
 
@@ -0,0 +1,35 @@
+"""add evidence_records extraction status columns
+
+Revision ID: e7v1x2t3r4c5
+Revises: o6c1r2s3t4o5
+Create Date: 2026-10-16
+
+Tracks the queued ``evidence_extract`` job (pending / processing / ready / failed) so
+uploads return before text extraction, OCR and link following run.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e7v1x2t3r4c5"
+down_revision = "o6c1r2s3t4o5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "evidence_records",
+        sa.Column("extraction_status", sa.String(length=50), nullable=True),
+    )
+    op.add_column(
+        "evidence_records",
+        sa.Column("extraction_error", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("evidence_records", "extraction_error")
+    op.drop_column("evidence_records", "extraction_status")
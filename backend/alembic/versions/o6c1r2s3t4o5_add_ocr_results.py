@@ -0,0 +1,54 @@
+"""add ocr_results durable OCR store
+
+Revision ID: o6c1r2s3t4o5
+Revises: g1l2m3a4b5e6
+Create Date: 2026-10-16
+
+Per-page OCR words keyed by file checksum, OCR backend and raster DPI so identical
+files are never OCR'd twice.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "o6c1r2s3t4o5"
+down_revision = "g1l2m3a4b5e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ocr_results",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("checksum", sa.String(length=64), nullable=False),
+        sa.Column("ocr_backend", sa.String(), nullable=False),
+        sa.Column("dpi", sa.Integer(), nullable=False),
+        sa.Column("page_index", sa.Integer(), nullable=False),
+        sa.Column("page_count", sa.Integer(), nullable=False),
+        sa.Column("source_format", sa.String(), nullable=False),
+        sa.Column("page_width", sa.Float(), nullable=True),
+        sa.Column("page_height", sa.Float(), nullable=True),
+        sa.Column("words_json", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.UniqueConstraint(
+            "checksum",
+            "ocr_backend",
+            "dpi",
+            "page_index",
+            name="uq_ocr_results_checksum_backend_dpi_page",
+        ),
+    )
+    op.create_index("ix_ocr_results_checksum", "ocr_results", ["checksum"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ocr_results_checksum", table_name="ocr_results")
+    op.drop_table("ocr_results")
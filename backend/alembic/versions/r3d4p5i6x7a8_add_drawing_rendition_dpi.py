@@ -0,0 +1,38 @@
+"""add drawing_renditions.dpi
+
+Revision ID: r3d4p5i6x7a8
+Revises: e7v1x2t3r4c5
+Create Date: 2026-10-16
+
+Raster DPI of PDF page renditions so master-drawing indexing can OCR the stored PNG
+instead of rasterizing the page again. Existing PDF renditions were all rendered at
+200 DPI; copied image renditions stay NULL.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "r3d4p5i6x7a8"
+down_revision = "e7v1x2t3r4c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("drawing_renditions", sa.Column("dpi", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE drawing_renditions
+        SET dpi = 200
+        WHERE drawing_id IN (
+            SELECT id FROM drawings
+            WHERE content_type = 'application/pdf' OR lower(storage_key) LIKE '%.pdf'
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("drawing_renditions", "dpi")
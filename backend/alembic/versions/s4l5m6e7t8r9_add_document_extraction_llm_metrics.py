@@ -0,0 +1,30 @@
+"""add document_extractions.llm_metrics_json
+
+Revision ID: s4l5m6e7t8r9
+Revises: r3d4p5i6x7a8
+Create Date: 2026-10-16
+
+Per-stage LLM latency and token usage recorded by the document extraction
+orchestrator. Existing rows stay NULL.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "s4l5m6e7t8r9"
+down_revision = "r3d4p5i6x7a8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_extractions",
+        sa.Column("llm_metrics_json", sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("document_extractions", "llm_metrics_json")
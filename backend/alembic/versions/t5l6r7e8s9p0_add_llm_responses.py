@@ -0,0 +1,54 @@
+"""add llm_responses durable chat-completion cache
+
+Revision ID: t5l6r7e8s9p0
+Revises: s4l5m6e7t8r9
+Create Date: 2026-10-16
+
+Chat completions keyed by model, stage, prompt template version and request content so
+retries, reprocessing and inspection replays do not call the model again.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "t5l6r7e8s9p0"
+down_revision = "s4l5m6e7t8r9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_responses",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("prompt_version", sa.Integer(), nullable=False),
+        sa.Column("response_text", sa.Text(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completion_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_tokens", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column(
+            "last_hit_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.UniqueConstraint("cache_key", name="uq_llm_responses_cache_key"),
+    )
+    op.create_index("ix_llm_responses_last_hit_at", "llm_responses", ["last_hit_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_responses_last_hit_at", table_name="llm_responses")
+    op.drop_table("llm_responses")
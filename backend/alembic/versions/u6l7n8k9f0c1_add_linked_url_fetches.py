@@ -0,0 +1,50 @@
+"""add linked_url_fetches conditional-GET cache
+
+Revision ID: u6l7n8k9f0c1
+Revises: t5l6r7e8s9p0
+Create Date: 2026-10-16
+
+Text of followed PDF hyperlinks plus their ETag / Last-Modified so repeated links are
+revalidated with a conditional GET instead of downloaded and OCR'd again.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "u6l7n8k9f0c1"
+down_revision = "t5l6r7e8s9p0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "linked_url_fetches",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("url_hash", sa.String(length=64), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("pages", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column(
+            "validated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.UniqueConstraint("url_hash", name="uq_linked_url_fetches_url_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("linked_url_fetches")
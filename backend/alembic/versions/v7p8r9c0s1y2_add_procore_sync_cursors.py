@@ -0,0 +1,54 @@
+"""add procore_sync_cursors for incremental Procore list sync
+
+Revision ID: v7p8r9c0s1y2
+Revises: u6l7n8k9f0c1
+Create Date: 2026-10-17
+
+Newest ``updated_at`` synced per project and Procore resource, so RFI ingestion only asks
+Procore for records changed since the last sync.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "v7p8r9c0s1y2"
+down_revision = "u6l7n8k9f0c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "procore_sync_cursors",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "project_id",
+            sa.Integer(),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("resource", sa.String(length=50), nullable=False),
+        sa.Column("cursor_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "synced_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.UniqueConstraint(
+            "project_id", "resource", name="uq_procore_sync_cursors_project_resource"
+        ),
+    )
+    # Bulk RFI upserts look up existing rows by (project_id, type, source_id).
+    op.create_index(
+        "ix_evidence_records_project_type_source",
+        "evidence_records",
+        ["project_id", "type", "source_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_records_project_type_source", table_name="evidence_records")
+    op.drop_table("procore_sync_cursors")
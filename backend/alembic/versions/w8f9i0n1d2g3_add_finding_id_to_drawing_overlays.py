@@ -0,0 +1,63 @@
+"""add finding_id to drawing_overlays
+
+Revision ID: w8f9i0n1d2g3
+Revises: v7p8r9c0s1y2
+Create Date: 2026-10-17
+
+Indexed link from an overlay to the finding created for it. The link previously lived only
+in ``meta["finding_id"]``, so resolving a finding's workspace link loaded every overlay on
+the master drawing. Existing rows are backfilled from that key; values that are not an
+integer or point at a deleted finding stay NULL.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "w8f9i0n1d2g3"
+down_revision = "v7p8r9c0s1y2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "drawing_overlays",
+        sa.Column("finding_id", sa.Integer(), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_drawing_overlays_finding_id_findings",
+        "drawing_overlays",
+        "findings",
+        ["finding_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE drawing_overlays AS o
+            SET finding_id = f.id
+            FROM findings AS f
+            WHERE o.finding_id IS NULL
+              AND (o.meta ->> 'finding_id') ~ '^[0-9]+$'
+              AND f.id = (o.meta ->> 'finding_id')::integer
+            """
+        )
+    )
+    op.create_index(
+        "ix_drawing_overlays_finding_id",
+        "drawing_overlays",
+        ["finding_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_drawing_overlays_finding_id", table_name="drawing_overlays")
+    op.drop_constraint(
+        "fk_drawing_overlays_finding_id_findings",
+        "drawing_overlays",
+        type_="foreignkey",
+    )
+    op.drop_column("drawing_overlays", "finding_id")
@@ -0,0 +1,54 @@
+"""add drawing_spatial_indexes for viewport queries
+
+Revision ID: x9s0p1a2t3i4
+Revises: w8f9i0n1d2g3
+Create Date: 2026-10-17
+
+Per drawing page and kind (text elements, regions, survey points, landmarks), the
+normalized boxes behind the in-process grid index that answers "what is inside this
+rectangle" for the viewer and the text-elements ``bbox`` query.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "x9s0p1a2t3i4"
+down_revision = "w8f9i0n1d2g3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "drawing_spatial_indexes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "drawing_id",
+            sa.Integer(),
+            sa.ForeignKey("drawings.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("page", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("grid_size", sa.Integer(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("entries_json", sa.JSON(), nullable=False),
+        sa.Column(
+            "built_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.UniqueConstraint(
+            "drawing_id",
+            "page",
+            "kind",
+            name="uq_drawing_spatial_indexes_drawing_page_kind",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("drawing_spatial_indexes")
@@ -0,0 +1,38 @@
+"""add drawings.index_version for candidate tile caching
+
+Revision ID: y0t1c2a3c4h5
+Revises: x9s0p1a2t3i4
+Create Date: 2026-10-17
+
+Counter bumped in the same transaction as any change to a drawing's indexed text
+elements or regions (index clear/re-index, region CRUD). Prepared candidate tile pages
+are cached under it, so every process sees a reindex as a cache miss.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+revision = "y0t1c2a3c4h5"
+down_revision = "x9s0p1a2t3i4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    columns = {col["name"] for col in inspect(bind).get_columns("drawings")}
+    if "index_version" not in columns:
+        op.add_column(
+            "drawings",
+            sa.Column("index_version", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    columns = {col["name"] for col in inspect(bind).get_columns("drawings")}
+    if "index_version" in columns:
+        op.drop_column("drawings", "index_version")
@@ -1,23 +1,36 @@
+import hashlib
+from pathlib import Path
 from typing import cast
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_db
-from services.storage import StorageService, open_storage_path
+from models.models import DrawingRendition
+from services.drawing_tiles import (
+    DZI_TILE_MIME_TYPE,
+    DeepZoomPyramid,
+    read_deep_zoom_pyramid_digest,
+)
+from services.storage import (
+    StorageService,
+    build_drawing_render_dzi_storage_key,
+    build_drawing_render_tile_storage_key,
+    open_storage_path,
+)
 
 router = APIRouter(tags=["drawing-files"])
 
+# ``?v=<pyramid digest>`` URLs never change content, so they cache for good; unversioned
+# ones revalidate against the strong ETag on every use.
+VERSIONED_TILE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+UNVERSIONED_TILE_CACHE_CONTROL = "no-cache"
 
-@router.get("/api/projects/{project_id}/drawings/{drawing_id}/pages/{page_number}/image")
-def get_rendered_drawing_page_image(
-    project_id: int,
-    drawing_id: int,
-    page_number: int,
-    db: Session = Depends(get_db),
-):
-    storage = StorageService(db)
+
+def _get_page_rendition(
+    storage: StorageService, project_id: int, drawing_id: int, page_number: int
+) -> DrawingRendition:
     drawing = storage.get_drawing_by_id(drawing_id)
 
     if drawing is None or cast(int, drawing.project_id) != project_id:
@@ -31,6 +44,54 @@ def get_rendered_drawing_page_image(
                 status_code=409, detail="Drawing rendition is not ready yet"
             )
         raise HTTPException(status_code=404, detail="Rendered page image not found")
+    return rendition
+
+
+def _strong_etag(pyramid_digest: str | None, abs_path: Path, suffix: str) -> str:
+    """Entity tag from the pyramid's write-time digest, else from the file bytes."""
+    if pyramid_digest:
+        return f'"{pyramid_digest[:32]}{suffix}"'
+    return f'"{hashlib.sha256(abs_path.read_bytes()).hexdigest()[:32]}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _cached_file_response(
+    request: Request,
+    abs_path: Path,
+    media_type: str,
+    *,
+    pyramid_digest: str | None,
+    etag_suffix: str = "",
+) -> Response:
+    """Serve a pyramid file with a strong ETag; 304 when ``If-None-Match`` matches it."""
+    etag = _strong_etag(pyramid_digest, abs_path, etag_suffix)
+    versioned = bool(pyramid_digest) and request.query_params.get("v") == pyramid_digest
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            VERSIONED_TILE_CACHE_CONTROL if versioned else UNVERSIONED_TILE_CACHE_CONTROL
+        ),
+    }
+    # If-None-Match uses the weak comparison function (RFC 9110 13.1.2).
+    if_none_match = request.headers.get("if-none-match", "")
+    client_tags = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+    if etag in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path=str(abs_path), media_type=media_type, headers=headers)
+
+
+@router.get("/api/projects/{project_id}/drawings/{drawing_id}/pages/{page_number}/image")
+def get_rendered_drawing_page_image(
+    project_id: int,
+    drawing_id: int,
+    page_number: int,
+    db: Session = Depends(get_db),
+):
+    storage = StorageService(db)
+    rendition = _get_page_rendition(storage, project_id, drawing_id, page_number)
 
     image_key = cast(str, rendition.image_storage_key)
     abs_path = open_storage_path(image_key)
@@ -44,3 +105,66 @@ def get_rendered_drawing_page_image(
         filename=abs_path.name,
         headers={"Cache-Control": "public, max-age=31536000, immutable"},
     )
+
+
+@router.get("/api/projects/{project_id}/drawings/{drawing_id}/pages/{page_number}/tiles.dzi")
+def get_rendered_drawing_page_tile_descriptor(
+    request: Request,
+    project_id: int,
+    drawing_id: int,
+    page_number: int,
+    db: Session = Depends(get_db),
+):
+    """Deep Zoom descriptor (size, tile size, overlap) for the page's tile pyramid."""
+    storage = StorageService(db)
+    _get_page_rendition(storage, project_id, drawing_id, page_number)
+
+    abs_path = open_storage_path(
+        build_drawing_render_dzi_storage_key(project_id, drawing_id, page_number)
+    )
+    if not abs_path.exists():
+        raise HTTPException(status_code=404, detail="Tile pyramid not found")
+    return _cached_file_response(
+        request,
+        abs_path,
+        "application/xml",
+        pyramid_digest=read_deep_zoom_pyramid_digest(project_id, drawing_id, page_number),
+    )
+
+
+@router.get(
+    "/api/projects/{project_id}/drawings/{drawing_id}/pages/{page_number}/tiles/{z}/{x}/{y}"
+)
+def get_rendered_drawing_page_tile(
+    request: Request,
+    project_id: int,
+    drawing_id: int,
+    page_number: int,
+    z: int,
+    x: int,
+    y: int,
+    db: Session = Depends(get_db),
+):
+    """One Deep Zoom tile: level ``z``, column ``x``, row ``y``."""
+    storage = StorageService(db)
+    rendition = _get_page_rendition(storage, project_id, drawing_id, page_number)
+
+    width_px = cast(int | None, rendition.width_px)
+    height_px = cast(int | None, rendition.height_px)
+    if not width_px or not height_px:
+        raise HTTPException(status_code=404, detail="Tile pyramid not found")
+    if not DeepZoomPyramid(width=width_px, height=height_px).has_tile(z, x, y):
+        raise HTTPException(status_code=404, detail="Tile out of range")
+
+    abs_path = open_storage_path(
+        build_drawing_render_tile_storage_key(project_id, drawing_id, page_number, z, x, y)
+    )
+    if not abs_path.exists():
+        raise HTTPException(status_code=404, detail="Tile not found")
+    return _cached_file_response(
+        request,
+        abs_path,
+        DZI_TILE_MIME_TYPE,
+        pyramid_digest=read_deep_zoom_pyramid_digest(project_id, drawing_id, page_number),
+        etag_suffix=f"-{z}-{x}-{y}",
+    )
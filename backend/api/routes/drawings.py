@@ -1,4 +1,5 @@
-from typing import List, Optional, cast
+import math
+from typing import List, Literal, Optional, cast
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
@@ -185,9 +186,14 @@ def get_drawing_index_status(
 def reindex_drawing(
     project_id: int,
     drawing_id: int,
+    mode: Literal["full", "incremental"] = Query("full"),
     db: Session = Depends(get_db),
 ) -> DrawingReindexResponse:
-    """Enqueue a manual re-index after legend updates or failed runs."""
+    """Enqueue a manual re-index after legend updates or failed runs.
+
+    ``mode=incremental`` re-indexes only pages whose content changed since the last
+    index (legend changes still need a full re-index).
+    """
     if not settings.drawing_index_enabled:
         raise HTTPException(status_code=400, detail="Drawing index is disabled")
 
@@ -202,7 +208,9 @@ def reindex_drawing(
             detail="Drawing render is not ready; wait for processing to finish",
         )
 
-    job = enqueue_drawing_index_job(db, project_id=project_id, drawing_id=drawing_id)
+    job = enqueue_drawing_index_job(
+        db, project_id=project_id, drawing_id=drawing_id, mode=mode
+    )
     drawing.index_status = "pending"  # type: ignore[assignment]
     drawing.index_error = None  # type: ignore[assignment]
     db.commit()
@@ -210,6 +218,7 @@ def reindex_drawing(
     return DrawingReindexResponse(
         job_id=cast(int, job.id),
         index_status="pending",
+        mode=mode,
     )
 
 
@@ -222,25 +231,44 @@ def list_drawing_text_elements_route(
     drawing_id: int,
     page: int = Query(1, ge=1),
     limit: int = Query(500, ge=1, le=500),
+    bbox: Optional[str] = Query(
+        None, description="Viewport x0,y0,x1,y1 (normalized 0-1); only intersecting elements"
+    ),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous response"),
     db: Session = Depends(get_db),
 ) -> DrawingTextElementListResponse:
-    """Debug/admin listing of OCR text elements for a master drawing page."""
+    """OCR text elements for a master drawing page, optionally inside a viewport rectangle."""
     service = StorageService(db)
     drawing = service.get_drawing(project_id, drawing_id)
     if not drawing:
         raise HTTPException(status_code=404, detail="Drawing not found")
 
-    items, total = list_drawing_text_elements(
+    viewport = None
+    if bbox is not None:
+        try:
+            x0, y0, x1, y1 = (float(part) for part in bbox.split(","))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="bbox must be x0,y0,x1,y1")
+        if not all(math.isfinite(v) and 0.0 <= v <= 1.0 for v in (x0, y0, x1, y1)):
+            raise HTTPException(status_code=400, detail="bbox values must be between 0 and 1")
+        if x0 > x1 or y0 > y1:
+            raise HTTPException(status_code=400, detail="bbox must have x0 <= x1 and y0 <= y1")
+        viewport = (x0, y0, x1, y1)
+
+    items, total, next_cursor = list_drawing_text_elements(
         db,
         master_drawing_id=drawing_id,
         page=page,
         limit=limit,
+        bbox=viewport,
+        cursor=cursor,
     )
     return DrawingTextElementListResponse(
         items=items,
         total=total,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
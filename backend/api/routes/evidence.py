@@ -9,6 +9,8 @@ from api.dependencies import get_db, get_idempotency_key
 from ai.pipelines.inspection_mapping import DocumentEvidenceInput, map_document_to_overlays
 from models.models import EvidenceRecord, InspectionRun, Project
 from models.schemas import (
+    EvidenceBatchUploadError,
+    EvidenceBatchUploadResponse,
     EvidenceRecordResponse,
     EvidenceListResponse,
     InspectionRunEvidenceUploadResponse,
@@ -17,6 +19,7 @@ from services.evidence_document_extraction import (
     InspectionMatchEnqueueContext,
     ingest_evidence_document_extraction,
 )
+from services.evidence_extract_jobs import enqueue_evidence_extract_job
 from services.evidence_file_storage import (
     UnsupportedEvidenceFileType,
     evidence_storage_dir,
@@ -36,6 +39,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["evidence"])
 
+MAX_EVIDENCE_BATCH_FILES = 50
+
 
 def _try_visual_registration(file_path: str, master_drawing_id: str):
     """Placeholder for Case A (alignment) registration — returns None until wired."""
@@ -216,43 +221,81 @@ async def upload_inspection_run_evidence(
         raise HTTPException(status_code=500, detail=message) from exc
 
 
-@router.post("/api/projects/{project_id}/evidence", response_model=EvidenceRecordResponse)
-async def upload_evidence(
-    project_id: int,
-    file: UploadFile = File(...),
-    type: str = Form(...),
-    title: Optional[str] = Form(None),
-    trade: Optional[str] = Form(None),
-    spec_section: Optional[str] = Form(None),
-    meta: Optional[str] = Form(None),
-    idempotency_key: str = Depends(get_idempotency_key),
-    db: Session = Depends(get_db),
-):
-    """Upload evidence record (photo, video, document, spec, etc.) for a project.
-    
-    Form Fields:
-    - file: multipart file (required)
-    - type: 'spec' or 'inspection_doc' (required)
-    - title: display name for evidence (optional, defaults to filename)
-    - trade: e.g., 'HVAC', 'Electrical' (optional)
-    - spec_section: e.g., '15830 - HVAC Controls' (optional)
-    - meta: JSON string with custom metadata (optional)
-    
-    Returns: EvidenceRecordResponse with file_url for download
-    """
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Missing filename")
-
+def _validate_evidence_type(type: Optional[str]) -> str:
     type_lower = type.strip().lower() if type else None
     if type_lower not in ("spec", "inspection_doc"):
         raise HTTPException(
             status_code=400,
             detail="type must be 'spec' or 'inspection_doc'",
         )
+    return type_lower
 
-    file_bytes, content_type, original_name = read_and_validate_upload(file, category="evidence")
-    checksum = sha256_bytes(file_bytes)
 
+def _store_evidence_upload(
+    db: Session,
+    project_id: int,
+    *,
+    file_bytes: bytes,
+    content_type: str,
+    original_name: str,
+    type_lower: str,
+    title: Optional[str],
+    trade: Optional[str],
+    spec_section: Optional[str],
+    meta: Optional[dict],
+) -> dict[str, Any]:
+    """Save the file, create the evidence row, and queue extraction for inspection docs."""
+    storage_key = save_upload_from_bytes(
+        file_bytes, project_id, category="evidence", content_type=content_type, original_name=original_name
+    )
+
+    service = StorageService(db)
+    evidence = service.create_evidence_record(
+        project_id=project_id,
+        type=type_lower,
+        trade=trade.strip() if trade else None,
+        spec_section=spec_section.strip() if spec_section else None,
+        title=title if title else original_name,
+        storage_key=storage_key,
+        content_type=content_type,
+        text_content=None,
+        meta=meta,
+    )
+    evidence_id = cast(int, evidence.id)
+
+    if type_lower == "inspection_doc":
+        enqueue_evidence_extract_job(db, project_id, evidence_id)
+
+    evidence.file_url = f"/api/projects/{project_id}/evidence/{evidence_id}/file"
+    db.commit()
+    db.refresh(evidence)
+
+    response_data = EvidenceRecordResponse.model_validate(evidence).model_dump(mode="json")
+    response_data["file_url"] = f"/api/projects/{project_id}/evidence/{evidence_id}/file"
+    return response_data
+
+
+def _idempotent_evidence_upload(
+    db: Session,
+    project_id: int,
+    *,
+    idempotency_key: str,
+    file_bytes: bytes,
+    content_type: str,
+    original_name: str,
+    type_lower: str,
+    title: Optional[str],
+    trade: Optional[str],
+    spec_section: Optional[str],
+    meta: Optional[dict],
+) -> dict[str, Any]:
+    """
+    Store one upload once per Idempotency-Key, file checksum and type.
+
+    A repeat of the same key and file (a retried request, or the same file twice in one
+    batch) returns the first upload's response instead of storing it again.
+    """
+    checksum = sha256_bytes(file_bytes)
     request_fingerprint = {
         "project_id": project_id,
         "checksum": checksum,
@@ -275,20 +318,70 @@ async def upload_evidence(
         row_status = getattr(idem_row, "status", None)
         cached_resp = dict(getattr(idem_row, "response_payload", None) or {})
         if row_status == "completed" and cached_resp:
-            return EvidenceRecordResponse(**cached_resp)
+            return cached_resp
         if row_status == "in_progress":
             raise HTTPException(status_code=409, detail="Request already in progress")
         if row_status == "failed" and cached_resp:
-            return EvidenceRecordResponse(**cached_resp)
+            return cached_resp
+
+    response_data = _store_evidence_upload(
+        db,
+        project_id,
+        file_bytes=file_bytes,
+        content_type=content_type,
+        original_name=original_name,
+        type_lower=type_lower,
+        title=title,
+        trade=trade,
+        spec_section=spec_section,
+        meta=meta,
+    )
+    finish_idempotent_operation(
+        db,
+        row_id=cast(int, idem_row.id),
+        response_payload=response_data,
+        resource_reference={"evidence_id": response_data["id"]},
+    )
+    return response_data
+
+
+@router.post("/api/projects/{project_id}/evidence", response_model=EvidenceRecordResponse)
+async def upload_evidence(
+    project_id: int,
+    file: UploadFile = File(...),
+    type: str = Form(...),
+    title: Optional[str] = Form(None),
+    trade: Optional[str] = Form(None),
+    spec_section: Optional[str] = Form(None),
+    meta: Optional[str] = Form(None),
+    idempotency_key: str = Depends(get_idempotency_key),
+    db: Session = Depends(get_db),
+):
+    """Upload evidence record (photo, video, document, spec, etc.) for a project.
+    
+    Form Fields:
+    - file: multipart file (required)
+    - type: 'spec' or 'inspection_doc' (required)
+    - title: display name for evidence (optional, defaults to filename)
+    - trade: e.g., 'HVAC', 'Electrical' (optional)
+    - spec_section: e.g., '15830 - HVAC Controls' (optional)
+    - meta: JSON string with custom metadata (optional)
+    
+    Returns: EvidenceRecordResponse with file_url for download. For ``inspection_doc``
+    uploads text extraction runs in a queued ``evidence_extract`` job; poll
+    ``extraction_status`` on the evidence record.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="Missing filename")
+
+    type_lower = _validate_evidence_type(type)
+
+    file_bytes, content_type, original_name = read_and_validate_upload(file, category="evidence")
 
     proj = db.query(Project).filter(Project.id == project_id).first()
     if not proj:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    storage_key = save_upload_from_bytes(
-        file_bytes, project_id, category="evidence", content_type=content_type, original_name=original_name
-    )
-
     parsed_meta: Optional[dict] = None
     if meta:
         try:
@@ -296,41 +389,93 @@ async def upload_evidence(
         except json.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid meta JSON")
 
-    evidence_title = title if title else original_name
-
-    service = StorageService(db)
-    evidence = service.create_evidence_record(
-        project_id=project_id,
-        type=type_lower,
-        trade=trade.strip() if trade else None,
-        spec_section=spec_section.strip() if spec_section else None,
-        title=evidence_title,
-        storage_key=storage_key,
+    response_data = _idempotent_evidence_upload(
+        db,
+        project_id,
+        idempotency_key=idempotency_key,
+        file_bytes=file_bytes,
         content_type=content_type,
-        text_content=None,
+        original_name=original_name,
+        type_lower=type_lower,
+        title=title,
+        trade=trade,
+        spec_section=spec_section,
         meta=parsed_meta,
     )
+    return EvidenceRecordResponse(**response_data)
 
-    if type_lower == "inspection_doc":
-        ingest_evidence_document_extraction(
-            db,
-            evidence_id=cast(int, evidence.id),
-            file_path=get_file_path(storage_key),
+
+@router.post(
+    "/api/projects/{project_id}/evidence/batch",
+    response_model=EvidenceBatchUploadResponse,
+)
+async def upload_evidence_batch(
+    project_id: int,
+    files: List[UploadFile] = File(...),
+    type: str = Form(...),
+    trade: Optional[str] = Form(None),
+    spec_section: Optional[str] = Form(None),
+    idempotency_key: str = Depends(get_idempotency_key),
+    db: Session = Depends(get_db),
+):
+    """Upload several evidence files for a project in one request.
+
+    Every file is validated before any is stored. Each file then goes through the
+    single-upload path under the request's Idempotency-Key. A retried batch, or a file
+    repeated in the batch, returns the stored record instead of a duplicate. Files that
+    fail to store are listed in ``errors`` and the rest are still returned in ``items``.
+    Each ``inspection_doc`` gets its own ``evidence_extract`` job, so items return with
+    ``extraction_status="pending"``.
+    """
+    type_lower = _validate_evidence_type(type)
+    if not files:
+        raise HTTPException(status_code=400, detail="No files uploaded")
+    if len(files) > MAX_EVIDENCE_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_EVIDENCE_BATCH_FILES} files per batch",
         )
 
-    evidence.file_url = f"/api/projects/{project_id}/evidence/{cast(int, evidence.id)}/file"
-    db.commit()
-    db.refresh(evidence)
+    proj = db.query(Project).filter(Project.id == project_id).first()
+    if not proj:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-    response_data = EvidenceRecordResponse.model_validate(evidence).model_dump(mode="json")
-    response_data["file_url"] = f"/api/projects/{project_id}/evidence/{cast(int, evidence.id)}/file"
-    finish_idempotent_operation(
-        db,
-        row_id=cast(int, idem_row.id),
-        response_payload=response_data,
-        resource_reference={"evidence_id": cast(int, evidence.id)},
-    )
-    return EvidenceRecordResponse(**response_data)
+    uploads = []
+    for file in files:
+        if not file.filename:
+            raise HTTPException(status_code=400, detail="Missing filename")
+        uploads.append(read_and_validate_upload(file, category="evidence"))
+
+    items: list[EvidenceRecordResponse] = []
+    errors: list[EvidenceBatchUploadError] = []
+    for file_bytes, content_type, original_name in uploads:
+        try:
+            response_data = _idempotent_evidence_upload(
+                db,
+                project_id,
+                idempotency_key=idempotency_key,
+                file_bytes=file_bytes,
+                content_type=content_type,
+                original_name=original_name,
+                type_lower=type_lower,
+                title=None,
+                trade=trade,
+                spec_section=spec_section,
+                meta=None,
+            )
+        except HTTPException as exc:
+            errors.append(EvidenceBatchUploadError(filename=original_name, detail=str(exc.detail)))
+            continue
+        except Exception:
+            db.rollback()
+            logger.exception(
+                "evidence_batch_item_failed",
+                extra={"project_id": project_id, "upload_name": original_name},
+            )
+            errors.append(EvidenceBatchUploadError(filename=original_name, detail="Upload failed"))
+            continue
+        items.append(EvidenceRecordResponse(**response_data))
+    return EvidenceBatchUploadResponse(items=items, total=len(items), errors=errors)
 
 
 @router.get("/api/projects/{project_id}/evidence", response_model=EvidenceListResponse)
@@ -22,4 +22,4 @@ def list_project_findings(
 
     service = FindingService(db)
     rows = service.list_project_findings(project_id, limit=limit)
-    return FindingListResponse(findings=[service.serialize_finding(f) for f in rows])
+    return FindingListResponse(findings=service.serialize_findings(rows))
@@ -11,9 +11,9 @@ from sqlalchemy.orm import Session
 
 from api.dependencies import get_db, get_idempotency_key
 from services.idempotency import begin_idempotent_operation, finish_idempotent_operation
-from ai.pipelines.inspection_mapping import run_inspection_mapping
 from models.schemas import InspectionRunCreate, InspectionRunListResponse, InspectionRunResponse
 from api.schemas.inspection_match_response import BboxResponse, InspectionMatchStatusResponse
+from services.inspection_mapping_jobs import enqueue_inspection_mapping_job
 from services.inspection_matching_jobs import load_inspection_match_status
 from services.inspection_run_deletion import delete_inspection_run_from_project
 from services.storage import StorageService
@@ -95,10 +95,11 @@ def create_inspection_run(
     db: Session = Depends(get_db),
 ) -> InspectionRunResponse:
     """
-    Create an inspection run and run the pipeline (MVP: synchronous).
+    Create an inspection run and queue the mapping pipeline.
 
-    Validates drawing and evidence belong to project. Creates run with status queued,
-    then kicks off the inspection mapping pipeline.
+    Validates drawing and evidence belong to project. Creates run with status queued
+    and enqueues an ``inspection_mapping`` job; poll
+    ``GET .../inspections/runs/{run_id}`` for processing → complete | failed.
     """
     request_fingerprint = {
         "project_id": project_id,
@@ -156,28 +157,22 @@ def create_inspection_run(
         )
         return response
 
-    # MVP: run pipeline synchronously
-    result = run_inspection_mapping(db, run)
-
-    if result.get("error"):
-        # Pipeline returned error; run status already updated to failed
-        # Re-fetch run for response (status/error_message updated)
-        run = storage.get_inspection_run(project_id, cast(int, run.id))
-        if run is None:
-            raise HTTPException(status_code=500, detail="Run created but not found after pipeline")
-        response = InspectionRunResponse.model_validate(run)
-        finish_idempotent_operation(
-            db,
-            row_id=cast(int, idem_row.id),
-            response_payload=response.model_dump(mode="json"),
-            resource_reference={"inspection_run_id": cast(int, run.id)},
+    try:
+        enqueue_inspection_mapping_job(db, project_id, cast(int, run.id))
+    except ValueError as e:
+        logger.exception(
+            "inspection_mapping_enqueue_failed",
+            extra={"project_id": project_id, "run_id": cast(int, run.id)},
+        )
+        storage.update_inspection_run_status(
+            cast(int, run.id),
+            "failed",
+            error_message=f"Could not queue inspection mapping: {e}"[:500],
         )
-        return response
 
-    # Re-fetch run for fresh status/updated_at after pipeline
     run = storage.get_inspection_run(project_id, cast(int, run.id))
     if run is None:
-        raise HTTPException(status_code=500, detail="Run not found after pipeline")
+        raise HTTPException(status_code=500, detail="Run created but not found after enqueue")
     response = InspectionRunResponse.model_validate(run)
     finish_idempotent_operation(
         db,
@@ -219,6 +214,25 @@ def list_inspection_runs(
     )
 
 
+@router.get(
+    "/{project_id}/inspections/runs/{run_id}",
+    response_model=InspectionRunResponse,
+)
+def get_inspection_run(
+    project_id: int,
+    run_id: int,
+    db: Session = Depends(get_db),
+) -> InspectionRunResponse:
+    """Get one inspection run; the status to poll after POST .../inspections/runs."""
+    storage = StorageService(db)
+    _ensure_project_exists(storage, project_id)
+
+    run = storage.get_inspection_run(project_id, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Inspection run not found")
+    return InspectionRunResponse.model_validate(run)
+
+
 @router.delete("/{project_id}/inspections/runs/{run_id}")
 def delete_inspection_run(
     project_id: int,
@@ -84,6 +84,7 @@ async def sync_procore(
 async def ingest_project_rfis(
     project_id: int,
     user_id: str = Query(...),
+    full: bool = Query(False, description="Ignore the sync cursor and re-read every RFI"),
     db: Session = Depends(get_db),
 ):
     storage = StorageService(db)
@@ -96,6 +97,7 @@ async def ingest_project_rfis(
         db,
         user_id=user_id,
         project=project,
+        full=full,
     )
 
     # Return hydrated records if you prefer, or keep the summary list from the service
@@ -265,7 +265,9 @@ def get_project_drawing(
         file_url=serialized["fileUrl"],
         source_file_url=serialized["sourceFileUrl"],
         page_count=serialized["pageCount"],
+        rendered_page_count=serialized.get("renderedPageCount", 0),
         active_page=serialized["activePage"],
+        tile_source_url=serialized.get("tileSourceUrl"),
         width_px=serialized.get("widthPx"),
         height_px=serialized.get("heightPx"),
         processing_status=serialized.get("processingStatus", "pending"),
@@ -8,6 +8,11 @@ registration (especially ``PROCORE_REDIRECT_URI``)::
     PROCORE_CLIENT_SECRET
     PROCORE_REDIRECT_URI    # must match authorize + token exchange redirect_uri exactly
     PROCORE_ENVIRONMENT     # production | sandbox
+    PROCORE_RATE_LIMIT_PER_HOUR  # client-side request budget per Procore company (default 3600)
+    PROCORE_RATE_LIMIT_BURST     # requests a company may send back to back (default 20)
+    PROCORE_MAX_RETRIES          # retries of GET/HEAD on 429 / 502-504 / network errors (default 3)
+    PROCORE_MAX_CONNECTIONS      # pooled Procore connections per event loop (default 20)
+    PROCORE_PAGE_CONCURRENCY     # list pages requested at once after the first (default 4)
 
 Frontend (post-OAuth browser redirect)::
 
@@ -30,6 +35,11 @@ Application environment::
     OPENAI_API_KEY              # API host only — required for inspection/GPT features (beta)
     OPENAI_CHAT_MODEL           # optional — defaults to gpt-4o-mini
     OPENAI_VISION_MODEL         # optional — defaults to gpt-4o-mini
+    OPENAI_MAX_CONNECTIONS      # optional — shared OpenAI client pool size (default 20)
+    DOCUMENT_EXTRACTION_LLM_MODE  # optional — sequential | concurrent | combined (default concurrent)
+    LLM_RESPONSE_CACHE_ENABLED  # default true — reuse llm_responses rows keyed by model/prompt version/content
+    LLM_RESPONSE_CACHE_TTL_SECONDS  # max age of a cached response; 0 = no expiry (default 30 days)
+    LLM_RESPONSE_CACHE_MAX_ENTRIES  # least recently hit rows beyond this are evicted; 0 = unbounded (default 50000)
     OCR_BACKEND                 # auto | tesseract | openai_vision
     TESSERACT_CMD               # optional — path to tesseract binary when not on PATH
 
@@ -38,6 +48,7 @@ PDF link enrichment (hyperlinks in uploaded evidence PDFs)::
     PDF_LINK_FOLLOW_ENABLED         # default true — set false to skip link follow on upload
     PDF_LINK_FOLLOW_MAX_EXTERNAL    # max HTTP fetches per PDF (default 5)
     PDF_LINK_FOLLOW_ALLOWED_HOSTS   # comma-separated host suffixes; FRONTEND_PUBLIC_URL host is merged in
+    PDF_LINK_FOLLOW_CACHE_ENABLED   # default true — revalidate repeated links via ETag / Last-Modified
 
 Master drawing auto-index::
 
@@ -46,6 +57,34 @@ Master drawing auto-index::
     DRAWING_INDEX_MIN_CLUSTER_WORDS        # min words per OCR cluster for auto-regions (default 2)
     DRAWING_INDEX_OCR_MAX_PAGES            # max pages to OCR; 0 = all (default 0)
     DRAWING_INDEX_AUTO_REGION_MODE         # cluster | grid | hybrid (default cluster)
+    CANDIDATE_TILE_CACHE_SIZE              # in-memory LRU of prepared candidate tile pages; 0 = off (default 32)
+    CANDIDATE_TILE_CACHE_DIR               # optional on-disk tier shared by workers (JSON per page); empty = memory only
+
+Document text extraction cache::
+
+    EXTRACTED_DOCUMENT_CACHE_SIZE          # in-memory LRU entries keyed by file content hash; 0 = off (default 64)
+    EXTRACTED_DOCUMENT_CACHE_DIR           # optional on-disk tier (JSON per document); empty = memory only
+    OCR_RESULT_STORE_ENABLED               # default true — reuse ocr_results rows keyed by checksum/backend/DPI
+    OCR_WORKERS                            # processes for page-parallel OCR of scanned PDFs; 0 = CPU count, 1 = serial
+    OCR_CAPABILITY_TTL_SECONDS             # how long a tesseract / OpenAI-key probe is trusted per process; 0 = forever (default 300)
+
+Legend index::
+
+    LEGEND_INDEX_TTL_SECONDS               # max age of the per-project in-memory legend index; 0 = until invalidated (default 300)
+
+Drawing render::
+
+    DRAWING_RENDER_WORKERS                 # processes for page-parallel PDF render; 0 = CPU count, 1 = serial
+
+Job worker (``python -m workers.job_worker``)::
+
+    JOB_WORKER_CONCURRENCY                 # max jobs in flight per worker process; 1 = serial loop (default 1)
+    JOB_WORKER_TYPE_LIMITS                 # per job_type caps, e.g. drawing_render=1,inspection_match=4; * = other types
+    JOB_WORKER_PROCESS_POOL_SIZE           # processes for CPU-bound render/index jobs; 0 = CPU count (default 0)
+    JOB_WORKER_METRICS_INTERVAL_SECONDS    # per-type throughput / queue-depth log interval (default 60)
+    JOB_WORKER_LISTEN_ENABLED              # default true — LISTEN job_queue wakeups on Postgres
+    INSPECTION_MATCH_BATCH_WORKERS         # threads extracting evidence files in inspection_match_batch (default 4)
+    INSPECTION_MATCH_BATCH_MAX_ITEMS       # inspections one queued inspection_match_batch may gather (default 50)
 """
 
 from urllib.parse import urlparse
@@ -73,6 +112,17 @@ class Settings(BaseSettings):
     )
     # Sandbox Developer Portal apps must use login-sandbox + sandbox API, not production hosts.
     procore_environment: Literal["production", "sandbox"] = "production"
+    #: Client-side Procore request budget per company (Procore enforces 3600/hour by default).
+    #: Env: ``PROCORE_RATE_LIMIT_PER_HOUR``.
+    procore_rate_limit_per_hour: float = Field(default=3600.0, description="PROCORE_RATE_LIMIT_PER_HOUR")
+    #: Token bucket size: requests a company may send back to back. Env: ``PROCORE_RATE_LIMIT_BURST``.
+    procore_rate_limit_burst: int = Field(default=20, description="PROCORE_RATE_LIMIT_BURST")
+    #: Retries of idempotent Procore requests on 429 / 502-504 / network errors. Env: ``PROCORE_MAX_RETRIES``.
+    procore_max_retries: int = Field(default=3, description="PROCORE_MAX_RETRIES")
+    #: Pooled connections to the Procore API per event loop. Env: ``PROCORE_MAX_CONNECTIONS``.
+    procore_max_connections: int = Field(default=20, description="PROCORE_MAX_CONNECTIONS")
+    #: List pages requested concurrently once page 1 reports the total. Env: ``PROCORE_PAGE_CONCURRENCY``.
+    procore_page_concurrency: int = Field(default=4, description="PROCORE_PAGE_CONCURRENCY")
     anthropic_api_key: Optional[str] = None
     #: Required on the API host for inspection mapping / GPT calls (set ``OPENAI_API_KEY`` in env or ``backend/.env``).
     openai_api_key: Optional[str] = Field(default=None, description="OPENAI_API_KEY")
@@ -80,6 +130,29 @@ class Settings(BaseSettings):
     openai_chat_model: str = Field(default="gpt-4o-mini", description="OPENAI_CHAT_MODEL")
     #: Vision model for OCR / image understanding (optional). Env: ``OPENAI_VISION_MODEL``.
     openai_vision_model: str = Field(default="gpt-4o-mini", description="OPENAI_VISION_MODEL")
+    #: Keep-alive connections in the shared OpenAI client pool. Env: ``OPENAI_MAX_CONNECTIONS``.
+    openai_max_connections: int = Field(default=20, description="OPENAI_MAX_CONNECTIONS")
+    #: How the document extraction orchestrator issues its LLM calls: ``sequential`` (one after
+    #: another), ``concurrent`` (classification and universal fields in parallel) or ``combined``
+    #: (one structured request for both). Env: ``DOCUMENT_EXTRACTION_LLM_MODE``.
+    document_extraction_llm_mode: Literal["sequential", "concurrent", "combined"] = Field(
+        default="concurrent", description="DOCUMENT_EXTRACTION_LLM_MODE"
+    )
+    #: Read/write the durable ``llm_responses`` table around cacheable chat completions.
+    #: Env: ``LLM_RESPONSE_CACHE_ENABLED``.
+    llm_response_cache_enabled: bool = Field(
+        default=True, description="LLM_RESPONSE_CACHE_ENABLED"
+    )
+    #: Seconds a cached chat completion stays valid; ``0`` never expires.
+    #: Env: ``LLM_RESPONSE_CACHE_TTL_SECONDS``.
+    llm_response_cache_ttl_seconds: float = Field(
+        default=30 * 24 * 3600.0, description="LLM_RESPONSE_CACHE_TTL_SECONDS"
+    )
+    #: Rows kept in ``llm_responses``; the least recently hit are evicted beyond this,
+    #: ``0`` = unbounded. Env: ``LLM_RESPONSE_CACHE_MAX_ENTRIES``.
+    llm_response_cache_max_entries: int = Field(
+        default=50_000, description="LLM_RESPONSE_CACHE_MAX_ENTRIES"
+    )
     #: OCR provider selection. Env: ``OCR_BACKEND``.
     ocr_backend: Literal["auto", "tesseract", "openai_vision"] = Field(
         default="auto",
@@ -119,6 +192,12 @@ class Settings(BaseSettings):
         default=0,
         description="PDF_LINK_FOLLOW_OCR_MAX_PAGES",
     )
+    #: Keep followed-link text in ``linked_url_fetches`` and revalidate it with conditional GETs.
+    #: Env: ``PDF_LINK_FOLLOW_CACHE_ENABLED``.
+    pdf_link_follow_cache_enabled: bool = Field(
+        default=True,
+        description="PDF_LINK_FOLLOW_CACHE_ENABLED",
+    )
 
     #: Enable master drawing auto-index jobs. Env: ``DRAWING_INDEX_ENABLED``.
     drawing_index_enabled: bool = Field(default=True, description="DRAWING_INDEX_ENABLED")
@@ -143,6 +222,80 @@ class Settings(BaseSettings):
         description="DRAWING_INDEX_AUTO_REGION_MODE",
     )
 
+    #: Prepared candidate tile pages kept per process, keyed by drawing, page and
+    #: ``drawings.index_version``; ``0`` disables caching. Env: ``CANDIDATE_TILE_CACHE_SIZE``.
+    candidate_tile_cache_size: int = Field(default=32, description="CANDIDATE_TILE_CACHE_SIZE")
+    #: Directory for the on-disk candidate tile tier; empty keeps the cache in memory only.
+    #: Env: ``CANDIDATE_TILE_CACHE_DIR``.
+    candidate_tile_cache_dir: str = Field(default="", description="CANDIDATE_TILE_CACHE_DIR")
+
+    #: In-memory ``ExtractedDocument`` LRU size (content-hash keyed); ``0`` disables caching.
+    #: Env: ``EXTRACTED_DOCUMENT_CACHE_SIZE``.
+    extracted_document_cache_size: int = Field(
+        default=64, description="EXTRACTED_DOCUMENT_CACHE_SIZE"
+    )
+    #: Directory for the on-disk extraction cache tier; empty keeps the cache in memory only.
+    #: Env: ``EXTRACTED_DOCUMENT_CACHE_DIR``.
+    extracted_document_cache_dir: str = Field(
+        default="", description="EXTRACTED_DOCUMENT_CACHE_DIR"
+    )
+
+    #: Read/write the durable ``ocr_results`` table before OCRing a file.
+    #: Env: ``OCR_RESULT_STORE_ENABLED``.
+    ocr_result_store_enabled: bool = Field(
+        default=True, description="OCR_RESULT_STORE_ENABLED"
+    )
+
+    #: Processes for page-parallel OCR of scanned PDFs; ``0`` = CPU count, ``1`` = serial.
+    #: Env: ``OCR_WORKERS``.
+    ocr_workers: int = Field(default=0, description="OCR_WORKERS")
+
+    #: Seconds a tesseract availability / version probe (and the OpenAI-key check) is reused
+    #: before re-probing; ``0`` probes once per process. Env: ``OCR_CAPABILITY_TTL_SECONDS``.
+    ocr_capability_ttl_seconds: float = Field(
+        default=300.0, description="OCR_CAPABILITY_TTL_SECONDS"
+    )
+
+    #: Seconds a cached per-project ``LegendIndex`` is trusted before it is rebuilt; ``0`` keeps
+    #: it until an ORM write invalidates it. Env: ``LEGEND_INDEX_TTL_SECONDS``.
+    legend_index_ttl_seconds: float = Field(
+        default=300.0, description="LEGEND_INDEX_TTL_SECONDS"
+    )
+
+    #: Processes for page-parallel PDF rendering; ``0`` = CPU count, ``1`` = serial.
+    #: Env: ``DRAWING_RENDER_WORKERS``.
+    drawing_render_workers: int = Field(default=0, description="DRAWING_RENDER_WORKERS")
+
+    #: Max concurrent jobs per worker process; ``1`` keeps the serial loop. Env: ``JOB_WORKER_CONCURRENCY``.
+    job_worker_concurrency: int = Field(default=1, description="JOB_WORKER_CONCURRENCY")
+    #: Comma-separated ``job_type=limit`` caps for the parallel worker. Env: ``JOB_WORKER_TYPE_LIMITS``.
+    job_worker_type_limits: str = Field(
+        default="drawing_render=1,drawing_index=1,inspection_match=4,*=1",
+        description="JOB_WORKER_TYPE_LIMITS",
+    )
+    #: Process pool size for CPU-bound job types; ``0`` = CPU count. Env: ``JOB_WORKER_PROCESS_POOL_SIZE``.
+    job_worker_process_pool_size: int = Field(
+        default=0,
+        description="JOB_WORKER_PROCESS_POOL_SIZE",
+    )
+    #: Seconds between ``job_worker_metrics`` log lines. Env: ``JOB_WORKER_METRICS_INTERVAL_SECONDS``.
+    job_worker_metrics_interval_seconds: float = Field(
+        default=60.0,
+        description="JOB_WORKER_METRICS_INTERVAL_SECONDS",
+    )
+    #: Threads extracting evidence documents in one ``inspection_match_batch`` job; ``1`` = serial.
+    #: Env: ``INSPECTION_MATCH_BATCH_WORKERS``.
+    inspection_match_batch_workers: int = Field(default=4, description="INSPECTION_MATCH_BATCH_WORKERS")
+    #: Inspections a pending match job for one drawing page may gather before a new job
+    #: starts. Env: ``INSPECTION_MATCH_BATCH_MAX_ITEMS``.
+    inspection_match_batch_max_items: int = Field(
+        default=50, description="INSPECTION_MATCH_BATCH_MAX_ITEMS"
+    )
+
+    #: Wake workers via Postgres ``LISTEN job_queue``; polling remains the fallback.
+    #: Env: ``JOB_WORKER_LISTEN_ENABLED``.
+    job_worker_listen_enabled: bool = Field(default=True, description="JOB_WORKER_LISTEN_ENABLED")
+
     # In some environments (CI, sandboxes), extra env vars may be present.
     # Ignore unknown keys instead of erroring at import time.
     model_config = SettingsConfigDict(
@@ -327,6 +480,29 @@ def pdf_link_follow_allowed_host_suffixes(s: Optional[Settings] = None) -> tuple
     return tuple(suffixes)
 
 
+def job_worker_type_limits(s: Optional[Settings] = None) -> dict[str, int]:
+    """
+    Per-``job_type`` concurrency caps for the parallel job worker.
+
+    Parses ``JOB_WORKER_TYPE_LIMITS`` (``type=limit`` pairs, comma-separated). The ``*`` key
+    caps job types that are not listed. Malformed or non-positive entries are skipped.
+    """
+    cfg = s or settings
+    limits: dict[str, int] = {}
+    for part in cfg.job_worker_type_limits.split(","):
+        name, sep, raw_limit = part.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        try:
+            limit = int(raw_limit.strip())
+        except ValueError:
+            continue
+        if limit >= 1:
+            limits[name] = limit
+    return limits
+
+
 def procore_authorization_url() -> str:
     if settings.procore_environment == "sandbox":
         return "https://login-sandbox.procore.com/oauth/authorize"
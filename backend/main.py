@@ -180,7 +180,7 @@ app.include_router(inspection_reviews.router)
 async def startup_event():
     """Initialize database on startup"""
     init_db()
-    from ai.pipelines.ocr_engine import tesseract_is_available
+    from ai.pipelines.ocr_capabilities import get_ocr_capabilities
 
     logger.info(
         "startup_complete",
@@ -189,15 +189,25 @@ async def startup_event():
             "openai_chat_model": app_settings.openai_chat_model,
             "openai_vision_model": app_settings.openai_vision_model,
             "ocr_backend": app_settings.ocr_backend,
-            "tesseract_available": tesseract_is_available(),
+            "tesseract_available": get_ocr_capabilities().tesseract_available(),
         },
     )
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled Procore connections"""
+    from services.procore_http import close_procore_http_clients
+
+    await close_procore_http_clients()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    from ai.pipelines.ocr_engine import tesseract_is_available
+    from ai.pipelines.ocr_capabilities import get_ocr_capabilities
+    from services.llm_response_store import llm_response_cache_stats
+    from services.procore_http import procore_http_stats
 
+    ocr = get_ocr_capabilities().stats()
     return {
         "status": "ok",
         "service": "qc-qa-platform",
@@ -207,7 +217,10 @@ async def health_check():
         "openai_chat_model": app_settings.openai_chat_model,
         "openai_vision_model": app_settings.openai_vision_model,
         "ocr_backend": app_settings.ocr_backend,
-        "tesseract_available": tesseract_is_available(),
+        "tesseract_available": ocr["tesseract_available"],
+        "ocr_capabilities": ocr,
+        "llm_response_cache": llm_response_cache_stats(),
+        "procore_http": procore_http_stats(),
     }
 
 @app.get("/")
@@ -15,13 +15,18 @@ from .drawing_survey_point import DrawingSurveyPoint
 from .drawing_text_element import DrawingTextElement
 from .drawing_overlay import DrawingOverlay, UnresolvedEvidence
 from .drawing_region import DrawingRegion
+from .drawing_spatial_index import DrawingSpatialIndex
 from .inspection_run import InspectionRun
 from .legend_reference import (
     DrawingLegendAbbreviation,
     DrawingLegendLineType,
     DrawingLegendSymbol,
 )
+from .linked_url_fetch import LinkedUrlFetch
+from .llm_response import LlmResponse
 from .location_match_label import LocationMatchLabel
+from .ocr_result import OcrResult
+from .procore_sync_cursor import ProcoreSyncCursor
 from .review_queue_item import ReviewQueueItem
 
 __all__ = [
@@ -36,10 +41,15 @@ __all__ = [
     "DrawingSurveyPoint",
     "DrawingTextElement",
     "DrawingRegion",
+    "DrawingSpatialIndex",
     "DrawingOverlay",
     "UnresolvedEvidence",
     "InspectionRun",
+    "LinkedUrlFetch",
+    "LlmResponse",
     "LocationMatchLabel",
+    "OcrResult",
+    "ProcoreSyncCursor",
     "ReviewQueueItem",
 ]
 
@@ -18,6 +18,8 @@ class DocumentExtraction(Base):
     classification_confidence = Column(Float, nullable=True)  # BACKEND ONLY
     universal_fields_json = Column(JSON, nullable=True)
     type_specific_fields_json = Column(JSON, nullable=True)
+    # {"mode", "total_ms", "stages": {stage: {calls, latency_ms, *_tokens}}}; BACKEND ONLY
+    llm_metrics_json = Column(JSON, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     clues = relationship(
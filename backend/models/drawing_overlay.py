@@ -24,6 +24,11 @@ matched, via drawing_location_resolver.py's MasterRegion.region_id.
 Nullable, ON DELETE SET NULL: deleting the region a historical overlay
 once pointed at must not delete the inspection record itself.
 
+``finding_id`` (migration w8f9i0n1d2g3) is the indexed link to the finding created for a
+failed / mixed outcome. It used to live only in ``meta["finding_id"]``, which forced a
+scan of every overlay on the master drawing per finding; the migration backfills it from
+that key, which is still written for older readers. Nullable, ON DELETE SET NULL.
+
 Reconciled with the existing Postgres schema: integer PKs/FKs,
 ``master_drawing_id``, ``geometry`` JSON (not separate bbox columns),
 ``tags_json`` as JSONB-compatible JSON, and ``created_at`` as the upload
@@ -73,6 +78,7 @@ class DrawingOverlay(Base):
         Index("ix_drawing_overlays_master_drawing_id", "master_drawing_id"),
         Index("ix_drawing_overlays_inspection_run_id", "inspection_run_id"),
         Index("ix_drawing_overlays_region_id", "region_id"),
+        Index("ix_drawing_overlays_finding_id", "finding_id"),
         Index("ix_drawing_overlays_status", "status"),
         Index("ix_drawing_overlays_master_drawing_id_created_at", "master_drawing_id", "created_at"),
         Index("ix_drawing_overlays_inspection_date", "inspection_date"),
@@ -95,6 +101,11 @@ class DrawingOverlay(Base):
         ForeignKey("drawing_regions.id", ondelete="SET NULL"),
         nullable=True,
     )
+    finding_id = Column(
+        Integer,
+        ForeignKey("findings.id", ondelete="SET NULL"),
+        nullable=True,
+    )
 
     geometry = Column(JSON, nullable=False)
     status = Column(String, nullable=False, server_default="unknown")  # pass | fail | unknown
@@ -0,0 +1,41 @@
+"""Persisted per-page spatial index over a drawing's indexed geometry."""
+
+from __future__ import annotations
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class DrawingSpatialIndex(Base):
+    """
+    Normalized boxes of one kind of index row on one drawing page, for viewport queries.
+
+    ``kind`` is ``text_element``, ``region``, ``survey_point`` or ``landmark``.
+    ``entries_json`` holds ``[id, x0, y0, x1, y1]`` per row (0-1 page fractions) and
+    ``grid_size`` the cells per side of the uniform grid
+    ``services.box_overlap.GridIndex`` buckets them into. Rows are written by
+    the drawing index job and deleted whenever the underlying rows change (re-index,
+    region CRUD); a missing row is rebuilt on the next query.
+    """
+
+    __tablename__ = "drawing_spatial_indexes"
+    __table_args__ = (
+        UniqueConstraint(
+            "drawing_id", "page", "kind", name="uq_drawing_spatial_indexes_drawing_page_kind"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    drawing_id = Column(
+        Integer,
+        ForeignKey("drawings.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    page = Column(Integer, nullable=False)
+    kind = Column(String(32), nullable=False)
+    grid_size = Column(Integer, nullable=False)
+    entry_count = Column(Integer, nullable=False, default=0)
+    entries_json = Column(JSON, nullable=False)
+    built_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,32 @@
+"""Text extracted from a followed PDF hyperlink, with the HTTP validators it was served with."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class LinkedUrlFetch(Base):
+    """
+    Last successful fetch of one external link (``pdf_link_follower``).
+
+    ``url_hash`` is the SHA-256 of the URL (signed storage URLs are too long for a plain
+    unique index). Only responses that carried an ``ETag`` or ``Last-Modified`` are stored:
+    the next follow of the same URL sends them as ``If-None-Match`` / ``If-Modified-Since``
+    and, on ``304 Not Modified``, reuses ``text`` without downloading or OCRing the body.
+    """
+
+    __tablename__ = "linked_url_fetches"
+
+    id = Column(Integer, primary_key=True)
+    url_hash = Column(String(64), nullable=False, unique=True)
+    url = Column(Text, nullable=False)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    filename = Column(String, nullable=False)
+    text = Column(Text, nullable=False)
+    pages = Column(Integer, nullable=False, default=0)
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
+    validated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,34 @@
+"""Durable chat-completion responses keyed by model, prompt template version and content."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class LlmResponse(Base):
+    """
+    One cached chat completion.
+
+    ``cache_key`` is the SHA-256 of the model, call stage, prompt template version and the
+    full request (messages, ``max_tokens``, ``response_format``), so identical evidence text
+    sent through the same prompt reuses the stored answer. Token counts are the usage of the
+    original call, i.e. what each hit saves. ``last_hit_at`` drives size-bounded eviction.
+    """
+
+    __tablename__ = "llm_responses"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, unique=True)
+    model = Column(String, nullable=False)
+    stage = Column(String, nullable=False)
+    prompt_version = Column(Integer, nullable=False)
+    response_text = Column(Text, nullable=False)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    total_tokens = Column(Integer, nullable=False, default=0)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_hit_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -317,6 +317,8 @@ class Drawing(Base):
     index_error = Column(Text, nullable=True)
     indexed_at = Column(DateTime, nullable=True)
     index_stats_json = Column(JSON, nullable=True)
+    # Bumped whenever indexed text elements or regions change; keys cached candidate tiles.
+    index_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
@@ -374,6 +376,7 @@ class DrawingRendition(Base):
     width_px = Column(Integer, nullable=True)
     height_px = Column(Integer, nullable=True)
     file_size = Column(Integer, nullable=True)
+    dpi = Column(Integer, nullable=True)  # raster DPI of PDF page renders; NULL for copied images
 
     render_status = Column(String, nullable=False, default="ready")  # ready | failed
     error_message = Column(Text, nullable=True)
@@ -479,6 +482,7 @@ class EvidenceRecord(Base):
     __tablename__ = "evidence_records"
     __table_args__ = (
         Index("ix_evidence_records_project_type", "project_id", "type"),
+        Index("ix_evidence_records_project_type_source", "project_id", "type", "source_id"),
     )
     
     id = Column(Integer, primary_key=True, index=True)
@@ -496,6 +500,9 @@ class EvidenceRecord(Base):
     dates = Column(JSON, nullable=True)
     attachments_json = Column(JSON, nullable=True)
     cross_refs_json = Column(JSON, nullable=True)
+    # evidence_extract job state: pending, processing, ready, failed (None = not queued)
+    extraction_status = Column(String(50), nullable=True)
+    extraction_error = Column(Text, nullable=True)
     
     # Flexible metadata for future extensions
     meta = Column(JSON, nullable=True)
@@ -0,0 +1,42 @@
+"""Durable per-page OCR output keyed by file checksum, OCR backend and raster DPI."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Float, Integer, JSON, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class OcrResult(Base):
+    """
+    One OCR'd page of an evidence/drawing file.
+
+    ``checksum`` is the SHA-256 of the file bytes (same digest as upload ``sha256_bytes``),
+    so re-uploads and retries of identical files reuse the stored words. ``dpi`` is the
+    PDF raster resolution; ``0`` means the image was OCR'd at its native resolution.
+    ``words_json`` rows are ``[text, ocr_confidence, x, y, width, height]`` in page pixels.
+    """
+
+    __tablename__ = "ocr_results"
+    __table_args__ = (
+        UniqueConstraint(
+            "checksum",
+            "ocr_backend",
+            "dpi",
+            "page_index",
+            name="uq_ocr_results_checksum_backend_dpi_page",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    checksum = Column(String(64), nullable=False, index=True)
+    ocr_backend = Column(String, nullable=False)
+    dpi = Column(Integer, nullable=False)
+    page_index = Column(Integer, nullable=False)
+    page_count = Column(Integer, nullable=False)
+    source_format = Column(String, nullable=False)
+    page_width = Column(Float, nullable=True)
+    page_height = Column(Float, nullable=True)
+    words_json = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,33 @@
+"""Per-project incremental sync position for a Procore list resource."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class ProcoreSyncCursor(Base):
+    """
+    Newest ``updated_at`` seen for one Procore resource (``rfis``, ...) of a project.
+
+    The next sync asks Procore only for records updated since ``cursor_updated_at``
+    (``filters[updated_at]``). The cursor is written in the same transaction as the records,
+    so a failed sync never skips changes.
+    """
+
+    __tablename__ = "procore_sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("project_id", "resource", name="uq_procore_sync_cursors_project_resource"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(
+        Integer,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    resource = Column(String(50), nullable=False)
+    cursor_updated_at = Column(DateTime(timezone=True), nullable=True)
+    synced_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
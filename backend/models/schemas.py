@@ -352,6 +352,7 @@ class DrawingIndexStatusResponse(BaseModel):
 class DrawingReindexResponse(BaseModel):
     job_id: int
     index_status: str
+    mode: str = "full"
 
 
 class DrawingTextElementResponse(BaseModel):
@@ -370,6 +371,7 @@ class DrawingTextElementListResponse(BaseModel):
     total: int
     page: int
     limit: int
+    next_cursor: Optional[int] = None
 
 
 class DrawingSurveyPointResponse(BaseModel):
@@ -490,7 +492,12 @@ class DrawingWorkspaceDrawingResponse(BaseModel):
     file_url: str = Field(..., serialization_alias="fileUrl")
     source_file_url: str = Field(..., serialization_alias="sourceFileUrl")
     page_count: int = Field(1, serialization_alias="pageCount")
+    #: Pages with a ready rendition; grows while ``processing_status`` is ``processing``.
+    rendered_page_count: int = Field(0, serialization_alias="renderedPageCount")
     active_page: int = Field(1, serialization_alias="activePage")
+    #: Deep Zoom descriptor for the active page (``?v=<pyramid digest>`` when known);
+    #: None until its tile pyramid exists.
+    tile_source_url: Optional[str] = Field(None, serialization_alias="tileSourceUrl")
     width_px: Optional[int] = Field(None, serialization_alias="widthPx")
     height_px: Optional[int] = Field(None, serialization_alias="heightPx")
     processing_status: str = Field(..., serialization_alias="processingStatus")
@@ -522,6 +529,9 @@ class EvidenceRecordResponse(BaseModel):
     cross_refs_json: Optional[List[Any]] = None
     file_url: Optional[str] = None
     content_type: Optional[str] = None
+    #: ``evidence_extract`` job state: pending | processing | ready | failed (None = not queued).
+    extraction_status: Optional[str] = None
+    extraction_error: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -529,6 +539,21 @@ class EvidenceRecordResponse(BaseModel):
         from_attributes = True
 
 
+class EvidenceBatchUploadError(BaseModel):
+    """A batch file that could not be stored; the other files were."""
+
+    filename: str
+    detail: str
+
+
+class EvidenceBatchUploadResponse(BaseModel):
+    """Result of a multi-file evidence upload; extraction runs in queued jobs."""
+
+    items: List[EvidenceRecordResponse]
+    total: int
+    errors: List[EvidenceBatchUploadError] = Field(default_factory=list)
+
+
 class EvidenceRecordCreate(BaseModel):
     type: str
     title: str
@@ -0,0 +1,88 @@
+"""
+Per-``job_type`` counters for the job worker.
+
+Counts live in the worker process. :func:`log_job_worker_metrics` emits them (with queue
+depth read from ``job_queue``) as one ``job_worker_metrics`` JSON log line.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobTypeCounters:
+    in_flight: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+
+
+class JobWorkerMetrics:
+    """In-process throughput counters keyed by ``job_type``."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._counters: dict[str, JobTypeCounters] = {}
+
+    def _for(self, job_type: str) -> JobTypeCounters:
+        counters = self._counters.get(job_type)
+        if counters is None:
+            counters = JobTypeCounters()
+            self._counters[job_type] = counters
+        return counters
+
+    def record_started(self, job_type: str) -> None:
+        counters = self._for(job_type)
+        counters.in_flight += 1
+        counters.started += 1
+
+    def record_finished(
+        self,
+        job_type: str,
+        *,
+        succeeded: bool,
+        duration_seconds: float,
+    ) -> None:
+        counters = self._for(job_type)
+        counters.in_flight = max(0, counters.in_flight - 1)
+        if succeeded:
+            counters.completed += 1
+        else:
+            counters.failed += 1
+        counters.busy_seconds += max(0.0, duration_seconds)
+
+    def snapshot(
+        self,
+        queue_depth: Mapping[str, int] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Per-type stats; ``throughput_per_minute`` counts finished jobs since start."""
+        uptime_minutes = max((self._clock() - self._started_at) / 60.0, 1e-9)
+        depth = dict(queue_depth or {})
+        out: dict[str, dict[str, Any]] = {}
+        for job_type in sorted(set(self._counters) | set(depth)):
+            counters = self._counters.get(job_type, JobTypeCounters())
+            finished = counters.completed + counters.failed
+            out[job_type] = {
+                "queue_depth": int(depth.get(job_type, 0)),
+                "in_flight": counters.in_flight,
+                "started": counters.started,
+                "completed": counters.completed,
+                "failed": counters.failed,
+                "throughput_per_minute": round(finished / uptime_minutes, 3),
+                "avg_duration_seconds": (
+                    round(counters.busy_seconds / finished, 3) if finished else None
+                ),
+            }
+        return out
+
+
+def log_job_worker_metrics(snapshot: Mapping[str, Mapping[str, Any]]) -> None:
+    logger.info("job_worker_metrics", extra={"job_metrics": dict(snapshot)})
@@ -56,6 +56,28 @@ class JsonFormatter(logging.Formatter):
             "evidence_ids",
             "finding_type",
             "severity",
+            # job_metrics.py
+            "job_type",
+            "job_metrics",
+            # drawing_rendering.py
+            "drawing_id",
+            "rendered",
+            "pages",
+            # inspection_mapping_jobs.py
+            "run_id",
+            "evidence_id",
+            # inspection_matching_jobs.py
+            "item_count",
+            "failed_count",
+            # api/routes/evidence.py
+            "upload_name",
+            # ocr_capabilities.py
+            "tesseract_available",
+            "tesseract_version",
+            # llm_response_store.py
+            "evicted",
+            # procore_http.py
+            "attempt",
         ):
             if hasattr(record, key):
                 payload[key] = getattr(record, key)
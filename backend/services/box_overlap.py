@@ -0,0 +1,251 @@
+"""Uniform-grid lookups between axis-aligned page boxes.
+
+Tile deduplication, region matching and viewport queries used to compare every box
+against every other one. Both grids here bucket normalized (0-1) boxes into a square grid
+sized to the number of boxes, so a lookup only looks at boxes sharing a cell with the
+query and the exact checks stay the same. Boxes reaching off the page land in the edge
+cells.
+
+* :class:`GridIndex` -- id'd boxes for rectangle queries (touching edges count); the
+  per-page index behind ``services.drawing_spatial_index``.
+* :class:`OverlapGrid` -- growing set of boxes for positive-area overlap tests; empty,
+  inverted and NaN boxes are kept but never overlap anything.
+
+:func:`bbox_from_json` is the one parser for the ``bbox_json`` shapes stored on text
+elements, survey points and landmarks.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, Sequence, cast
+
+Box = tuple[float, float, float, float]
+
+#: Average boxes per cell a grid is sized for.
+_BOXES_PER_CELL = 4
+_MAX_GRID_SIZE = 128
+
+
+def bbox_from_json(bbox_json: object) -> Box | None:
+    """``{x0, y0, x1, y1}`` or ``{x, y, width, height}`` as ``(x0, y0, x1, y1)``; else None."""
+    if not isinstance(bbox_json, dict):
+        return None
+    try:
+        if all(key in bbox_json for key in ("x0", "y0", "x1", "y1")):
+            return (
+                float(bbox_json["x0"]),
+                float(bbox_json["y0"]),
+                float(bbox_json["x1"]),
+                float(bbox_json["y1"]),
+            )
+        if all(key in bbox_json for key in ("x", "y", "width", "height")):
+            x = float(bbox_json["x"])
+            y = float(bbox_json["y"])
+            return x, y, x + float(bbox_json["width"]), y + float(bbox_json["height"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def grid_bucket(value: float, bucket_size: float) -> int:
+    """Grid cell of ``value`` for cells ``bucket_size`` wide, clamped to the unit page."""
+    if bucket_size <= 0:
+        raise ValueError("bucket_size must be positive")
+    bucket = int(value / bucket_size)
+    max_bucket = max(0, int(round(1 / bucket_size)) - 1)
+    return max(0, min(bucket, max_bucket))
+
+
+def box_overlap_area(a: Box, b: Box) -> float:
+    """Intersection area of two boxes; 0.0 when they only touch or are disjoint."""
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
+    ix0, iy0 = max(ax0, bx0), max(ay0, by0)
+    ix1, iy1 = min(ax1, bx1), min(ay1, by1)
+    if ix1 <= ix0 or iy1 <= iy0:
+        return 0.0
+    return (ix1 - ix0) * (iy1 - iy0)
+
+
+def box_overlap_ratio(left: Box | None, right: Box | None) -> float:
+    """Intersection area over the smaller box's area (1.0 when one contains the other)."""
+    if left is None or right is None:
+        return 0.0
+    intersection = box_overlap_area(left, right)
+    if intersection == 0.0:
+        return 0.0
+    lx0, ly0, lx1, ly1 = left
+    rx0, ry0, rx1, ry1 = right
+    left_area = max((lx1 - lx0) * (ly1 - ly0), 1e-9)
+    right_area = max((rx1 - rx0) * (ry1 - ry0), 1e-9)
+    return intersection / min(left_area, right_area)
+
+
+class _UniformGrid:
+    """Square grid over the unit page; each box is listed in every cell it touches."""
+
+    def __init__(self, grid_size: int) -> None:
+        self.grid_size = max(1, min(_MAX_GRID_SIZE, grid_size))
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    @staticmethod
+    def size_for(count: int) -> int:
+        return int(math.sqrt(count / _BOXES_PER_CELL))
+
+    def _cell_range(self, low: float, high: float) -> range:
+        # Comparisons first so infinite coordinates clamp instead of overflowing int().
+        last = self.grid_size - 1
+        first = 0 if low <= 0 else last if low >= 1 else min(int(low * self.grid_size), last)
+        end = 0 if high <= 0 else last if high >= 1 else min(int(high * self.grid_size), last)
+        return range(first, end + 1)
+
+    def _cells_for(self, box: Box) -> list[tuple[int, int]]:
+        x0, y0, x1, y1 = box
+        if math.isnan(x0 + y0 + x1 + y1):
+            return []
+        rows = self._cell_range(min(y0, y1), max(y0, y1))
+        return [
+            (column, row)
+            for column in self._cell_range(min(x0, x1), max(x0, x1))
+            for row in rows
+        ]
+
+    def _insert(self, position: int, cells: Iterable[tuple[int, int]]) -> None:
+        buckets = self._cells
+        for cell in cells:
+            bucket = buckets.get(cell)
+            if bucket is None:
+                buckets[cell] = [position]
+            else:
+                bucket.append(position)
+
+    def _positions(self, cells: Iterable[tuple[int, int]]) -> list[int]:
+        found: set[int] = set()
+        for cell in cells:
+            found.update(self._cells.get(cell, ()))
+        return sorted(found)
+
+
+class GridIndex(_UniformGrid):
+    """
+    Id'd boxes for rectangle queries; inverted boxes are indexed by their normalized extent.
+
+    Queries visit only the cells under the rectangle, then check the candidates' boxes
+    exactly, so cost tracks the viewport's contents rather than the page's.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, Box]], grid_size: int | None = None) -> None:
+        ordered = sorted(entries, key=lambda entry: entry[0])
+        super().__init__(self.size_for(len(ordered)) if grid_size is None else grid_size)
+        self.ids: list[int] = [entry_id for entry_id, _ in ordered]
+        self.boxes: list[Box] = [box for _, box in ordered]
+        for position, box in enumerate(self.boxes):
+            self._insert(position, self._cells_for(box))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def query(self, bbox: Box) -> list[int]:
+        """Ids (ascending) of boxes intersecting ``bbox``; touching edges count."""
+        qx0, qy0, qx1, qy1 = bbox
+        qx0, qx1 = min(qx0, qx1), max(qx0, qx1)
+        qy0, qy1 = min(qy0, qy1), max(qy0, qy1)
+        hits: list[int] = []
+        for position in self._positions(self._cells_for((qx0, qy0, qx1, qy1))):
+            x0, y0, x1, y1 = self.boxes[position]
+            if min(x0, x1) <= qx1 and max(x0, x1) >= qx0 and min(y0, y1) <= qy1 and max(y0, y1) >= qy0:
+                hits.append(self.ids[position])
+        return hits
+
+    def to_entries_json(self) -> list[list[float]]:
+        return [[entry_id, *box] for entry_id, box in zip(self.ids, self.boxes)]
+
+    @classmethod
+    def from_entries_json(cls, entries_json: Sequence[Sequence[float]], grid_size: int) -> "GridIndex":
+        return cls(
+            ((int(entry[0]), cast(Box, tuple(float(v) for v in entry[1:5]))) for entry in entries_json),
+            grid_size=grid_size,
+        )
+
+
+class OverlapGrid(_UniformGrid):
+    """
+    Boxes indexed by insertion order, for positive-area overlap tests.
+
+    Two boxes with a positive intersection always share a cell, so checking only the
+    boxes in the query's cells finds exactly what a scan over all boxes would. Size the
+    grid with ``expected`` (the number of boxes that will be added); it does not resize.
+    """
+
+    def __init__(self, boxes: Iterable[Box | None] = (), *, expected: int | None = None) -> None:
+        initial = list(boxes)
+        super().__init__(self.size_for(expected if expected is not None else len(initial)))
+        self.boxes: list[Box | None] = []
+        for box in initial:
+            self.add(box)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def _overlap_cells(self, box: Box | None) -> list[tuple[int, int]]:
+        if box is None:
+            return []
+        x0, y0, x1, y1 = box
+        # Also false for NaN: degenerate, inverted and NaN boxes intersect nothing.
+        if not (x1 > x0 and y1 > y0):
+            return []
+        return self._cells_for(box)
+
+    def add(self, box: Box | None) -> int:
+        """Index ``box``; returns its position (insertion order)."""
+        position = len(self.boxes)
+        self.boxes.append(box)
+        self._insert(position, self._overlap_cells(box))
+        return position
+
+    def candidates(self, box: Box | None) -> list[int]:
+        """Positions (ascending) of boxes sharing a cell with ``box``; a superset of overlaps."""
+        return self._positions(self._overlap_cells(box))
+
+    def overlaps(self, box: Box | None, threshold: float) -> bool:
+        """Whether any indexed box has :func:`box_overlap_ratio` ``>= threshold`` with ``box``."""
+        if threshold <= 0:
+            return bool(self.boxes)
+        cells = self._overlap_cells(box)
+        if not cells:
+            return False
+        assert box is not None
+        x0, y0, x1, y1 = box
+        area = max((x1 - x0) * (y1 - y0), 1e-9)
+        seen: set[int] = set()
+        boxes = self.boxes
+        for cell in cells:
+            for position in self._cells.get(cell, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                # Inlined box_overlap_ratio: this is the dedup hot loop.
+                ox0, oy0, ox1, oy1 = cast(Box, boxes[position])
+                width = min(x1, ox1) - max(x0, ox0)
+                height = min(y1, oy1) - max(y0, oy0)
+                if width <= 0 or height <= 0:
+                    continue
+                other_area = max((ox1 - ox0) * (oy1 - oy0), 1e-9)
+                if width * height / min(area, other_area) >= threshold:
+                    return True
+        return False
+
+    def best_overlap(self, box: Box | None) -> int | None:
+        """Position of the box with the largest intersection area (earliest on ties), if any."""
+        best: int | None = None
+        best_area = 0.0
+        for position in self.candidates(box):
+            other = self.boxes[position]
+            if other is None or box is None:
+                continue
+            area = box_overlap_area(box, other)
+            if area > best_area:
+                best_area = area
+                best = position
+        return best
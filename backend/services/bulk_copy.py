@@ -0,0 +1,83 @@
+"""
+Bulk row writer for index artifacts (text elements, survey points, landmarks).
+
+The master drawing index writes tens to hundreds of thousands of rows per drawing. Building
+one ORM instance per row and flushing them costs far more than the data itself, so these
+paths hand plain dicts to :func:`bulk_insert_rows`:
+
+- Postgres (psycopg 3): ``COPY <table> (<columns>) FROM STDIN`` streamed on the session's
+  own connection, so rows land in the caller's transaction.
+- Other dialects / drivers (SQLite in tests): one ``executemany`` INSERT.
+
+Rows are not loaded back; callers keep their own in-memory records.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import JSON, insert
+from sqlalchemy.orm import Session
+
+
+def _copy_rows(
+    session: Session,
+    table: Any,
+    columns: list[str],
+    rows: Sequence[Mapping[str, Any]],
+) -> bool:
+    """Stream ``rows`` through COPY; False when the driver has no COPY support."""
+    driver_connection = session.connection().connection.driver_connection
+    cursor = driver_connection.cursor()  # type: ignore[union-attr]
+    try:
+        if not hasattr(cursor, "copy"):
+            return False
+
+        preparer = session.get_bind().dialect.identifier_preparer
+        column_sql = ", ".join(preparer.quote(column) for column in columns)
+        json_columns = {
+            column for column in columns if isinstance(table.c[column].type, JSON)
+        }
+        with cursor.copy(
+            f"COPY {preparer.format_table(table)} ({column_sql}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row(
+                    [
+                        json.dumps(row[column])
+                        if column in json_columns and row[column] is not None
+                        else row[column]
+                        for column in columns
+                    ]
+                )
+        return True
+    finally:
+        cursor.close()
+
+
+def bulk_insert_rows(
+    session: Session,
+    model: Any,
+    rows: Sequence[Mapping[str, Any]],
+) -> int:
+    """
+    Insert ``rows`` (column name → value; every row has the same keys) into ``model``'s table.
+
+    Pending ORM changes are flushed first so the COPY sees them (e.g. the delete of the
+    previous index run). Column defaults that only exist on the ORM side are not applied.
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    columns = list(rows[0].keys())
+    session.flush()
+
+    if session.get_bind().dialect.name == "postgresql" and _copy_rows(
+        session, table, columns, rows
+    ):
+        return len(rows)
+
+    session.execute(insert(table), [dict(row) for row in rows])
+    return len(rows)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 from typing import Any, cast
 
 from sqlalchemy.orm import Session
@@ -14,6 +15,7 @@ from models.schemas import (
     DrawingSurveyPointResponse,
     DrawingTextElementResponse,
 )
+from services.drawing_spatial_index import Box, query_bbox
 
 
 def drawing_index_status_response(drawing: Drawing) -> DrawingIndexStatusResponse:
@@ -41,18 +43,42 @@ def list_drawing_text_elements(
     master_drawing_id: int,
     page: int,
     limit: int,
-) -> tuple[list[DrawingTextElementResponse], int]:
+    bbox: Box | None = None,
+    cursor: int | None = None,
+) -> tuple[list[DrawingTextElementResponse], int, int | None]:
+    """
+    Text elements on a page in id order, ``limit`` at a time: ``(items, total, next_cursor)``.
+
+    ``bbox`` (normalized ``x0, y0, x1, y1``) keeps only elements intersecting it, answered
+    from the page's spatial index. ``cursor`` is the previous response's ``next_cursor``
+    (the last id it returned); ``next_cursor`` is None on the last page.
+    """
     query = session.query(DrawingTextElement).filter(
         DrawingTextElement.master_drawing_id == master_drawing_id,
         DrawingTextElement.page == page,
     )
-    total = query.count()
-    rows = (
-        query.order_by(DrawingTextElement.id.asc())
-        .offset(0)
-        .limit(limit)
-        .all()
-    )
+    if bbox is not None:
+        matching = query_bbox(session, master_drawing_id, page, bbox)
+        total = len(matching)
+        if cursor is not None:
+            matching = matching[bisect.bisect_right(matching, cursor) :]
+        has_more = len(matching) > limit
+        ids = matching[:limit]
+        rows = (
+            query.filter(DrawingTextElement.id.in_(ids))
+            .order_by(DrawingTextElement.id.asc())
+            .all()
+            if ids
+            else []
+        )
+    else:
+        total = query.count()
+        if cursor is not None:
+            query = query.filter(DrawingTextElement.id > cursor)
+        rows = query.order_by(DrawingTextElement.id.asc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+    next_cursor = cast(int, rows[-1].id) if has_more and rows else None
     items = [
         DrawingTextElementResponse(
             id=cast(int, row.id),
@@ -66,7 +92,7 @@ def list_drawing_text_elements(
         )
         for row in rows
     ]
-    return items, total
+    return items, total, next_cursor
 
 
 def list_drawing_survey_points(
@@ -3,32 +3,53 @@ Master drawing auto-index job queue integration.
 
 Enqueues index jobs after successful drawing render. OCR ingest and region
 building run in :mod:`ai.pipelines.master_drawing_indexer` (Phase 2+).
+
+Jobs with ``input_data.mode == "incremental"`` re-index only the pages whose content
+fingerprint changed since the last successful index; a drawing without stored
+fingerprints (or whose last run failed) gets a full index instead.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
+from concurrent.futures import Executor
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, Optional, cast
+from typing import Any, Collection, Literal, Optional, cast
 
 from sqlalchemy.orm import Session
 
-from ai.pipelines.master_drawing_indexer import IndexResult, index_master_drawing
+from ai.pipelines.master_drawing_indexer import (
+    IndexResult,
+    changed_pages,
+    index_master_drawing,
+    page_fingerprints,
+)
 from ai.pipelines.master_drawing_region_builder import AUTO_INDEX_REGION_SOURCE
 from config import settings
 from models.drawing_region import DrawingRegion
 from models.drawing_landmark import DrawingLandmark
 from models.drawing_survey_point import DrawingSurveyPoint
 from models.drawing_text_element import DrawingTextElement
-from models.models import Drawing, JobQueue, Project, User, UserCompany
+from models.models import Drawing, JobQueue, Project
 from observability.workflow_logging import log_job_status_transition
+from services.drawing_index_version import bump_drawing_index_version
+from services.drawing_spatial_index import (
+    build_drawing_spatial_index,
+    invalidate_drawing_spatial_index,
+)
 from services.inspection_matching_jobs import flush_deferred_inspection_matches_for_drawing
+from services.job_execution import run_blocking
+from services.job_notifications import notify_job_enqueued
+from services.job_owner import resolve_user_id_for_project
+from services.storage import open_storage_path
 
 logger = logging.getLogger(__name__)
 
 JOB_TYPE = "drawing_index"
 
+IndexMode = Literal["full", "incremental"]
+
 
 def region_geometry_source(geometry: object) -> str | None:
     if not isinstance(geometry, dict):
@@ -44,64 +65,65 @@ def is_auto_index_region(region: DrawingRegion) -> bool:
     return region_geometry_source(region.geometry) == AUTO_INDEX_REGION_SOURCE
 
 
-def _resolve_user_id_for_project(db: Session, project_id: int) -> int:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise ValueError(f"Project {project_id} not found")
-
-    uc = (
-        db.query(UserCompany)
-        .filter(UserCompany.company_id == project.company_id)
-        .first()
-    )
-    if uc is not None:
-        return cast(int, uc.user_id)
-
-    user = db.query(User).order_by(User.id.asc()).first()
-    if user is None:
-        raise ValueError("No users in database; cannot enqueue drawing index job")
-    return cast(int, user.id)
+def clear_drawing_index_artifacts(
+    session: Session,
+    drawing_id: int,
+    pages: Collection[int] | None = None,
+) -> None:
+    """Remove indexed text elements and auto-generated regions before re-index.
 
+    ``pages`` (1-based) limits the cleanup to those pages (incremental re-index). Their
+    stored spatial indexes are dropped too, and the drawing's ``index_version`` is bumped
+    so cached candidate tiles go stale.
+    """
+    page_list = sorted(pages) if pages is not None else None
 
-def clear_drawing_index_artifacts(session: Session, drawing_id: int) -> None:
-    """Remove indexed text elements and auto-generated regions before re-index."""
-    session.query(DrawingTextElement).filter(
+    text_elements = session.query(DrawingTextElement).filter(
         DrawingTextElement.master_drawing_id == drawing_id
-    ).delete(synchronize_session=False)
-
-    session.query(DrawingSurveyPoint).filter(
+    )
+    survey_points = session.query(DrawingSurveyPoint).filter(
         DrawingSurveyPoint.drawing_id == drawing_id,
         DrawingSurveyPoint.source == "auto_index",
-    ).delete(synchronize_session=False)
-
-    session.query(DrawingLandmark).filter(
+    )
+    landmarks = session.query(DrawingLandmark).filter(
         DrawingLandmark.drawing_id == drawing_id,
         DrawingLandmark.source == "auto_index",
-    ).delete(synchronize_session=False)
+    )
+    regions = session.query(DrawingRegion).filter(
+        DrawingRegion.master_drawing_id == drawing_id
+    )
+    if page_list is not None:
+        text_elements = text_elements.filter(DrawingTextElement.page.in_(page_list))
+        survey_points = survey_points.filter(DrawingSurveyPoint.page.in_(page_list))
+        landmarks = landmarks.filter(DrawingLandmark.page.in_(page_list))
+        regions = regions.filter(DrawingRegion.page.in_(page_list))
 
-    auto_regions = [
-        region
-        for region in session.query(DrawingRegion)
-        .filter(DrawingRegion.master_drawing_id == drawing_id)
-        .all()
-        if is_auto_index_region(region)
-    ]
+    text_elements.delete(synchronize_session=False)
+    survey_points.delete(synchronize_session=False)
+    landmarks.delete(synchronize_session=False)
+
+    auto_regions = [region for region in regions.all() if is_auto_index_region(region)]
     for region in auto_regions:
         session.delete(region)
 
+    invalidate_drawing_spatial_index(session, drawing_id, pages=page_list)
+    bump_drawing_index_version(session, drawing_id)
+
 
 def enqueue_drawing_index_job(
     db: Session,
     project_id: int,
     drawing_id: int,
     user_id: Optional[int] = None,
+    *,
+    mode: IndexMode = "full",
 ) -> JobQueue:
-    """Enqueue a master drawing index job."""
+    """Enqueue a master drawing index job (``mode="incremental"``: changed pages only)."""
     if not settings.drawing_index_enabled:
         raise ValueError("Drawing index is disabled (DRAWING_INDEX_ENABLED=false)")
 
     if user_id is None:
-        user_id = _resolve_user_id_for_project(db, project_id)
+        user_id = resolve_user_id_for_project(db, project_id, job_label="drawing index")
 
     project = db.query(Project).filter(Project.id == project_id).first()
     if project is None:
@@ -124,9 +146,10 @@ def enqueue_drawing_index_job(
         project_id=project_id,
         job_type=JOB_TYPE,
         status="pending",
-        input_data={"drawing_id": int(drawing_id)},
+        input_data={"drawing_id": int(drawing_id), "mode": mode},
     )
     db.add(job)
+    notify_job_enqueued(db, JOB_TYPE)
     db.commit()
     db.refresh(job)
     log_job_status_transition(
@@ -174,8 +197,76 @@ def _apply_index_result(drawing: Drawing, result: IndexResult) -> None:
         drawing.page_meta_json = result.page_meta_json  # type: ignore[assignment]
 
 
-def run_drawing_index_job(drawing_id: int, session: Session) -> IndexResult:
-    """Index a master drawing: clear prior auto-index data, run pipeline, persist status."""
+def _pages_to_reindex(drawing: Drawing) -> tuple[set[int] | None, list[str | None] | None]:
+    """
+    Pages whose fingerprint changed since the last successful index (None = all pages),
+    and the current fingerprints so the index run does not hash the pages again.
+    """
+    storage_key = cast(str | None, drawing.storage_key)
+    if not storage_key:
+        return None, None
+    source_path = open_storage_path(storage_key)
+    if not source_path.exists():
+        return None, None
+    fingerprints = page_fingerprints(source_path)
+    pages = changed_pages(
+        cast(list[dict[str, Any]] | None, drawing.page_meta_json),
+        fingerprints,
+    )
+    return pages, fingerprints
+
+
+def _drawing_index_totals(session: Session, drawing_id: int) -> dict[str, int]:
+    """Whole-drawing row counts, so incremental runs report the same stats as full ones."""
+    auto_regions = sum(
+        1
+        for region in session.query(DrawingRegion)
+        .filter(DrawingRegion.master_drawing_id == drawing_id)
+        .all()
+        if is_auto_index_region(region)
+    )
+    return {
+        "text_elements": session.query(DrawingTextElement)
+        .filter(DrawingTextElement.master_drawing_id == drawing_id)
+        .count(),
+        "regions": auto_regions,
+        "survey_points": session.query(DrawingSurveyPoint)
+        .filter(
+            DrawingSurveyPoint.drawing_id == drawing_id,
+            DrawingSurveyPoint.source == "auto_index",
+        )
+        .count(),
+        "landmarks": session.query(DrawingLandmark)
+        .filter(
+            DrawingLandmark.drawing_id == drawing_id,
+            DrawingLandmark.source == "auto_index",
+        )
+        .count(),
+    }
+
+
+def _forget_page_fingerprints(drawing: Drawing) -> None:
+    """After a failed run the stored fingerprints no longer describe the indexed rows."""
+    page_meta = cast(list[dict[str, Any]] | None, drawing.page_meta_json)
+    if not page_meta:
+        return
+    drawing.page_meta_json = [  # type: ignore[assignment]
+        {key: value for key, value in entry.items() if key != "fingerprint"}
+        for entry in page_meta
+        if isinstance(entry, dict)
+    ]
+
+
+def run_drawing_index_job(
+    drawing_id: int,
+    session: Session,
+    *,
+    mode: IndexMode = "full",
+) -> IndexResult:
+    """Index a master drawing: clear prior auto-index data, run pipeline, persist status.
+
+    ``mode="incremental"`` clears and re-indexes only pages whose content changed.
+    """
     drawing = session.get(Drawing, drawing_id)
     if drawing is None:
         raise ValueError(f"Drawing {drawing_id} not found")
@@ -198,10 +289,27 @@ def run_drawing_index_job(drawing_id: int, session: Session) -> IndexResult:
     session.commit()
 
     try:
-        clear_drawing_index_artifacts(session, drawing_id)
+        pages: set[int] | None = None
+        fingerprints: list[str | None] | None = None
+        if mode == "incremental":
+            pages, fingerprints = _pages_to_reindex(drawing)
+        if pages is not None:
+            logger.info(
+                "drawing_index_incremental",
+                extra={"drawing_id": drawing_id, "pages": sorted(pages)},
+            )
+
+        clear_drawing_index_artifacts(session, drawing_id, pages=pages)
         session.commit()
 
-        result = index_master_drawing(drawing_id, session)
+        result = index_master_drawing(
+            drawing_id, session, pages=pages, fingerprints=fingerprints
+        )
+        build_drawing_spatial_index(session, drawing_id, pages=pages)
+        # Again with the new rows: a tile load between the clear and now cached an empty page.
+        bump_drawing_index_version(session, drawing_id)
+        if pages is not None:
+            result = replace(result, **_drawing_index_totals(session, drawing_id))
         _apply_index_result(drawing, result)
         session.commit()
         flush_deferred_inspection_matches_for_drawing(session, drawing_id)
@@ -209,19 +317,30 @@ def run_drawing_index_job(drawing_id: int, session: Session) -> IndexResult:
     except Exception as exc:
         drawing.index_status = "failed"  # type: ignore[assignment]
         drawing.index_error = str(exc)  # type: ignore[assignment]
+        _forget_page_fingerprints(drawing)
         session.commit()
         raise
 
 
-async def process_drawing_index_job(drawing_id: int) -> None:
-    """Async wrapper for run_drawing_index_job (CPU-bound work in a thread)."""
+def run_drawing_index_job_in_new_session(
+    drawing_id: int,
+    mode: IndexMode = "full",
+) -> None:
+    """Run :func:`run_drawing_index_job` with its own session (thread or pool process)."""
     from database import SessionLocal
 
-    def _run() -> None:
-        db = SessionLocal()
-        try:
-            run_drawing_index_job(drawing_id, db)
-        finally:
-            db.close()
+    db = SessionLocal()
+    try:
+        run_drawing_index_job(drawing_id, db, mode=mode)
+    finally:
+        db.close()
 
-    await asyncio.to_thread(_run)
+
+async def process_drawing_index_job(
+    drawing_id: int,
+    executor: Executor | None = None,
+    *,
+    mode: IndexMode = "full",
+) -> None:
+    """Async wrapper for run_drawing_index_job (CPU-bound work in a thread or ``executor``)."""
+    await run_blocking(executor, run_drawing_index_job_in_new_session, drawing_id, mode)
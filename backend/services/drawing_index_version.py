@@ -0,0 +1,33 @@
+"""
+``drawings.index_version``: one counter per drawing for caches derived from its index.
+
+Anything that changes a drawing's indexed text elements or regions calls
+:func:`bump_drawing_index_version` in the same transaction (``clear_drawing_index_artifacts``,
+the index job once it has written the new rows, region CRUD). Caches key their entries by
+the version, so a committed change is a miss in every process without any messaging;
+entries under older versions simply age out.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from models.models import Drawing
+
+
+def drawing_index_version(session: Session, drawing_id: int) -> int | None:
+    """Current version, or None when the drawing does not exist."""
+    version = session.execute(
+        select(Drawing.index_version).where(Drawing.id == drawing_id)
+    ).scalar_one_or_none()
+    return int(version) if version is not None else None
+
+
+def bump_drawing_index_version(session: Session, drawing_id: int) -> None:
+    """Increment the version in the caller's transaction."""
+    session.execute(
+        update(Drawing)
+        .where(Drawing.id == drawing_id)
+        .values(index_version=Drawing.index_version + 1)
+    )
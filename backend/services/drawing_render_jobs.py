@@ -7,39 +7,22 @@ is CPU-bound and runs via asyncio.to_thread() or a worker process.
 
 from __future__ import annotations
 
-import asyncio
+from concurrent.futures import Executor
 from typing import Optional, cast
 
 from sqlalchemy.orm import Session
 
-from models.models import Drawing, JobQueue, Project, User, UserCompany
+from models.models import Drawing, JobQueue, Project
 from observability.workflow_logging import log_job_status_transition
 from services.drawing_index_jobs import maybe_enqueue_drawing_index_job
 from services.drawing_rendering import run_render_drawing_job
+from services.job_execution import run_blocking
+from services.job_notifications import notify_job_enqueued
+from services.job_owner import resolve_user_id_for_project
 
 DRAWING_RENDER_JOB_TYPE = "drawing_render"
 
 
-def _resolve_user_id_for_project(db: Session, project_id: int) -> int:
-    """Get a valid user_id for job creation (project's company member or first user)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise ValueError(f"Project {project_id} not found")
-
-    uc = (
-        db.query(UserCompany)
-        .filter(UserCompany.company_id == project.company_id)
-        .first()
-    )
-    if uc:
-        return cast(int, uc.user_id)
-
-    user = db.query(User).order_by(User.id.asc()).first()
-    if not user:
-        raise ValueError("No users in database; cannot enqueue drawing render job")
-    return cast(int, user.id)
-
-
 def enqueue_drawing_render_job(
     db: Session,
     project_id: int,
@@ -48,7 +31,7 @@ def enqueue_drawing_render_job(
 ) -> JobQueue:
     """Enqueue a drawing render job. Uses DB-backed JobQueue."""
     if user_id is None:
-        user_id = _resolve_user_id_for_project(db, project_id)
+        user_id = resolve_user_id_for_project(db, project_id, job_label="drawing render")
 
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -76,6 +59,7 @@ def enqueue_drawing_render_job(
         },
     )
     db.add(job)
+    notify_job_enqueued(db, DRAWING_RENDER_JOB_TYPE)
     db.commit()
     db.refresh(job)
     log_job_status_transition(
@@ -87,16 +71,20 @@ def enqueue_drawing_render_job(
     return job
 
 
-async def process_drawing_render_job(drawing_id: int) -> None:
+async def process_drawing_render_job(
+    drawing_id: int,
+    executor: Executor | None = None,
+) -> None:
     """
     Async wrapper for run_render_drawing_job. PyMuPDF rendering is CPU-bound,
-    so we offload to a thread via asyncio.to_thread().
+    so we offload to a thread via asyncio.to_thread(), or to ``executor``
+    (the parallel worker's process pool) when given.
 
     On success, chains a drawing_index job when auto-index is enabled.
     """
     from database import SessionLocal
 
-    await asyncio.to_thread(run_render_drawing_job, drawing_id)
+    await run_blocking(executor, run_render_drawing_job, drawing_id)
 
     db = SessionLocal()
     try:
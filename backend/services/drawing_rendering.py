@@ -2,27 +2,122 @@
 PDF/image rendering service using PyMuPDF.
 
 Standardizes all drawing page rendering logic for the workspace viewer.
+
+Multi-page PDFs render across a process pool (``DRAWING_RENDER_WORKERS``); each worker
+process opens its own ``fitz.Document`` once. Rendition rows are bulk-upserted in chunks,
+with page 1 flushed on its own so the viewer can show it while later pages render.
+
+Every page rendition is also cut into a Deep Zoom tile pyramid
+(:mod:`services.drawing_tiles`) served by the ``/pages/{n}/tiles/{z}/{x}/{y}`` route.
 """
 
 from __future__ import annotations
 
+import logging
 import mimetypes
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 import fitz  # PyMuPDF
+from PIL import Image
 
+from config import settings
 from database import SessionLocal
+from services.drawing_tiles import write_deep_zoom_pyramid
+from services.job_execution import reserve_pool_workers
 from services.storage import (
     StorageService,
     build_drawing_render_storage_key,
-    get_storage_file_size,
     open_storage_path,
     write_bytes_to_storage_key,
 )
 
+logger = logging.getLogger(__name__)
+
 RENDER_DPI = 200
 RENDER_MIME_TYPE = "image/png"
+#: Rendition rows per bulk upsert while a PDF is rendering.
+RENDER_UPSERT_CHUNK_SIZE = 16
+#: Below this page count the pool start-up costs more than it saves; render in-process.
+RENDER_PARALLEL_MIN_PAGES = 4
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    page_number: int
+    storage_key: str
+    width_px: int
+    height_px: int
+    file_size: int
+
+    def to_rendition_row(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "image_storage_key": self.storage_key,
+            "mime_type": RENDER_MIME_TYPE,
+            "width_px": self.width_px,
+            "height_px": self.height_px,
+            "file_size": self.file_size,
+            "dpi": RENDER_DPI,
+            "render_status": "ready",
+        }
+
+
+def render_pdf_page(
+    doc: fitz.Document,
+    project_id: int,
+    drawing_id: int,
+    zero_based_index: int,
+) -> RenderedPage:
+    """Rasterize one page at :data:`RENDER_DPI` and write its PNG and tile pyramid to storage."""
+    page = doc.load_page(zero_based_index)
+    pix = page.get_pixmap(dpi=RENDER_DPI, alpha=False)
+
+    png_bytes = pix.tobytes("png")
+    page_number = zero_based_index + 1
+    storage_key = build_drawing_render_storage_key(project_id, drawing_id, page_number)
+    write_bytes_to_storage_key(storage_key, png_bytes)
+    write_deep_zoom_pyramid(
+        Image.frombytes("RGB", (pix.width, pix.height), pix.samples),
+        project_id,
+        drawing_id,
+        page_number,
+    )
+    return RenderedPage(
+        page_number=page_number,
+        storage_key=storage_key,
+        width_px=pix.width,
+        height_px=pix.height,
+        file_size=len(png_bytes),
+    )
+
+
+# Per-process document opened by the pool initializer (one ``fitz.Document`` per worker).
+_worker_doc: fitz.Document | None = None
+
+
+def _open_worker_doc(source_path: str) -> None:
+    global _worker_doc
+    _worker_doc = fitz.open(source_path)
+
+
+def _render_page_in_worker(project_id: int, drawing_id: int, zero_based_index: int) -> RenderedPage:
+    if _worker_doc is None:
+        raise RuntimeError("render worker document not initialized")
+    return render_pdf_page(_worker_doc, project_id, drawing_id, zero_based_index)
+
+
+def render_worker_count(page_count: int) -> int:
+    """Processes to render ``page_count`` pages with (1 = serial, in-process)."""
+    if page_count < RENDER_PARALLEL_MIN_PAGES:
+        return 1
+    configured = int(settings.drawing_render_workers)
+    workers = configured if configured > 0 else (os.cpu_count() or 1)
+    return max(1, min(workers, page_count))
 
 
 class DrawingRenderingService:
@@ -86,32 +181,69 @@ class DrawingRenderingService:
         doc = fitz.open(source_path)
         try:
             page_count = doc.page_count
-            for zero_based_index in range(page_count):
-                page = doc.load_page(zero_based_index)
-                pix = page.get_pixmap(dpi=RENDER_DPI, alpha=False)
-
-                png_bytes = pix.tobytes("png")
-                page_number = zero_based_index + 1
-                storage_key = build_drawing_render_storage_key(
-                    project_id, drawing_id, page_number
-                )
-                write_bytes_to_storage_key(storage_key, png_bytes)
-
-                self.storage.upsert_drawing_rendition(
-                    drawing_id=drawing_id,
-                    page_number=page_number,
-                    image_storage_key=storage_key,
-                    mime_type=RENDER_MIME_TYPE,
-                    width_px=pix.width,
-                    height_px=pix.height,
-                    file_size=get_storage_file_size(storage_key),
-                    render_status="ready",
-                )
+            # Page count up front so the viewer can show "n of page_count" progress.
+            self.storage.set_drawing_processing_status(
+                drawing_id, "processing", page_count=page_count
+            )
+            # Inline inside a CPU job process or when the pool budget is spent.
+            with reserve_pool_workers(render_worker_count(page_count)) as workers:
+                if workers == 1:
+                    pages = (
+                        render_pdf_page(doc, project_id, drawing_id, index)
+                        for index in range(page_count)
+                    )
+                    self._persist_rendered_pages(drawing_id, page_count, pages)
+                    return page_count
 
-            return page_count
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_open_worker_doc,
+                    initargs=(str(source_path),),
+                ) as pool:
+                    futures = [
+                        pool.submit(_render_page_in_worker, project_id, drawing_id, index)
+                        for index in range(page_count)
+                    ]
+                    self._persist_rendered_pages(
+                        drawing_id,
+                        page_count,
+                        (future.result() for future in as_completed(futures)),
+                    )
+                return page_count
         finally:
             doc.close()
 
+    def _persist_rendered_pages(
+        self,
+        drawing_id: int,
+        page_count: int,
+        pages: Iterator[RenderedPage],
+    ) -> None:
+        """Bulk-upsert renditions as pages finish; page 1 is flushed immediately."""
+        pending: List[RenderedPage] = []
+        done = 0
+        for page in pages:
+            pending.append(page)
+            done += 1
+            logger.debug(
+                "drawing_render_page_ready",
+                extra={"drawing_id": drawing_id, "page": page.page_number, "pages": page_count},
+            )
+            if page.page_number == 1 or len(pending) >= RENDER_UPSERT_CHUNK_SIZE:
+                self.storage.bulk_upsert_drawing_renditions(
+                    drawing_id, [p.to_rendition_row() for p in pending]
+                )
+                pending.clear()
+                logger.info(
+                    "drawing_render_progress",
+                    extra={"drawing_id": drawing_id, "rendered": done, "pages": page_count},
+                )
+        if pending:
+            self.storage.bulk_upsert_drawing_renditions(
+                drawing_id, [p.to_rendition_row() for p in pending]
+            )
+
     def _register_existing_image_as_rendition(
         self,
         project_id: int,
@@ -128,6 +260,9 @@ class DrawingRenderingService:
         height_px = int(img.shape[0]) if img is not None else None
         file_size = source_path.stat().st_size if source_path.exists() else None
 
+        with Image.open(source_path) as pil_image:
+            write_deep_zoom_pyramid(pil_image, project_id, drawing_id, 1)
+
         self.storage.upsert_drawing_rendition(
             drawing_id=drawing_id,
             page_number=1,
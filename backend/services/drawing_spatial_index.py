@@ -0,0 +1,250 @@
+"""
+Spatial index over a drawing's indexed geometry ("what is inside this rectangle").
+
+Text elements, regions, survey points and landmarks all carry normalized 0-1 boxes, but
+the only way to find the ones in a viewport used to be loading every row on the page.
+Per drawing page and kind, :func:`build_drawing_spatial_index` (run by the drawing index
+job) stores the boxes in ``drawing_spatial_indexes``; :func:`query_bbox` answers
+rectangle queries from a :class:`~services.box_overlap.GridIndex` built over them and cached in-process by
+the stored row's id.
+
+Writers of the underlying rows call :func:`invalidate_drawing_spatial_index` in the same
+transaction (``clear_drawing_index_artifacts``, region CRUD); a missing index is rebuilt
+from the rows on the next query and stored in its own short-lived session, like
+``ocr_result_store``. Database errors on that write are logged and the index is only kept
+in memory.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from collections import OrderedDict
+from typing import Collection, Literal, cast
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models.drawing_landmark import DrawingLandmark
+from models.drawing_region import DrawingRegion
+from models.drawing_spatial_index import DrawingSpatialIndex
+from models.drawing_survey_point import DrawingSurveyPoint
+from models.drawing_text_element import DrawingTextElement
+from services.box_overlap import Box, GridIndex, bbox_from_json
+
+logger = logging.getLogger(__name__)
+
+SpatialKind = Literal["text_element", "region", "survey_point", "landmark"]
+SPATIAL_KINDS: tuple[SpatialKind, ...] = ("text_element", "region", "survey_point", "landmark")
+
+#: Page indexes kept in memory per process.
+_CACHE_MAX_ENTRIES = 64
+
+
+def _region_box(geometry: object) -> Box | None:
+    """Bounding box of a rect or polygon ``drawing_regions.geometry``."""
+    if not isinstance(geometry, dict):
+        return None
+    if geometry.get("type") == "polygon":
+        points = [
+            point
+            for point in geometry.get("points") or []
+            if isinstance(point, (list, tuple)) and len(point) >= 2
+        ]
+        try:
+            xs = [float(point[0]) for point in points]
+            ys = [float(point[1]) for point in points]
+        except (TypeError, ValueError):
+            return None
+        if not xs:
+            return None
+        return min(xs), min(ys), max(xs), max(ys)
+    return bbox_from_json(geometry)
+
+
+class _IndexCache:
+    """LRU of built page indexes keyed by their ``drawing_spatial_indexes`` row id."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[int, GridIndex] = OrderedDict()
+
+    def get(self, row_id: int) -> GridIndex | None:
+        with self.lock:
+            index = self.entries.get(row_id)
+            if index is not None:
+                self.entries.move_to_end(row_id)
+            return index
+
+    def put(self, row_id: int, index: GridIndex) -> None:
+        with self.lock:
+            self.entries[row_id] = index
+            self.entries.move_to_end(row_id)
+            while len(self.entries) > _CACHE_MAX_ENTRIES:
+                self.entries.popitem(last=False)
+
+
+_cache = _IndexCache()
+
+
+def reset_spatial_index_cache() -> None:
+    global _cache
+    _cache = _IndexCache()
+
+
+def _source_entries(
+    session: Session,
+    drawing_id: int,
+    kind: SpatialKind,
+    pages: Collection[int] | None,
+) -> dict[int, list[tuple[int, Box]]]:
+    """``{page: [(id, box), ...]}`` read from the rows behind ``kind``."""
+    if kind == "text_element":
+        columns = (DrawingTextElement.id, DrawingTextElement.page, DrawingTextElement.bbox_json)
+        owner = DrawingTextElement.master_drawing_id
+        to_box = bbox_from_json
+    elif kind == "region":
+        columns = (DrawingRegion.id, DrawingRegion.page, DrawingRegion.geometry)
+        owner = DrawingRegion.master_drawing_id
+        to_box = _region_box
+    elif kind == "survey_point":
+        columns = (DrawingSurveyPoint.id, DrawingSurveyPoint.page, DrawingSurveyPoint.label_bbox_json)
+        owner = DrawingSurveyPoint.drawing_id
+        to_box = bbox_from_json
+    else:
+        columns = (DrawingLandmark.id, DrawingLandmark.page, DrawingLandmark.bbox_json)
+        owner = DrawingLandmark.drawing_id
+        to_box = bbox_from_json
+
+    stmt = select(*columns).where(owner == drawing_id)
+    if pages is not None:
+        stmt = stmt.where(columns[1].in_(sorted(pages)))
+
+    by_page: dict[int, list[tuple[int, Box]]] = {page: [] for page in pages or ()}
+    for row_id, page, raw in session.execute(stmt):
+        box = to_box(raw)
+        if box is not None:
+            by_page.setdefault(int(page), []).append((int(row_id), box))
+    return by_page
+
+
+def _index_row(drawing_id: int, page: int, kind: SpatialKind, index: GridIndex) -> DrawingSpatialIndex:
+    return DrawingSpatialIndex(
+        drawing_id=drawing_id,
+        page=page,
+        kind=kind,
+        grid_size=index.grid_size,
+        entry_count=len(index),
+        entries_json=index.to_entries_json(),
+    )
+
+
+def invalidate_drawing_spatial_index(
+    session: Session,
+    drawing_id: int,
+    *,
+    pages: Collection[int] | None = None,
+    kinds: Collection[SpatialKind] | None = None,
+) -> None:
+    """Drop stored indexes (all pages / kinds unless narrowed) in the caller's transaction."""
+    stmt = delete(DrawingSpatialIndex).where(DrawingSpatialIndex.drawing_id == drawing_id)
+    if pages is not None:
+        stmt = stmt.where(DrawingSpatialIndex.page.in_(sorted(pages)))
+    if kinds is not None:
+        stmt = stmt.where(DrawingSpatialIndex.kind.in_(sorted(kinds)))
+    session.execute(stmt)
+
+
+def build_drawing_spatial_index(
+    session: Session,
+    drawing_id: int,
+    *,
+    pages: Collection[int] | None = None,
+) -> int:
+    """
+    (Re)build the stored indexes for ``pages`` (default: every page with rows) in the
+    caller's transaction. Returns the number of page indexes written.
+    """
+    invalidate_drawing_spatial_index(session, drawing_id, pages=pages)
+    written = 0
+    for kind in SPATIAL_KINDS:
+        for page, entries in sorted(_source_entries(session, drawing_id, kind, pages).items()):
+            session.add(_index_row(drawing_id, page, kind, GridIndex(entries)))
+            written += 1
+    session.flush()
+    return written
+
+
+def _store_page_index(drawing_id: int, page: int, kind: SpatialKind, index: GridIndex) -> int | None:
+    try:
+        with SessionLocal() as db:
+            row = _index_row(drawing_id, page, kind, index)
+            db.add(row)
+            db.commit()
+            return cast(int, row.id)
+    except SQLAlchemyError:
+        # A concurrent query stored the same page first; either copy is current.
+        logger.warning("drawing_spatial_index_write_failed", exc_info=True)
+        return None
+
+
+def load_page_index(
+    session: Session,
+    drawing_id: int,
+    page: int,
+    kind: SpatialKind = "text_element",
+) -> GridIndex:
+    """The page's grid index: cached, else loaded from the stored row, else rebuilt."""
+    row_id = session.execute(
+        select(DrawingSpatialIndex.id).where(
+            DrawingSpatialIndex.drawing_id == drawing_id,
+            DrawingSpatialIndex.page == page,
+            DrawingSpatialIndex.kind == kind,
+        )
+    ).scalar_one_or_none()
+
+    if row_id is not None:
+        cached = _cache.get(row_id)
+        if cached is not None:
+            return cached
+        grid_size, entries_json = session.execute(
+            select(DrawingSpatialIndex.grid_size, DrawingSpatialIndex.entries_json).where(
+                DrawingSpatialIndex.id == row_id
+            )
+        ).one()
+        index = GridIndex.from_entries_json(entries_json or [], int(grid_size))
+    else:
+        entries = _source_entries(session, drawing_id, kind, [page]).get(page, [])
+        index = GridIndex(entries)
+        row_id = _store_page_index(drawing_id, page, kind, index)
+        if row_id is None:
+            return index
+
+    _cache.put(row_id, index)
+    return index
+
+
+def query_bbox(
+    session: Session,
+    drawing_id: int,
+    page: int,
+    bbox: Box,
+    *,
+    kind: SpatialKind = "text_element",
+    after_id: int | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    """
+    Ids of ``kind`` rows on the page whose box intersects ``bbox`` (normalized
+    ``x0, y0, x1, y1``), ascending. ``after_id`` / ``limit`` page through the result.
+    """
+    ids = load_page_index(session, drawing_id, page, kind).query(bbox)
+    if after_id is not None:
+        ids = ids[bisect.bisect_right(ids, after_id) :]
+    if limit is not None:
+        ids = ids[:limit]
+    return ids
+
@@ -0,0 +1,174 @@
+"""
+Deep Zoom (DZI) tile pyramids for rendered drawing pages.
+
+The render job cuts each page rendition into a multi-resolution pyramid next to the
+full PNG::
+
+    drawings/rendered/project-{p}/drawing-{d}/page-{n}.dzi
+    drawings/rendered/project-{p}/drawing-{d}/page-{n}_files/{level}/{col}_{row}.png
+
+Level ``max_level`` is the full rendition; each lower level halves both dimensions down
+to a 1x1 image at level 0 (the standard Deep Zoom layout, so OpenSeadragon-style viewers
+can consume the ``.dzi`` descriptor directly). A viewer paints a low level first and only
+fetches the tiles it needs while zooming.
+
+The writer also records a SHA-256 over every tile and the descriptor in
+``page-{n}.dzi.sha256``. The tile routes derive strong ETags from it and the workspace
+versions ``tileSourceUrl`` with it, so a re-render that changes any pixel changes both.
+
+Pyramid geometry is a pure function of the rendition's ``width_px``/``height_px`` and the
+constants below, so tile requests are validated without reading the descriptor.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Iterator, Optional, Tuple
+
+from PIL import Image
+
+from services.storage import (
+    build_drawing_render_dzi_digest_storage_key,
+    build_drawing_render_dzi_storage_key,
+    build_drawing_render_tile_storage_key,
+    open_storage_path,
+    write_bytes_to_storage_key,
+)
+
+DZI_TILE_SIZE = 256
+DZI_TILE_OVERLAP = 1
+DZI_TILE_FORMAT = "png"
+DZI_TILE_MIME_TYPE = "image/png"
+
+DZI_XML_NAMESPACE = "http://schemas.microsoft.com/deepzoom/2008"
+
+
+@dataclass(frozen=True)
+class DeepZoomPyramid:
+    width: int
+    height: int
+    tile_size: int = DZI_TILE_SIZE
+    overlap: int = DZI_TILE_OVERLAP
+    tile_format: str = DZI_TILE_FORMAT
+
+    @property
+    def max_level(self) -> int:
+        return int(math.ceil(math.log2(max(self.width, self.height, 1))))
+
+    def level_dimensions(self, level: int) -> Tuple[int, int]:
+        scale = 2 ** (self.max_level - level)
+        return (
+            max(1, int(math.ceil(self.width / scale))),
+            max(1, int(math.ceil(self.height / scale))),
+        )
+
+    def tile_grid(self, level: int) -> Tuple[int, int]:
+        """``(columns, rows)`` of tiles at ``level``."""
+        width, height = self.level_dimensions(level)
+        return (
+            int(math.ceil(width / self.tile_size)),
+            int(math.ceil(height / self.tile_size)),
+        )
+
+    def has_tile(self, level: int, column: int, row: int) -> bool:
+        if level < 0 or level > self.max_level:
+            return False
+        columns, rows = self.tile_grid(level)
+        return 0 <= column < columns and 0 <= row < rows
+
+    def tile_box(self, level: int, column: int, row: int) -> Tuple[int, int, int, int]:
+        """Pixel box ``(left, top, right, bottom)`` of a tile within its level image."""
+        width, height = self.level_dimensions(level)
+        left = column * self.tile_size - (self.overlap if column > 0 else 0)
+        top = row * self.tile_size - (self.overlap if row > 0 else 0)
+        right = min(width, (column + 1) * self.tile_size + self.overlap)
+        bottom = min(height, (row + 1) * self.tile_size + self.overlap)
+        return left, top, right, bottom
+
+    def to_dzi_xml(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<Image xmlns="{DZI_XML_NAMESPACE}" Format="{self.tile_format}" '
+            f'Overlap="{self.overlap}" TileSize="{self.tile_size}">'
+            f'<Size Width="{self.width}" Height="{self.height}"/>'
+            "</Image>"
+        )
+
+
+def _pyramid_levels(
+    image: Image.Image, pyramid: DeepZoomPyramid
+) -> Iterator[Tuple[int, Image.Image]]:
+    """Yield ``(level, image)`` from the full size down, halving the previous level."""
+    current = image
+    for level in range(pyramid.max_level, -1, -1):
+        size = pyramid.level_dimensions(level)
+        if current.size != size:
+            current = current.resize(size, Image.Resampling.BOX)
+        yield level, current
+
+
+def write_deep_zoom_pyramid(
+    image: Image.Image,
+    project_id: int,
+    drawing_id: int,
+    page_number: int,
+) -> DeepZoomPyramid:
+    """Cut ``image`` into tiles plus a ``.dzi`` descriptor under the page's render keys."""
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    pyramid = DeepZoomPyramid(width=image.width, height=image.height)
+    digest_key = build_drawing_render_dzi_digest_storage_key(project_id, drawing_id, page_number)
+    # A re-render overwrites tiles in place; drop the old digest first so no tile is
+    # served under a tag that no longer describes its bytes.
+    open_storage_path(digest_key).unlink(missing_ok=True)
+    digest = hashlib.sha256()
+
+    for level, level_image in _pyramid_levels(image, pyramid):
+        columns, rows = pyramid.tile_grid(level)
+        for column in range(columns):
+            for row in range(rows):
+                tile = level_image.crop(pyramid.tile_box(level, column, row))
+                buf = BytesIO()
+                tile.save(buf, format="PNG")
+                data = buf.getvalue()
+                digest.update(f"{level}/{column}_{row}:{len(data)}:".encode("utf-8"))
+                digest.update(data)
+                write_bytes_to_storage_key(
+                    build_drawing_render_tile_storage_key(
+                        project_id, drawing_id, page_number, level, column, row
+                    ),
+                    data,
+                )
+
+    descriptor = pyramid.to_dzi_xml().encode("utf-8")
+    digest.update(descriptor)
+    write_bytes_to_storage_key(digest_key, digest.hexdigest().encode("ascii"))
+    # Descriptor last: its presence means the whole pyramid is on disk.
+    write_bytes_to_storage_key(
+        build_drawing_render_dzi_storage_key(project_id, drawing_id, page_number),
+        descriptor,
+    )
+    return pyramid
+
+
+def deep_zoom_pyramid_exists(project_id: int, drawing_id: int, page_number: int) -> bool:
+    return open_storage_path(
+        build_drawing_render_dzi_storage_key(project_id, drawing_id, page_number)
+    ).exists()
+
+
+def read_deep_zoom_pyramid_digest(
+    project_id: int, drawing_id: int, page_number: int
+) -> Optional[str]:
+    """Content digest recorded by :func:`write_deep_zoom_pyramid`, or ``None`` if absent."""
+    path = open_storage_path(
+        build_drawing_render_dzi_digest_storage_key(project_id, drawing_id, page_number)
+    )
+    try:
+        value = path.read_text(encoding="ascii").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return value or None
@@ -7,6 +7,7 @@ from typing import Any, Dict, cast
 from sqlalchemy.orm import Session
 
 from models.models import Drawing
+from services.drawing_tiles import deep_zoom_pyramid_exists, read_deep_zoom_pyramid_digest
 from services.storage import StorageService
 
 
@@ -30,10 +31,19 @@ def serialize_drawing_for_workspace(
         file_url = f"/api/projects/{pid}/drawings/{did}/pages/{active_page}/image"
         width_px = rendition.width_px
         height_px = rendition.height_px
+        tile_source_url = None
+        if deep_zoom_pyramid_exists(pid, did, active_page):
+            tile_source_url = f"/api/projects/{pid}/drawings/{did}/pages/{active_page}/tiles.dzi"
+            digest = read_deep_zoom_pyramid_digest(pid, did, active_page)
+            if digest:
+                # Re-renders change the digest, so the URL (and tile URLs carrying the
+                # same ``v``) can be cached as immutable.
+                tile_source_url = f"{tile_source_url}?v={digest}"
     else:
         file_url = source_file_url
         width_px = None
         height_px = None
+        tile_source_url = None
 
     return {
         "id": did,
@@ -41,7 +51,9 @@ def serialize_drawing_for_workspace(
         "fileUrl": file_url,
         "sourceFileUrl": source_file_url,
         "pageCount": drawing.page_count or 1,
+        "renderedPageCount": storage.count_ready_drawing_renditions(did),
         "activePage": active_page,
+        "tileSourceUrl": tile_source_url,
         "widthPx": width_px,
         "heightPx": height_px,
         "processingStatus": getattr(drawing, "processing_status", "pending"),
@@ -0,0 +1,135 @@
+"""
+Evidence extraction job queue integration.
+
+``POST /api/projects/{id}/evidence`` stores the file and enqueues an ``evidence_extract``
+job instead of running text extraction, OCR, PDF link following, survey-point extraction
+and LLM classification on the request path. Progress is exposed on the evidence row as
+``extraction_status`` (pending → processing → ready | failed).
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Executor
+from typing import Optional, cast
+
+from sqlalchemy.orm import Session
+
+from models.models import EvidenceRecord, JobQueue, Project
+from observability.workflow_logging import log_job_status_transition
+from services.evidence_document_extraction import ingest_evidence_document_extraction
+from services.file_storage import get_file_path
+from services.job_execution import run_blocking
+from services.job_notifications import notify_job_enqueued
+from services.job_owner import resolve_user_id_for_project
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_EXTRACT_JOB_TYPE = "evidence_extract"
+
+
+def enqueue_evidence_extract_job(
+    db: Session,
+    project_id: int,
+    evidence_id: int,
+    user_id: Optional[int] = None,
+) -> JobQueue:
+    """Mark the evidence ``extraction_status=pending`` and enqueue its extract job."""
+    if user_id is None:
+        user_id = resolve_user_id_for_project(db, project_id, job_label="evidence extract")
+
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise ValueError(f"Project {project_id} not found")
+
+    evidence = (
+        db.query(EvidenceRecord)
+        .filter(EvidenceRecord.id == evidence_id, EvidenceRecord.project_id == project_id)
+        .first()
+    )
+    if not evidence:
+        raise ValueError(
+            f"Evidence {evidence_id} not found for project {project_id}; cannot enqueue extract job"
+        )
+
+    evidence.extraction_status = "pending"  # type: ignore[assignment]
+    evidence.extraction_error = None  # type: ignore[assignment]
+    job = JobQueue(
+        user_id=user_id,
+        company_id=project.company_id,
+        project_id=project_id,
+        job_type=EVIDENCE_EXTRACT_JOB_TYPE,
+        status="pending",
+        input_data={"evidence_id": int(evidence_id)},
+    )
+    db.add(job)
+    notify_job_enqueued(db, EVIDENCE_EXTRACT_JOB_TYPE)
+    db.commit()
+    db.refresh(job)
+    log_job_status_transition(
+        project_id=project_id,
+        job_id=cast(int, job.id),
+        status=cast(str | None, job.status),
+        previous_status=None,
+    )
+    return job
+
+
+def _set_extraction_status(
+    db: Session,
+    evidence_id: int,
+    status: str,
+    error: Optional[str] = None,
+) -> None:
+    evidence = db.get(EvidenceRecord, evidence_id)
+    if evidence is None:
+        return
+    evidence.extraction_status = status  # type: ignore[assignment]
+    evidence.extraction_error = error  # type: ignore[assignment]
+    db.commit()
+
+
+def run_evidence_extract_job(evidence_id: int) -> None:
+    """Run upload-time extraction for one evidence row in its own session."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        evidence = db.get(EvidenceRecord, evidence_id)
+        if evidence is None:
+            raise ValueError(f"Evidence {evidence_id} not found")
+        storage_key = cast(Optional[str], evidence.storage_key)
+        if not storage_key:
+            _set_extraction_status(db, evidence_id, "failed", "Evidence has no stored file")
+            raise ValueError(f"Evidence {evidence_id} has no storage_key")
+
+        _set_extraction_status(db, evidence_id, "processing")
+        try:
+            extraction = ingest_evidence_document_extraction(
+                db,
+                evidence_id=evidence_id,
+                file_path=get_file_path(storage_key),
+            )
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            _set_extraction_status(db, evidence_id, "failed", str(exc)[:500])
+            raise
+
+        if extraction is None:
+            # ingest_evidence_document_extraction logs the cause (unreadable or empty file).
+            _set_extraction_status(
+                db, evidence_id, "failed", "No text could be extracted from the file"
+            )
+            return
+        _set_extraction_status(db, evidence_id, "ready")
+    finally:
+        db.close()
+
+
+async def process_evidence_extract_job(
+    evidence_id: int,
+    executor: Executor | None = None,
+) -> None:
+    """Async wrapper: extraction mixes OCR and blocking HTTP/LLM calls, so run it off-loop."""
+    await run_blocking(executor, run_evidence_extract_job, evidence_id)
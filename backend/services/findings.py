@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
 
 from models.models import DrawingOverlay, Finding
 from models.schemas import FindingResponse, WorkspaceLinkMetadata
@@ -34,31 +34,38 @@ def _resolve_master_drawing_id(finding: Finding) -> int | None:
 
 
 def _find_overlay_for_finding(db: Session, finding: Finding) -> DrawingOverlay | None:
-    """Locate the overlay row tied to this finding via ``meta.finding_id``."""
-    finding_id = cast(int, finding.id)
+    """Newest overlay on the finding's master drawing linked via ``finding_id``."""
     master_id = _resolve_master_drawing_id(finding)
     if master_id is None:
         return None
 
-    overlays = (
+    return (
         db.query(DrawingOverlay)
-        .filter(DrawingOverlay.master_drawing_id == master_id)
+        .filter(
+            DrawingOverlay.finding_id == cast(int, finding.id),
+            DrawingOverlay.master_drawing_id == master_id,
+        )
         .order_by(DrawingOverlay.id.desc())
-        .all()
+        .first()
+    )
+
+
+def _workspace_link_metadata(
+    finding: Finding,
+    master_id: int,
+    overlay_id: int | None,
+    overlay_run_id: int | None,
+) -> WorkspaceLinkMetadata:
+    inspection_run_id = overlay_run_id
+    if inspection_run_id is None:
+        inspection_run_id = _parse_inspection_run_id_from_affected_items(finding)
+
+    return WorkspaceLinkMetadata(
+        project_id=cast(int, finding.project_id),
+        master_drawing_id=master_id,
+        inspection_run_id=inspection_run_id,
+        overlay_id=overlay_id,
     )
-    for overlay in overlays:
-        meta = getattr(overlay, "meta", None)
-        if not isinstance(meta, dict):
-            continue
-        candidate = meta.get("finding_id")
-        if candidate is None:
-            continue
-        try:
-            if int(candidate) == finding_id:
-                return overlay
-        except (TypeError, ValueError):
-            continue
-    return None
 
 
 def build_finding_workspace_link_metadata(
@@ -71,24 +78,54 @@ def build_finding_workspace_link_metadata(
         return None
 
     overlay = _find_overlay_for_finding(db, finding)
-    inspection_run_id: int | None = None
-    overlay_id: int | None = None
-
-    if overlay is not None:
-        overlay_id = cast(int, overlay.id)
-        raw_run_id = getattr(overlay, "inspection_run_id", None)
-        if raw_run_id is not None:
-            inspection_run_id = cast(int, raw_run_id)
+    if overlay is None:
+        return _workspace_link_metadata(finding, master_id, None, None)
+    return _workspace_link_metadata(
+        finding,
+        master_id,
+        cast(int, overlay.id),
+        cast(Optional[int], overlay.inspection_run_id),
+    )
 
-    if inspection_run_id is None:
-        inspection_run_id = _parse_inspection_run_id_from_affected_items(finding)
 
-    return WorkspaceLinkMetadata(
-        project_id=cast(int, finding.project_id),
-        master_drawing_id=master_id,
-        inspection_run_id=inspection_run_id,
-        overlay_id=overlay_id,
-    )
+def workspace_link_metadata_for_findings(
+    findings: Sequence[Finding],
+    db: Session,
+) -> Dict[int, WorkspaceLinkMetadata | None]:
+    """
+    Workspace link metadata for many findings, keyed by finding id.
+
+    Resolves every finding's overlay in one query joined on ``finding_id`` and the
+    finding's master drawing, so listing N findings costs one round trip, not N scans.
+    """
+    finding_ids = [
+        cast(int, f.id) for f in findings if _resolve_master_drawing_id(f) is not None
+    ]
+    overlays: Dict[int, tuple[int, int | None]] = {}
+    if finding_ids:
+        rows = (
+            db.query(DrawingOverlay.finding_id, DrawingOverlay.id, DrawingOverlay.inspection_run_id)
+            .join(
+                Finding,
+                (Finding.id == DrawingOverlay.finding_id)
+                & (Finding.drawing_id == DrawingOverlay.master_drawing_id),
+            )
+            .filter(Finding.id.in_(finding_ids))
+            .order_by(DrawingOverlay.id.desc())
+            .all()
+        )
+        for finding_id, overlay_id, run_id in rows:
+            overlays.setdefault(finding_id, (overlay_id, run_id))
+
+    links: Dict[int, WorkspaceLinkMetadata | None] = {}
+    for finding in findings:
+        master_id = _resolve_master_drawing_id(finding)
+        if master_id is None:
+            links[cast(int, finding.id)] = None
+            continue
+        overlay_id, run_id = overlays.get(cast(int, finding.id), (None, None))
+        links[cast(int, finding.id)] = _workspace_link_metadata(finding, master_id, overlay_id, run_id)
+    return links
 
 
 def build_finding_link(finding: Finding, db: Session) -> str | None:
@@ -127,6 +164,18 @@ class FindingService:
         return workspace_link_metadata_for_finding(finding, self.db)
 
     def serialize_finding(self, finding: Finding) -> FindingResponse:
+        return self._to_response(finding, self._build_workspace_link_for_finding(finding))
+
+    def serialize_findings(self, findings: Sequence[Finding]) -> List[FindingResponse]:
+        """Serialize a list of findings, resolving all workspace links in one query."""
+        links = workspace_link_metadata_for_findings(findings, self.db)
+        return [self._to_response(f, links.get(cast(int, f.id))) for f in findings]
+
+    def _to_response(
+        self,
+        finding: Finding,
+        workspace_link: WorkspaceLinkMetadata | None,
+    ) -> FindingResponse:
         return FindingResponse(
             id=cast(int, finding.id),
             project_id=cast(int, finding.project_id),
@@ -135,7 +184,7 @@ class FindingService:
             severity=cast(Optional[str], getattr(finding, "severity", None)),
             type=cast(Optional[str], getattr(finding, "type", None)),
             created_at=cast(Any, getattr(finding, "created_at", None)),
-            workspace_link=self._build_workspace_link_for_finding(finding),
+            workspace_link=workspace_link,
         )
 
     def list_project_findings(self, project_id: int, limit: Optional[int] = None) -> List[Finding]:
@@ -0,0 +1,174 @@
+"""
+Inspection mapping job queue integration.
+
+``POST /api/projects/{id}/inspections/runs`` creates the run (``status=queued``) and
+enqueues an ``inspection_mapping`` job instead of calling :func:`run_inspection_mapping`
+on the request path (LLM classification, outcome extraction, vocabulary tagging and
+overlay persistence). Clients poll the run: queued → processing → complete | failed.
+
+Runs that share an evidence record are grouped: while an ``inspection_mapping`` job for
+that evidence is still pending, new runs are appended to its ``input_data.run_ids``
+instead of getting their own job. The worker then maps them back to back in one session,
+so the evidence file is extracted once (see ``extracted_document_cache``).
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import Any, Optional, cast
+
+from sqlalchemy.orm import Session
+
+from ai.pipelines.inspection_mapping import run_inspection_mapping
+from models.inspection_run import InspectionRun
+from models.models import JobQueue, Project
+from observability.workflow_logging import log_job_status_transition
+from services.job_execution import run_blocking
+from services.job_notifications import notify_job_enqueued
+from services.job_owner import resolve_user_id_for_project
+from services.storage import StorageService
+
+logger = logging.getLogger(__name__)
+
+INSPECTION_MAPPING_JOB_TYPE = "inspection_mapping"
+
+
+def _pending_job_for_evidence(
+    db: Session, project_id: int, evidence_id: int
+) -> JobQueue | None:
+    """
+    Pending mapping job for this evidence, row-locked so the worker cannot claim it
+    mid-append. Only the matching row is locked; other evidence's jobs stay claimable.
+    """
+    return (
+        db.query(JobQueue)
+        .filter(
+            JobQueue.project_id == project_id,
+            JobQueue.job_type == INSPECTION_MAPPING_JOB_TYPE,
+            JobQueue.status == "pending",
+            JobQueue.input_data["evidence_id"].as_integer() == evidence_id,
+        )
+        .order_by(JobQueue.id.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+
+
+def enqueue_inspection_mapping_job(
+    db: Session,
+    project_id: int,
+    run_id: int,
+    user_id: Optional[int] = None,
+) -> JobQueue:
+    """Queue mapping for ``run_id``, joining a pending job for the same evidence when one exists."""
+    run = (
+        db.query(InspectionRun)
+        .filter(InspectionRun.id == run_id, InspectionRun.project_id == project_id)
+        .first()
+    )
+    if run is None:
+        raise ValueError(
+            f"Inspection run {run_id} not found for project {project_id}; cannot enqueue mapping job"
+        )
+    evidence_id = cast(Optional[int], run.evidence_id)
+
+    if evidence_id is not None:
+        job = _pending_job_for_evidence(db, project_id, evidence_id)
+        if job is not None:
+            input_data = dict(cast(dict[str, Any], job.input_data))
+            run_ids = [int(r) for r in input_data.get("run_ids") or []]
+            if run_id not in run_ids:
+                run_ids.append(run_id)
+            # Reassign so SQLAlchemy sees the JSON change.
+            job.input_data = {**input_data, "run_ids": run_ids}  # type: ignore[assignment]
+            db.commit()
+            db.refresh(job)
+            logger.info(
+                "inspection_mapping_run_grouped",
+                extra={
+                    "project_id": project_id,
+                    "job_id": cast(int, job.id),
+                    "run_id": run_id,
+                    "evidence_id": evidence_id,
+                },
+            )
+            return job
+
+    if user_id is None:
+        user_id = resolve_user_id_for_project(db, project_id, job_label="inspection mapping")
+
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise ValueError(f"Project {project_id} not found")
+
+    job = JobQueue(
+        user_id=user_id,
+        company_id=project.company_id,
+        project_id=project_id,
+        job_type=INSPECTION_MAPPING_JOB_TYPE,
+        status="pending",
+        input_data={"run_ids": [int(run_id)], "evidence_id": evidence_id},
+    )
+    db.add(job)
+    notify_job_enqueued(db, INSPECTION_MAPPING_JOB_TYPE)
+    db.commit()
+    db.refresh(job)
+    log_job_status_transition(
+        project_id=project_id,
+        job_id=cast(int, job.id),
+        status=cast(str | None, job.status),
+        previous_status=None,
+    )
+    return job
+
+
+def run_inspection_mapping_job(run_ids: list[int]) -> None:
+    """Map each queued run in ``run_ids`` in one session; run status records each outcome."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        failed: list[int] = []
+        for run_id in run_ids:
+            run = db.get(InspectionRun, run_id)
+            if run is None:
+                # Deleted while queued.
+                continue
+            if cast(str, run.status) != "queued":
+                continue
+            try:
+                result = run_inspection_mapping(db, run)
+            except Exception as exc:
+                # run_inspection_mapping marks the run failed itself; this covers the
+                # session breaking underneath it.
+                db.rollback()
+                logger.exception(
+                    "inspection_mapping_job_run_failed",
+                    extra={"run_id": run_id},
+                )
+                StorageService(db).update_inspection_run_status(
+                    run_id,
+                    "failed",
+                    completed_at=datetime.now(timezone.utc),
+                    error_message=str(exc)[:500],
+                )
+                failed.append(run_id)
+                continue
+            if result.get("error"):
+                failed.append(run_id)
+
+        if failed and len(failed) == len(run_ids):
+            raise RuntimeError(f"Inspection mapping failed for runs {failed}")
+    finally:
+        db.close()
+
+
+async def process_inspection_mapping_job(
+    run_ids: list[int],
+    executor: Executor | None = None,
+) -> None:
+    """Async wrapper: mapping makes blocking LLM and DB calls, so run it off-loop."""
+    await run_blocking(executor, run_inspection_mapping_job, run_ids)
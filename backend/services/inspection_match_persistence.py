@@ -1,11 +1,16 @@
-"""Persist inspection match results with backend-only scores."""
+"""Persist inspection match results with backend-only scores.
+
+The single-item helpers commit per inspection. :func:`persist_inspection_match_results`
+writes a whole ``inspection_match_batch`` with a fixed number of queries and one commit.
+"""
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Literal, cast
+from typing import Any, Literal, Sequence, cast
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from services.overlay_geometry import UNMAPPED_GEOMETRY
@@ -32,6 +37,19 @@ class InternalMatchCandidate:
     rank: int | None = None
 
 
+@dataclass(frozen=True)
+class InspectionMatchOutcome:
+    """One inspection's match result for :func:`persist_inspection_match_results`."""
+
+    inspection_id: str
+    status: MatchStatus
+    bbox: tuple[float, float, float, float] | None = None
+    page: int = 1
+    region_id: int | None = None
+    candidate: InternalMatchCandidate | None = None
+    inspection_run_id: int | None = None
+
+
 def match_status_from_internal_score(internal_score: float) -> MatchStatus:
     return "matched" if internal_score >= MATCH_SCORE_THRESHOLD else "needs_review"
 
@@ -220,6 +238,152 @@ def resolve_inspection_run_id(
     return None
 
 
+def resolve_inspection_run_ids(
+    session: Session,
+    requests: Sequence[tuple[str, int | None]],
+) -> list[int | None]:
+    """:func:`resolve_inspection_run_id` for ``(inspection_id, inspection_run_id)`` pairs.
+
+    Same precedence per pair, answered from three queries for the whole batch.
+    """
+    numeric_ids = {int(inspection_id) for inspection_id, _ in requests if inspection_id.isdigit()}
+    run_id_lookups = numeric_ids | {hint for _, hint in requests if hint is not None}
+
+    existing_runs: set[int] = set()
+    if run_id_lookups:
+        existing_runs = {
+            cast(int, run_id)
+            for (run_id,) in session.query(InspectionRun.id)
+            .filter(InspectionRun.id.in_(run_id_lookups))
+            .all()
+        }
+
+    existing_evidence: set[int] = set()
+    latest_run_by_evidence: dict[int, int] = {}
+    if numeric_ids:
+        existing_evidence = {
+            cast(int, evidence_id)
+            for (evidence_id,) in session.query(EvidenceRecord.id)
+            .filter(EvidenceRecord.id.in_(numeric_ids))
+            .all()
+        }
+        for run_id, evidence_id in (
+            session.query(InspectionRun.id, InspectionRun.evidence_id)
+            .filter(InspectionRun.evidence_id.in_(numeric_ids))
+            .order_by(InspectionRun.id.asc())
+            .all()
+        ):
+            latest_run_by_evidence[cast(int, evidence_id)] = cast(int, run_id)
+
+    resolved: list[int | None] = []
+    for inspection_id, hint in requests:
+        if hint is not None and hint in existing_runs:
+            resolved.append(hint)
+            continue
+        if not inspection_id.isdigit():
+            resolved.append(None)
+            continue
+        numeric_id = int(inspection_id)
+        if numeric_id in existing_evidence and numeric_id in latest_run_by_evidence:
+            resolved.append(latest_run_by_evidence[numeric_id])
+        elif numeric_id in existing_runs:
+            resolved.append(numeric_id)
+        else:
+            resolved.append(latest_run_by_evidence.get(numeric_id))
+    return resolved
+
+
+def persist_inspection_match_results(
+    session: Session,
+    *,
+    drawing_id: str | int,
+    outcomes: Sequence[InspectionMatchOutcome],
+) -> None:
+    """Bulk :func:`record_internal_match_candidate` + :func:`persist_inspection_match_overlay`.
+
+    Candidates are added together, the latest overlays of every run are loaded in one
+    query and everything is committed once. Per outcome the rows written match what the
+    single-item helpers would write when called in order.
+    """
+    master_drawing_id = int(drawing_id)
+    run_ids = resolve_inspection_run_ids(
+        session,
+        [(outcome.inspection_id, outcome.inspection_run_id) for outcome in outcomes],
+    )
+
+    session.add_all(
+        [
+            DrawingMatchCandidate(
+                inspection_id=str(outcome.inspection_id),
+                inspection_run_id=run_id,
+                master_drawing_id=master_drawing_id,
+                page=int(outcome.candidate.page),
+                region_id=outcome.candidate.region_id,
+                score=float(outcome.candidate.score),
+                bbox_json=list(outcome.candidate.bbox) if outcome.candidate.bbox is not None else None,
+                source=outcome.candidate.source,
+                rank=outcome.candidate.rank,
+            )
+            for outcome, run_id in zip(outcomes, run_ids)
+            if outcome.candidate is not None
+        ]
+    )
+
+    latest_overlays: dict[int, DrawingOverlay] = {}
+    known_runs = {run_id for run_id in run_ids if run_id is not None}
+    if known_runs:
+        for overlay in (
+            session.query(DrawingOverlay)
+            .filter(
+                DrawingOverlay.inspection_run_id.in_(known_runs),
+                DrawingOverlay.master_drawing_id == master_drawing_id,
+            )
+            .order_by(DrawingOverlay.id.asc())
+            .all()
+        ):
+            latest_overlays[cast(int, overlay.inspection_run_id)] = overlay
+
+    for outcome, run_id in zip(outcomes, run_ids):
+        if run_id is None:
+            logger.warning(
+                "inspection_match_missing_run",
+                extra={"inspection_id": outcome.inspection_id, "match_status": outcome.status},
+            )
+            continue
+
+        meta_patch = {"match_status": outcome.status}
+        overlay = latest_overlays.get(run_id)
+        if overlay is not None:
+            current_meta = overlay.meta if isinstance(overlay.meta, dict) else {}
+            setattr(overlay, "meta", {**current_meta, **meta_patch})
+            if outcome.status == "matched" and outcome.bbox is not None:
+                setattr(overlay, "geometry", bbox_to_geometry(outcome.bbox, page=outcome.page))
+                if outcome.region_id is not None:
+                    setattr(overlay, "region_id", outcome.region_id)
+            continue
+
+        created = DrawingOverlay(
+            master_drawing_id=master_drawing_id,
+            inspection_run_id=run_id,
+            geometry=bbox_to_geometry(
+                outcome.bbox if outcome.status == "matched" else None,
+                page=outcome.page,
+            ),
+            status="unknown",
+            meta=meta_patch,
+            label="Inspection match",
+            region_id=outcome.region_id,
+        )
+        session.add(created)
+        latest_overlays[run_id] = created
+
+    try:
+        session.commit()
+    except SQLAlchemyError:
+        session.rollback()
+        raise
+
+
 def bbox_to_geometry(
     bbox: tuple[float, float, float, float] | None,
     *,
@@ -1,7 +1,15 @@
-"""Inspection matching job.
+"""Inspection matching jobs.
 
 Uses the unified location-match orchestrator to resolve evidence on master drawings.
 Internal confidence/score values never leave the backend.
+
+``inspection_match`` resolves one inspection. ``inspection_match_batch`` resolves many
+inspections against the same master drawing page in one pass
+(``resolve_evidence_locations_batch``) and persists the results with one commit; items
+whose resolution failed are re-enqueued as ``inspection_match`` jobs. Batches come from
+the deferred flush once a master finishes indexing, and from uploads against an indexed
+master: each joins a still-pending match job for its drawing page (up to
+``INSPECTION_MATCH_BATCH_MAX_ITEMS``) instead of queueing its own.
 """
 
 from __future__ import annotations
@@ -9,30 +17,38 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Any, Optional, cast
+from typing import Any, Optional, Sequence, cast
 
 from sqlalchemy.orm import Session
 
 from ai.pipelines.drawing_location_resolver import ResolutionMethod
 from ai.pipelines.location_match_orchestrator import (
+    LocationMatchResult,
     match_status_from_result,
     resolve_evidence_location,
+    resolve_evidence_locations_batch,
 )
+from config import settings
 from models.drawing_overlay import DrawingOverlay
 from models.inspection_run import InspectionRun
-from models.models import Drawing, EvidenceRecord, JobQueue, Project, User, UserCompany
+from models.models import Drawing, EvidenceRecord, JobQueue, Project
 from services.inspection_match_persistence import (
+    InspectionMatchOutcome,
     InternalMatchCandidate,
     MatchStatus,
     persist_inspection_match_overlay,
+    persist_inspection_match_results,
     record_internal_match_candidate,
     resolve_inspection_run_id,
 )
+from services.job_notifications import notify_job_enqueued
+from services.job_owner import resolve_user_id_for_project
 from services.master_drawing_index_readiness import get_master_drawing_index_readiness
 
 logger = logging.getLogger(__name__)
 
 JOB_TYPE_INSPECTION_MATCH = "inspection_match"
+JOB_TYPE_INSPECTION_MATCH_BATCH = "inspection_match_batch"
 DEFERRED_MATCH_META_KEY = "deferredInspectionMatch"
 
 
@@ -91,25 +107,6 @@ def load_inspection_match_status(
     return InspectionMatchRecord(match_status=status, bbox=bbox)
 
 
-def _resolve_user_id_for_project(db: Session, project_id: int) -> int:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise ValueError(f"Project {project_id} not found")
-
-    uc = (
-        db.query(UserCompany)
-        .filter(UserCompany.company_id == project.company_id)
-        .first()
-    )
-    if uc is not None:
-        return cast(int, uc.user_id)
-
-    user = db.query(User).order_by(User.id.asc()).first()
-    if user is None:
-        raise ValueError("No users in database; cannot enqueue inspection match job")
-    return cast(int, user.id)
-
-
 def _parse_optional_int(value: Any) -> int | None:
     if value is None:
         return None
@@ -119,6 +116,18 @@ def _parse_optional_int(value: Any) -> int | None:
         return None
 
 
+def _match_job_page(
+    project_id: int | None,
+    inspection_id: str | None,
+    master_drawing_id: int | str | None,
+    page: int,
+) -> int | None:
+    """Page to match on (at least 1); None when project, inspection or drawing is unknown."""
+    if project_id is None or not inspection_id or master_drawing_id is None:
+        return None
+    return page if page >= 1 else 1
+
+
 def enqueue_inspection_match_job(
     db: Session,
     *,
@@ -130,7 +139,7 @@ def enqueue_inspection_match_job(
     inspection_run_id: Optional[int] = None,
 ) -> JobQueue:
     if user_id is None:
-        user_id = _resolve_user_id_for_project(db, project_id)
+        user_id = resolve_user_id_for_project(db, project_id, job_label="inspection match")
 
     project = db.query(Project).filter(Project.id == project_id).first()
     if project is None:
@@ -154,6 +163,7 @@ def enqueue_inspection_match_job(
         input_data=input_data,
     )
     db.add(job)
+    notify_job_enqueued(db, JOB_TYPE_INSPECTION_MATCH)
     db.commit()
     db.refresh(job)
     return job
@@ -170,10 +180,10 @@ def maybe_enqueue_inspection_match_job(
     inspection_run_id: Optional[int] = None,
 ) -> JobQueue | None:
     """Enqueue clue-based matching when project, inspection, and master drawing are known."""
-    if project_id is None or not inspection_id or master_drawing_id is None:
+    safe_page = _match_job_page(project_id, inspection_id, master_drawing_id, page)
+    if safe_page is None:
         return None
-
-    safe_page = page if page >= 1 else 1
+    assert project_id is not None and inspection_id and master_drawing_id is not None
 
     try:
         return enqueue_inspection_match_job(
@@ -198,6 +208,139 @@ def maybe_enqueue_inspection_match_job(
         return None
 
 
+def _batch_item(inspection_id: str, inspection_run_id: int | None) -> dict[str, Any]:
+    item: dict[str, Any] = {"inspection_id": str(inspection_id)}
+    if inspection_run_id is not None:
+        item["inspection_run_id"] = int(inspection_run_id)
+    return item
+
+
+def enqueue_inspection_match_batch_job(
+    db: Session,
+    *,
+    project_id: int,
+    drawing_id: str | int,
+    page: int,
+    items: Sequence[tuple[str, int | None]],
+    user_id: Optional[int] = None,
+) -> JobQueue:
+    """Enqueue one job matching ``(inspection_id, inspection_run_id)`` items on one page."""
+    if not items:
+        raise ValueError("inspection_match_batch job needs at least one item")
+    if user_id is None:
+        user_id = resolve_user_id_for_project(db, project_id, job_label="inspection match batch")
+
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if project is None:
+        raise ValueError(f"Project {project_id} not found")
+
+    batch_items = [
+        _batch_item(inspection_id, inspection_run_id) for inspection_id, inspection_run_id in items
+    ]
+
+    job = JobQueue(
+        user_id=user_id,
+        company_id=project.company_id,
+        project_id=project_id,
+        job_type=JOB_TYPE_INSPECTION_MATCH_BATCH,
+        status="pending",
+        input_data={
+            "drawing_id": str(drawing_id),
+            "page": int(page),
+            "project_id": int(project_id),
+            "items": batch_items,
+        },
+    )
+    db.add(job)
+    notify_job_enqueued(db, JOB_TYPE_INSPECTION_MATCH_BATCH)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _pending_match_job_for_page(
+    db: Session, project_id: int, drawing_id: int | str, page: int
+) -> JobQueue | None:
+    """
+    Newest pending match job (single or batch) for this drawing page, row-locked so the
+    worker cannot claim it mid-append. A job the worker is claiming is skipped.
+    """
+    return (
+        db.query(JobQueue)
+        .filter(
+            JobQueue.project_id == project_id,
+            JobQueue.job_type.in_((JOB_TYPE_INSPECTION_MATCH, JOB_TYPE_INSPECTION_MATCH_BATCH)),
+            JobQueue.status == "pending",
+            JobQueue.input_data["drawing_id"].as_string() == str(drawing_id),
+            JobQueue.input_data["page"].as_integer() == page,
+        )
+        .order_by(JobQueue.id.desc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+
+
+def _coalesce_inspection_match(
+    db: Session,
+    *,
+    project_id: int,
+    inspection_id: str,
+    drawing_id: int | str,
+    page: int,
+    inspection_run_id: int | None,
+) -> JobQueue | None:
+    """
+    Add the inspection to a pending match job for the same drawing page; None when there
+    is none with room.
+
+    A pending single ``inspection_match`` job becomes an ``inspection_match_batch`` job
+    holding both inspections, so a burst of uploads against an indexed master is matched
+    in batches while the worker is busy.
+    """
+    with db.begin_nested():
+        job = _pending_match_job_for_page(db, project_id, drawing_id, page)
+        if job is None:
+            return None
+        input_data = cast(dict[str, Any], job.input_data)
+        if cast(str, job.job_type) == JOB_TYPE_INSPECTION_MATCH:
+            items = [
+                _batch_item(
+                    str(input_data["inspection_id"]),
+                    _parse_optional_int(input_data.get("inspection_run_id")),
+                )
+            ]
+        else:
+            items = list(input_data.get("items") or [])
+        item = _batch_item(inspection_id, inspection_run_id)
+        if item not in items:
+            if len(items) >= settings.inspection_match_batch_max_items:
+                return None
+            items.append(item)
+        job.job_type = JOB_TYPE_INSPECTION_MATCH_BATCH  # type: ignore[assignment]
+        # Reassign so SQLAlchemy sees the JSON change.
+        job.input_data = {  # type: ignore[assignment]
+            "drawing_id": str(drawing_id),
+            "page": int(page),
+            "project_id": int(project_id),
+            "items": items,
+        }
+    db.commit()
+    db.refresh(job)
+    logger.info(
+        "inspection_match_coalesced",
+        extra={
+            "project_id": project_id,
+            "job_id": cast(int, job.id),
+            "inspection_id": inspection_id,
+            "master_drawing_id": drawing_id,
+            "page": page,
+            "item_count": len(items),
+        },
+    )
+    return job
+
+
 def _defer_inspection_match(
     session: Session,
     *,
@@ -243,7 +386,12 @@ def maybe_enqueue_inspection_match_after_extraction(
     user_id: Optional[int] = None,
     inspection_run_id: Optional[int] = None,
 ) -> JobQueue | None:
-    """Enqueue clue matching when the master index is ready; otherwise defer."""
+    """
+    Enqueue clue matching when the master index is ready; otherwise defer.
+
+    When ready, the inspection joins a pending match job for the same drawing page if one
+    has room (see :func:`_coalesce_inspection_match`).
+    """
     readiness = get_master_drawing_index_readiness(db, int(master_drawing_id))
     if not readiness.is_ready_for_matching:
         _defer_inspection_match(
@@ -266,6 +414,31 @@ def maybe_enqueue_inspection_match_after_extraction(
         )
         return None
 
+    safe_page = _match_job_page(project_id, inspection_id, master_drawing_id, page)
+    if safe_page is not None:
+        try:
+            job = _coalesce_inspection_match(
+                db,
+                project_id=project_id,
+                inspection_id=inspection_id,
+                drawing_id=master_drawing_id,
+                page=safe_page,
+                inspection_run_id=inspection_run_id,
+            )
+        except Exception:
+            logger.exception(
+                "inspection_match_coalesce_failed",
+                extra={
+                    "project_id": project_id,
+                    "inspection_id": inspection_id,
+                    "master_drawing_id": master_drawing_id,
+                    "page": safe_page,
+                },
+            )
+            job = None
+        if job is not None:
+            return job
+
     return maybe_enqueue_inspection_match_job(
         db,
         project_id=project_id,
@@ -281,14 +454,19 @@ def flush_deferred_inspection_matches_for_drawing(
     session: Session,
     drawing_id: int,
 ) -> int:
-    """Enqueue match jobs that were deferred while this master drawing indexed."""
+    """
+    Enqueue match jobs that were deferred while this master drawing indexed.
+
+    Inspections deferred for the same project and page go into one
+    ``inspection_match_batch`` job; a lone inspection keeps the ``inspection_match`` job.
+    """
     runs = (
         session.query(InspectionRun)
         .filter(InspectionRun.master_drawing_id == drawing_id)
         .order_by(InspectionRun.id.asc())
         .all()
     )
-    enqueued = 0
+    groups: dict[tuple[int, int], list[tuple[EvidenceRecord, int]]] = {}
     for run in runs:
         evidence_id = getattr(run, "evidence_id", None)
         if evidence_id is None:
@@ -312,30 +490,97 @@ def flush_deferred_inspection_matches_for_drawing(
         if project_id is None:
             continue
 
-        page = _parse_optional_int(deferred.get("page")) or 1
+        page = _match_job_page(
+            project_id,
+            str(evidence.id),
+            drawing_id,
+            _parse_optional_int(deferred.get("page")) or 1,
+        )
+        if page is None:
+            continue
         inspection_run_id = _parse_optional_int(deferred.get("inspection_run_id"))
         if inspection_run_id is None:
             inspection_run_id = cast(int, run.id)
 
+        groups.setdefault((project_id, page), []).append((evidence, inspection_run_id))
+
+    enqueued = 0
+    for (project_id, page), deferred_items in groups.items():
+        scheduled = _enqueue_deferred_group(
+            session,
+            project_id=project_id,
+            drawing_id=drawing_id,
+            page=page,
+            deferred_items=deferred_items,
+        )
+        if not scheduled:
+            continue
+        for evidence in scheduled:
+            meta_raw = evidence.meta if isinstance(evidence.meta, dict) else {}
+            meta = dict(meta_raw)
+            meta.pop(DEFERRED_MATCH_META_KEY, None)
+            evidence.meta = meta  # type: ignore[assignment]
+        # Per group, so a later group's rollback cannot resurrect these deferrals.
+        session.commit()
+        enqueued += len(scheduled)
+
+    return enqueued
+
+
+def _enqueue_deferred_group(
+    session: Session,
+    *,
+    project_id: int,
+    drawing_id: int,
+    page: int,
+    deferred_items: list[tuple[EvidenceRecord, int]],
+) -> list[EvidenceRecord]:
+    """
+    Enqueue one project/page group of deferred matches; returns the evidence scheduled.
+
+    Several items share a batch job. When that enqueue fails the items are enqueued one
+    by one instead; any that still fail stay deferred for the next flush.
+    """
+    if len(deferred_items) > 1:
+        try:
+            enqueue_inspection_match_batch_job(
+                session,
+                project_id=project_id,
+                drawing_id=drawing_id,
+                page=page,
+                items=[
+                    (str(evidence.id), inspection_run_id)
+                    for evidence, inspection_run_id in deferred_items
+                ],
+            )
+            return [evidence for evidence, _ in deferred_items]
+        except Exception:
+            session.rollback()
+            logger.exception(
+                "inspection_match_enqueue_failed",
+                extra={
+                    "project_id": project_id,
+                    "master_drawing_id": drawing_id,
+                    "page": page,
+                    "item_count": len(deferred_items),
+                },
+            )
+
+    scheduled: list[EvidenceRecord] = []
+    for evidence, inspection_run_id in deferred_items:
         job = maybe_enqueue_inspection_match_job(
             session,
             project_id=project_id,
-            inspection_id=str(evidence_id),
+            inspection_id=str(evidence.id),
             master_drawing_id=drawing_id,
             page=page,
             inspection_run_id=inspection_run_id,
         )
         if job is None:
+            session.rollback()
             continue
-
-        meta = dict(meta_raw)
-        meta.pop(DEFERRED_MATCH_META_KEY, None)
-        evidence.meta = meta  # type: ignore[assignment]
-        enqueued += 1
-
-    if enqueued:
-        session.commit()
-    return enqueued
+        scheduled.append(evidence)
+    return scheduled
 
 
 def run_inspection_match_job(payload: dict[str, Any], session: Session) -> MatchStatus:
@@ -418,3 +663,167 @@ async def process_inspection_match_job(payload: dict[str, Any]) -> MatchStatus:
             db.close()
 
     return await asyncio.to_thread(_run)
+
+
+def _match_outcome(
+    inspection_id: str,
+    result: LocationMatchResult,
+    *,
+    inspection_run_id: int | None,
+) -> InspectionMatchOutcome:
+    status = match_status_from_result(result)
+    candidate: InternalMatchCandidate | None = None
+    if result.method != ResolutionMethod.UNRESOLVED:
+        candidate = InternalMatchCandidate(
+            score=result.confidence,
+            bbox=result.bbox_fractional,
+            page=result.page,
+            region_id=result.region_id,
+            source=result.method.value,
+            rank=1,
+        )
+    return InspectionMatchOutcome(
+        inspection_id=inspection_id,
+        status=status,
+        bbox=result.bbox_fractional if status == "matched" else None,
+        page=result.page,
+        region_id=result.region_id,
+        candidate=candidate,
+        inspection_run_id=inspection_run_id,
+    )
+
+
+def run_inspection_match_batch_job(
+    payload: dict[str, Any],
+    session: Session,
+) -> dict[str, MatchStatus]:
+    """
+    Resolve every item of an ``inspection_match_batch`` job and persist them together.
+
+    Returns the match status per inspection id. Items whose resolution failed are
+    re-enqueued as single ``inspection_match`` jobs so they are retried on their own; the
+    batch job fails when that enqueue does.
+    """
+    drawing_id = payload["drawing_id"]
+    page = int(payload.get("page", 1))
+    master_drawing_id = _parse_optional_int(drawing_id)
+    if master_drawing_id is None:
+        raise ValueError(f"inspection_match_batch job has invalid drawing_id {drawing_id!r}")
+
+    items = [
+        (str(item["inspection_id"]), _parse_optional_int(item.get("inspection_run_id")))
+        for item in payload.get("items") or []
+    ]
+    evidence_ids = {
+        inspection_id: evidence_id
+        for inspection_id, _ in items
+        if (evidence_id := _parse_optional_int(inspection_id)) is not None
+    }
+    results = resolve_evidence_locations_batch(
+        session,
+        list(evidence_ids.values()),
+        master_drawing_id=master_drawing_id,
+        page=page,
+    )
+
+    run_ids = dict(items)
+    outcomes: list[InspectionMatchOutcome] = []
+    failed: list[str] = []
+    for inspection_id, run_id_hint in items:
+        evidence_id = evidence_ids.get(inspection_id)
+        if evidence_id is None:
+            outcomes.append(
+                InspectionMatchOutcome(
+                    inspection_id=inspection_id,
+                    status="needs_review",
+                    page=page,
+                    inspection_run_id=run_id_hint,
+                )
+            )
+            continue
+
+        result = results.get(evidence_id)
+        if result is None:
+            failed.append(inspection_id)
+            continue
+        if result.method == ResolutionMethod.UNRESOLVED:
+            logger.info(
+                "inspection_match_unresolved",
+                extra={
+                    "inspection_id": inspection_id,
+                    "drawing_id": drawing_id,
+                    "page": page,
+                    "evidence_id": evidence_id,
+                    "notes": result.notes,
+                },
+            )
+        outcomes.append(_match_outcome(inspection_id, result, inspection_run_id=run_id_hint))
+
+    if outcomes:
+        persist_inspection_match_results(session, drawing_id=drawing_id, outcomes=outcomes)
+    if failed:
+        _retry_failed_batch_items(
+            session,
+            payload,
+            master_drawing_id=master_drawing_id,
+            page=page,
+            items=[(inspection_id, run_ids[inspection_id]) for inspection_id in failed],
+        )
+    logger.info(
+        "inspection_match_batch_completed",
+        extra={
+            "drawing_id": drawing_id,
+            "page": page,
+            "item_count": len(items),
+            "failed_count": len(failed),
+        },
+    )
+    return {outcome.inspection_id: outcome.status for outcome in outcomes}
+
+
+def _retry_failed_batch_items(
+    session: Session,
+    payload: dict[str, Any],
+    *,
+    master_drawing_id: int,
+    page: int,
+    items: Sequence[tuple[str, int | None]],
+) -> None:
+    project_id = _parse_optional_int(payload.get("project_id"))
+    if project_id is None:
+        raise RuntimeError(
+            "inspection_match_batch failed for "
+            f"{', '.join(inspection_id for inspection_id, _ in items)} and has no project_id"
+        )
+    for inspection_id, inspection_run_id in items:
+        enqueue_inspection_match_job(
+            session,
+            project_id=project_id,
+            inspection_id=inspection_id,
+            drawing_id=master_drawing_id,
+            page=page,
+            inspection_run_id=inspection_run_id,
+        )
+    logger.info(
+        "inspection_match_batch_items_requeued",
+        extra={
+            "drawing_id": master_drawing_id,
+            "page": page,
+            "item_count": len(items),
+        },
+    )
+
+
+async def process_inspection_match_batch_job(payload: dict[str, Any]) -> dict[str, MatchStatus]:
+    """Run an inspection match batch in a worker thread (sync SQLAlchemy session)."""
+
+    def _run() -> dict[str, MatchStatus]:
+        from database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            return run_inspection_match_batch_job(payload, db)
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(_run)
@@ -14,7 +14,10 @@ from models.inspection_run import InspectionRun
 from models.models import EvidenceDrawingLink, EvidenceRecord, InspectionResult, JobQueue
 from models.review_queue_item import ReviewQueueItem
 from services.file_storage import get_file_path
-from services.inspection_matching_jobs import JOB_TYPE_INSPECTION_MATCH
+from services.inspection_matching_jobs import (
+    JOB_TYPE_INSPECTION_MATCH,
+    JOB_TYPE_INSPECTION_MATCH_BATCH,
+)
 from services.storage import StorageService
 
 logger = logging.getLogger(__name__)
@@ -54,6 +57,27 @@ def delete_inspection_run_from_project(
         if file_id and str(input_data.get("inspection_id")) == file_id:
             db.delete(job)
 
+    if file_id:
+        batch_jobs = (
+            db.query(JobQueue)
+            .filter(
+                JobQueue.project_id == project_id,
+                JobQueue.job_type == JOB_TYPE_INSPECTION_MATCH_BATCH,
+                JobQueue.status == "pending",
+            )
+            .all()
+        )
+        for job in batch_jobs:
+            input_data = dict(getattr(job, "input_data", None) or {})
+            items = input_data.get("items") or []
+            remaining = [item for item in items if str(item.get("inspection_id")) != file_id]
+            if len(remaining) == len(items):
+                continue
+            if remaining:
+                job.input_data = {**input_data, "items": remaining}  # type: ignore[assignment]
+            else:
+                db.delete(job)
+
     if file_id:
         db.query(DrawingMatchCandidate).filter(
             DrawingMatchCandidate.inspection_id == file_id
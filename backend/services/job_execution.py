@@ -0,0 +1,122 @@
+"""
+Executor plumbing shared by JobQueue handlers and the job worker.
+
+Handlers run their blocking body through :func:`run_blocking`. Without an executor this is
+``asyncio.to_thread`` (the serial worker's behaviour); the parallel worker passes the
+process pool from :func:`create_cpu_job_executor` for CPU-bound job types.
+
+Page-level pools (OCR, drawing render) size themselves through :func:`reserve_pool_workers`.
+Inside a CPU job process they run inline, since the job pool already fills the cores.
+Elsewhere, concurrent callers (job threads, batch extraction threads) and the job pool
+share one per-process budget of ``cpu_count`` helper processes, so pools started side by
+side cannot multiply into N x CPU processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+async def run_blocking(
+    executor: Executor | None,
+    func: Callable[..., T],
+    *args: Any,
+) -> T:
+    """Run ``func(*args)`` off the event loop (thread by default, or ``executor``)."""
+    if executor is None:
+        return await asyncio.to_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+class _PoolBudget:
+    """Helper processes this process may still start (``cpu_count`` in total)."""
+
+    def __init__(self, capacity: int) -> None:
+        self.lock = threading.Lock()
+        self.capacity = capacity
+        self.in_use = 0
+
+    def take(self, wanted: int) -> int:
+        with self.lock:
+            granted = max(0, min(wanted, self.capacity - self.in_use))
+            self.in_use += granted
+            return granted
+
+    def give(self, count: int) -> None:
+        with self.lock:
+            self.in_use = max(0, self.in_use - count)
+
+
+_pool_budget = _PoolBudget(os.cpu_count() or 1)
+_in_cpu_job_process = False
+
+
+def in_cpu_job_process() -> bool:
+    """True inside a :func:`create_cpu_job_executor` child process."""
+    return _in_cpu_job_process
+
+
+@contextlib.contextmanager
+def reserve_pool_workers(wanted: int) -> Iterator[int]:
+    """
+    Reserve helper processes for a page-level pool; yields how many to start.
+
+    Yields 1 (run inline) inside a CPU job process, or when fewer than two processes are
+    free in the per-process budget. The reservation is returned on exit.
+    """
+    if wanted <= 1 or _in_cpu_job_process:
+        yield 1
+        return
+    granted = _pool_budget.take(wanted)
+    if granted <= 1:
+        _pool_budget.give(granted)
+        yield 1
+        return
+    try:
+        yield granted
+    finally:
+        _pool_budget.give(granted)
+
+
+def _init_cpu_job_process() -> None:
+    global _in_cpu_job_process
+    _in_cpu_job_process = True
+    logging.basicConfig(level=logging.INFO)
+
+
+class _CpuJobExecutor(ProcessPoolExecutor):
+    """Process pool whose workers count against the budget until shutdown."""
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_cpu_job_process,
+        )
+        self._reserved = _pool_budget.take(max_workers)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        reserved, self._reserved = self._reserved, 0
+        _pool_budget.give(reserved)
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def create_cpu_job_executor(max_workers: int = 0) -> ProcessPoolExecutor:
+    """
+    Process pool for PyMuPDF / OCR job bodies.
+
+    Uses the ``spawn`` start method so children never inherit pooled DB connections or
+    worker-loop threads; each child opens its own ``SessionLocal``. ``max_workers=0``
+    sizes the pool to the CPU count. Its workers are taken from the page-pool budget, so
+    job threads in the parent OCR inline while the job pool is busy with every core.
+    """
+    return _CpuJobExecutor(max_workers if max_workers > 0 else (os.cpu_count() or 1))
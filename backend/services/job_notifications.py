@@ -0,0 +1,121 @@
+"""
+Postgres LISTEN/NOTIFY wakeups for the JobQueue worker.
+
+Enqueue helpers call :func:`notify_job_enqueued` before committing the new ``job_queue``
+row; Postgres delivers the notification on commit. Workers run a
+:class:`JobQueueListener` that sets an ``asyncio.Event`` on each notification, so a new
+job is claimed immediately instead of after the next ``JOB_WORKER_POLL_SECONDS`` tick.
+
+On non-Postgres databases (SQLite dev) both sides are no-ops and the worker keeps its
+fallback poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import psycopg
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_CHANNEL = "job_queue"
+
+
+def _is_postgres(bind: Any) -> bool:
+    return getattr(getattr(bind, "dialect", None), "name", None) == "postgresql"
+
+
+def notify_job_enqueued(db: Session, job_type: str) -> None:
+    """Send ``NOTIFY job_queue`` in the caller's transaction (delivered on commit)."""
+    if not _is_postgres(db.get_bind()):
+        return
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": JOB_QUEUE_CHANNEL, "payload": job_type},
+    )
+
+
+class JobQueueListener:
+    """
+    Dedicated autocommit connection blocked on ``LISTEN job_queue``.
+
+    ``conninfo`` is None off Postgres; :meth:`run` then returns immediately and callers rely
+    on their poll timeout. Connection errors are logged and retried after
+    ``retry_seconds`` so a DB restart degrades to polling rather than stopping the worker.
+    """
+
+    def __init__(
+        self,
+        conninfo: str | None,
+        connect_kwargs: dict[str, Any] | None = None,
+        *,
+        retry_seconds: float = 2.0,
+    ) -> None:
+        self.conninfo = conninfo
+        self.connect_kwargs = dict(connect_kwargs or {})
+        self.retry_seconds = retry_seconds
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: Engine,
+        connect_kwargs: dict[str, Any] | None = None,
+        *,
+        retry_seconds: float = 2.0,
+    ) -> JobQueueListener:
+        if not _is_postgres(engine):
+            return cls(None, retry_seconds=retry_seconds)
+        # psycopg wants a libpq URI, not SQLAlchemy's ``postgresql+psycopg`` driver name.
+        conninfo = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        return cls(conninfo, connect_kwargs, retry_seconds=retry_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        return self.conninfo is not None
+
+    async def run(self, wakeup: asyncio.Event) -> None:
+        """Set ``wakeup`` on every notification until cancelled."""
+        if self.conninfo is None:
+            return
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    self.conninfo,
+                    autocommit=True,
+                    **self.connect_kwargs,
+                )
+                try:
+                    await conn.execute(f"LISTEN {JOB_QUEUE_CHANNEL}")
+                    logger.info("job_queue_listen_started")
+                    # A notification may have been missed while (re)connecting.
+                    wakeup.set()
+                    async for _notify in conn.notifies():
+                        wakeup.set()
+                finally:
+                    await conn.close()
+            except asyncio.CancelledError:
+                raise
+            except psycopg.Error:
+                logger.warning("job_queue_listen_failed", exc_info=True)
+                await asyncio.sleep(self.retry_seconds)
+
+    def start(self, wakeup: asyncio.Event) -> asyncio.Task[None] | None:
+        """Run the listener as a background task; None when LISTEN is unavailable."""
+        if self.conninfo is None:
+            return None
+        return asyncio.create_task(self.run(wakeup))
+
+
+async def wait_for_wakeup(wakeup: asyncio.Event, timeout: float) -> bool:
+    """Block until ``wakeup`` is set or ``timeout`` elapses (fallback poll). Returns True if woken."""
+    try:
+        await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
@@ -0,0 +1,34 @@
+"""User a background job is filed under when the request did not name one."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from sqlalchemy.orm import Session
+
+from models.models import Project, User, UserCompany
+
+
+def resolve_user_id_for_project(db: Session, project_id: int, *, job_label: str) -> int:
+    """
+    A member of the project's company, else the first user.
+
+    ``job_label`` names the job in the error raised when no user exists
+    (``"drawing index"`` -> "cannot enqueue drawing index job").
+    """
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if project is None:
+        raise ValueError(f"Project {project_id} not found")
+
+    uc = (
+        db.query(UserCompany)
+        .filter(UserCompany.company_id == project.company_id)
+        .first()
+    )
+    if uc is not None:
+        return cast(int, uc.user_id)
+
+    user = db.query(User).order_by(User.id.asc()).first()
+    if user is None:
+        raise ValueError(f"No users in database; cannot enqueue {job_label} job")
+    return cast(int, user.id)
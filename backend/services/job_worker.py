@@ -3,22 +3,35 @@ Async job worker for JobQueue.
 
 Polls for pending jobs and dispatches to type-specific handlers.
 Run as a separate process: python -m services.job_worker
+
+With ``JOB_WORKER_CONCURRENCY`` > 1 the worker runs several jobs at once, capped per
+``job_type`` by ``JOB_WORKER_TYPE_LIMITS`` (see :func:`run_parallel_worker_loop`).
+
+On Postgres the worker blocks on ``LISTEN job_queue`` (see :mod:`services.job_notifications`)
+and ``JOB_WORKER_POLL_SECONDS`` is only the fallback poll.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import Counter
+from concurrent.futures import Executor
 from datetime import datetime, timezone
-from typing import Any, cast
+from typing import Any, Mapping, cast
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select, update
 from sqlalchemy.orm import Session
 
-from database import SessionLocal
+from config import job_worker_type_limits, settings, sqlalchemy_connect_args
+from database import SessionLocal, engine
 from models.models import JobQueue
+from observability.job_metrics import JobWorkerMetrics, log_job_worker_metrics
 from observability.workflow_logging import log_job_status_transition
+from services.job_execution import create_cpu_job_executor
 from services.job_input_data import coerce_job_int
+from services.job_notifications import JobQueueListener, wait_for_wakeup
 from services.drawing_render_jobs import (
     DRAWING_RENDER_JOB_TYPE,
     process_drawing_render_job,
@@ -30,14 +43,33 @@ from services.drawing_index_jobs import (
 )
 from services.inspection_matching_jobs import (
     JOB_TYPE_INSPECTION_MATCH,
+    JOB_TYPE_INSPECTION_MATCH_BATCH,
+    process_inspection_match_batch_job,
     process_inspection_match_job,
 )
+from services.evidence_extract_jobs import (
+    EVIDENCE_EXTRACT_JOB_TYPE,
+    process_evidence_extract_job,
+)
+from services.inspection_mapping_jobs import (
+    INSPECTION_MAPPING_JOB_TYPE,
+    process_inspection_mapping_job,
+)
 
 logger = logging.getLogger(__name__)
 
+#: Job types whose handlers rasterize / OCR in-process; the parallel worker runs them in a process pool.
+CPU_BOUND_JOB_TYPES = frozenset({DRAWING_RENDER_JOB_TYPE, DRAWING_INDEX_JOB_TYPE})
+#: ``JOB_WORKER_TYPE_LIMITS`` key that caps every job type not listed explicitly.
+OTHER_JOB_TYPES_KEY = "*"
+
+
+async def handle_job(job: JobQueue, cpu_executor: Executor | None = None) -> None:
+    """
+    Dispatch job to the appropriate handler based on job_type.
 
-async def handle_job(job: JobQueue) -> None:
-    """Dispatch job to the appropriate handler based on job_type."""
+    ``cpu_executor`` is used for :data:`CPU_BOUND_JOB_TYPES`; other handlers stay on threads.
+    """
     # Compare Python str values — `job.job_type == ...` is typed as ColumnElement[bool] for ORM descriptors.
     job_type = cast(str, job.job_type)
     if job_type == DRAWING_RENDER_JOB_TYPE:
@@ -46,7 +78,7 @@ async def handle_job(job: JobQueue) -> None:
         if drawing_id is None:
             raise ValueError("drawing_render job missing input_data.drawing_id")
         resolved_drawing_id = coerce_job_int(drawing_id, "drawing_id")
-        await process_drawing_render_job(resolved_drawing_id)
+        await process_drawing_render_job(resolved_drawing_id, executor=cpu_executor)
         return
 
     if job_type == DRAWING_INDEX_JOB_TYPE:
@@ -54,7 +86,33 @@ async def handle_job(job: JobQueue) -> None:
         drawing_id = input_data.get("drawing_id") if input_data else None
         if drawing_id is None:
             raise ValueError("drawing_index job missing input_data.drawing_id")
-        await process_drawing_index_job(coerce_job_int(drawing_id, "drawing_id"))
+        # Jobs queued before index modes existed carry no mode: full index.
+        mode = (input_data or {}).get("mode") or "full"
+        if mode not in ("full", "incremental"):
+            raise ValueError(f"drawing_index job has unknown input_data.mode: {mode!r}")
+        await process_drawing_index_job(
+            coerce_job_int(drawing_id, "drawing_id"),
+            executor=cpu_executor,
+            mode=mode,
+        )
+        return
+
+    if job_type == EVIDENCE_EXTRACT_JOB_TYPE:
+        input_data = cast(dict[str, Any] | None, job.input_data)
+        evidence_id = input_data.get("evidence_id") if input_data else None
+        if evidence_id is None:
+            raise ValueError("evidence_extract job missing input_data.evidence_id")
+        await process_evidence_extract_job(coerce_job_int(evidence_id, "evidence_id"))
+        return
+
+    if job_type == INSPECTION_MAPPING_JOB_TYPE:
+        input_data = cast(dict[str, Any] | None, job.input_data)
+        run_ids = input_data.get("run_ids") if input_data else None
+        if not run_ids:
+            raise ValueError("inspection_mapping job missing input_data.run_ids")
+        await process_inspection_mapping_job(
+            [coerce_job_int(run_id, "run_id") for run_id in run_ids]
+        )
         return
 
     if job_type == JOB_TYPE_INSPECTION_MATCH:
@@ -68,34 +126,65 @@ async def handle_job(job: JobQueue) -> None:
         await process_inspection_match_job(input_data)
         return
 
+    if job_type == JOB_TYPE_INSPECTION_MATCH_BATCH:
+        input_data = cast(dict[str, Any] | None, job.input_data)
+        if not input_data or not input_data.get("items"):
+            raise ValueError("inspection_match_batch job missing input_data.items")
+        await process_inspection_match_batch_job(input_data)
+        return
+
     raise ValueError(f"Unknown job_type: {job_type}")
 
 
-def _claim_pending_job(db: Session) -> JobQueue | None:
-    """Atomically claim the oldest pending job. Returns None if none available."""
-    result = db.execute(
-        select(JobQueue)
-        .where(JobQueue.status == "pending")
-        .order_by(JobQueue.id.asc())
-        .with_for_update(skip_locked=True)
-        .limit(1)
-    )
-    job = result.scalars().first()
-    if not job:
-        return None
+def _claim_pending_jobs(
+    db: Session,
+    limit: int,
+    job_filter: ColumnElement[bool] | None = None,
+) -> list[JobQueue]:
+    """
+    Atomically claim up to ``limit`` oldest pending jobs in one round trip.
 
-    previous_status = cast(str | None, job.status)
-    job.status = "processing"  # type: ignore[assignment]
-    job.started_at = datetime.now(timezone.utc)  # type: ignore[assignment]
-    db.commit()
-    db.refresh(job)
-    log_job_status_transition(
-        project_id=cast(int, job.project_id),
-        job_id=cast(int, job.id),
-        status=cast(str | None, job.status),
-        previous_status=cast(str | None, previous_status),
+    ``UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED LIMIT k) RETURNING`` so
+    concurrent workers never claim the same row. SQLite ignores the row lock (single writer).
+    """
+    if limit < 1:
+        return []
+    pending = select(JobQueue.id).where(JobQueue.status == "pending")
+    if job_filter is not None:
+        pending = pending.where(job_filter)
+    pending = pending.order_by(JobQueue.id.asc()).with_for_update(skip_locked=True).limit(limit)
+
+    jobs = list(
+        db.scalars(
+            update(JobQueue)
+            .where(JobQueue.id.in_(pending.scalar_subquery()))
+            .values(status="processing", started_at=datetime.now(timezone.utc))
+            .returning(JobQueue),
+            execution_options={"synchronize_session": False},
+        )
     )
-    return job
+    # Detach before commit so RETURNING values stay loaded (no per-row refresh SELECT).
+    for job in jobs:
+        db.expunge(job)
+    db.commit()
+    jobs.sort(key=lambda job: cast(int, job.id))
+    for job in jobs:
+        log_job_status_transition(
+            project_id=cast(int, job.project_id),
+            job_id=cast(int, job.id),
+            status="processing",
+            previous_status="pending",
+        )
+    return jobs
+
+
+def _claim_pending_job(
+    db: Session,
+    job_filter: ColumnElement[bool] | None = None,
+) -> JobQueue | None:
+    """Atomically claim the oldest pending job (optionally matching ``job_filter``)."""
+    jobs = _claim_pending_jobs(db, 1, job_filter)
+    return jobs[0] if jobs else None
 
 
 def _mark_job_completed(db: Session, job_id: int) -> None:
@@ -116,70 +205,311 @@ def _mark_job_failed(db: Session, job_id: int, error_message: str) -> None:
     db.commit()
 
 
+def pending_job_counts_by_type(db: Session) -> dict[str, int]:
+    """Queue depth: pending ``job_queue`` rows grouped by ``job_type``."""
+    rows = db.execute(
+        select(JobQueue.job_type, func.count(JobQueue.id))
+        .where(JobQueue.status == "pending")
+        .group_by(JobQueue.job_type)
+    ).all()
+    return {str(job_type): int(count) for job_type, count in rows}
+
+
+async def _run_claimed_job(
+    db: Session,
+    job: JobQueue,
+    cpu_executor: Executor | None = None,
+) -> bool:
+    """Run a claimed job and persist completed/failed. Returns True on success."""
+    job_id = cast(int, job.id)
+    job_type = job.job_type
+    logger.info("Processing job %s (type=%s)", job_id, job_type)
+
+    try:
+        await handle_job(job, cpu_executor=cpu_executor)
+        previous_status = cast(str | None, job.status)
+        _mark_job_completed(db, job_id)
+        log_job_status_transition(
+            project_id=cast(int, job.project_id),
+            job_id=job_id,
+            status="completed",
+            previous_status=previous_status,
+        )
+        logger.info("Job %s completed", job_id)
+        return True
+    except Exception as exc:
+        previous_status = cast(str | None, job.status)
+        _mark_job_failed(db, job_id, str(exc))
+        log_job_status_transition(
+            project_id=cast(int, job.project_id),
+            job_id=job_id,
+            status="failed",
+            previous_status=previous_status,
+        )
+        logger.exception(
+            "Job %s failed: %s",
+            job_id,
+            exc,
+            extra={
+                "project_id": cast(int, job.project_id),
+                "job_id": job_id,
+                # Persisted status is failed (ORM instance may not be refreshed after bulk update)
+                "status": "failed",
+                "error_class": exc.__class__.__name__,
+            },
+        )
+        return False
+
+
 async def process_one_job() -> bool:
-    """Claim and process one pending job. Returns True if a job was processed."""
+    """
+    Claim and process one pending job. Returns True if a job was processed.
+
+    The serial worker claims one job at a time: a batch would mark jobs ``processing``
+    while they wait behind the first, out of reach of other workers.
+    """
     db = SessionLocal()
     try:
         job = _claim_pending_job(db)
         if not job:
             return False
 
-        job_id = cast(int, job.id)
-        job_type = job.job_type
-        logger.info("Processing job %s (type=%s)", job_id, job_type)
-
-        try:
-            await handle_job(job)
-            previous_status = cast(str | None, job.status)
-            _mark_job_completed(db, job_id)
-            log_job_status_transition(
-                project_id=cast(int, job.project_id),
-                job_id=job_id,
-                status="completed",
-                previous_status=previous_status,
-            )
-            logger.info("Job %s completed", job_id)
-        except Exception as exc:
-            previous_status = cast(str | None, job.status)
-            _mark_job_failed(db, job_id, str(exc))
-            log_job_status_transition(
-                project_id=cast(int, job.project_id),
-                job_id=job_id,
-                status="failed",
-                previous_status=previous_status,
-            )
-            logger.exception(
-                "Job %s failed: %s",
-                job_id,
-                exc,
-                extra={
-                    "project_id": cast(int, job.project_id),
-                    "job_id": job_id,
-                    # Persisted status is failed (ORM instance may not be refreshed after bulk update)
-                    "status": "failed",
-                    "error_class": exc.__class__.__name__,
-                },
-            )
-
+        await _run_claimed_job(db, job)
         return True
     finally:
         db.close()
 
 
-async def run_worker_loop(poll_interval_seconds: float = 2.0) -> None:
-    """Poll for and process jobs until interrupted."""
-    logger.info("Job worker started (poll_interval=%s)", poll_interval_seconds)
-    while True:
-        try:
-            processed = await process_one_job()
-            if not processed:
+async def _stop_listener(listen_task: asyncio.Task[None] | None) -> None:
+    if listen_task is None:
+        return
+    listen_task.cancel()
+    await asyncio.gather(listen_task, return_exceptions=True)
+
+
+async def run_worker_loop(
+    poll_interval_seconds: float = 2.0,
+    *,
+    listener: JobQueueListener | None = None,
+) -> None:
+    """
+    Process jobs until interrupted.
+
+    Sleeps until a ``job_queue`` NOTIFY arrives (``listener``) or ``poll_interval_seconds``
+    elapses — the poll is the only wakeup on SQLite or when LISTEN is unavailable.
+    """
+    logger.info(
+        "Job worker started (poll_interval=%s, listen=%s)",
+        poll_interval_seconds,
+        bool(listener and listener.enabled),
+    )
+    wakeup = asyncio.Event()
+    listen_task = listener.start(wakeup) if listener is not None else None
+    try:
+        while True:
+            try:
+                # Clear before claiming so a NOTIFY that lands mid-claim is not lost.
+                wakeup.clear()
+                processed = await process_one_job()
+                if not processed:
+                    await wait_for_wakeup(wakeup, poll_interval_seconds)
+            except asyncio.CancelledError:
+                logger.info("Job worker stopped")
+                raise
+            except Exception:
+                logger.exception("Worker loop error")
+                await asyncio.sleep(poll_interval_seconds)
+    finally:
+        await _stop_listener(listen_task)
+
+
+class JobTypeSlots:
+    """
+    Concurrency accounting for :func:`run_parallel_worker_loop`.
+
+    ``type_limits`` caps in-flight jobs per ``job_type``; the :data:`OTHER_JOB_TYPES_KEY`
+    entry (default 1) caps every unlisted type together. ``max_concurrency`` caps the total.
+    """
+
+    def __init__(self, type_limits: Mapping[str, int], max_concurrency: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.type_limits = {
+            job_type: max(1, limit)
+            for job_type, limit in type_limits.items()
+            if job_type != OTHER_JOB_TYPES_KEY
+        }
+        self.other_limit = max(1, type_limits.get(OTHER_JOB_TYPES_KEY, 1))
+        self._in_flight: Counter[str] = Counter()
+
+    def _bucket(self, job_type: str) -> str:
+        return job_type if job_type in self.type_limits else OTHER_JOB_TYPES_KEY
+
+    @property
+    def total_in_flight(self) -> int:
+        return sum(self._in_flight.values())
+
+    @property
+    def room(self) -> int:
+        """Free slots under ``max_concurrency``."""
+        return max(0, self.max_concurrency - self.total_in_flight)
+
+    def claim_buckets(self) -> list[tuple[ColumnElement[bool], int]]:
+        """``(job filter, free slots)`` for each bucket with capacity (ignores the total cap)."""
+        buckets: list[tuple[ColumnElement[bool], int]] = []
+        for job_type, limit in self.type_limits.items():
+            free = limit - self._in_flight[job_type]
+            if free > 0:
+                buckets.append((JobQueue.job_type == job_type, free))
+        other_free = self.other_limit - self._in_flight[OTHER_JOB_TYPES_KEY]
+        if other_free > 0:
+            buckets.append((JobQueue.job_type.not_in(list(self.type_limits)), other_free))
+        return buckets
+
+    def acquire(self, job_type: str) -> None:
+        self._in_flight[self._bucket(job_type)] += 1
+
+    def release(self, job_type: str) -> None:
+        bucket = self._bucket(job_type)
+        self._in_flight[bucket] = max(0, self._in_flight[bucket] - 1)
+
+
+async def _run_slot(
+    job: JobQueue,
+    *,
+    slots: JobTypeSlots,
+    metrics: JobWorkerMetrics,
+    cpu_executor: Executor,
+    wakeup: asyncio.Event,
+) -> None:
+    job_type = cast(str, job.job_type)
+    started = time.monotonic()
+    succeeded = False
+    db = SessionLocal()
+    try:
+        executor = cpu_executor if job_type in CPU_BOUND_JOB_TYPES else None
+        succeeded = await _run_claimed_job(db, job, cpu_executor=executor)
+    finally:
+        db.close()
+        slots.release(job_type)
+        metrics.record_finished(
+            job_type,
+            succeeded=succeeded,
+            duration_seconds=time.monotonic() - started,
+        )
+        wakeup.set()
+
+
+def _claim_into_free_slots(
+    *,
+    slots: JobTypeSlots,
+    metrics: JobWorkerMetrics,
+    cpu_executor: Executor,
+    tasks: set[asyncio.Task[None]],
+    wakeup: asyncio.Event,
+) -> int:
+    """
+    Fill free slots with one batch claim per ``job_type`` bucket.
+
+    A bucket that returns fewer jobs than it asked for is drained; a full bucket is
+    refilled when one of its jobs finishes and sets ``wakeup``.
+    """
+    claimed = 0
+    db = SessionLocal()
+    try:
+        for job_filter, free in slots.claim_buckets():
+            limit = min(free, slots.room)
+            if limit < 1:
+                break
+            for job in _claim_pending_jobs(db, limit, job_filter):
+                job_type = cast(str, job.job_type)
+                slots.acquire(job_type)
+                metrics.record_started(job_type)
+                task = asyncio.create_task(
+                    _run_slot(
+                        job,
+                        slots=slots,
+                        metrics=metrics,
+                        cpu_executor=cpu_executor,
+                        wakeup=wakeup,
+                    )
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                claimed += 1
+    finally:
+        db.close()
+    return claimed
+
+
+def _log_metrics(metrics: JobWorkerMetrics) -> None:
+    db = SessionLocal()
+    try:
+        queue_depth = pending_job_counts_by_type(db)
+    finally:
+        db.close()
+    log_job_worker_metrics(metrics.snapshot(queue_depth))
+
+
+async def run_parallel_worker_loop(
+    *,
+    max_concurrency: int,
+    type_limits: Mapping[str, int],
+    poll_interval_seconds: float = 2.0,
+    process_pool_size: int = 0,
+    metrics_interval_seconds: float = 60.0,
+    metrics: JobWorkerMetrics | None = None,
+    listener: JobQueueListener | None = None,
+) -> None:
+    """
+    Run up to ``max_concurrency`` jobs at once, capped per ``job_type`` by ``type_limits``.
+
+    CPU-bound types (:data:`CPU_BOUND_JOB_TYPES`) run in a process pool; DB/LLM-bound types
+    (``inspection_match``) stay on threads. A long render no longer blocks short matches
+    as long as their type has a free slot. The loop wakes on a finished job, a
+    ``job_queue`` NOTIFY (``listener``), or the fallback poll.
+    """
+    slots = JobTypeSlots(type_limits, max_concurrency)
+    metrics = metrics or JobWorkerMetrics()
+    cpu_executor = create_cpu_job_executor(process_pool_size)
+    tasks: set[asyncio.Task[None]] = set()
+    wakeup = asyncio.Event()
+    listen_task = listener.start(wakeup) if listener is not None else None
+    next_metrics_at = time.monotonic() + metrics_interval_seconds
+    logger.info(
+        "Parallel job worker started (max_concurrency=%s, type_limits=%s, poll_interval=%s, listen=%s)",
+        slots.max_concurrency,
+        dict(type_limits),
+        poll_interval_seconds,
+        bool(listener and listener.enabled),
+    )
+    try:
+        while True:
+            try:
+                wakeup.clear()
+                _claim_into_free_slots(
+                    slots=slots,
+                    metrics=metrics,
+                    cpu_executor=cpu_executor,
+                    tasks=tasks,
+                    wakeup=wakeup,
+                )
+                if metrics_interval_seconds > 0 and time.monotonic() >= next_metrics_at:
+                    _log_metrics(metrics)
+                    next_metrics_at = time.monotonic() + metrics_interval_seconds
+                await wait_for_wakeup(wakeup, poll_interval_seconds)
+            except asyncio.CancelledError:
+                logger.info("Job worker stopped")
+                raise
+            except Exception:
+                logger.exception("Worker loop error")
                 await asyncio.sleep(poll_interval_seconds)
-        except asyncio.CancelledError:
-            logger.info("Job worker stopped")
-            raise
-        except Exception:
-            logger.exception("Worker loop error")
-            await asyncio.sleep(poll_interval_seconds)
+    finally:
+        await _stop_listener(listen_task)
+        for task in list(tasks):
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        cpu_executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main() -> None:
@@ -187,7 +517,33 @@ def main() -> None:
 
     logging.basicConfig(level=logging.INFO)
     poll = float(os.getenv("JOB_WORKER_POLL_SECONDS", "2"))
-    asyncio.run(run_worker_loop(poll_interval_seconds=poll))
+    listener = (
+        JobQueueListener.from_engine(
+            engine,
+            sqlalchemy_connect_args(),
+            retry_seconds=poll,
+        )
+        if settings.job_worker_listen_enabled
+        else None
+    )
+    if settings.job_worker_concurrency > 1:
+        asyncio.run(
+            run_parallel_worker_loop(
+                max_concurrency=settings.job_worker_concurrency,
+                type_limits=job_worker_type_limits(),
+                poll_interval_seconds=poll,
+                process_pool_size=settings.job_worker_process_pool_size,
+                metrics_interval_seconds=settings.job_worker_metrics_interval_seconds,
+                listener=listener,
+            )
+        )
+        return
+    asyncio.run(
+        run_worker_loop(
+            poll_interval_seconds=poll,
+            listener=listener,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Collection
+
 from sqlalchemy.orm import Session
 
 from ai.pipelines.landmark_extractor import LandmarkRecord
 from models.drawing_landmark import DrawingLandmark
+from services.bulk_copy import bulk_insert_rows
 
 
 def persist_landmarks(
@@ -14,25 +17,31 @@ def persist_landmarks(
     landmarks: list[LandmarkRecord],
     *,
     source: str,
+    pages: Collection[int] | None = None,
 ) -> int:
-    session.query(DrawingLandmark).filter(
+    """Replace ``source`` rows for the drawing (only on ``pages`` when given) with the new ones."""
+    query = session.query(DrawingLandmark).filter(
         DrawingLandmark.drawing_id == drawing_id,
         DrawingLandmark.source == source,
-    ).delete(synchronize_session=False)
-
-    for record in landmarks:
-        session.add(
-            DrawingLandmark(
-                drawing_id=drawing_id,
-                page=record.page,
-                landmark_type=record.landmark_type,
-                bbox_json=record.bbox_json,
-                hu_moments_json=record.hu_moments_json,
-                ocr_confidence=record.ocr_confidence,
-                source=source,
-                meta_json=record.meta_json,
-            )
-        )
+    )
+    if pages is not None:
+        query = query.filter(DrawingLandmark.page.in_(sorted(pages)))
+    query.delete(synchronize_session=False)
 
-    session.flush()
-    return len(landmarks)
+    return bulk_insert_rows(
+        session,
+        DrawingLandmark,
+        [
+            {
+                "drawing_id": drawing_id,
+                "page": record.page,
+                "landmark_type": record.landmark_type,
+                "bbox_json": record.bbox_json,
+                "hu_moments_json": record.hu_moments_json,
+                "ocr_confidence": record.ocr_confidence,
+                "source": source,
+                "meta_json": record.meta_json,
+            }
+            for record in landmarks
+        ],
+    )
@@ -0,0 +1,179 @@
+"""Per-project in-memory index over the legend reference tables.
+
+:mod:`services.legend_lookup` used to query every ``drawing_legend_*`` row for the
+project on each call and scan them in Python; legend tagging calls it once per OCR'd
+text element, so a dense sheet ran tens of thousands of full-table queries.
+:class:`LegendIndex` loads the project's rows (plus the global ``project_id IS NULL``
+defaults) once and answers:
+
+- exact abbreviation → expansion (project row overrides the global one), and
+- term → codes: names that *contain* the term via one ``str.find`` sweep over the joined
+  names, names *contained in* the term via an Aho-Corasick automaton.
+
+Indexes are cached per process and keyed by project. ORM inserts/updates/deletes of
+legend rows drop the affected entries (a global row drops every project); entries also
+expire after ``LEGEND_INDEX_TTL_SECONDS`` so edits made by other processes (e.g.
+``scripts/seed_legend_reference.py``) or bulk ``DELETE`` statements are picked up.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.legend_reference import (
+    DrawingLegendAbbreviation,
+    DrawingLegendLineType,
+    DrawingLegendSymbol,
+)
+from services.term_automaton import TermAutomaton
+
+_NAME_SEPARATOR = "\x00"
+
+
+class LegendIndex:
+    """Immutable lookup structure built from one project's legend rows."""
+
+    def __init__(
+        self,
+        abbreviations: dict[str, str],
+        named_codes: Iterable[tuple[str, str]],
+    ) -> None:
+        """
+        ``abbreviations`` maps the stored abbreviation to its expansion (project rows
+        already applied over global ones). ``named_codes`` pairs a lowercased expansion /
+        line-type / symbol name with the code it yields.
+        """
+        self._abbreviations = dict(abbreviations)
+        pairs = list(named_codes)
+        self._names = [name for name, _ in pairs]
+        self._codes = [code for _, code in pairs]
+
+        self._haystack = _NAME_SEPARATOR.join(self._names)
+        self._starts: list[int] = []
+        offset = 0
+        for name in self._names:
+            self._starts.append(offset)
+            offset += len(name) + len(_NAME_SEPARATOR)
+
+        self._automaton = TermAutomaton(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def expand_abbreviation(self, token: str) -> Optional[str]:
+        token_clean = token.strip().upper()
+        if not token_clean:
+            return None
+        return self._abbreviations.get(token_clean)
+
+    def _names_containing(self, term_lower: str) -> set[int]:
+        found: set[int] = set()
+        position = self._haystack.find(term_lower)
+        while position != -1:
+            index = bisect.bisect_right(self._starts, position) - 1
+            found.add(index)
+            # Skip to the next name: one hit per name is enough.
+            next_start = (
+                self._starts[index + 1] if index + 1 < len(self._starts) else len(self._haystack)
+            )
+            position = self._haystack.find(term_lower, next_start)
+        return found
+
+    def find_codes_for_term(self, term: str) -> List[str]:
+        term_lower = term.strip().lower()
+        if not term_lower:
+            return []
+        matched = self._names_containing(term_lower) | self._automaton.find(term_lower)
+        return sorted({self._codes[index] for index in matched})
+
+    @classmethod
+    def load(cls, session: Session, project_id: int | None) -> LegendIndex:
+        """Read project-scoped and global legend rows in three queries."""
+
+        def _scoped(model: Any) -> Any:
+            query = session.query(model)
+            if project_id is not None:
+                return query.filter(
+                    (model.project_id == project_id) | (model.project_id.is_(None))
+                )
+            return query.filter(model.project_id.is_(None))
+
+        abbreviations: dict[str, str] = {}
+        named_codes: list[tuple[str, str]] = []
+
+        # Global rows first so project rows overwrite them in ``abbreviations``.
+        abbrev_rows = sorted(
+            _scoped(DrawingLegendAbbreviation).all(),
+            key=lambda row: row.project_id is not None,
+        )
+        for row in abbrev_rows:
+            abbreviations[str(row.abbreviation)] = str(row.expansion)
+            expansion_lower = str(row.expansion).strip().lower()
+            if expansion_lower:
+                named_codes.append((expansion_lower, str(row.abbreviation)))
+
+        for row in _scoped(DrawingLegendLineType).all():
+            if row.abbreviation_code is not None:
+                named_codes.append(
+                    (str(row.line_type_name).strip().lower(), str(row.abbreviation_code))
+                )
+
+        for row in _scoped(DrawingLegendSymbol).all():
+            if row.abbreviation_code is not None:
+                named_codes.append(
+                    (str(row.symbol_name).strip().lower(), str(row.abbreviation_code))
+                )
+
+        return cls(abbreviations, named_codes)
+
+
+_cache: dict[int | None, tuple[float, LegendIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_legend_index(session: Session, project_id: int | None = None) -> LegendIndex:
+    """Cached :class:`LegendIndex` for ``project_id`` (``None`` = global rows only)."""
+    ttl = float(settings.legend_index_ttl_seconds)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(project_id)
+    if cached is not None and (ttl <= 0 or now - cached[0] < ttl):
+        return cached[1]
+
+    index = LegendIndex.load(session, project_id)
+    with _cache_lock:
+        _cache[project_id] = (now, index)
+    return index
+
+
+def invalidate_legend_index(project_id: int | None = None) -> None:
+    """Drop the cached index for ``project_id``; ``None`` (global rows) drops every project."""
+    with _cache_lock:
+        if project_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(project_id, None)
+
+
+def reset_legend_index_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _on_legend_row_change(mapper: Any, connection: Any, target: Any) -> None:
+    invalidate_legend_index(target.project_id)
+    previous = inspect(target).attrs.project_id.history.deleted
+    for old_project_id in previous or ():
+        invalidate_legend_index(old_project_id)
+
+
+for _model in (DrawingLegendAbbreviation, DrawingLegendLineType, DrawingLegendSymbol):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _on_legend_row_change)
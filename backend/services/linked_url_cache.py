@@ -0,0 +1,114 @@
+"""
+Conditional-GET cache for followed PDF hyperlinks (``linked_url_fetches``).
+
+Inspection reports in a project link the same install drawings and submittals over and
+over. ``safe_url_fetch.fetch_url_attachment_async`` stores the extracted text of each link
+with the ``ETag`` / ``Last-Modified`` it was served with. The next follow sends them back
+as ``If-None-Match`` / ``If-Modified-Since``; a ``304`` reuses the text with no download and
+no OCR.
+
+Like ``ocr_result_store`` the cache opens its own short-lived session. Database errors are
+logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import cast
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from config import settings
+from database import SessionLocal
+from models.linked_url_fetch import LinkedUrlFetch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedLinkedUrl:
+    etag: str | None
+    last_modified: str | None
+    filename: str
+    text: str
+    pages: int
+
+
+def linked_url_cache_enabled() -> bool:
+    return bool(settings.pdf_link_follow_cache_enabled)
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def load_linked_url(url: str) -> CachedLinkedUrl | None:
+    try:
+        with SessionLocal() as db:
+            row = (
+                db.query(LinkedUrlFetch)
+                .filter(LinkedUrlFetch.url_hash == _url_hash(url))
+                .one_or_none()
+            )
+    except SQLAlchemyError:
+        logger.warning("linked_url_cache_read_failed", exc_info=True)
+        return None
+    if row is None:
+        return None
+    return CachedLinkedUrl(
+        etag=cast(str | None, row.etag),
+        last_modified=cast(str | None, row.last_modified),
+        filename=cast(str, row.filename),
+        text=cast(str, row.text),
+        pages=cast(int, row.pages),
+    )
+
+
+def mark_linked_url_validated(url: str) -> None:
+    """Record a ``304``: the stored text is still current."""
+    try:
+        with SessionLocal() as db:
+            db.execute(
+                update(LinkedUrlFetch)
+                .where(LinkedUrlFetch.url_hash == _url_hash(url))
+                .values(validated_at=func.now())
+            )
+            db.commit()
+    except SQLAlchemyError:
+        logger.warning("linked_url_cache_write_failed", exc_info=True)
+
+
+def save_linked_url(
+    url: str,
+    *,
+    etag: str | None,
+    last_modified: str | None,
+    filename: str,
+    text: str,
+    pages: int,
+) -> None:
+    """Replace the stored fetch of ``url``; responses without validators are not stored."""
+    if not etag and not last_modified:
+        return
+    url_hash = _url_hash(url)
+    try:
+        with SessionLocal() as db:
+            db.execute(delete(LinkedUrlFetch).where(LinkedUrlFetch.url_hash == url_hash))
+            db.add(
+                LinkedUrlFetch(
+                    url_hash=url_hash,
+                    url=url,
+                    etag=etag,
+                    last_modified=last_modified,
+                    filename=filename,
+                    text=text,
+                    pages=pages,
+                )
+            )
+            db.commit()
+    except SQLAlchemyError:
+        # A concurrent follow of the same link stored it first; either copy is fine.
+        logger.warning("linked_url_cache_write_failed", exc_info=True)
@@ -0,0 +1,217 @@
+"""
+Durable chat-completion cache (``llm_responses``) keyed by model, prompt version and content.
+
+``ai.llm_client.chat_completion`` reads here before calling the model for every call site
+that passes a ``prompt_version`` (document classification, universal / type-specific field
+extraction, drawing scale parsing, inspection type / outcome mapping). Fresh answers are
+written back only after the call site has parsed them and the model stopped normally
+(``ChatCompletion.remember``). Retries, reprocessing and replays of the same evidence text
+then cost no model latency or tokens. Bumping a call site's prompt version orphans its old rows; they
+age out through the TTL / size bound like any other entry.
+
+Like ``ocr_result_store`` the store opens its own short-lived session so pipeline code stays
+session-free. Database errors are logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Mapping
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from config import settings
+from database import SessionLocal
+from models.llm_response import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+#: Writes per process between eviction passes.
+_PRUNE_EVERY_WRITES = 256
+
+
+@dataclass(frozen=True)
+class StoredLlmResponse:
+    text: str
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class _CacheCounters:
+    """Per-process hit / miss / saved-token counters."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.saved_tokens = 0
+
+
+_counters = _CacheCounters()
+
+
+def llm_response_cache_enabled() -> bool:
+    return bool(settings.llm_response_cache_enabled)
+
+
+def llm_cache_key(
+    *,
+    stage: str,
+    prompt_version: int,
+    request: Mapping[str, Any],
+) -> str:
+    """SHA-256 over the stage, prompt version and request (model, messages, limits)."""
+    payload = json.dumps(
+        {"stage": stage, "prompt_version": prompt_version, "request": request},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _ttl_cutoff() -> datetime | None:
+    ttl = float(settings.llm_response_cache_ttl_seconds)
+    if ttl <= 0:
+        return None
+    return datetime.now(timezone.utc) - timedelta(seconds=ttl)
+
+
+def load_llm_response(cache_key: str) -> StoredLlmResponse | None:
+    """Stored answer for ``cache_key`` within the TTL (recording the hit), else None."""
+    stmt = (
+        update(LlmResponse)
+        .where(LlmResponse.cache_key == cache_key)
+        .values(hit_count=LlmResponse.hit_count + 1, last_hit_at=func.now())
+        .returning(
+            LlmResponse.response_text,
+            LlmResponse.prompt_tokens,
+            LlmResponse.completion_tokens,
+            LlmResponse.total_tokens,
+        )
+    )
+    cutoff = _ttl_cutoff()
+    if cutoff is not None:
+        stmt = stmt.where(LlmResponse.created_at >= cutoff)
+
+    try:
+        with SessionLocal() as db:
+            row = db.execute(stmt).first()
+            db.commit()
+    except SQLAlchemyError:
+        logger.warning("llm_response_store_read_failed", exc_info=True)
+        row = None
+
+    with _counters.lock:
+        if row is None:
+            _counters.misses += 1
+            return None
+        _counters.hits += 1
+        _counters.saved_tokens += int(row.total_tokens or 0)
+
+    return StoredLlmResponse(
+        text=str(row.response_text),
+        prompt_tokens=int(row.prompt_tokens or 0),
+        completion_tokens=int(row.completion_tokens or 0),
+        total_tokens=int(row.total_tokens or 0),
+    )
+
+
+def save_llm_response(
+    cache_key: str,
+    *,
+    model: str,
+    stage: str,
+    prompt_version: int,
+    text: str,
+    usage: Any = None,
+) -> None:
+    """Store a fresh answer; an existing row for the key is replaced (it was expired)."""
+    values = {
+        "cache_key": cache_key,
+        "model": model,
+        "stage": stage,
+        "prompt_version": prompt_version,
+        "response_text": text,
+        "prompt_tokens": int(getattr(usage, "prompt_tokens", 0) or 0),
+        "completion_tokens": int(getattr(usage, "completion_tokens", 0) or 0),
+        "total_tokens": int(getattr(usage, "total_tokens", 0) or 0),
+        "hit_count": 0,
+    }
+    try:
+        with SessionLocal() as db:
+            db.execute(delete(LlmResponse).where(LlmResponse.cache_key == cache_key))
+            db.add(LlmResponse(**values))
+            db.commit()
+    except SQLAlchemyError:
+        # A concurrent writer stored the same key first; either answer is fine.
+        logger.warning("llm_response_store_write_failed", exc_info=True)
+        return
+
+    with _counters.lock:
+        _counters.writes += 1
+        prune_due = _counters.writes % _PRUNE_EVERY_WRITES == 0
+    if prune_due:
+        prune_llm_responses()
+
+
+def prune_llm_responses() -> int:
+    """Delete expired rows, then the least recently hit rows beyond the size bound."""
+    cutoff = _ttl_cutoff()
+    max_entries = int(settings.llm_response_cache_max_entries)
+    removed = 0
+    try:
+        with SessionLocal() as db:
+            if cutoff is not None:
+                removed += db.execute(
+                    delete(LlmResponse).where(LlmResponse.created_at < cutoff)
+                ).rowcount or 0
+            if max_entries > 0:
+                overflow = (
+                    select(LlmResponse.id)
+                    .order_by(LlmResponse.last_hit_at.desc(), LlmResponse.id.desc())
+                    .offset(max_entries)
+                    .scalar_subquery()
+                )
+                removed += db.execute(
+                    delete(LlmResponse).where(LlmResponse.id.in_(overflow))
+                ).rowcount or 0
+            db.commit()
+    except SQLAlchemyError:
+        logger.warning("llm_response_store_prune_failed", exc_info=True)
+        return 0
+
+    with _counters.lock:
+        _counters.evictions += removed
+    if removed:
+        logger.info("llm_response_store_pruned", extra={"evicted": removed})
+    return removed
+
+
+def llm_response_cache_stats() -> dict[str, Any]:
+    """Per-process hit rate and tokens saved since start (or the last reset)."""
+    with _counters.lock:
+        lookups = _counters.hits + _counters.misses
+        return {
+            "enabled": llm_response_cache_enabled(),
+            "hits": _counters.hits,
+            "misses": _counters.misses,
+            "hit_rate": round(_counters.hits / lookups, 4) if lookups else 0.0,
+            "saved_tokens": _counters.saved_tokens,
+            "writes": _counters.writes,
+            "evictions": _counters.evictions,
+        }
+
+
+def reset_llm_response_cache_stats() -> None:
+    global _counters
+    _counters = _CacheCounters()
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import re
+from typing import Sequence
 
 from sqlalchemy.orm import Session
 
 from models.drawing_text_element import DrawingTextElement
-from services.legend_lookup import expand_abbreviation, find_codes_for_term
+from services.legend_index import LegendIndex, get_legend_index
+from services.text_element_storage import TextElementRecord
 
 _TOKEN_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9\-_/]*$")
 
@@ -19,7 +21,7 @@ def is_single_token(text: str) -> bool:
     return bool(_TOKEN_RE.match(stripped))
 
 
-def legend_tags_for_text_element(row: DrawingTextElement) -> list[str]:
+def legend_tags_for_text_element(row: DrawingTextElement | TextElementRecord) -> list[str]:
     """Searchable tag strings derived from a text element's legend fields."""
     tags: set[str] = set()
     text = str(row.text).strip()
@@ -42,27 +44,31 @@ def legend_tags_for_text_element(row: DrawingTextElement) -> list[str]:
 
 def enrich_text_element(
     session: Session,
-    row: DrawingTextElement,
+    row: DrawingTextElement | TextElementRecord,
     *,
     project_id: int | None,
+    legend_index: LegendIndex | None = None,
 ) -> bool:
-    """Apply legend lookup to one persisted text element. Returns True if enriched."""
+    """Apply legend lookup to one text element (row or pre-insert record). Returns True if enriched."""
     text = str(row.text).strip()
     if not text:
         return False
 
+    if legend_index is None:
+        legend_index = get_legend_index(session, project_id)
+
     expansion: str | None = None
     codes: list[str] = []
 
     if is_single_token(text):
-        expansion = expand_abbreviation(session, text, project_id)
+        expansion = legend_index.expand_abbreviation(text)
         if expansion:
-            codes = find_codes_for_term(session, expansion, project_id)
+            codes = legend_index.find_codes_for_term(expansion)
             token_upper = text.upper()
             if token_upper not in codes:
                 codes = sorted({token_upper, *codes})
     else:
-        codes = find_codes_for_term(session, text, project_id)
+        codes = legend_index.find_codes_for_term(text)
 
     changed = False
     if expansion:
@@ -88,11 +94,26 @@ def enrich_text_elements_with_legend(
         .all()
     )
 
+    legend_index = get_legend_index(session, project_id)
     enriched = 0
     for row in rows:
-        if enrich_text_element(session, row, project_id=project_id):
+        if enrich_text_element(session, row, project_id=project_id, legend_index=legend_index):
             enriched += 1
 
     if enriched:
         session.flush()
     return enriched
+
+
+def enrich_text_element_records(
+    session: Session,
+    records: Sequence[TextElementRecord],
+    project_id: int | None,
+) -> int:
+    """Tag text element records before they are written, so the index needs no UPDATE pass."""
+    legend_index = get_legend_index(session, project_id)
+    return sum(
+        1
+        for record in records
+        if enrich_text_element(session, record, project_id=project_id, legend_index=legend_index)
+    )
@@ -0,0 +1,173 @@
+"""
+Durable OCR results (``ocr_results``) keyed by file checksum, OCR backend and DPI.
+
+``document_text_extraction`` reads here before running Tesseract / OpenAI vision and
+writes every fresh OCR pass back, so upload-time extraction, survey-point extraction,
+evidence-kind classification, later ``inspection_match`` jobs, retries and re-uploads of
+the same bytes all share one OCR pass.
+
+The store opens its own short-lived session so pipeline code stays session-free. Database
+errors are logged and treated as a miss; OCR then runs as if the store did not exist.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, cast
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from ai.pipelines.document_text_extraction import (
+    BoundingBox,
+    ExtractedDocument,
+    PositionedWord,
+    SourceFormat,
+)
+from config import settings
+from database import SessionLocal
+from models.ocr_result import OcrResult
+
+logger = logging.getLogger(__name__)
+
+
+def ocr_result_store_enabled() -> bool:
+    return bool(settings.ocr_result_store_enabled)
+
+
+def _words_to_json(words: list[PositionedWord]) -> list[list[Any]]:
+    return [
+        [w.text, w.ocr_confidence, w.bbox.x, w.bbox.y, w.bbox.width, w.bbox.height]
+        for w in words
+    ]
+
+
+def _words_from_row(row: OcrResult) -> list[PositionedWord]:
+    page_index = cast(int, row.page_index)
+    page_width = float(cast(float | None, row.page_width) or 0.0)
+    page_height = float(cast(float | None, row.page_height) or 0.0)
+    return [
+        PositionedWord(
+            text=str(text),
+            bbox=BoundingBox(
+                x=float(x),
+                y=float(y),
+                width=float(width),
+                height=float(height),
+                page_width=page_width,
+                page_height=page_height,
+            ),
+            page_index=page_index,
+            ocr_confidence=float(confidence),
+        )
+        for text, confidence, x, y, width, height in cast(list[list[Any]], row.words_json)
+    ]
+
+
+def load_stored_ocr_document(
+    checksum: str,
+    *,
+    ocr_backend: str,
+    dpi: int,
+    max_pages: int | None = None,
+) -> ExtractedDocument | None:
+    """Rebuild an ``ExtractedDocument`` when every requested page is stored, else None."""
+    try:
+        with SessionLocal() as db:
+            rows = (
+                db.query(OcrResult)
+                .filter(
+                    OcrResult.checksum == checksum,
+                    OcrResult.ocr_backend == ocr_backend,
+                    OcrResult.dpi == dpi,
+                )
+                .order_by(OcrResult.page_index.asc())
+                .all()
+            )
+    except SQLAlchemyError:
+        logger.warning("ocr_result_store_read_failed", exc_info=True)
+        return None
+    if not rows:
+        return None
+
+    total_pages = cast(int, rows[0].page_count)
+    pages_needed = min(total_pages, max_pages) if max_pages else total_pages
+    by_page = {cast(int, row.page_index): row for row in rows}
+    if any(page_index not in by_page for page_index in range(pages_needed)):
+        return None
+
+    words: list[PositionedWord] = []
+    for page_index in range(pages_needed):
+        words.extend(_words_from_row(by_page[page_index]))
+    return ExtractedDocument(
+        source_format=SourceFormat(cast(str, rows[0].source_format)),
+        page_count=pages_needed,
+        words=words,
+    )
+
+
+def save_ocr_document(
+    checksum: str,
+    document: ExtractedDocument,
+    *,
+    ocr_backend: str,
+    dpi: int,
+    total_page_count: int,
+) -> None:
+    """Store each OCR'd page; pages already stored for this key are left untouched."""
+    words_by_page: dict[int, list[PositionedWord]] = {
+        page_index: [] for page_index in range(document.page_count)
+    }
+    for word in document.words:
+        words_by_page.setdefault(word.page_index, []).append(word)
+
+    values = [
+        {
+            "checksum": checksum,
+            "ocr_backend": ocr_backend,
+            "dpi": dpi,
+            "page_index": page_index,
+            "page_count": total_page_count,
+            "source_format": document.source_format.value,
+            "page_width": page_words[0].bbox.page_width if page_words else None,
+            "page_height": page_words[0].bbox.page_height if page_words else None,
+            "words_json": _words_to_json(page_words),
+        }
+        for page_index, page_words in sorted(words_by_page.items())
+    ]
+    if not values:
+        return
+
+    try:
+        with SessionLocal() as db:
+            dialect = db.get_bind().dialect.name
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                existing = {
+                    cast(int, page_index)
+                    for (page_index,) in db.query(OcrResult.page_index).filter(
+                        OcrResult.checksum == checksum,
+                        OcrResult.ocr_backend == ocr_backend,
+                        OcrResult.dpi == dpi,
+                    )
+                }
+                db.add_all(
+                    OcrResult(**row) for row in values if row["page_index"] not in existing
+                )
+                db.commit()
+                return
+
+            stmt = insert(OcrResult).values(values).on_conflict_do_nothing(
+                index_elements=[
+                    OcrResult.checksum,
+                    OcrResult.ocr_backend,
+                    OcrResult.dpi,
+                    OcrResult.page_index,
+                ]
+            )
+            db.execute(stmt)
+            db.commit()
+    except SQLAlchemyError:
+        logger.warning("ocr_result_store_write_failed", exc_info=True)
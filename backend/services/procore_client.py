@@ -1,9 +1,13 @@
 """
 Procore API Client Service
 Handles all HTTP requests to Procore API with authentication
+
+Requests share a pooled connection per environment and go through the per-company rate
+limiter and retry policy in ``services.procore_http``.
 """
+import asyncio
 import httpx
-from typing import Optional, Dict, Any, List, cast
+from typing import AsyncIterator, Optional, Dict, Any, List, cast
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 import json
@@ -15,26 +19,53 @@ from errors import (
 )
 from models.models import Company
 from services.procore_connection_store import get_active_connection
-from config import procore_api_base_url
+from config import procore_api_base_url, settings
+from services.procore_http import (
+    procore_http_client,
+    retry_after_seconds,
+    send_procore_request,
+)
+
+#: File downloads (drawing PDFs, documents) get longer than the 30s API default.
+DOWNLOAD_TIMEOUT_SECONDS = 60.0
 
 class ProcoreAPIClient:
     """Main client for interacting with Procore REST API"""
     
     API_VERSION = "v1.0"
+    #: ``per_page`` for paginated list endpoints.
+    PAGE_SIZE = 100
     
     def __init__(self, db: Session, user_id: str):
         self.db = db
         self.user_id = user_id
         self.base_url = procore_api_base_url()
-        self._client: Optional[httpx.AsyncClient] = None
     
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        # The pooled connection outlives this client; nothing to close.
+        return None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        **request_kwargs: Any,
+    ) -> httpx.Response:
+        """Send through the shared pool, rate-limited per Procore-Company-Id."""
+        return await send_procore_request(
+            procore_http_client(self.base_url),
+            method,
+            url,
+            company=headers.get("Procore-Company-Id", ""),
+            headers=headers,
+            timeout=timeout,
+            **request_kwargs,
+        )
     
     async def _get_access_token(self) -> str:
         """Get valid access token, refreshing if necessary"""
@@ -64,6 +95,20 @@ class ProcoreAPIClient:
         headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """Make authenticated request to Procore API"""
+        response = await self._request_response(
+            method, endpoint, params=params, json_data=json_data, headers=headers
+        )
+        return response.json()
+
+    async def _request_response(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Authenticated request; returns the raw response (list endpoints need its headers)."""
         access_token = await self._get_access_token()
         
         url = f"{self.base_url}/rest/{self.API_VERSION}/{endpoint.lstrip('/')}"
@@ -81,36 +126,19 @@ class ProcoreAPIClient:
             request_headers.update(headers)
         
         try:
-            if not self._client:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        params=params,
-                        json=json_data,
-                        headers=request_headers,
-                    )
-            else:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    headers=request_headers,
-                )
-
+            response = await self._send(
+                method,
+                url,
+                request_headers,
+                params=params,
+                json=json_data,
+            )
             response.raise_for_status()
-            return response.json()
+            return response
 
         except httpx.HTTPStatusError as e:
             status = e.response.status_code
-            # Best-effort parse retry-after
-            retry_after = None
-            try:
-                ra = e.response.headers.get("retry-after")
-                retry_after = int(ra) if ra is not None else None
-            except Exception:
-                retry_after = None
+            retry_after = retry_after_seconds(e.response)
 
             details = {
                 "upstream": "procore",
@@ -135,6 +163,66 @@ class ProcoreAPIClient:
                 details={"upstream": "procore", "endpoint": endpoint, "method": method},
             ) from e
 
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        *,
+        per_page: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield every page of a Procore list endpoint, in order.
+
+        Page 1's ``Total`` header gives the page count; the remaining pages are requested
+        ``PROCORE_PAGE_CONCURRENCY`` at a time (the per-company rate limiter paces them).
+        Without ``Total``, pages are read one by one until a short page.
+        """
+        per_page = per_page or self.PAGE_SIZE
+        base_params = dict(params or {})
+        base_params["per_page"] = per_page
+
+        async def fetch(page: int) -> tuple[List[Dict[str, Any]], httpx.Response]:
+            response = await self._request_response(
+                "GET", endpoint, params={**base_params, "page": page}, headers=headers
+            )
+            return self._ensure_list(response.json()), response
+
+        items, response = await fetch(1)
+        yield items
+
+        total = response.headers.get("total")
+        if total is None or not total.isdigit():
+            page, previous = 1, items
+            # An endpoint that ignores ``page`` would repeat itself; stop on a repeat.
+            while len(previous) == per_page:
+                page += 1
+                items, _ = await fetch(page)
+                if not items or items == previous:
+                    return
+                yield items
+                previous = items
+            return
+
+        last_page = -(-int(total) // per_page)
+        window = max(1, int(settings.procore_page_concurrency))
+        for start in range(2, last_page + 1, window):
+            pages = range(start, min(start + window, last_page + 1))
+            for items, _ in await asyncio.gather(*(fetch(page) for page in pages)):
+                if items:
+                    yield items
+
+    async def _list_all(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        async for page in self.paginate(endpoint, params=params, headers=headers):
+            records.extend(page)
+        return records
+
     def _ensure_list(self, data: Any) -> List[Dict[str, Any]]:
         """Normalize API response to list; handles raw array or {data|results|companies} wrapper."""
         if isinstance(data, list):
@@ -187,7 +275,7 @@ class ProcoreAPIClient:
     
     # Project Methods
     async def get_projects(self, company_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all projects user has access to"""
+        """List all projects user has access to (every page)"""
         params = {}
         if company_id:
             params["company_id"] = company_id
@@ -196,8 +284,7 @@ class ProcoreAPIClient:
         if company_id:
             headers["Procore-Company-Id"] = company_id
         
-        data = await self._request("GET", "/projects", params=params, headers=headers)
-        return self._ensure_list(data)
+        return await self._list_all("/projects", params=params, headers=headers)
     
     async def get_project(self, project_id: str, company_id: Optional[str] = None) -> Dict[str, Any]:
         """Get project details"""
@@ -232,7 +319,7 @@ class ProcoreAPIClient:
         company_id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List submittals for a project"""
+        """List submittals for a project (every page)"""
         headers = {}
         if company_id:
             headers["Procore-Company-Id"] = company_id
@@ -241,8 +328,7 @@ class ProcoreAPIClient:
         if params:
             request_params.update(params)
         
-        data = await self._request("GET", "/submittals", params=request_params, headers=headers)
-        return self._ensure_list(data)
+        return await self._list_all("/submittals", params=request_params, headers=headers)
     
     async def get_submittal(
         self,
@@ -322,13 +408,30 @@ class ProcoreAPIClient:
         return self._ensure_list(data)
     
     # RFIs Methods
+    def iter_rfis(
+        self,
+        project_id: str,
+        company_id: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Page through RFIs for a project (see ``paginate``)"""
+        headers = {}
+        if company_id:
+            headers["Procore-Company-Id"] = company_id
+        
+        request_params = {"project_id": project_id}
+        if params:
+            request_params.update(params)
+        
+        return self.paginate("/rfis", params=request_params, headers=headers)
+    
     async def get_rfis(
         self,
         project_id: str,
         company_id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List RFIs for a project"""
+        """List RFIs for a project (every page)"""
         headers = {}
         if company_id:
             headers["Procore-Company-Id"] = company_id
@@ -337,8 +440,7 @@ class ProcoreAPIClient:
         if params:
             request_params.update(params)
         
-        data = await self._request("GET", "/rfis", params=request_params, headers=headers)
-        return self._ensure_list(data)
+        return await self._list_all("/rfis", params=request_params, headers=headers)
     
     async def get_rfi(
         self,
@@ -385,7 +487,7 @@ class ProcoreAPIClient:
         company_id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List drawings for a project"""
+        """List drawings for a project (every page)"""
         headers = {}
         if company_id:
             headers["Procore-Company-Id"] = company_id
@@ -394,8 +496,7 @@ class ProcoreAPIClient:
         if params:
             request_params.update(params)
         
-        data = await self._request("GET", "/drawings", params=request_params, headers=headers)
-        return self._ensure_list(data)
+        return await self._list_all("/drawings", params=request_params, headers=headers)
     
     async def get_drawing(
         self,
@@ -432,10 +533,11 @@ class ProcoreAPIClient:
         
         params = {"project_id": project_id}
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.content
+        response = await self._send(
+            "GET", url, headers, timeout=DOWNLOAD_TIMEOUT_SECONDS, params=params
+        )
+        response.raise_for_status()
+        return response.content
     
     async def create_drawing_markup(
         self,
@@ -464,7 +566,7 @@ class ProcoreAPIClient:
         company_id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """List inspections for a project"""
+        """List inspections for a project (every page)"""
         headers = {}
         if company_id:
             headers["Procore-Company-Id"] = company_id
@@ -473,8 +575,7 @@ class ProcoreAPIClient:
         if params:
             request_params.update(params)
         
-        data = await self._request("GET", "/inspections", params=request_params, headers=headers)
-        return self._ensure_list(data)
+        return await self._list_all("/inspections", params=request_params, headers=headers)
     
     async def get_inspection(
         self,
@@ -612,7 +713,8 @@ class ProcoreAPIClient:
         
         params = {"project_id": project_id}
         
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.content
+        response = await self._send(
+            "GET", url, headers, timeout=DOWNLOAD_TIMEOUT_SECONDS, params=params
+        )
+        response.raise_for_status()
+        return response.content
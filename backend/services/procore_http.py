@@ -0,0 +1,313 @@
+"""
+Shared HTTP transport for the Procore REST API.
+
+``ProcoreAPIClient`` used to open a new ``httpx.AsyncClient`` per request (and per file
+download), and surfaced every 429 straight to the caller. This module provides:
+
+- :func:`procore_http_client`: one pooled ``httpx.AsyncClient`` per Procore base URL (so per
+  environment) and event loop, with HTTP/2 when the ``h2`` package is installed.
+- :class:`ProcoreRateLimiter`: a token bucket per Procore company. It refills at
+  ``PROCORE_RATE_LIMIT_PER_HOUR``, allows bursts of ``PROCORE_RATE_LIMIT_BURST``, tightens to the
+  ``X-Rate-Limit-Remaining`` Procore reports, and stops all requests for the company until a
+  429's ``Retry-After`` has passed.
+- :func:`send_procore_request`: schedules a request through the bucket. Idempotent requests
+  (GET / HEAD) are retried on 429, 502-504 and transport errors, up to
+  ``PROCORE_MAX_RETRIES`` times, with jittered exponential backoff.
+
+:func:`procore_http_stats` reports the request rate and remaining budget per company.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_SECONDS = 30.0
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 30.0
+#: Window for the per-company requests-per-minute metric.
+_RATE_WINDOW_SECONDS = 60.0
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def procore_http_client(base_url: str) -> httpx.AsyncClient:
+    """Pooled client for ``base_url`` on the running event loop (clients are loop-bound)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        per_loop = _clients.setdefault(loop, {})
+        client = per_loop.get(base_url)
+        if client is None or client.is_closed:
+            connections = max(1, int(settings.procore_max_connections))
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                http2=_http2_available(),
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections,
+                ),
+            )
+            per_loop[base_url] = client
+        return client
+
+
+async def close_procore_http_clients() -> None:
+    """Close this loop's pooled clients (app shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = list(_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated_at: float
+    paused_until: float = 0.0
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    recent: deque[float] = field(default_factory=deque)
+    upstream_limit: int | None = None
+    upstream_remaining: int | None = None
+    upstream_reset: str | None = None
+
+
+class ProcoreRateLimiter:
+    """Token bucket per Procore company, shared by every event loop in the process."""
+
+    def __init__(
+        self,
+        *,
+        per_hour: float | None = None,
+        burst: int | None = None,
+    ) -> None:
+        """``None`` reads ``PROCORE_RATE_LIMIT_PER_HOUR`` / ``PROCORE_RATE_LIMIT_BURST``."""
+        self._per_hour = per_hour
+        self._burst = burst
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _rate_per_second(self) -> float:
+        per_hour = self._per_hour if self._per_hour is not None else settings.procore_rate_limit_per_hour
+        return max(float(per_hour), 1.0) / 3600.0
+
+    def _capacity(self) -> float:
+        burst = self._burst if self._burst is not None else settings.procore_rate_limit_burst
+        return float(max(int(burst), 1))
+
+    def _bucket(self, company: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(company)
+        if bucket is None:
+            bucket = _Bucket(tokens=self._capacity(), updated_at=now)
+            self._buckets[company] = bucket
+        else:
+            bucket.tokens = min(
+                self._capacity(),
+                bucket.tokens + (now - bucket.updated_at) * self._rate_per_second(),
+            )
+            bucket.updated_at = now
+        return bucket
+
+    def reserve(self, company: str) -> float:
+        """Take one token; returns seconds to wait before sending (0 when one was free)."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(company, now)
+            bucket.tokens -= 1.0
+            bucket.requests += 1
+            bucket.recent.append(now)
+            while bucket.recent and now - bucket.recent[0] > _RATE_WINDOW_SECONDS:
+                bucket.recent.popleft()
+            wait = max(0.0, -bucket.tokens / self._rate_per_second())
+            return max(wait, bucket.paused_until - now)
+
+    async def acquire(self, company: str) -> None:
+        wait = self.reserve(company)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, company: str, response: httpx.Response) -> None:
+        """Fold Procore's ``X-Rate-Limit-*`` headers into the bucket."""
+        headers = response.headers
+        limit = _int_header(headers.get("x-rate-limit-limit"))
+        remaining = _int_header(headers.get("x-rate-limit-remaining"))
+        if limit is None and remaining is None:
+            return
+        with self._lock:
+            bucket = self._bucket(company, time.monotonic())
+            bucket.upstream_limit = limit
+            bucket.upstream_remaining = remaining
+            bucket.upstream_reset = headers.get("x-rate-limit-reset")
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, float(remaining))
+
+    def pause(self, company: str, seconds: float) -> None:
+        """Hold every request for ``company`` for ``seconds`` (a 429's ``Retry-After``)."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(company, now)
+            bucket.rate_limited += 1
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.paused_until = max(bucket.paused_until, now + seconds)
+
+    def record_retry(self, company: str) -> None:
+        with self._lock:
+            self._bucket(company, time.monotonic()).retries += 1
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            companies = {}
+            for company, bucket in self._buckets.items():
+                self._bucket(company, now)
+                while bucket.recent and now - bucket.recent[0] > _RATE_WINDOW_SECONDS:
+                    bucket.recent.popleft()
+                companies[company or "-"] = {
+                    "requests": bucket.requests,
+                    "requests_last_minute": len(bucket.recent),
+                    "retries": bucket.retries,
+                    "rate_limited": bucket.rate_limited,
+                    "tokens_available": round(max(bucket.tokens, 0.0), 2),
+                    "paused_for_seconds": round(max(bucket.paused_until - now, 0.0), 3),
+                    "upstream_limit": bucket.upstream_limit,
+                    "upstream_remaining": bucket.upstream_remaining,
+                    "upstream_reset": bucket.upstream_reset,
+                }
+            return {
+                "http2": _http2_available(),
+                "rate_per_hour": round(self._rate_per_second() * 3600.0, 1),
+                "burst": self._capacity(),
+                "companies": companies,
+            }
+
+
+def _int_header(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(response: httpx.Response) -> int | None:
+    """``Retry-After`` in seconds (numeric form only, as Procore sends it)."""
+    return _int_header(response.headers.get("retry-after"))
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry ``attempt`` (0-based)."""
+    return random.uniform(0.0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+_rate_limiter: ProcoreRateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_procore_rate_limiter() -> ProcoreRateLimiter:
+    """Process-wide limiter."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = ProcoreRateLimiter()
+        return _rate_limiter
+
+
+def reset_procore_rate_limiter() -> None:
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
+
+
+def procore_http_stats() -> dict[str, Any]:
+    return get_procore_rate_limiter().stats()
+
+
+async def send_procore_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    company: str,
+    timeout: float | None = None,
+    **request_kwargs: Any,
+) -> httpx.Response:
+    """
+    Send one Procore request through the company's token bucket.
+
+    Returns the final response (callers map error statuses). Retries only idempotent methods;
+    a 429 on any method pauses the company's bucket for ``Retry-After`` seconds. Transport
+    errors from the last attempt propagate.
+    """
+    limiter = get_procore_rate_limiter()
+    method = method.upper()
+    max_retries = max(0, int(settings.procore_max_retries)) if method in IDEMPOTENT_METHODS else 0
+    if timeout is not None:
+        request_kwargs["timeout"] = timeout
+
+    attempt = 0
+    while True:
+        await limiter.acquire(company)
+        try:
+            response = await client.request(method, url, **request_kwargs)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            delay = _backoff_seconds(attempt)
+            status = None
+        else:
+            limiter.observe(company, response)
+            retry_after = retry_after_seconds(response) if response.status_code == 429 else None
+            if retry_after is not None:
+                limiter.pause(company, retry_after)
+            elif response.status_code == 429:
+                limiter.pause(company, _backoff_seconds(attempt))
+            if response.status_code not in RETRYABLE_STATUSES or attempt >= max_retries:
+                return response
+            # The bucket already holds requests for Retry-After; jitter spreads the wakeups.
+            delay = _backoff_seconds(attempt)
+            status = response.status_code
+            await response.aclose()
+
+        attempt += 1
+        limiter.record_retry(company)
+        logger.info(
+            "procore_request_retry",
+            extra={
+                "endpoint": url,
+                "attempt": attempt,
+                "upstream_status": status,
+                "retry_after": round(delay, 3),
+            },
+        )
+        await asyncio.sleep(delay)
@@ -14,6 +14,8 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from models.drawing_region import DrawingRegion
+from services.drawing_index_version import bump_drawing_index_version
+from services.drawing_spatial_index import invalidate_drawing_spatial_index
 
 
 def _check_normalized(value: float, name: str) -> None:
@@ -125,6 +127,8 @@ def create_drawing_region(
     )
     db.add(row)
     try:
+        invalidate_drawing_spatial_index(db, master_drawing_id, pages=[page], kinds=["region"])
+        bump_drawing_index_version(db, master_drawing_id)
         db.commit()
     except Exception:
         db.rollback()
@@ -155,9 +159,11 @@ def update_drawing_region(
     if geometry is not None or polygon_points is not ...:
         validate_region_geometry(next_geometry, polygon_points=next_polygon)
 
+    touched_pages = {int(row.page)}
     if label is not None:
         row.label = label
     if page is not None:
+        touched_pages.add(page)
         row.page = page
     if geometry is not None:
         row.geometry = geometry
@@ -170,6 +176,10 @@ def update_drawing_region(
 
     row.updated_at = datetime.now(timezone.utc)
     try:
+        invalidate_drawing_spatial_index(
+            db, master_drawing_id, pages=touched_pages, kinds=["region"]
+        )
+        bump_drawing_index_version(db, master_drawing_id)
         db.commit()
     except Exception:
         db.rollback()
@@ -187,8 +197,11 @@ def delete_drawing_region(
     row = get_drawing_region(db, master_drawing_id, region_id)
     if row is None:
         return False
+    page = int(row.page)
     db.delete(row)
     try:
+        invalidate_drawing_spatial_index(db, master_drawing_id, pages=[page], kinds=["region"])
+        bump_drawing_index_version(db, master_drawing_id)
         db.commit()
     except Exception:
         db.rollback()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, cast
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, cast
 from sqlalchemy.orm import Session
 
 from services.procore_client import ProcoreAPIClient
@@ -57,14 +58,37 @@ def _normalize_rfi_to_evidence(rfi: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _parse_procore_timestamp(value: Any) -> Optional[datetime]:
+    """Procore ISO-8601 timestamp (``...Z``) as an aware UTC datetime."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _procore_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 async def ingest_rfis_for_project(
     db: Session,
     *,
     user_id: str,
     project: Project,
+    full: bool = False,
 ) -> List[EvidenceRecord]:
     """
     Pull RFIs from Procore for one project and normalize them into EvidenceRecord(type='rfi').
+
+    Incremental by default: only RFIs updated since the project's ``rfis`` sync cursor are
+    requested (``filters[updated_at]``), all pages of them. ``full=True`` ignores the cursor.
+    Changed records and the advanced cursor are written in one transaction. Returns the
+    records that were inserted or updated.
     """
     storage = StorageService(db)
 
@@ -72,25 +96,35 @@ async def ingest_rfis_for_project(
     if not procore_project_id:
         raise ValueError("Project is missing procore_project_id")
 
-    async with ProcoreAPIClient(db, user_id) as client:
-        rfis = await client.get_rfis(project_id=str(procore_project_id))
-
-    records: List[EvidenceRecord] = []
-
-    for rfi in rfis:
-        normalized = _normalize_rfi_to_evidence(cast(Dict[str, Any], rfi))
-
-        record = storage.upsert_rfi_evidence_record(
-            project_id=cast(int, project.id),
-            source_id=normalized["source_id"],
-            title=normalized["title"],
-            status=normalized["status"],
-            text_content=normalized["text_content"],
-            dates=normalized["dates"],
-            attachments_json=normalized["attachments_json"],
-            cross_refs_json=normalized["cross_refs_json"],
+    project_id = cast(int, project.id)
+    since = None if full else storage.get_procore_sync_cursor(project_id, "rfis")
+    params: Dict[str, Any] = {}
+    if since is not None:
+        params["filters[updated_at]"] = (
+            f"{_procore_timestamp(since)}...{_procore_timestamp(datetime.now(timezone.utc))}"
         )
 
-        records.append(record)
-
-    return records
+    rows: List[Dict[str, Any]] = []
+    newest = since
+    async with ProcoreAPIClient(db, user_id) as client:
+        async for page in client.iter_rfis(project_id=str(procore_project_id), params=params):
+            for rfi in page:
+                normalized = _normalize_rfi_to_evidence(cast(Dict[str, Any], rfi))
+                rows.append(normalized)
+                updated_at = _parse_procore_timestamp(normalized["dates"].get("updated_at"))
+                if updated_at is not None and (newest is None or updated_at > newest):
+                    newest = updated_at
+
+    written = storage.bulk_upsert_rfi_evidence_records(
+        project_id,
+        rows,
+        cursor_updated_at=newest,
+    )
+    if not written:
+        return []
+    return (
+        db.query(EvidenceRecord)
+        .filter(EvidenceRecord.id.in_(written))
+        .order_by(EvidenceRecord.id)
+        .all()
+    )
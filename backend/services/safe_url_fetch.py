@@ -4,28 +4,49 @@ Network and security rules live here — not in the AI pipeline module.
 Allowed hosts come from ``config.pdf_link_follow_allowed_host_suffixes()``.
 
 Followed PDF and image attachments are always OCR'd (never native PDF text layers).
+
+``pdf_link_follower`` uses the async path (:func:`fetch_url_attachment_async`). Every
+link-follow stage in the process shares one event loop thread and one pooled
+``httpx.AsyncClient`` (:func:`run_link_fetch`). Bodies stream into a temp file rather than
+memory, and repeated links are revalidated through ``services.linked_url_cache``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
+import os
 import re
 import tempfile
+import threading
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from html import unescape
 from pathlib import Path
+from typing import Any, TypeVar
 from urllib.parse import unquote, urlparse
 
 import httpx
 
 from ai.pipelines.document_text_extraction import extract_document_via_ocr
 from config import pdf_link_follow_allowed_host_suffixes, settings
+from services.linked_url_cache import (
+    linked_url_cache_enabled,
+    load_linked_url,
+    mark_linked_url_validated,
+    save_linked_url,
+)
 
 logger = logging.getLogger(__name__)
 
 FETCH_TIMEOUT_SECONDS = 10.0
 
+#: Bytes read from a spooled body to sniff its type.
+_SNIFF_BYTES = 512
+
+T = TypeVar("T")
+
 
 def max_response_bytes() -> int:
     """Configured cap for a single external link fetch (default 20 MiB)."""
@@ -43,6 +64,22 @@ class SafeFetchResult:
     error: str | None = None
 
 
+@dataclass(frozen=True)
+class SpooledFetch:
+    """Streaming GET result: the body lives in ``path`` (caller deletes) unless ``not_modified``."""
+
+    ok: bool
+    url: str
+    status_code: int | None = None
+    content_type: str | None = None
+    content_disposition: str | None = None
+    path: Path | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class UrlAttachmentFetch:
     text: str
@@ -51,6 +88,66 @@ class UrlAttachmentFetch:
     pages: int
 
 
+class _LinkFetchRuntime:
+    """
+    Process-wide HTTP clients for link fetches.
+
+    The async client lives on a daemon event-loop thread so synchronous callers (upload
+    handlers, job threads) can run link-follow stages on it concurrently and still share
+    one connection pool. Rebuilt after a fork.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._sync_client: httpx.Client | None = None
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._loop = None
+            self._async_client = None
+            self._sync_client = None
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            self._reset_after_fork()
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="link-fetch-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Pooled async client; only use it from coroutines run via :func:`run_link_fetch`."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=FETCH_TIMEOUT_SECONDS, follow_redirects=True
+            )
+        return self._async_client
+
+    def sync_client(self) -> httpx.Client:
+        with self._lock:
+            self._reset_after_fork()
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(
+                    timeout=FETCH_TIMEOUT_SECONDS, follow_redirects=True
+                )
+            return self._sync_client
+
+
+_link_fetch_runtime = _LinkFetchRuntime()
+
+
+def run_link_fetch(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared link-fetch loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _link_fetch_runtime.loop()).result()
+
+
 def is_allowed_external_url(url: str) -> bool:
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
@@ -88,39 +185,38 @@ def fetch_allowed_url(url: str) -> SafeFetchResult:
     byte_cap = max_response_bytes()
 
     try:
-        with httpx.Client(timeout=FETCH_TIMEOUT_SECONDS, follow_redirects=True) as client:
-            with client.stream("GET", url) as response:
-                redirect_blocked = url_fetch_blocked_reason(str(response.url))
-                if redirect_blocked:
+        with _link_fetch_runtime.sync_client().stream("GET", url) as response:
+            redirect_blocked = url_fetch_blocked_reason(str(response.url))
+            if redirect_blocked:
+                return SafeFetchResult(
+                    ok=False,
+                    url=url,
+                    error=f"redirect blocked: {redirect_blocked}",
+                )
+
+            raw_content_type = response.headers.get("content-type", "")
+            content_type = raw_content_type.split(";", 1)[0].strip().lower() or None
+
+            chunks: list[bytes] = []
+            total = 0
+            for chunk in response.iter_bytes():
+                total += len(chunk)
+                if total > byte_cap:
                     return SafeFetchResult(
                         ok=False,
                         url=url,
-                        error=f"redirect blocked: {redirect_blocked}",
+                        error=f"response exceeds {byte_cap} byte cap",
                     )
-
-                raw_content_type = response.headers.get("content-type", "")
-                content_type = raw_content_type.split(";", 1)[0].strip().lower() or None
-
-                chunks: list[bytes] = []
-                total = 0
-                for chunk in response.iter_bytes():
-                    total += len(chunk)
-                    if total > byte_cap:
-                        return SafeFetchResult(
-                            ok=False,
-                            url=url,
-                            error=f"response exceeds {byte_cap} byte cap",
-                        )
-                    chunks.append(chunk)
-
-                return SafeFetchResult(
-                    ok=True,
-                    url=url,
-                    status_code=response.status_code,
-                    content_type=content_type,
-                    content_disposition=response.headers.get("content-disposition"),
-                    body=b"".join(chunks),
-                )
+                chunks.append(chunk)
+
+            return SafeFetchResult(
+                ok=True,
+                url=url,
+                status_code=response.status_code,
+                content_type=content_type,
+                content_disposition=response.headers.get("content-disposition"),
+                body=b"".join(chunks),
+            )
     except httpx.TimeoutException:
         return SafeFetchResult(ok=False, url=url, error="request timed out")
     except httpx.RequestError as exc:
@@ -154,11 +250,176 @@ def fetch_url_attachment_with_error(url: str) -> UrlAttachmentFetch:
         logger.debug("pdf_link_fetch_failed url=%s error=%s", url, error)
         return UrlAttachmentFetch(text="", error=error, filename=filename, pages=0)
 
-    content_type = (fetched.content_type or "").lower()
-    body = fetched.body
+    return _attachment_from_spool(
+        _spool_bytes(fetched.body),
+        (fetched.content_type or "").lower(),
+        filename,
+    )
+
 
-    if content_type == "application/pdf" or body.startswith(b"%PDF"):
-        text, pages = _pdf_bytes_to_text(body)
+async def fetch_allowed_url_to_file(
+    url: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> SpooledFetch:
+    """
+    Streaming GET of an allowlisted URL into a temp file (same guards and byte cap as
+    :func:`fetch_allowed_url`). ``etag`` / ``last_modified`` make the request conditional.
+    """
+    blocked = url_fetch_blocked_reason(url)
+    if blocked:
+        return SpooledFetch(ok=False, url=url, error=blocked)
+
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    byte_cap = max_response_bytes()
+    http = client or _link_fetch_runtime.async_client()
+    spool_path: Path | None = None
+    try:
+        async with http.stream("GET", url, headers=headers) as response:
+            redirect_blocked = url_fetch_blocked_reason(str(response.url))
+            if redirect_blocked:
+                return SpooledFetch(
+                    ok=False,
+                    url=url,
+                    error=f"redirect blocked: {redirect_blocked}",
+                )
+
+            raw_content_type = response.headers.get("content-type", "")
+            validators = {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+            if response.status_code == 304:
+                return SpooledFetch(
+                    ok=True,
+                    url=url,
+                    status_code=304,
+                    not_modified=True,
+                    **validators,
+                )
+
+            fd, name = tempfile.mkstemp(prefix="link-fetch-")
+            spool_path = Path(name)
+            total = 0
+            with os.fdopen(fd, "wb") as out:
+                async for chunk in response.aiter_bytes():
+                    total += len(chunk)
+                    if total > byte_cap:
+                        return SpooledFetch(
+                            ok=False,
+                            url=url,
+                            error=f"response exceeds {byte_cap} byte cap",
+                        )
+                    out.write(chunk)
+
+            fetched = SpooledFetch(
+                ok=True,
+                url=url,
+                status_code=response.status_code,
+                content_type=raw_content_type.split(";", 1)[0].strip().lower() or None,
+                content_disposition=response.headers.get("content-disposition"),
+                path=spool_path,
+                **validators,
+            )
+            spool_path = None  # handed to the caller
+            return fetched
+    except httpx.TimeoutException:
+        return SpooledFetch(ok=False, url=url, error="request timed out")
+    except httpx.RequestError as exc:
+        return SpooledFetch(ok=False, url=url, error=str(exc))
+    finally:
+        if spool_path is not None:
+            spool_path.unlink(missing_ok=True)
+
+
+async def fetch_url_attachment_async(
+    url: str,
+    *,
+    client: httpx.AsyncClient | None = None,
+) -> UrlAttachmentFetch:
+    """
+    Async :func:`fetch_url_attachment_with_error`: streams the body to disk, OCRs off the
+    event loop, and answers repeated links from ``linked_url_fetches`` on ``304``.
+    """
+    cached = None
+    if linked_url_cache_enabled():
+        cached = await asyncio.to_thread(load_linked_url, url)
+
+    fetched = await fetch_allowed_url_to_file(
+        url,
+        etag=cached.etag if cached else None,
+        last_modified=cached.last_modified if cached else None,
+        client=client,
+    )
+    if fetched.not_modified and cached is not None:
+        await asyncio.to_thread(mark_linked_url_validated, url)
+        logger.info("pdf_link_fetch_not_modified", extra={"attachment": cached.filename})
+        return UrlAttachmentFetch(
+            text=cached.text, error=None, filename=cached.filename, pages=cached.pages
+        )
+
+    filename = _resolve_attachment_filename(
+        url,
+        fetched.content_disposition if fetched.ok else None,
+    )
+    if not fetched.ok or fetched.path is None:
+        error = fetched.error or (
+            "not modified but no cached copy" if fetched.not_modified else "fetch failed"
+        )
+        logger.debug("pdf_link_fetch_failed url=%s error=%s", url, error)
+        return UrlAttachmentFetch(text="", error=error, filename=filename, pages=0)
+
+    attachment = await asyncio.to_thread(
+        _attachment_from_spool,
+        fetched.path,
+        (fetched.content_type or "").lower(),
+        filename,
+    )
+    if attachment.text.strip() and linked_url_cache_enabled():
+        await asyncio.to_thread(
+            save_linked_url,
+            url,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+            filename=attachment.filename,
+            text=attachment.text,
+            pages=attachment.pages,
+        )
+    return attachment
+
+
+def _spool_bytes(body: bytes) -> Path:
+    fd, name = tempfile.mkstemp(prefix="link-fetch-")
+    with os.fdopen(fd, "wb") as out:
+        out.write(body)
+    return Path(name)
+
+
+def _attachment_from_spool(path: Path, content_type: str, filename: str) -> UrlAttachmentFetch:
+    """Turn a spooled response body into text; always deletes ``path``."""
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(_SNIFF_BYTES)
+        return _attachment_from_file(path, head, content_type, filename)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _attachment_from_file(
+    path: Path,
+    head: bytes,
+    content_type: str,
+    filename: str,
+) -> UrlAttachmentFetch:
+    if content_type == "application/pdf" or head.startswith(b"%PDF"):
+        text, pages = _pdf_file_to_text(path)
         if not text.strip():
             return UrlAttachmentFetch(
                 text="",
@@ -167,8 +428,8 @@ def fetch_url_attachment_with_error(url: str) -> UrlAttachmentFetch:
                 pages=pages,
             )
         return UrlAttachmentFetch(text=text, error=None, filename=filename, pages=pages)
-    if content_type.startswith("image/") or _looks_like_image(body):
-        text, pages = _image_bytes_to_text(body, content_type)
+    if content_type.startswith("image/") or _looks_like_image(head):
+        text, pages = _image_file_to_text(path, content_type)
         if not text.strip():
             return UrlAttachmentFetch(
                 text="",
@@ -177,8 +438,8 @@ def fetch_url_attachment_with_error(url: str) -> UrlAttachmentFetch:
                 pages=pages,
             )
         return UrlAttachmentFetch(text=text, error=None, filename=filename, pages=pages)
-    if content_type in ("text/html", "application/xhtml+xml") or _looks_like_html(body):
-        text = _html_bytes_to_text(body)
+    if content_type in ("text/html", "application/xhtml+xml") or _looks_like_html(head):
+        text = _html_bytes_to_text(path.read_bytes())
         if not text.strip():
             return UrlAttachmentFetch(
                 text="",
@@ -188,7 +449,7 @@ def fetch_url_attachment_with_error(url: str) -> UrlAttachmentFetch:
             )
         return UrlAttachmentFetch(text=text, error=None, filename=filename, pages=0)
     if content_type.startswith("text/"):
-        text = body.decode("utf-8", errors="replace").strip()
+        text = path.read_bytes().decode("utf-8", errors="replace").strip()
         if not text:
             return UrlAttachmentFetch(
                 text="",
@@ -252,39 +513,42 @@ def _resolve_attachment_filename(url: str, content_disposition: str | None) -> s
     return _filename_from_url(url)
 
 
-def _pdf_bytes_to_text(body: bytes) -> tuple[str, int]:
-    tmp_path: str | None = None
+def _with_suffix_link(path: Path, suffix: str) -> Path:
+    """Hard link (or copy) of ``path`` with the extension OCR dispatch keys on."""
+    target = path.with_name(path.name + suffix)
+    try:
+        os.link(path, target)
+    except OSError:
+        target.write_bytes(path.read_bytes())
+    return target
+
+
+def _pdf_file_to_text(path: Path) -> tuple[str, int]:
+    ocr_path: Path | None = None
     try:
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(body)
-            tmp.flush()
-            tmp_path = tmp.name
-        doc = extract_document_via_ocr(tmp_path, max_pages=_link_follow_ocr_max_pages())
+        ocr_path = _with_suffix_link(path, ".pdf")
+        doc = extract_document_via_ocr(ocr_path, max_pages=_link_follow_ocr_max_pages())
         return doc.full_text(), doc.page_count
     except Exception:
         logger.exception("pdf_link_fetch_ocr_failed")
         return "", 0
     finally:
-        if tmp_path:
-            Path(tmp_path).unlink(missing_ok=True)
+        if ocr_path is not None:
+            ocr_path.unlink(missing_ok=True)
 
 
-def _image_bytes_to_text(body: bytes, content_type: str) -> tuple[str, int]:
-    tmp_path: str | None = None
+def _image_file_to_text(path: Path, content_type: str) -> tuple[str, int]:
+    ocr_path: Path | None = None
     try:
-        suffix = _suffix_for_image(content_type)
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(body)
-            tmp.flush()
-            tmp_path = tmp.name
-        doc = extract_document_via_ocr(tmp_path)
+        ocr_path = _with_suffix_link(path, _suffix_for_image(content_type))
+        doc = extract_document_via_ocr(ocr_path)
         return doc.full_text(), doc.page_count
     except Exception:
         logger.exception("pdf_link_fetch_image_ocr_failed")
         return "", 0
     finally:
-        if tmp_path:
-            Path(tmp_path).unlink(missing_ok=True)
+        if ocr_path is not None:
+            ocr_path.unlink(missing_ok=True)
 
 
 def _html_bytes_to_text(body: bytes) -> str:
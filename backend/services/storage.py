@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
 from shutil import rmtree
-from sqlalchemy import distinct, func, or_
+from sqlalchemy import distinct, func, insert, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
 
@@ -36,6 +36,33 @@ def build_drawing_render_storage_key(project_id: int, drawing_id: int, page_numb
     return f"drawings/rendered/project-{project_id}/drawing-{drawing_id}/page-{page_number}.png"
 
 
+def build_drawing_render_dzi_storage_key(project_id: int, drawing_id: int, page_number: int) -> str:
+    return f"drawings/rendered/project-{project_id}/drawing-{drawing_id}/page-{page_number}.dzi"
+
+
+def build_drawing_render_dzi_digest_storage_key(
+    project_id: int, drawing_id: int, page_number: int
+) -> str:
+    return f"drawings/rendered/project-{project_id}/drawing-{drawing_id}/page-{page_number}.dzi.sha256"
+
+
+def build_drawing_render_tiles_dir_storage_key(project_id: int, drawing_id: int, page_number: int) -> str:
+    return f"drawings/rendered/project-{project_id}/drawing-{drawing_id}/page-{page_number}_files"
+
+
+def build_drawing_render_tile_storage_key(
+    project_id: int,
+    drawing_id: int,
+    page_number: int,
+    level: int,
+    column: int,
+    row: int,
+    tile_format: str = "png",
+) -> str:
+    tiles_dir = build_drawing_render_tiles_dir_storage_key(project_id, drawing_id, page_number)
+    return f"{tiles_dir}/{level}/{column}_{row}.{tile_format}"
+
+
 def storage_key_to_abs_path(storage_key: str) -> Path:
     return UPLOAD_ROOT / storage_key
 
@@ -76,6 +103,7 @@ from models.models import (
     DrawingOverlay,
     ProcoreWriteback,
 )
+from models.procore_sync_cursor import ProcoreSyncCursor
 from observability.workflow_logging import log_finding_created
 from services.procore_connection_store import get_active_connection
 from services.evidence_linking import replace_evidence_drawing_links
@@ -476,6 +504,14 @@ class StorageService:
         for rn in self.list_drawing_renditions(drawing_id):
             ik = cast(Optional[str], getattr(rn, "image_storage_key", None))
             paths.extend(self._paths_under_upload_root_for_keys(ik))
+            page_number = cast(int, rn.page_number)
+            paths.extend(
+                self._paths_under_upload_root_for_keys(
+                    build_drawing_render_dzi_storage_key(project_id, drawing_id, page_number),
+                    build_drawing_render_dzi_digest_storage_key(project_id, drawing_id, page_number),
+                    build_drawing_render_tiles_dir_storage_key(project_id, drawing_id, page_number),
+                )
+            )
 
         deduped: List[Path] = []
         seen: Set[str] = set()
@@ -542,6 +578,7 @@ class StorageService:
         file_size: Optional[int],
         render_status: str = "ready",
         error_message: Optional[str] = None,
+        dpi: Optional[int] = None,
     ) -> DrawingRendition:
         rendition = (
             self.db.query(DrawingRendition)
@@ -563,6 +600,7 @@ class StorageService:
         setattr(rendition, "width_px", width_px)
         setattr(rendition, "height_px", height_px)
         setattr(rendition, "file_size", file_size)
+        setattr(rendition, "dpi", dpi)
         setattr(rendition, "render_status", render_status)
         setattr(rendition, "error_message", error_message)
 
@@ -571,6 +609,79 @@ class StorageService:
         self.db.refresh(rendition)
         return rendition
 
+    def bulk_upsert_drawing_renditions(
+        self,
+        drawing_id: int,
+        renditions: Sequence[Dict[str, Any]],
+    ) -> int:
+        """
+        Insert or update many renditions in one statement.
+
+        Each dict carries ``page_number`` plus the ``upsert_drawing_rendition`` fields.
+        Uses ``INSERT ... ON CONFLICT (drawing_id, page_number) DO UPDATE`` on Postgres
+        and SQLite; other dialects fall back to per-row upserts.
+        """
+        if not renditions:
+            return 0
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            for row in renditions:
+                self.upsert_drawing_rendition(drawing_id=drawing_id, **row)
+            return len(renditions)
+
+        now = datetime.now(timezone.utc)
+        values = [
+            {
+                "drawing_id": drawing_id,
+                "page_number": int(row["page_number"]),
+                "image_storage_key": row["image_storage_key"],
+                "mime_type": row["mime_type"],
+                "width_px": row.get("width_px"),
+                "height_px": row.get("height_px"),
+                "file_size": row.get("file_size"),
+                "dpi": row.get("dpi"),
+                "render_status": row.get("render_status", "ready"),
+                "error_message": row.get("error_message"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in renditions
+        ]
+        stmt = insert(DrawingRendition).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DrawingRendition.drawing_id, DrawingRendition.page_number],
+            set_={
+                "image_storage_key": stmt.excluded.image_storage_key,
+                "mime_type": stmt.excluded.mime_type,
+                "width_px": stmt.excluded.width_px,
+                "height_px": stmt.excluded.height_px,
+                "file_size": stmt.excluded.file_size,
+                "dpi": stmt.excluded.dpi,
+                "render_status": stmt.excluded.render_status,
+                "error_message": stmt.excluded.error_message,
+                "updated_at": now,
+            },
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        return len(values)
+
+    def count_ready_drawing_renditions(self, drawing_id: int) -> int:
+        return int(
+            self.db.query(func.count(DrawingRendition.id))
+            .filter(
+                DrawingRendition.drawing_id == drawing_id,
+                DrawingRendition.render_status == "ready",
+            )
+            .scalar()
+            or 0
+        )
+
     def get_drawing_rendition(
         self, drawing_id: int, page_number: int
     ) -> Optional[DrawingRendition]:
@@ -1035,6 +1146,112 @@ class StorageService:
         self.db.refresh(record)
         return record
 
+    def bulk_upsert_rfi_evidence_records(
+        self,
+        project_id: int,
+        rows: Sequence[Dict[str, Any]],
+        *,
+        cursor_updated_at: Optional[datetime] = None,
+    ) -> List[int]:
+        """
+        Insert or update many RFI evidence rows (keyed by ``source_id``) in one transaction.
+
+        Each dict carries the ``upsert_rfi_evidence_record`` fields. Rows whose stored values
+        already match are not written. When ``cursor_updated_at`` is given, the project's
+        ``rfis`` sync cursor is advanced in the same commit. Returns the ids written.
+        """
+        fields = ("title", "status", "text_content", "dates", "attachments_json", "cross_refs_json")
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            incoming[str(row["source_id"])] = {
+                "title": row["title"],
+                "status": row["status"],
+                "text_content": row.get("text_content"),
+                "dates": row.get("dates") or {},
+                "attachments_json": row.get("attachments_json") or [],
+                "cross_refs_json": row.get("cross_refs_json") or [],
+            }
+
+        existing: Dict[str, tuple[int, Dict[str, Any]]] = {}
+        source_ids = list(incoming)
+        for start in range(0, len(source_ids), 1000):
+            result = self.db.execute(
+                select(EvidenceRecord.id, EvidenceRecord.source_id, *(getattr(EvidenceRecord, f) for f in fields))
+                .where(
+                    EvidenceRecord.project_id == project_id,
+                    EvidenceRecord.type == "rfi",
+                    EvidenceRecord.source_id.in_(source_ids[start : start + 1000]),
+                )
+                .order_by(EvidenceRecord.id)
+            )
+            for record_id, source_id, *values in result:
+                existing.setdefault(source_id, (record_id, dict(zip(fields, values))))
+
+        now = datetime.now(timezone.utc)
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for source_id, values in incoming.items():
+            current = existing.get(source_id)
+            if current is None:
+                inserts.append(
+                    {
+                        "project_id": project_id,
+                        "type": "rfi",
+                        "source_id": source_id,
+                        **values,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+            elif current[1] != values:
+                updates.append({"id": current[0], **values, "updated_at": now})
+
+        written: List[int] = [row["id"] for row in updates]
+        try:
+            if inserts:
+                written.extend(
+                    self.db.scalars(insert(EvidenceRecord).returning(EvidenceRecord.id), inserts).all()
+                )
+            if updates:
+                self.db.execute(update(EvidenceRecord), updates)
+            if cursor_updated_at is not None:
+                self._set_procore_sync_cursor(project_id, "rfis", cursor_updated_at)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            raise
+
+        return written
+
+    def get_procore_sync_cursor(self, project_id: int, resource: str) -> Optional[datetime]:
+        """Newest ``updated_at`` synced for ``resource`` of the project, or None."""
+        cursor = (
+            self.db.query(ProcoreSyncCursor.cursor_updated_at)
+            .filter(
+                ProcoreSyncCursor.project_id == project_id,
+                ProcoreSyncCursor.resource == resource,
+            )
+            .scalar()
+        )
+        return cast(Optional[datetime], cursor)
+
+    def _set_procore_sync_cursor(self, project_id: int, resource: str, value: datetime) -> None:
+        cursor = (
+            self.db.query(ProcoreSyncCursor)
+            .filter(
+                ProcoreSyncCursor.project_id == project_id,
+                ProcoreSyncCursor.resource == resource,
+            )
+            .first()
+        )
+        if cursor is None:
+            cursor = ProcoreSyncCursor(project_id=project_id, resource=resource)
+            self.db.add(cursor)
+        previous = cast(Optional[datetime], cursor.cursor_updated_at)
+        if previous is None or value > previous:
+            setattr(cursor, "cursor_updated_at", value)
+        setattr(cursor, "synced_at", datetime.now(timezone.utc))
+
     # ------------------------------------------------------------------
     # Inspection Runs
     # ------------------------------------------------------------------
@@ -1284,25 +1501,15 @@ class StorageService:
         """
         Return Findings associated with an inspection run.
 
-        Looks for ``finding_id`` stored in overlay ``meta``.
+        Follows each overlay's ``finding_id``.
         Optionally accept pre-fetched overlays to avoid duplicate queries.
         """
         overlay_records = list(overlays) if overlays is not None else self.list_overlays_for_inspection_run(inspection_run_id)
-        finding_ids: Set[int] = set()
-
-        for overlay in overlay_records:
-            meta = getattr(overlay, "meta", None)
-            if isinstance(meta, dict):
-                candidate = meta.get("finding_id")
-                if isinstance(candidate, int):
-                    finding_ids.add(candidate)
-                elif candidate is not None:
-                    try:
-                        candidate_int = int(candidate)
-                    except (TypeError, ValueError):
-                        candidate_int = None
-                    if candidate_int is not None:
-                        finding_ids.add(candidate_int)
+        finding_ids: Set[int] = {
+            cast(int, overlay.finding_id)
+            for overlay in overlay_records
+            if overlay.finding_id is not None
+        }
 
         if not finding_ids:
             return []
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Collection
+
 from sqlalchemy.orm import Session
 
 from ai.pipelines.survey_point_extractor import SurveyPointRecord
 from models.drawing_survey_point import DrawingSurveyPoint
+from services.bulk_copy import bulk_insert_rows
 
 
 def persist_survey_points(
@@ -14,29 +17,35 @@ def persist_survey_points(
     points: list[SurveyPointRecord],
     *,
     source: str,
+    pages: Collection[int] | None = None,
 ) -> int:
-    session.query(DrawingSurveyPoint).filter(
+    """Replace ``source`` rows for the drawing (only on ``pages`` when given) with the new ones."""
+    query = session.query(DrawingSurveyPoint).filter(
         DrawingSurveyPoint.drawing_id == drawing_id,
         DrawingSurveyPoint.source == source,
-    ).delete(synchronize_session=False)
-
-    for point in points:
-        session.add(
-            DrawingSurveyPoint(
-                drawing_id=drawing_id,
-                page=point.page,
-                northing=point.northing,
-                easting=point.easting,
-                station=point.station,
-                structure_label=point.structure_label,
-                label_bbox_json=point.label_bbox_json,
-                northing_bbox_json=point.northing_bbox_json,
-                easting_bbox_json=point.easting_bbox_json,
-                ocr_confidence=point.ocr_confidence,
-                source=source,
-                meta_json=point.meta_json,
-            )
-        )
+    )
+    if pages is not None:
+        query = query.filter(DrawingSurveyPoint.page.in_(sorted(pages)))
+    query.delete(synchronize_session=False)
 
-    session.flush()
-    return len(points)
+    return bulk_insert_rows(
+        session,
+        DrawingSurveyPoint,
+        [
+            {
+                "drawing_id": drawing_id,
+                "page": point.page,
+                "northing": point.northing,
+                "easting": point.easting,
+                "station": point.station,
+                "structure_label": point.structure_label,
+                "label_bbox_json": point.label_bbox_json,
+                "northing_bbox_json": point.northing_bbox_json,
+                "easting_bbox_json": point.easting_bbox_json,
+                "ocr_confidence": point.ocr_confidence,
+                "source": source,
+                "meta_json": point.meta_json,
+            }
+            for point in points
+        ],
+    )
@@ -0,0 +1,69 @@
+"""Aho-Corasick automaton for "which of these terms occur in this text" checks.
+
+Built once over a fixed term list, :meth:`TermAutomaton.find` scans a text in a single
+pass regardless of how many terms there are, instead of one ``term in text`` scan per
+term. Callers normalize case themselves; matching is plain substring containment.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class TermAutomaton:
+    """Multi-pattern substring matcher over ``terms`` (indexes follow input order)."""
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms: list[str] = list(terms)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        # Empty terms occur in every text.
+        self._always: list[int] = []
+
+        for index, term in enumerate(self.terms):
+            if not term:
+                self._always.append(index)
+                continue
+            state = 0
+            for char in term:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(index)
+
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find(self, text: str) -> set[int]:
+        """Indexes of every term that occurs somewhere in ``text``."""
+        found: set[int] = set(self._always)
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
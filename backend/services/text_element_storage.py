@@ -0,0 +1,55 @@
+"""Persist indexed drawing text elements."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from sqlalchemy.orm import Session
+
+from models.drawing_text_element import DrawingTextElement
+from services.bulk_copy import bulk_insert_rows
+
+
+@dataclass(slots=True)
+class TextElementRecord:
+    """
+    In-memory twin of a ``DrawingTextElement`` row written by the index pipeline.
+
+    Has the attributes legend tagging, region building, orientation detection and survey
+    point extraction read, so the pipeline works on these instead of re-querying the rows.
+    """
+
+    page: int
+    text: str
+    text_normalized: str
+    bbox_json: dict[str, Any]
+    ocr_confidence: float
+    source: str
+    legend_expansion: str | None = None
+    legend_codes_json: list[str] | None = None
+
+
+def persist_text_element_records(
+    session: Session,
+    drawing_id: int,
+    records: Sequence[TextElementRecord],
+) -> int:
+    return bulk_insert_rows(
+        session,
+        DrawingTextElement,
+        [
+            {
+                "master_drawing_id": drawing_id,
+                "page": record.page,
+                "text": record.text,
+                "text_normalized": record.text_normalized,
+                "bbox_json": record.bbox_json,
+                "ocr_confidence": record.ocr_confidence,
+                "legend_expansion": record.legend_expansion,
+                "legend_codes_json": record.legend_codes_json,
+                "source": record.source,
+            }
+            for record in records
+        ],
+    )
@@ -9,6 +9,7 @@ set ``DATABASE_SSL_INSECURE_DEV=true`` for encrypted-but-unverified cloud DB
 
 from __future__ import annotations
 
+import importlib
 import uuid
 from collections.abc import Iterator
 from pathlib import Path
@@ -30,6 +31,69 @@ def _unique_id() -> str:
     return uuid.uuid4().hex[:12]
 
 
+#: Per-process caches ``isolated_caches`` can reset: name -> (module, reset function).
+_PROCESS_CACHES = {
+    "extracted_documents": (
+        "ai.pipelines.extracted_document_cache",
+        "reset_extracted_document_cache",
+    ),
+    "legend_index": ("services.legend_index", "reset_legend_index_cache"),
+    "ocr_capabilities": ("ai.pipelines.ocr_capabilities", "reset_ocr_capabilities"),
+}
+#: Durable stores ``isolated_caches`` can switch off: name -> ``settings`` flag.
+_DURABLE_STORES = {
+    "ocr_results": "ocr_result_store_enabled",
+    "llm_responses": "llm_response_cache_enabled",
+    "linked_url_fetches": "pdf_link_follow_cache_enabled",
+}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "isolated_caches(*names): reset / switch off the named caches for the test "
+        "(every cache when no names are given)",
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """
+    Opt-in cache isolation for tests that fake OCR, LLM or HTTP backends.
+
+    Does nothing unless the test carries ``@pytest.mark.isolated_caches(*names)`` (usually
+    as a module ``pytestmark``): then the named per-process caches are reset around the
+    test and the named durable stores switched off for it, every cache when no names are
+    given. Unmarked tests run with the caches as configured.
+    """
+    marker = request.node.get_closest_marker("isolated_caches")
+    if marker is None:
+        yield
+        return
+
+    from config import settings
+
+    names = marker.args or (*_PROCESS_CACHES, *_DURABLE_STORES)
+    unknown = set(names) - _PROCESS_CACHES.keys() - _DURABLE_STORES.keys()
+    if unknown:
+        raise ValueError(f"unknown caches for isolated_caches: {sorted(unknown)}")
+
+    resets = [
+        getattr(importlib.import_module(module), func)
+        for module, func in (_PROCESS_CACHES[n] for n in names if n in _PROCESS_CACHES)
+    ]
+    for name in names:
+        if name in _DURABLE_STORES:
+            monkeypatch.setattr(settings, _DURABLE_STORES[name], False)
+    for reset in resets:
+        reset()
+    yield
+    for reset in resets:
+        reset()
+
+
 @pytest.fixture
 def db_session() -> Iterator[Session]:
     session = SessionLocal()
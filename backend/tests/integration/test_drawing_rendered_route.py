@@ -10,3 +10,66 @@ def test_rendered_page_route_returns_png(client, seeded_ready_pdf_drawing):
 
     assert response.status_code == 200
     assert response.headers["content-type"].startswith("image/png")
+
+
+def test_tile_route_serves_pyramid_tiles_with_strong_etag(client, seeded_ready_pdf_drawing):
+    from services.drawing_tiles import DeepZoomPyramid
+
+    drawing = seeded_ready_pdf_drawing
+    rendition = drawing.renditions[0]
+    pyramid = DeepZoomPyramid(width=rendition.width_px, height=rendition.height_px)
+    base = f"/api/projects/{drawing.project_id}/drawings/{drawing.id}/pages/1"
+    tile_url = f"{base}/tiles/{pyramid.max_level}/0/0"
+
+    descriptor = client.get(f"{base}/tiles.dzi")
+    assert descriptor.status_code == 200
+    assert f'Width="{rendition.width_px}"' in descriptor.text
+    assert descriptor.headers["cache-control"] == "no-cache"
+
+    response = client.get(tile_url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("image/png")
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+    assert etag != descriptor.headers["etag"]
+
+    cached = client.get(tile_url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    columns, _ = pyramid.tile_grid(pyramid.max_level)
+    assert client.get(f"{base}/tiles/{pyramid.max_level}/{columns}/0").status_code == 404
+
+
+def test_workspace_tile_source_url_is_versioned_by_pyramid_digest(
+    client, seeded_ready_pdf_drawing
+):
+    from PIL import Image, ImageDraw
+
+    from services.drawing_tiles import read_deep_zoom_pyramid_digest, write_deep_zoom_pyramid
+    from services.storage import open_storage_path
+
+    drawing = seeded_ready_pdf_drawing
+    rendition = drawing.renditions[0]
+    base = f"/api/projects/{drawing.project_id}/drawings/{drawing.id}/pages/1"
+    digest = read_deep_zoom_pyramid_digest(drawing.project_id, drawing.id, 1)
+    assert digest
+
+    payload = client.get(f"/api/projects/{drawing.project_id}/drawings/{drawing.id}").json()
+    assert payload["tileSourceUrl"] == f"{base}/tiles.dzi?v={digest}"
+    versioned = client.get(f"{base}/tiles/0/0/0?v={digest}")
+    assert versioned.headers["cache-control"] == "public, max-age=31536000, immutable"
+    etag = versioned.headers["etag"]
+
+    with Image.open(open_storage_path(rendition.image_storage_key)) as image:
+        rerendered = image.convert("RGB")
+    ImageDraw.Draw(rerendered).rectangle((0, 0, 20, 20), fill=(255, 0, 0))
+    write_deep_zoom_pyramid(rerendered, drawing.project_id, drawing.id, 1)
+
+    new_digest = read_deep_zoom_pyramid_digest(drawing.project_id, drawing.id, 1)
+    assert new_digest and new_digest != digest
+    payload = client.get(f"/api/projects/{drawing.project_id}/drawings/{drawing.id}").json()
+    assert payload["tileSourceUrl"] == f"{base}/tiles.dzi?v={new_digest}"
+    stale = client.get(f"{base}/tiles/0/0/0?v={digest}", headers={"If-None-Match": etag})
+    assert stale.status_code == 200
+    assert stale.headers["cache-control"] == "no-cache"
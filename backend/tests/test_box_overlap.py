@@ -0,0 +1,59 @@
+"""OverlapGrid answers the same overlap questions as a scan over every box."""
+
+from __future__ import annotations
+
+import random
+
+from services.box_overlap import (
+    Box,
+    OverlapGrid,
+    box_overlap_area,
+    box_overlap_ratio,
+)
+
+
+def _random_boxes(rng: random.Random, count: int) -> list[Box | None]:
+    boxes: list[Box | None] = []
+    for _ in range(count):
+        if rng.random() < 0.05:
+            boxes.append(None)
+            continue
+        x0, y0 = rng.uniform(-0.1, 1.0), rng.uniform(-0.1, 1.0)
+        # Mostly token-sized boxes, some region-sized ones and a few degenerate ones.
+        scale = rng.choice([0.01, 0.03, 0.2, 0.6, 0.0])
+        boxes.append((x0, y0, x0 + rng.uniform(0, scale), y0 + rng.uniform(0, scale)))
+    return boxes
+
+
+def test_overlap_grid_matches_pairwise_dedup_and_best_overlap() -> None:
+    rng = random.Random(7)
+    preferred = _random_boxes(rng, 400)
+    others = _random_boxes(rng, 400)
+
+    kept_scan = list(preferred)
+    for box in others:
+        if not any(box_overlap_ratio(box, existing) >= 0.5 for existing in kept_scan):
+            kept_scan.append(box)
+
+    grid = OverlapGrid(preferred, expected=len(preferred) + len(others))
+    kept_grid = list(preferred)
+    for box in others:
+        if not grid.overlaps(box, 0.5):
+            kept_grid.append(box)
+            grid.add(box)
+
+    assert kept_grid == kept_scan
+    assert len(preferred) < len(kept_grid) < len(preferred) + len(others)
+
+    regions = [box for box in _random_boxes(rng, 300) if box is not None]
+    region_grid = OverlapGrid(regions)
+    for query in _random_boxes(rng, 200):
+        if query is None:
+            continue
+        expected = None
+        best = 0.0
+        for position, region in enumerate(regions):
+            area = box_overlap_area(query, region)
+            if area > best:
+                best, expected = area, position
+        assert region_grid.best_overlap(query) == expected
@@ -0,0 +1,86 @@
+"""Tests for the COPY-based bulk row writer used by the drawing index."""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+from sqlalchemy.orm import Session
+
+from database import engine
+from models.drawing_text_element import DrawingTextElement
+from models.models import Drawing
+from services.bulk_copy import _copy_rows, bulk_insert_rows
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql", reason="COPY FROM STDIN needs Postgres"
+)
+
+
+def _row(drawing_id: int, text: str, **overrides: object) -> dict[str, object]:
+    row: dict[str, object] = {
+        "master_drawing_id": drawing_id,
+        "page": 1,
+        "text": text,
+        "text_normalized": text.lower(),
+        "bbox_json": {"x0": 0.1, "y0": 0.2, "x1": 0.3, "y1": 0.25},
+        "ocr_confidence": 0.9,
+        "legend_expansion": None,
+        "legend_codes_json": None,
+        "source": "tesseract",
+    }
+    row.update(overrides)
+    return row
+
+
+def _stored(db_session: Session, drawing_id: int) -> list[DrawingTextElement]:
+    return (
+        db_session.query(DrawingTextElement)
+        .filter(DrawingTextElement.master_drawing_id == drawing_id)
+        .order_by(DrawingTextElement.id.asc())
+        .all()
+    )
+
+
+def test_copy_rows_round_trips_text_and_json(
+    db_session: Session, sample_pdf_drawing: Drawing
+) -> None:
+    drawing_id = cast(int, sample_pdf_drawing.id)
+    rows = [
+        _row(drawing_id, "COLO"),
+        _row(
+            drawing_id,
+            "tab\there \\ newline\nquote\"",
+            page=2,
+            legend_expansion="Sanitary Sewer",
+            legend_codes_json=["SS", "S-1"],
+        ),
+    ]
+    columns = list(rows[0].keys())
+
+    assert _copy_rows(db_session, DrawingTextElement.__table__, columns, rows) is True
+    db_session.commit()
+
+    stored = _stored(db_session, drawing_id)
+    assert [row.text for row in stored] == ["COLO", "tab\there \\ newline\nquote\""]
+    assert stored[0].bbox_json == {"x0": 0.1, "y0": 0.2, "x1": 0.3, "y1": 0.25}
+    assert stored[0].legend_codes_json is None
+    assert stored[1].page == 2
+    assert stored[1].legend_expansion == "Sanitary Sewer"
+    assert stored[1].legend_codes_json == ["SS", "S-1"]
+
+
+def test_bulk_insert_rows_copies_in_the_callers_transaction(
+    db_session: Session, sample_pdf_drawing: Drawing
+) -> None:
+    drawing_id = cast(int, sample_pdf_drawing.id)
+    db_session.add(DrawingTextElement(**_row(drawing_id, "ORM")))
+
+    written = bulk_insert_rows(
+        db_session, DrawingTextElement, [_row(drawing_id, "A"), _row(drawing_id, "B")]
+    )
+
+    assert written == 2
+    assert [row.text for row in _stored(db_session, drawing_id)] == ["ORM", "A", "B"]
+    db_session.rollback()
+    assert _stored(db_session, drawing_id) == []
@@ -0,0 +1,91 @@
+"""Prepared candidate tile pages are cached per drawing index version."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import cast
+
+from sqlalchemy import event
+
+from ai.pipelines.candidate_tile_cache import (
+    CandidateTileCache,
+    candidate_tile_cache_key,
+)
+from ai.pipelines.candidate_tile_selector import CandidateTile, _load_candidate_tiles
+from models.drawing_text_element import DrawingTextElement
+from services.drawing_index_jobs import clear_drawing_index_artifacts
+from services.storage import StorageService
+
+
+def _text_element(drawing_id: int, text: str, x0: float) -> DrawingTextElement:
+    return DrawingTextElement(
+        master_drawing_id=drawing_id,
+        page=1,
+        text=text,
+        text_normalized=text.lower(),
+        bbox_json={"x0": x0, "y0": 0.10, "x1": x0 + 0.04, "y1": 0.12},
+        ocr_confidence=0.95,
+        source="native_pdf",
+    )
+
+
+def test_tiles_load_once_per_index_version(db_session, project) -> None:
+    drawing = StorageService(db_session).create_drawing(
+        project_id=cast(int, project.id),
+        source="upload",
+        name="Master.pdf",
+        storage_key="projects/2/drawings/master.pdf",
+        content_type="application/pdf",
+    )
+    drawing_id = cast(int, drawing.id)
+    db_session.add(_text_element(drawing_id, "SS-3", 0.10))
+    db_session.commit()
+
+    first = _load_candidate_tiles(db_session, drawing_id, page=1)
+    assert [tile.text for tile in first] == ["SS-3"]
+
+    statements: list[str] = []
+    bind = db_session.get_bind()
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        assert _load_candidate_tiles(db_session, drawing_id, page=1) == first
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+    # Only the index version is read; no text element or region rows.
+    assert len(statements) == 1
+    assert "drawing_text_elements" not in statements[0]
+
+    clear_drawing_index_artifacts(db_session, drawing_id)
+    db_session.add(_text_element(drawing_id, "SD-7", 0.50))
+    db_session.commit()
+
+    assert [tile.text for tile in _load_candidate_tiles(db_session, drawing_id, page=1)] == ["SD-7"]
+
+
+def test_disk_tier_is_shared_and_lru_bounded(tmp_path: Path) -> None:
+    tile = CandidateTile(
+        drawing_id="7",
+        page=1,
+        text="SS-3 Sanitary Sewerage",
+        confidence=0.85,
+        bbox_normalized=(0.1, 0.1, 0.2, 0.2),
+        text_element_id=3,
+    )
+    region = CandidateTile(
+        drawing_id="7", page=1, text="COLO", confidence=0.75, bbox_normalized=None, region_id=9
+    )
+    key = candidate_tile_cache_key(7, 1, 4)
+
+    writer = CandidateTileCache(1, tmp_path)
+    writer.put(key, [tile, region])
+    writer.put(candidate_tile_cache_key(7, 2, 4), [tile])
+    assert writer._entries.keys() == {candidate_tile_cache_key(7, 2, 4)}
+
+    reader = CandidateTileCache(0, tmp_path)
+    assert reader.get(key) == (tile, region)
+    assert reader.get(candidate_tile_cache_key(7, 1, 5)) is None
+    assert (reader.hits, reader.misses) == (1, 1)
@@ -10,14 +10,16 @@ from sqlalchemy.orm import Session
 
 from ai.pipelines.candidate_tile_selector import (
     CandidateTile,
-    _bbox_overlap_ratio,
-    _clue_matches_row,
+    ClueMatcher,
     _load_candidate_tiles,
     _merge_candidate_tiles,
+    compute_tile_match_score,
     find_candidate_tiles_from_clues,
+    score_candidate_tiles,
 )
 from models.drawing_region import DrawingRegion
 from models.drawing_text_element import DrawingTextElement
+from services.box_overlap import box_overlap_ratio
 from services.storage import StorageService
 from ai.schemas.document_extraction_schemas import Clue
 
@@ -50,13 +52,15 @@ def test_location_relevant_clues_are_used_for_matching() -> None:
 
 def test_clue_matching_uses_literal_substrings_not_regex() -> None:
     """Clue values are matched literally, not via legacy regex search terms."""
-    dot_clue = SimpleNamespace(clue_value=".", location_relevant=True, confidence=0.9)
-    assert _clue_matches_row(dot_clue, "roof drainage plan") is False
-    assert _clue_matches_row(dot_clue, "a.b") is True
+    dot = ClueMatcher([SimpleNamespace(clue_value=".", location_relevant=True, confidence=0.9)])
+    assert dot.matched_clue_indexes("roof drainage plan") == set()
+    assert dot.matched_clue_indexes("a.b") == {0}
 
-    paren_clue = SimpleNamespace(clue_value="(ZONE-A)", location_relevant=True, confidence=0.9)
-    assert _clue_matches_row(paren_clue, "zone-a parking lot") is False
-    assert _clue_matches_row(paren_clue, "(zone-a) parking lot") is True
+    paren = ClueMatcher(
+        [SimpleNamespace(clue_value="(ZONE-A)", location_relevant=True, confidence=0.9)]
+    )
+    assert paren.matched_clue_indexes("zone-a parking lot") == set()
+    assert paren.matched_clue_indexes("(ZONE-A) parking lot") == {0}
 
 
 def _tile(text: str, confidence: float = 0.75) -> CandidateTile:
@@ -250,8 +254,8 @@ def test_sanitary_sewer_clue_matches_ss_only_labels_via_legend(
 def test_bbox_overlap_ratio_detects_intersection() -> None:
     left = (0.0, 0.0, 0.5, 0.5)
     contained = (0.1, 0.1, 0.4, 0.4)
-    assert _bbox_overlap_ratio(left, contained) > 0.5
-    assert _bbox_overlap_ratio(left, (0.6, 0.6, 0.8, 0.8)) == 0.0
+    assert box_overlap_ratio(left, contained) > 0.5
+    assert box_overlap_ratio(left, (0.6, 0.6, 0.8, 0.8)) == 0.0
 
 
 def test_merge_candidate_tiles_prefers_text_elements_over_overlapping_regions() -> None:
@@ -383,3 +387,50 @@ def test_overlapping_region_dropped_when_text_element_covers_same_bbox(
     assert len(tiles) == 1
     assert tiles[0].text_element_id is not None
     assert tiles[0].region_id is None
+
+
+def test_clue_matcher_expands_each_clue_once() -> None:
+    calls: list[str] = []
+
+    def _counting_expand(value, **kwargs):
+        calls.append(value)
+        return [value, "SS"]
+
+    tiles = [
+        CandidateTile(
+            drawing_id="1", page=1, text=f"Tile {i} SS", confidence=0.5, bbox_normalized=None
+        )
+        for i in range(50)
+    ]
+    with patch("ai.pipelines.candidate_tile_selector.expand_clue_value", _counting_expand):
+        matcher = ClueMatcher([_clue("sanitary sewer"), _clue("manhole")])
+        scored = score_candidate_tiles(tiles, matcher, limit=5)
+
+    assert calls == ["sanitary sewer", "manhole"]
+    assert [tile.text for _, tile in scored] == [f"Tile {i} SS" for i in range(5)]
+
+
+def test_score_candidate_tiles_matches_compute_tile_match_score() -> None:
+    clues = [_clue("colo", 0.6), _clue("sanitary sewer", 0.9), _clue("trench", 0.7)]
+    tiles = [
+        CandidateTile(drawing_id="1", page=1, text=text, confidence=conf, bbox_normalized=None)
+        for text, conf in (
+            ("COLO PARKING LOT", 0.8),
+            ("SS MAIN", 0.85),
+            ("utility trench colocation", 0.9),
+            ("roof plan", 0.95),
+        )
+    ]
+
+    scored = score_candidate_tiles(tiles, ClueMatcher(clues), limit=10)
+
+    expected = sorted(
+        (
+            (compute_tile_match_score(tile, clues), tile)
+            for tile in tiles
+            if compute_tile_match_score(tile, clues) > 0
+        ),
+        key=lambda item: -item[0],
+    )
+    assert scored == expected
+    assert "roof plan" not in {tile.text for _, tile in scored}
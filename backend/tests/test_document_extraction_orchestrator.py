@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import json
+import threading
 import uuid
 from collections.abc import Iterator
-from typing import cast
-from unittest.mock import patch
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy.orm import Session
 
+from ai.llm_client import reset_openai_client
 from ai.pipelines.document_extraction_orchestrator import run_document_extraction
 from ai.schemas.document_extraction_schemas import (
     DocumentClassification,
@@ -17,6 +21,7 @@ from ai.schemas.document_extraction_schemas import (
     InspectionReportFields,
     UniversalFields,
 )
+from config import settings
 from database import SessionLocal
 from models.document_clue import DocumentClue
 from models.document_extraction import DocumentExtraction
@@ -128,3 +133,112 @@ def test_run_document_extraction_unknown_classification_queues_review(
         document_extraction_id=cast(int, extraction.id)
     ).all()
     assert len(clues) == 2
+
+
+@patch("ai.pipelines.document_extraction_orchestrator.extract_type_specific_fields")
+@patch("ai.pipelines.document_extraction_orchestrator.extract_universal_fields")
+@patch("ai.pipelines.document_extraction_orchestrator.classify_document")
+def test_concurrent_mode_overlaps_classification_and_universal_calls(
+    mock_classify,
+    mock_universal,
+    mock_type_specific,
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "document_extraction_llm_mode", "concurrent")
+    # Both calls must be in flight at once to get past the barrier.
+    both_started = threading.Barrier(2, timeout=5)
+
+    def classify(_text: str) -> DocumentClassification:
+        both_started.wait()
+        return DocumentClassification(
+            document_type=DocumentType.INSPECTION_REPORT, confidence=0.9
+        )
+
+    def universal(_text: str) -> UniversalFields:
+        both_started.wait()
+        return UniversalFields(location_text="COLO")
+
+    mock_classify.side_effect = classify
+    mock_universal.side_effect = universal
+    mock_type_specific.return_value = None
+
+    extraction = run_document_extraction(db, _unique_file_id(), UCSF_REPORT_TEXT)
+
+    assert cast(str, extraction.document_type) == DocumentType.INSPECTION_REPORT.value
+    mock_type_specific.assert_called_once()
+    assert cast(dict, extraction.llm_metrics_json)["mode"] == "concurrent"
+
+
+@pytest.fixture
+def fake_openai(monkeypatch: pytest.MonkeyPatch) -> Iterator[MagicMock]:
+    """Shared client backed by a fake ``chat.completions.create``."""
+    import openai
+
+    client = MagicMock()
+    monkeypatch.setattr(openai, "OpenAI", MagicMock(return_value=client))
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    reset_openai_client()
+    try:
+        yield client.chat.completions.create
+    finally:
+        reset_openai_client()
+
+
+def _completion(payload: dict[str, Any], prompt_tokens: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens, completion_tokens=10, total_tokens=prompt_tokens + 10
+        ),
+    )
+
+
+def test_combined_mode_uses_one_request_and_records_metrics(
+    db: Session,
+    fake_openai: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "document_extraction_llm_mode", "combined")
+    fake_openai.return_value = _completion(
+        {
+            "classification": {"document_type": "unknown", "confidence": 0.2},
+            "universal_fields": {"location_text": "COLO", "trade": "33-Sanitary Sewerage"},
+        },
+        prompt_tokens=400,
+    )
+
+    extraction = run_document_extraction(db, _unique_file_id(), UCSF_REPORT_TEXT)
+
+    fake_openai.assert_called_once()
+    assert cast(str, extraction.document_type) == DocumentType.UNKNOWN.value
+    assert cast(dict, extraction.universal_fields_json)["location_text"] == "COLO"
+
+    metrics = cast(dict, extraction.llm_metrics_json)
+    assert metrics["mode"] == "combined"
+    assert metrics["stages"]["combined"]["calls"] == 1
+    assert metrics["stages"]["combined"]["total_tokens"] == 410
+    assert metrics["total_ms"] >= metrics["stages"]["combined"]["latency_ms"]
+
+
+def test_concurrent_mode_records_per_stage_metrics(
+    db: Session,
+    fake_openai: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(settings, "document_extraction_llm_mode", "concurrent")
+
+    def create(**kwargs: Any) -> SimpleNamespace:
+        prompt = kwargs["messages"][0]["content"]
+        if prompt.startswith("Classify"):
+            return _completion({"document_type": "unknown", "confidence": 0.1}, 100)
+        return _completion({"location_text": "COLO"}, 200)
+
+    fake_openai.side_effect = create
+
+    extraction = run_document_extraction(db, _unique_file_id(), UCSF_REPORT_TEXT)
+
+    stages = cast(dict, extraction.llm_metrics_json)["stages"]
+    assert set(stages) == {"classify", "universal"}
+    assert stages["classify"]["prompt_tokens"] == 100
+    assert stages["universal"]["prompt_tokens"] == 200
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +16,7 @@ from ai.pipelines.document_text_extraction import (
     detect_source_format,
     extract_document,
 )
+from ai.pipelines.ocr_engine import PageRaster
 
 
 def _bbox(
@@ -74,7 +75,11 @@ def fake_ocr_image(
     return words, 612.0, 792.0
 
 
-def fake_ocr_scanned_pdf(file_path: str | Path) -> ExtractedDocument:
+def fake_ocr_scanned_pdf(
+    file_path: str | Path,
+    *,
+    rendered_pages: Mapping[int, str | Path] | None = None,
+) -> ExtractedDocument:
     page0 = [
         _word("Sheet", page_index=0, y=50.0),
         _word("U1.C4.31", page_index=0, y=50.0),
@@ -289,10 +294,10 @@ def test_ocr_scanned_pdf_rasterizes_each_page_in_memory(tmp_path: Path) -> None:
     page_indices: list[int] = []
 
     def fake_ocr_page(
-        file_path: str | Path,
-        page_index: int = 0,
+        raster: PageRaster,
         **kwargs: object,
     ) -> tuple[list[PositionedWord], float, float]:
+        page_index = raster.page_index
         page_indices.append(page_index)
         return (
             [
@@ -307,7 +312,7 @@ def test_ocr_scanned_pdf_rasterizes_each_page_in_memory(tmp_path: Path) -> None:
         )
 
     with patch(
-        "ai.pipelines.ocr_engine.ocr_pdf_page_in_memory",
+        "ai.pipelines.ocr_engine.ocr_page_raster",
         side_effect=fake_ocr_page,
     ):
         extracted = _ocr_scanned_pdf(pdf_path)
@@ -335,15 +340,15 @@ def test_ocr_scanned_pdf_respects_max_pages(tmp_path: Path) -> None:
     page_indices: list[int] = []
 
     def fake_ocr_page(
-        file_path: str | Path,
-        page_index: int = 0,
+        raster: PageRaster,
         **kwargs: object,
     ) -> tuple[list[PositionedWord], float, float]:
+        page_index = raster.page_index
         page_indices.append(page_index)
         return ([_word(f"page-{page_index + 1}", page_index=page_index)], 612.0, 792.0)
 
     with patch(
-        "ai.pipelines.ocr_engine.ocr_pdf_page_in_memory",
+        "ai.pipelines.ocr_engine.ocr_page_raster",
         side_effect=fake_ocr_page,
     ):
         extracted = _ocr_scanned_pdf(pdf_path, max_pages=2)
@@ -365,14 +370,14 @@ def test_extract_document_via_ocr_forces_pdf_ocr(tmp_path: Path) -> None:
     doc.close()
 
     def fake_ocr_page(
-        file_path: str | Path,
-        page_index: int = 0,
+        raster: PageRaster,
         **kwargs: object,
     ) -> tuple[list[PositionedWord], float, float]:
+        page_index = raster.page_index
         return ([_word("Sewer and Trench Sanitary", page_index=page_index)], 612.0, 792.0)
 
     with patch(
-        "ai.pipelines.ocr_engine.ocr_pdf_page_in_memory",
+        "ai.pipelines.ocr_engine.ocr_page_raster",
         side_effect=fake_ocr_page,
     ):
         extracted = extract_document_via_ocr(pdf_path)
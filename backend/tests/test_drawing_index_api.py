@@ -103,6 +103,45 @@ def test_reindex_drawing_enqueues_job(
     mock_enqueue.assert_called_once()
 
 
+@patch("api.routes.drawings.settings")
+@patch("api.routes.drawings.enqueue_drawing_index_job")
+def test_reindex_drawing_incremental_mode(
+    mock_enqueue,
+    mock_settings,
+    client,
+    db_session,
+    project,
+) -> None:
+    mock_settings.drawing_index_enabled = True
+    project_id, drawing_id = _drawing_base(db_session, project)
+    row = db_session.get(Drawing, drawing_id)
+    assert row is not None
+    setattr(row, "processing_status", "ready")
+    db_session.commit()
+
+    mock_enqueue.return_value = JobQueue(
+        id=1000,
+        user_id=1,
+        company_id=1,
+        project_id=project_id,
+        job_type=JOB_TYPE,
+        status="pending",
+        input_data={"drawing_id": drawing_id, "mode": "incremental"},
+    )
+
+    response = client.post(
+        f"/api/projects/{project_id}/drawings/{drawing_id}/reindex?mode=incremental"
+    )
+    assert response.status_code == 200
+    assert response.json()["mode"] == "incremental"
+    assert mock_enqueue.call_args.kwargs["mode"] == "incremental"
+
+    invalid = client.post(
+        f"/api/projects/{project_id}/drawings/{drawing_id}/reindex?mode=partial"
+    )
+    assert invalid.status_code == 422
+
+
 def test_list_drawing_text_elements(client, db_session, project) -> None:
     project_id, drawing_id = _drawing_base(db_session, project)
     db_session.add_all(
@@ -141,6 +180,62 @@ def test_list_drawing_text_elements(client, db_session, project) -> None:
     assert texts == {"SS", "COLO"}
 
 
+def test_list_drawing_text_elements_in_bbox_with_cursor(client, db_session, project) -> None:
+    project_id, drawing_id = _drawing_base(db_session, project)
+    # A 10 x 10 lattice of tokens; the viewport covers the 3 x 3 block in the top-left.
+    db_session.add_all(
+        [
+            DrawingTextElement(
+                master_drawing_id=drawing_id,
+                page=1,
+                text=f"T{col}{row}",
+                text_normalized=f"t{col}{row}",
+                bbox_json={
+                    "x0": col / 10 + 0.01,
+                    "y0": row / 10 + 0.01,
+                    "x1": col / 10 + 0.05,
+                    "y1": row / 10 + 0.03,
+                },
+                ocr_confidence=0.95,
+                source="native_pdf",
+            )
+            for row in range(10)
+            for col in range(10)
+        ]
+    )
+    db_session.commit()
+
+    url = f"/api/projects/{project_id}/drawings/{drawing_id}/text-elements"
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"page": 1, "limit": 4, "bbox": "0,0,0.29,0.29"}
+        if cursor is not None:
+            params["cursor"] = cursor
+        body = client.get(url, params=params).json()
+        assert body["total"] == 9
+        seen.extend(item["text"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(f"T{col}{row}" for row in range(3) for col in range(3))
+    assert len(seen) == 9
+
+    unfiltered = client.get(url, params={"page": 1, "limit": 60}).json()
+    assert unfiltered["total"] == 100
+    assert len(unfiltered["items"]) == 60
+    rest = client.get(
+        url, params={"page": 1, "limit": 60, "cursor": unfiltered["next_cursor"]}
+    ).json()
+    assert len(rest["items"]) == 40
+    assert rest["next_cursor"] is None
+
+    for bad in ("0,0,1", "0,0,inf,1", "nan,0,1,1", "0,0,1.5,1", "-0.1,0,1,1", "0.5,0,0.2,1"):
+        invalid = client.get(url, params={"bbox": bad})
+        assert invalid.status_code == 400, bad
+
+
 def test_list_drawing_survey_points(client, db_session, project) -> None:
     project_id, drawing_id = _drawing_base(db_session, project)
     db_session.add_all(
@@ -11,6 +11,13 @@ from unittest.mock import patch
 import fitz
 from sqlalchemy.orm import Session
 
+from ai.pipelines.document_text_extraction import (
+    BoundingBox,
+    ExtractedDocument,
+    PositionedWord,
+    SourceFormat,
+)
+from ai.pipelines.master_drawing_indexer import changed_pages, pdf_page_fingerprint
 from models.drawing_region import DrawingRegion
 from models.drawing_text_element import DrawingTextElement
 from models.models import Drawing, JobQueue, Project
@@ -23,6 +30,7 @@ from services.drawing_index_jobs import (
     run_drawing_index_job,
 )
 from services.drawing_render_jobs import DRAWING_RENDER_JOB_TYPE, process_drawing_render_job
+from services.storage import open_storage_path
 
 
 def _minimal_pdf_bytes() -> bytes:
@@ -220,3 +228,160 @@ def test_process_drawing_render_job_chains_index_job(
             mock_enqueue.assert_called_once()
             assert mock_enqueue.call_args.kwargs["project_id"] == project_id
             assert mock_enqueue.call_args.kwargs["drawing_id"] == drawing_id
+
+
+def _pdf_with_pages(*texts: str) -> bytes:
+    doc = fitz.open()
+    for text in texts:
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((50, 100), text)
+    out = doc.tobytes()
+    doc.close()
+    return out
+
+
+def _document(*page_words: tuple[int, str]) -> ExtractedDocument:
+    words = [
+        PositionedWord(
+            text=text,
+            bbox=BoundingBox(x=50, y=90, width=60, height=12, page_width=200, page_height=200),
+            page_index=page_index,
+            ocr_confidence=0.95,
+        )
+        for page_index, text in page_words
+    ]
+    return ExtractedDocument(source_format=SourceFormat.NATIVE_PDF, page_count=2, words=words)
+
+
+def _text_rows(db_session: Session, drawing_id: int) -> list[DrawingTextElement]:
+    db_session.expire_all()
+    return (
+        db_session.query(DrawingTextElement)
+        .filter(DrawingTextElement.master_drawing_id == drawing_id)
+        .order_by(DrawingTextElement.page.asc())
+        .all()
+    )
+
+
+def test_changed_pages_diffs_fingerprints() -> None:
+    previous = [
+        {"page": 1, "fingerprint": "a"},
+        {"page": 2, "fingerprint": "b"},
+        {"page": 3, "fingerprint": "c"},
+    ]
+
+    assert changed_pages(previous, ["a", "b", "c"]) == set()
+    assert changed_pages(previous, ["a", "x"]) == {2, 3}
+    assert changed_pages(previous, ["a", "b", "c", "d"]) == {4}
+    assert changed_pages([{"page": 1}], ["a"]) is None
+    assert changed_pages(None, ["a"]) is None
+
+
+def test_incremental_reindex_only_touches_changed_pages(
+    db_session: Session,
+    sample_pdf_drawing: Drawing,
+) -> None:
+    drawing_id = cast(int, sample_pdf_drawing.id)
+    source_path = open_storage_path(cast(str, sample_pdf_drawing.storage_key))
+    source_path.write_bytes(_pdf_with_pages("ALPHA", "BETA"))
+    sample_pdf_drawing.processing_status = "ready"  # type: ignore[assignment]
+    db_session.commit()
+
+    with patch(
+        "ai.pipelines.master_drawing_indexer.extract_document",
+        return_value=_document((0, "ALPHA"), (1, "BETA")),
+    ):
+        run_drawing_index_job(drawing_id, db_session)
+    first_rows = _text_rows(db_session, drawing_id)
+    assert [row.text for row in first_rows] == ["ALPHA", "BETA"]
+    page_meta = cast(list[dict], sample_pdf_drawing.page_meta_json)
+    assert all(entry["fingerprint"] for entry in page_meta)
+
+    # Revise sheet 2 only.
+    source_path.write_bytes(_pdf_with_pages("ALPHA", "GAMMA"))
+    with patch(
+        "ai.pipelines.master_drawing_indexer.extract_document_pages",
+        return_value=_document((1, "GAMMA")),
+    ) as mock_pages:
+        result = run_drawing_index_job(drawing_id, db_session, mode="incremental")
+
+    assert mock_pages.call_args.args[1] == {1}
+    rows = _text_rows(db_session, drawing_id)
+    assert [row.text for row in rows] == ["ALPHA", "GAMMA"]
+    assert rows[0].id == first_rows[0].id
+    assert result.pages_reindexed == [2]
+    db_session.refresh(sample_pdf_drawing)
+    stats = cast(dict, sample_pdf_drawing.index_stats_json)
+    assert stats["text_elements"] == 2
+    assert stats["pages_reindexed"] == [2]
+    new_meta = cast(list[dict], sample_pdf_drawing.page_meta_json)
+    assert new_meta[0]["fingerprint"] == page_meta[0]["fingerprint"]
+    assert new_meta[1]["fingerprint"] != page_meta[1]["fingerprint"]
+
+    # Nothing changed since: no page is extracted again.
+    with patch(
+        "ai.pipelines.master_drawing_indexer.extract_document_pages",
+        return_value=_document(),
+    ) as mock_pages:
+        result = run_drawing_index_job(drawing_id, db_session, mode="incremental")
+
+    assert mock_pages.call_args.args[1] == set()
+    assert result.pages_reindexed == []
+    assert [row.id for row in _text_rows(db_session, drawing_id)] == [row.id for row in rows]
+
+
+def test_incremental_hybrid_reindex_keeps_one_title_block(
+    db_session: Session,
+    sample_pdf_drawing: Drawing,
+) -> None:
+    drawing_id = cast(int, sample_pdf_drawing.id)
+    source_path = open_storage_path(cast(str, sample_pdf_drawing.storage_key))
+    source_path.write_bytes(_pdf_with_pages("ALPHA", "BETA"))
+    sample_pdf_drawing.processing_status = "ready"  # type: ignore[assignment]
+    db_session.commit()
+
+    title = PositionedWord(
+        text="SHEET",
+        bbox=BoundingBox(x=170, y=180, width=20, height=10, page_width=200, page_height=200),
+        page_index=0,
+        ocr_confidence=0.95,
+    )
+    first = _document((0, "ALPHA"), (1, "BETA"))
+    first.words.append(title)
+
+    def title_blocks() -> list[DrawingRegion]:
+        db_session.expire_all()
+        return (
+            db_session.query(DrawingRegion)
+            .filter(
+                DrawingRegion.master_drawing_id == drawing_id,
+                DrawingRegion.label == "Title block",
+            )
+            .all()
+        )
+
+    with patch("services.drawing_index_jobs.settings.drawing_index_auto_region_mode", "hybrid"):
+        with patch(
+            "ai.pipelines.master_drawing_indexer.extract_document",
+            return_value=first,
+        ):
+            run_drawing_index_job(drawing_id, db_session)
+        assert [region.page for region in title_blocks()] == [1]
+
+        # Revise sheet 2 only; the page fingerprints are hashed once for the run.
+        source_path.write_bytes(_pdf_with_pages("ALPHA", "GAMMA"))
+        with (
+            patch(
+                "ai.pipelines.master_drawing_indexer.extract_document_pages",
+                return_value=_document((1, "GAMMA")),
+            ),
+            patch(
+                "ai.pipelines.master_drawing_indexer.pdf_page_fingerprint",
+                wraps=pdf_page_fingerprint,
+            ) as mock_fingerprint,
+        ):
+            result = run_drawing_index_job(drawing_id, db_session, mode="incremental")
+
+    assert result.pages_reindexed == [2]
+    assert mock_fingerprint.call_count == 2
+    assert [region.page for region in title_blocks()] == [1]
@@ -0,0 +1,92 @@
+"""Tests for the per-page grid index behind drawing viewport queries."""
+
+from __future__ import annotations
+
+import random
+from typing import cast
+
+from models.drawing_spatial_index import DrawingSpatialIndex
+from models.drawing_text_element import DrawingTextElement
+from services.drawing_spatial_index import (
+    GridIndex,
+    build_drawing_spatial_index,
+    invalidate_drawing_spatial_index,
+    query_bbox,
+)
+from services.storage import StorageService
+
+
+def _brute_force(entries, bbox) -> list[int]:
+    qx0, qy0, qx1, qy1 = bbox
+    return sorted(
+        entry_id
+        for entry_id, (x0, y0, x1, y1) in entries
+        if x0 <= qx1 and x1 >= qx0 and y0 <= qy1 and y1 >= qy0
+    )
+
+
+def test_grid_index_matches_brute_force() -> None:
+    rng = random.Random(7)
+    entries = []
+    for entry_id in range(1, 3001):
+        x0, y0 = rng.random(), rng.random()
+        entries.append((entry_id, (x0, y0, min(x0 + rng.random() * 0.05, 1.0), min(y0 + 0.01, 1.0))))
+    index = GridIndex(entries)
+    assert index.grid_size > 1
+
+    for _ in range(50):
+        x0, y0 = rng.random(), rng.random()
+        bbox = (x0, y0, x0 + rng.random() * 0.3, y0 + rng.random() * 0.3)
+        assert index.query(bbox) == _brute_force(entries, bbox)
+
+    restored = GridIndex.from_entries_json(index.to_entries_json(), index.grid_size)
+    assert restored.query((0.0, 0.0, 1.0, 1.0)) == list(range(1, 3001))
+
+
+def test_query_bbox_uses_stored_index_until_invalidated(db_session, project) -> None:
+    drawing = StorageService(db_session).create_drawing(
+        project_id=cast(int, project.id),
+        source="upload",
+        name="Master.pdf",
+        storage_key="projects/1/drawings/master.pdf",
+        content_type="application/pdf",
+    )
+    drawing_id = cast(int, drawing.id)
+
+    def token(text: str, x0: float) -> DrawingTextElement:
+        return DrawingTextElement(
+            master_drawing_id=drawing_id,
+            page=1,
+            text=text,
+            text_normalized=text.lower(),
+            bbox_json={"x0": x0, "y0": 0.5, "x1": x0 + 0.05, "y1": 0.52},
+            source="native_pdf",
+        )
+
+    left = token("MH-1", 0.1)
+    db_session.add(left)
+    db_session.flush()
+    assert build_drawing_spatial_index(db_session, drawing_id) == 1
+    db_session.commit()
+
+    # A row written without invalidating is not visible: the stored index answers.
+    right = token("MH-2", 0.8)
+    db_session.add(right)
+    db_session.commit()
+    everything = (0.0, 0.0, 1.0, 1.0)
+    assert query_bbox(db_session, drawing_id, 1, everything) == [left.id]
+    assert query_bbox(db_session, drawing_id, 1, (0.7, 0.4, 0.9, 0.6)) == []
+
+    invalidate_drawing_spatial_index(db_session, drawing_id, pages=[1])
+    db_session.commit()
+    assert query_bbox(db_session, drawing_id, 1, everything) == [left.id, right.id]
+    assert query_bbox(db_session, drawing_id, 1, (0.7, 0.4, 0.9, 0.6)) == [right.id]
+    assert query_bbox(db_session, drawing_id, 1, everything, after_id=cast(int, left.id)) == [right.id]
+
+    # The rebuilt index was stored for the next query.
+    stored = (
+        db_session.query(DrawingSpatialIndex)
+        .filter(DrawingSpatialIndex.drawing_id == drawing_id, DrawingSpatialIndex.kind == "text_element")
+        .one()
+    )
+    assert stored.entry_count == 2
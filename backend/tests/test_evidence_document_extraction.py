@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from io import BytesIO
+from pathlib import Path
 from typing import cast
 from unittest.mock import patch
 
@@ -115,6 +116,11 @@ def _word(text: str, x: float = 0.0) -> PositionedWord:
     )
 
 
+def _write_pdf_stub(file_path: Path) -> None:
+    """Unique bytes per test, so the content-hash extraction cache never crosses tests."""
+    file_path.write_bytes(b"%PDF-1.4\n%" + uuid.uuid4().hex.encode())
+
+
 def _patch_pdf_text(monkeypatch: pytest.MonkeyPatch, words: list[str]) -> None:
     positioned = [_word(word, x=idx * 50.0) for idx, word in enumerate(words)]
     fake_doc = ExtractedDocument(
@@ -134,7 +140,7 @@ def test_ingest_evidence_document_extraction_persists_text_and_runs_orchestrator
     tmp_path,
 ) -> None:
     file_path = tmp_path / "report.pdf"
-    file_path.write_bytes(b"%PDF-1.4")
+    _write_pdf_stub(file_path)
     _patch_pdf_text(
         monkeypatch,
         ["COLO", "33-Sanitary", "Sewerage", "Underground", "Sanitary", "Sewer"],
@@ -199,7 +205,7 @@ def test_ingest_merges_pdf_link_supplemental_text_and_cross_refs(
     project,
 ) -> None:
     file_path = tmp_path / "report.pdf"
-    file_path.write_bytes(b"%PDF-1.4")
+    _write_pdf_stub(file_path)
     _patch_pdf_text(monkeypatch, ["Inspection", "summary"])
 
     supplemental_block = "\n\n--- Linked content (page 2) ---\nLocation: COLO"
@@ -380,7 +386,7 @@ def test_ingest_without_match_context_does_not_enqueue(
     project,
 ) -> None:
     file_path = tmp_path / "report.pdf"
-    file_path.write_bytes(b"%PDF-1.4")
+    _write_pdf_stub(file_path)
     _patch_pdf_text(monkeypatch, ["COLO"])
 
     storage = StorageService(db_session)
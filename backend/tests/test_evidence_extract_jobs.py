@@ -0,0 +1,190 @@
+"""Tests for queued evidence extraction (``evidence_extract`` jobs)."""
+
+from __future__ import annotations
+
+import uuid
+from typing import cast
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models.models import EvidenceRecord, JobQueue, Project, User
+from services import evidence_extract_jobs
+from services.evidence_extract_jobs import (
+    EVIDENCE_EXTRACT_JOB_TYPE,
+    run_evidence_extract_job,
+)
+
+
+@pytest.fixture
+def job_user(db_session: Session) -> User:
+    user = User(email=f"extract-{uuid.uuid4().hex[:8]}@example.com")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _pending_extract_jobs(db_session: Session, project: Project) -> list[JobQueue]:
+    return (
+        db_session.query(JobQueue)
+        .filter(
+            JobQueue.project_id == project.id,
+            JobQueue.job_type == EVIDENCE_EXTRACT_JOB_TYPE,
+        )
+        .order_by(JobQueue.id.asc())
+        .all()
+    )
+
+
+def _cleanup_jobs(db_session: Session, project: Project) -> None:
+    db_session.query(JobQueue).filter(JobQueue.project_id == project.id).delete(
+        synchronize_session=False
+    )
+    db_session.commit()
+
+
+def test_upload_inspection_doc_returns_before_extraction(
+    client, db_session: Session, project: Project, job_user: User, monkeypatch
+) -> None:
+    def _fail_if_called(*args, **kwargs):
+        raise AssertionError("extraction must not run on the request path")
+
+    monkeypatch.setattr(evidence_extract_jobs, "ingest_evidence_document_extraction", _fail_if_called)
+    try:
+        response = client.post(
+            f"/api/projects/{project.id}/evidence",
+            files={"file": ("report.pdf", b"%PDF-1.4 report", "application/pdf")},
+            data={"type": "inspection_doc"},
+            headers={"Idempotency-Key": uuid.uuid4().hex},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["extraction_status"] == "pending"
+        jobs = _pending_extract_jobs(db_session, project)
+        assert [cast(dict, job.input_data)["evidence_id"] for job in jobs] == [body["id"]]
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_batch_upload_enqueues_one_job_per_inspection_doc(
+    client, db_session: Session, project: Project, job_user: User
+) -> None:
+    try:
+        response = client.post(
+            f"/api/projects/{project.id}/evidence/batch",
+            files=[
+                ("files", ("a.pdf", b"%PDF-1.4 a", "application/pdf")),
+                ("files", ("b.png", b"\x89PNG b", "image/png")),
+            ],
+            data={"type": "inspection_doc"},
+            headers={"Idempotency-Key": uuid.uuid4().hex},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 2
+        assert body["errors"] == []
+        assert [item["title"] for item in body["items"]] == ["a.pdf", "b.png"]
+        assert {item["extraction_status"] for item in body["items"]} == {"pending"}
+        assert len(_pending_extract_jobs(db_session, project)) == 2
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_batch_upload_replays_repeated_files_instead_of_duplicating(
+    client, db_session: Session, project: Project, job_user: User
+) -> None:
+    key = uuid.uuid4().hex
+    files = [
+        ("files", ("a.pdf", b"%PDF-1.4 same", "application/pdf")),
+        ("files", ("copy-of-a.pdf", b"%PDF-1.4 same", "application/pdf")),
+    ]
+    try:
+        first = client.post(
+            f"/api/projects/{project.id}/evidence/batch",
+            files=files,
+            data={"type": "inspection_doc"},
+            headers={"Idempotency-Key": key},
+        ).json()
+        retry = client.post(
+            f"/api/projects/{project.id}/evidence/batch",
+            files=files,
+            data={"type": "inspection_doc"},
+            headers={"Idempotency-Key": key},
+        ).json()
+
+        ids = {item["id"] for item in first["items"] + retry["items"]}
+        assert len(ids) == 1
+        assert db_session.query(EvidenceRecord).filter_by(project_id=project.id).count() == 1
+        assert len(_pending_extract_jobs(db_session, project)) == 1
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_batch_upload_rejects_whole_batch_on_invalid_file(
+    client, db_session: Session, project: Project
+) -> None:
+    response = client.post(
+        f"/api/projects/{project.id}/evidence/batch",
+        files=[
+            ("files", ("a.pdf", b"%PDF-1.4 a", "application/pdf")),
+            ("files", ("notes.txt", b"text", "text/plain")),
+        ],
+        data={"type": "inspection_doc"},
+        headers={"Idempotency-Key": uuid.uuid4().hex},
+    )
+
+    assert response.status_code == 400
+    assert db_session.query(EvidenceRecord).filter_by(project_id=project.id).count() == 0
+
+
+def _evidence(db_session: Session, project: Project) -> EvidenceRecord:
+    evidence = EvidenceRecord(
+        project_id=project.id,
+        type="inspection_doc",
+        title="report.pdf",
+        storage_key=f"projects/{project.id}/evidence/report.pdf",
+        extraction_status="pending",
+    )
+    db_session.add(evidence)
+    db_session.commit()
+    return evidence
+
+
+def test_run_evidence_extract_job_marks_ready(
+    db_session: Session, project: Project, monkeypatch
+) -> None:
+    evidence = _evidence(db_session, project)
+    calls: list[int] = []
+
+    def _fake_ingest(session, *, evidence_id, file_path):
+        calls.append(evidence_id)
+        return object()
+
+    monkeypatch.setattr(evidence_extract_jobs, "ingest_evidence_document_extraction", _fake_ingest)
+
+    run_evidence_extract_job(cast(int, evidence.id))
+
+    db_session.refresh(evidence)
+    assert calls == [evidence.id]
+    assert evidence.extraction_status == "ready"
+    assert evidence.extraction_error is None
+
+
+def test_run_evidence_extract_job_records_failure(
+    db_session: Session, project: Project, monkeypatch
+) -> None:
+    evidence = _evidence(db_session, project)
+
+    def _boom(session, *, evidence_id, file_path):
+        raise RuntimeError("ocr exploded")
+
+    monkeypatch.setattr(evidence_extract_jobs, "ingest_evidence_document_extraction", _boom)
+
+    with pytest.raises(RuntimeError):
+        run_evidence_extract_job(cast(int, evidence.id))
+
+    db_session.refresh(evidence)
+    assert evidence.extraction_status == "failed"
+    assert evidence.extraction_error == "ocr exploded"
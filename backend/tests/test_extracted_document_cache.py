@@ -0,0 +1,100 @@
+"""Tests for the content-hash ExtractedDocument cache used by extract_document."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai.pipelines.document_text_extraction import (
+    BoundingBox,
+    ExtractedDocument,
+    PositionedWord,
+    SourceFormat,
+    extract_document,
+)
+from ai.pipelines.extracted_document_cache import (
+    ExtractedDocumentCache,
+    document_from_json,
+    document_to_json,
+    extracted_document_cache_key,
+)
+
+pytestmark = pytest.mark.isolated_caches("extracted_documents", "ocr_results")
+
+
+def _document(text: str = "Hydrant") -> ExtractedDocument:
+    return ExtractedDocument(
+        source_format=SourceFormat.IMAGE,
+        page_count=1,
+        words=[
+            PositionedWord(
+                text=text,
+                bbox=BoundingBox(10.0, 20.0, 30.0, 8.0, 1000.0, 800.0),
+                page_index=0,
+                ocr_confidence=0.87,
+            )
+        ],
+    )
+
+
+def test_extract_document_ocrs_identical_content_once(tmp_path: Path) -> None:
+    first = tmp_path / "photo-a.png"
+    second = tmp_path / "photo-b.png"
+    first.write_bytes(b"same image bytes")
+    second.write_bytes(b"same image bytes")
+    words = _document().words
+
+    with patch(
+        "ai.pipelines.document_text_extraction._ocr_image",
+        return_value=(words, 1000.0, 800.0),
+    ) as ocr:
+        assert extract_document(first).words == words
+        assert extract_document(second).words == words
+        assert extract_document(first).words == words
+
+    assert ocr.call_count == 1
+
+
+def test_extract_document_skips_cache_for_unreadable_files() -> None:
+    with patch(
+        "ai.pipelines.document_text_extraction._ocr_image",
+        return_value=(_document().words, 1000.0, 800.0),
+    ) as ocr:
+        extract_document("/missing/photo.png")
+        extract_document("/missing/photo.png")
+
+    assert ocr.call_count == 2
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = ExtractedDocumentCache(max_entries=2)
+    cache.put("a", _document("a"))
+    cache.put("b", _document("b"))
+    assert cache.get("a") is not None
+    cache.put("c", _document("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_disk_tier_survives_a_fresh_memory_cache(tmp_path: Path) -> None:
+    ExtractedDocumentCache(max_entries=4, disk_dir=tmp_path).put("k" * 64, _document())
+
+    restored = ExtractedDocumentCache(max_entries=4, disk_dir=tmp_path).get("k" * 64)
+
+    assert restored == _document()
+
+
+def test_document_json_round_trip_and_variant_keys(tmp_path: Path) -> None:
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+
+    assert document_from_json(document_to_json(_document())) == _document()
+    assert extracted_document_cache_key(path, "auto") != extracted_document_cache_key(
+        path, "ocr-0"
+    )
+    assert extracted_document_cache_key(tmp_path / "missing.pdf", "auto") is None
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from typing import cast
 
+from sqlalchemy import event
+
 from models.models import Drawing, DrawingOverlay, EvidenceRecord, Finding, InspectionRun
 from services.findings import (
+    FindingService,
     build_finding_link,
     build_finding_workspace_link_metadata,
 )
@@ -68,6 +71,7 @@ def test_build_finding_link_resolves_overlay_and_inspection_run(
         inspection_run_id=run_id,
         geometry={"bbox": {"x": 0, "y": 0, "width": 10, "height": 10}},
         status="fail",
+        finding_id=finding_id,
         meta={"finding_id": finding_id},
     )
     db_session.add(overlay)
@@ -136,6 +140,7 @@ def test_findings_api_serializes_run_overlay_workspace_link(
         inspection_run_id=run_id,
         geometry={"bbox": {"x": 1, "y": 2, "width": 3, "height": 4}},
         status="unknown",
+        finding_id=finding_id,
         meta={"finding_id": finding_id},
     )
     db_session.add(overlay)
@@ -152,3 +157,91 @@ def test_findings_api_serializes_run_overlay_workspace_link(
     assert workspace_link["overlayId"] == overlay.id
     assert "alignmentId" not in workspace_link
     assert "diffId" not in workspace_link
+
+
+def test_serialize_findings_resolves_links_in_one_query(db_session, project) -> None:
+    project_id = cast(int, project.id)
+    master, other = (
+        Drawing(project_id=project_id, source="upload", name=name, content_type="application/pdf")
+        for name in ("master.pdf", "other.pdf")
+    )
+    db_session.add_all([master, other])
+    db_session.commit()
+    run = InspectionRun(project_id=project_id, master_drawing_id=master.id, status="complete")
+    db_session.add(run)
+    db_session.commit()
+
+    findings = [
+        Finding(
+            project_id=project_id,
+            drawing_id=master.id,
+            type="deviation",
+            severity="high",
+            title=f"Finding {i}",
+            description="Detected during inspection mapping.",
+            affected_items=[f"Inspection run #{run.id}"],
+        )
+        for i in range(4)
+    ]
+    findings.append(
+        Finding(
+            project_id=project_id,
+            type="warning",
+            severity="info",
+            title="No drawing",
+            description="Manual.",
+        )
+    )
+    db_session.add_all(findings)
+    db_session.commit()
+
+    geometry = {"bbox": {"x": 0, "y": 0, "width": 1, "height": 1}}
+    for finding in findings[:2]:
+        for _ in range(2):
+            db_session.add(
+                DrawingOverlay(
+                    master_drawing_id=master.id,
+                    inspection_run_id=run.id,
+                    geometry=geometry,
+                    status="fail",
+                    finding_id=finding.id,
+                )
+            )
+    # Linked, but on another drawing than the finding's master: not a workspace link.
+    other_run = InspectionRun(project_id=project_id, master_drawing_id=other.id, status="complete")
+    db_session.add(other_run)
+    db_session.commit()
+    db_session.add(
+        DrawingOverlay(
+            master_drawing_id=other.id,
+            inspection_run_id=other_run.id,
+            geometry=geometry,
+            status="fail",
+            finding_id=findings[2].id,
+        )
+    )
+    db_session.commit()
+
+    service = FindingService(db_session)
+    expected = [service.serialize_finding(f) for f in findings]
+
+    statements: list[str] = []
+    bind = db_session.get_bind()
+
+    def count(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        batch = service.serialize_findings(findings)
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+
+    assert batch == expected
+    assert len(statements) == 1
+    assert batch[0].workspace_link is not None
+    assert batch[0].workspace_link.overlay_id is not None
+    assert batch[2].workspace_link is not None
+    assert batch[2].workspace_link.overlay_id is None
+    assert batch[2].workspace_link.inspection_run_id == run.id
+    assert batch[4].workspace_link is None
@@ -0,0 +1,198 @@
+"""Tests for queued inspection mapping (``inspection_mapping`` jobs)."""
+
+from __future__ import annotations
+
+import uuid
+from typing import cast
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models.inspection_run import InspectionRun
+from models.models import Drawing, EvidenceRecord, JobQueue, Project, User
+from services import inspection_mapping_jobs
+from services.inspection_mapping_jobs import (
+    INSPECTION_MAPPING_JOB_TYPE,
+    enqueue_inspection_mapping_job,
+    run_inspection_mapping_job,
+)
+from services.storage import StorageService
+
+
+@pytest.fixture
+def job_user(db_session: Session) -> User:
+    user = User(email=f"mapping-{uuid.uuid4().hex[:8]}@example.com")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def evidence(db_session: Session, project: Project) -> EvidenceRecord:
+    record = EvidenceRecord(
+        project_id=project.id,
+        type="inspection_doc",
+        title="report.pdf",
+        storage_key=f"projects/{project.id}/evidence/report.pdf",
+    )
+    db_session.add(record)
+    db_session.commit()
+    return record
+
+
+def _mapping_jobs(db_session: Session, project: Project) -> list[JobQueue]:
+    return (
+        db_session.query(JobQueue)
+        .filter(
+            JobQueue.project_id == project.id,
+            JobQueue.job_type == INSPECTION_MAPPING_JOB_TYPE,
+        )
+        .order_by(JobQueue.id.asc())
+        .all()
+    )
+
+
+def _cleanup_jobs(db_session: Session, project: Project) -> None:
+    db_session.query(JobQueue).filter(JobQueue.project_id == project.id).delete(
+        synchronize_session=False
+    )
+    db_session.commit()
+
+
+def _run(
+    db_session: Session, project: Project, drawing: Drawing, evidence_id: int | None
+) -> InspectionRun:
+    return StorageService(db_session).create_inspection_run(
+        project_id=cast(int, project.id),
+        master_drawing_id=cast(int, drawing.id),
+        evidence_id=evidence_id,
+    )
+
+
+def test_create_run_returns_queued_without_running_pipeline(
+    client,
+    db_session: Session,
+    project: Project,
+    sample_pdf_drawing: Drawing,
+    evidence: EvidenceRecord,
+    job_user: User,
+    monkeypatch,
+) -> None:
+    def _fail_if_called(*args, **kwargs):
+        raise AssertionError("mapping must not run on the request path")
+
+    monkeypatch.setattr(inspection_mapping_jobs, "run_inspection_mapping", _fail_if_called)
+    try:
+        response = client.post(
+            f"/api/projects/{project.id}/inspections/runs",
+            json={"master_drawing_id": sample_pdf_drawing.id, "evidence_id": evidence.id},
+            headers={"Idempotency-Key": uuid.uuid4().hex},
+        )
+
+        assert response.status_code == 201
+        body = response.json()
+        assert body["status"] == "queued"
+        jobs = _mapping_jobs(db_session, project)
+        assert [cast(dict, job.input_data)["run_ids"] for job in jobs] == [[body["id"]]]
+
+        polled = client.get(f"/api/projects/{project.id}/inspections/runs/{body['id']}")
+        assert polled.status_code == 200
+        assert polled.json()["status"] == "queued"
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_runs_sharing_evidence_join_one_pending_job(
+    db_session: Session,
+    project: Project,
+    sample_pdf_drawing: Drawing,
+    evidence: EvidenceRecord,
+    job_user: User,
+) -> None:
+    project_id = cast(int, project.id)
+    first = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    second = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    unrelated = _run(db_session, project, sample_pdf_drawing, None)
+    try:
+        job_a = enqueue_inspection_mapping_job(db_session, project_id, cast(int, first.id))
+        job_b = enqueue_inspection_mapping_job(db_session, project_id, cast(int, second.id))
+        job_c = enqueue_inspection_mapping_job(db_session, project_id, cast(int, unrelated.id))
+
+        assert job_a.id == job_b.id
+        assert job_c.id != job_a.id
+        db_session.refresh(job_a)
+        assert cast(dict, job_a.input_data)["run_ids"] == [first.id, second.id]
+        assert len(_mapping_jobs(db_session, project)) == 2
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_claimed_job_is_not_joined(
+    db_session: Session,
+    project: Project,
+    sample_pdf_drawing: Drawing,
+    evidence: EvidenceRecord,
+    job_user: User,
+) -> None:
+    project_id = cast(int, project.id)
+    first = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    second = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    try:
+        job_a = enqueue_inspection_mapping_job(db_session, project_id, cast(int, first.id))
+        job_a.status = "processing"  # type: ignore[assignment]
+        db_session.commit()
+
+        job_b = enqueue_inspection_mapping_job(db_session, project_id, cast(int, second.id))
+
+        assert job_b.id != job_a.id
+        assert cast(dict, job_b.input_data)["run_ids"] == [second.id]
+    finally:
+        _cleanup_jobs(db_session, project)
+
+
+def test_run_job_maps_only_queued_runs(
+    db_session: Session,
+    project: Project,
+    sample_pdf_drawing: Drawing,
+    evidence: EvidenceRecord,
+    monkeypatch,
+) -> None:
+    queued = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    done = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+    StorageService(db_session).update_inspection_run_status(cast(int, done.id), "complete")
+    mapped: list[int] = []
+
+    def _fake_mapping(session, run):
+        mapped.append(cast(int, run.id))
+        StorageService(session).update_inspection_run_status(cast(int, run.id), "complete")
+        return {"run": run}
+
+    monkeypatch.setattr(inspection_mapping_jobs, "run_inspection_mapping", _fake_mapping)
+
+    run_inspection_mapping_job([cast(int, queued.id), cast(int, done.id), 999_999])
+
+    db_session.refresh(queued)
+    assert mapped == [queued.id]
+    assert queued.status == "complete"
+
+
+def test_run_job_raises_when_every_run_fails(
+    db_session: Session,
+    project: Project,
+    sample_pdf_drawing: Drawing,
+    evidence: EvidenceRecord,
+    monkeypatch,
+) -> None:
+    run = _run(db_session, project, sample_pdf_drawing, cast(int, evidence.id))
+
+    def _boom(session, run):
+        raise RuntimeError("llm unavailable")
+
+    monkeypatch.setattr(inspection_mapping_jobs, "run_inspection_mapping", _boom)
+
+    with pytest.raises(RuntimeError):
+        run_inspection_mapping_job([cast(int, run.id)])
+
+    db_session.refresh(run)
+    assert run.status == "failed"
+    assert run.error_message == "llm unavailable"
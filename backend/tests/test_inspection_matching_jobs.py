@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import patch
 
@@ -11,20 +12,27 @@ import pytest
 from sqlalchemy.orm import Session
 
 from ai.pipelines.drawing_location_resolver import ResolutionMethod
-from ai.pipelines.location_match_orchestrator import LocationMatchResult
+from ai.pipelines.location_match_orchestrator import (
+    LocationMatchResult,
+    resolve_evidence_location,
+    resolve_evidence_locations_batch,
+)
 from database import SessionLocal
 from models.drawing_overlay import DrawingOverlay
 from models.drawing_match_candidate import DrawingMatchCandidate
 from models.document_clue import DocumentClue
 from models.document_extraction import DocumentExtraction
+from models.drawing_text_element import DrawingTextElement
 from models.models import Company, Drawing, EvidenceRecord, JobQueue, Project
 from models.inspection_run import InspectionRun
 from services.inspection_match_persistence import MATCH_SCORE_THRESHOLD
 from services.inspection_matching_jobs import (
     DEFERRED_MATCH_META_KEY,
     JOB_TYPE_INSPECTION_MATCH,
+    JOB_TYPE_INSPECTION_MATCH_BATCH,
     flush_deferred_inspection_matches_for_drawing,
     maybe_enqueue_inspection_match_after_extraction,
+    run_inspection_match_batch_job,
     run_inspection_match_job,
 )
 
@@ -437,3 +445,293 @@ def test_flush_deferred_inspection_matches_enqueues_after_index(db: Session) ->
     meta = cast(dict, evidence.meta or {})
     assert DEFERRED_MATCH_META_KEY not in meta
     assert _match_job_count_for_inspection(db, file_id) == before + 1
+
+
+def _seed_second_run(db: Session, run: InspectionRun) -> tuple[InspectionRun, str]:
+    evidence = EvidenceRecord(
+        project_id=run.project_id,
+        type="inspection_doc",
+        title="Second inspection PDF",
+        storage_key=f"evidence/{_unique()}.pdf",
+    )
+    db.add(evidence)
+    db.flush()
+    second = InspectionRun(
+        project_id=run.project_id,
+        master_drawing_id=run.master_drawing_id,
+        evidence_id=evidence.id,
+        status="complete",
+    )
+    db.add(second)
+    db.commit()
+    db.refresh(second)
+    return second, str(evidence.id)
+
+
+@patch("services.inspection_matching_jobs.resolve_evidence_locations_batch")
+def test_run_inspection_match_batch_job_persists_every_item(mock_resolve, db: Session):
+    run, file_id = _seed_run(db)
+    second_run, second_file_id = _seed_second_run(db, run)
+    master_drawing_id = cast(int, run.master_drawing_id)
+    mock_resolve.return_value = {
+        int(file_id): LocationMatchResult(
+            master_drawing_id=master_drawing_id,
+            method=ResolutionMethod.COORDINATE_LOOKUP,
+            confidence=MATCH_SCORE_THRESHOLD + 0.1,
+            bbox_fractional=(0.1, 0.2, 0.4, 0.5),
+            page=1,
+        ),
+        int(second_file_id): LocationMatchResult.unresolved(master_drawing_id),
+    }
+
+    statuses = run_inspection_match_batch_job(
+        {
+            "drawing_id": str(master_drawing_id),
+            "page": 1,
+            "items": [
+                {"inspection_id": file_id, "inspection_run_id": cast(int, run.id)},
+                {"inspection_id": second_file_id},
+            ],
+        },
+        db,
+    )
+
+    assert statuses == {file_id: "matched", second_file_id: "no_match"}
+    mock_resolve.assert_called_once_with(
+        db,
+        [int(file_id), int(second_file_id)],
+        master_drawing_id=master_drawing_id,
+        page=1,
+    )
+    overlays = {
+        cast(int, overlay.inspection_run_id): overlay
+        for overlay in db.query(DrawingOverlay)
+        .filter(DrawingOverlay.inspection_run_id.in_([run.id, second_run.id]))
+        .all()
+    }
+    assert cast(dict, overlays[cast(int, run.id)].meta)["match_status"] == "matched"
+    assert cast(dict, overlays[cast(int, run.id)].geometry)["type"] == "rect"
+    assert cast(dict, overlays[cast(int, second_run.id)].meta)["match_status"] == "no_match"
+
+    candidates = (
+        db.query(DrawingMatchCandidate)
+        .filter(DrawingMatchCandidate.inspection_id.in_([file_id, second_file_id]))
+        .all()
+    )
+    assert [(c.inspection_id, c.inspection_run_id) for c in candidates] == [(file_id, run.id)]
+
+    # A rerun updates the same overlays instead of adding new ones.
+    run_inspection_match_batch_job(
+        {
+            "drawing_id": str(master_drawing_id),
+            "items": [{"inspection_id": file_id}, {"inspection_id": second_file_id}],
+        },
+        db,
+    )
+    assert (
+        db.query(DrawingOverlay)
+        .filter(DrawingOverlay.inspection_run_id.in_([run.id, second_run.id]))
+        .count()
+        == 2
+    )
+
+
+def test_resolve_evidence_locations_batch_matches_single_resolution(db: Session) -> None:
+    run, file_id = _seed_run(db)
+    _, second_file_id = _seed_second_run(db, run)
+    master_drawing_id = cast(int, run.master_drawing_id)
+    db.add(
+        DrawingTextElement(
+            master_drawing_id=master_drawing_id,
+            page=1,
+            text="COLO",
+            text_normalized="colo",
+            bbox_json={"x0": 0.3, "y0": 0.3, "x1": 0.36, "y1": 0.32},
+            ocr_confidence=0.95,
+            source="native_pdf",
+        )
+    )
+    db.commit()
+    missing_id = int(second_file_id) + 1_000_000
+
+    batch = resolve_evidence_locations_batch(
+        db,
+        [int(file_id), int(second_file_id), missing_id],
+        master_drawing_id,
+        max_workers=2,
+    )
+
+    assert batch.keys() == {int(file_id), int(second_file_id), missing_id}
+    for evidence_id in (int(file_id), int(second_file_id)):
+        assert batch[evidence_id] == resolve_evidence_location(
+            db, evidence_id, master_drawing_id
+        )
+    assert batch[int(file_id)].method == ResolutionMethod.REFERENCE_LOOKUP
+    assert batch[int(file_id)].bbox_fractional == (0.3, 0.3, 0.36, 0.32)
+    assert batch[missing_id].method == ResolutionMethod.UNRESOLVED
+
+
+
+def _delete_match_jobs(db: Session, *inspection_ids: str) -> None:
+    db.rollback()
+    for job in db.query(JobQueue).filter(JobQueue.job_type == JOB_TYPE_INSPECTION_MATCH).all():
+        input_data = job.input_data if isinstance(job.input_data, dict) else {}
+        if str(input_data.get("inspection_id")) in inspection_ids:
+            db.delete(job)
+    db.commit()
+
+
+@patch("services.inspection_matching_jobs.resolve_evidence_locations_batch")
+def test_run_inspection_match_batch_job_requeues_failed_items(mock_resolve, db: Session):
+    run, file_id = _seed_run(db)
+    second_run, second_file_id = _seed_second_run(db, run)
+    master_drawing_id = cast(int, run.master_drawing_id)
+    # The second record's resolution raised, so the batch left it out.
+    mock_resolve.return_value = {int(file_id): LocationMatchResult.unresolved(master_drawing_id)}
+
+    try:
+        statuses = run_inspection_match_batch_job(
+            {
+                "drawing_id": str(master_drawing_id),
+                "page": 1,
+                "project_id": cast(int, run.project_id),
+                "items": [
+                    {"inspection_id": file_id},
+                    {"inspection_id": second_file_id, "inspection_run_id": cast(int, second_run.id)},
+                ],
+            },
+            db,
+        )
+
+        assert statuses == {file_id: "no_match"}
+        assert _match_job_count_for_inspection(db, file_id) == 0
+        assert _match_job_count_for_inspection(db, second_file_id) == 1
+    finally:
+        _delete_match_jobs(db, file_id, second_file_id)
+
+
+def test_run_inspection_match_batch_job_requeues_item_with_bad_storage_key(db: Session):
+    run, file_id = _seed_run(db)
+    second_run, second_file_id = _seed_second_run(db, run)
+    master_drawing_id = cast(int, run.master_drawing_id)
+    bad = db.query(EvidenceRecord).filter(EvidenceRecord.id == int(second_file_id)).one()
+    bad.storage_key = "../../outside-uploads.pdf"  # type: ignore[assignment]
+    db.commit()
+
+    try:
+        statuses = run_inspection_match_batch_job(
+            {
+                "drawing_id": str(master_drawing_id),
+                "page": 1,
+                "project_id": cast(int, run.project_id),
+                "items": [
+                    {"inspection_id": file_id, "inspection_run_id": cast(int, run.id)},
+                    {"inspection_id": second_file_id, "inspection_run_id": cast(int, second_run.id)},
+                ],
+            },
+            db,
+        )
+
+        assert set(statuses) == {file_id}
+        assert _match_job_count_for_inspection(db, file_id) == 0
+        assert _match_job_count_for_inspection(db, second_file_id) == 1
+    finally:
+        _delete_match_jobs(db, file_id, second_file_id)
+
+
+def test_uploads_against_indexed_master_coalesce_into_one_batch_job(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from config import settings
+
+    run, file_id = _seed_run(db)
+    second_run, second_file_id = _seed_second_run(db, run)
+    project_id = cast(int, run.project_id)
+    drawing_id = cast(int, run.master_drawing_id)
+    monkeypatch.setattr(settings, "inspection_match_batch_max_items", 2)
+
+    def _enqueue(inspection_id: str, inspection_run_id: int | None) -> JobQueue | None:
+        return maybe_enqueue_inspection_match_after_extraction(
+            db,
+            evidence_id=int(inspection_id),
+            project_id=project_id,
+            inspection_id=inspection_id,
+            master_drawing_id=drawing_id,
+            page=0,
+            inspection_run_id=inspection_run_id,
+        )
+
+    overflow_id = str(int(second_file_id) + 1_000_000)
+    try:
+        with patch(
+            "services.inspection_matching_jobs.get_master_drawing_index_readiness",
+            return_value=SimpleNamespace(is_ready_for_matching=True),
+        ):
+            first = _enqueue(file_id, cast(int, run.id))
+            second = _enqueue(second_file_id, cast(int, second_run.id))
+            repeat = _enqueue(second_file_id, cast(int, second_run.id))
+            overflow = _enqueue(overflow_id, None)
+
+        assert first is not None and second is not None and repeat is not None
+        assert overflow is not None
+        assert first.id == second.id == repeat.id != overflow.id
+        db.expire_all()
+        batch = db.get(JobQueue, first.id)
+        assert batch is not None
+        assert batch.job_type == JOB_TYPE_INSPECTION_MATCH_BATCH
+        assert batch.input_data == {
+            "drawing_id": str(drawing_id),
+            "page": 1,
+            "project_id": project_id,
+            "items": [
+                {"inspection_id": file_id, "inspection_run_id": cast(int, run.id)},
+                {"inspection_id": second_file_id, "inspection_run_id": cast(int, second_run.id)},
+            ],
+        }
+        assert overflow.job_type == JOB_TYPE_INSPECTION_MATCH
+    finally:
+        db.rollback()
+        db.query(JobQueue).filter(
+            JobQueue.project_id == project_id,
+            JobQueue.job_type.in_((JOB_TYPE_INSPECTION_MATCH, JOB_TYPE_INSPECTION_MATCH_BATCH)),
+        ).delete(synchronize_session=False)
+        db.commit()
+
+
+def test_flush_deferred_falls_back_to_single_jobs_when_batch_enqueue_fails(db: Session) -> None:
+    run, file_id = _seed_run(db)
+    second_run, second_file_id = _seed_second_run(db, run)
+    drawing_id = cast(int, run.master_drawing_id)
+    for deferred_run, inspection_id in ((run, file_id), (second_run, second_file_id)):
+        maybe_enqueue_inspection_match_after_extraction(
+            db,
+            evidence_id=int(inspection_id),
+            project_id=cast(int, run.project_id),
+            inspection_id=inspection_id,
+            master_drawing_id=drawing_id,
+            page=0,
+            inspection_run_id=cast(int, deferred_run.id),
+        )
+    db.commit()
+
+    try:
+        with patch(
+            "services.inspection_matching_jobs.enqueue_inspection_match_batch_job",
+            side_effect=RuntimeError("queue unavailable"),
+        ):
+            enqueued = flush_deferred_inspection_matches_for_drawing(db, drawing_id)
+
+        assert enqueued == 2
+        for inspection_id in (file_id, second_file_id):
+            evidence = db.query(EvidenceRecord).filter(EvidenceRecord.id == int(inspection_id)).one()
+            assert DEFERRED_MATCH_META_KEY not in cast(dict, evidence.meta or {})
+            jobs = [
+                job
+                for job in db.query(JobQueue)
+                .filter(JobQueue.job_type == JOB_TYPE_INSPECTION_MATCH)
+                .all()
+                if cast(dict, job.input_data).get("inspection_id") == inspection_id
+            ]
+            assert [cast(dict, job.input_data)["page"] for job in jobs] == [1]
+    finally:
+        _delete_match_jobs(db, file_id, second_file_id)
@@ -0,0 +1,215 @@
+"""Tests for the job worker: per-type slots, batch claims, NOTIFY wakeups, and metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from unittest.mock import patch
+from typing import cast
+
+from sqlalchemy.orm import Session
+
+from config import Settings, job_worker_type_limits, sqlalchemy_connect_args
+from database import engine
+from models.models import JobQueue, Project, User
+from observability.job_metrics import JobWorkerMetrics
+from services import job_execution
+from services.inspection_matching_jobs import enqueue_inspection_match_job
+from services.job_notifications import JobQueueListener, wait_for_wakeup
+from services.job_worker import (
+    OTHER_JOB_TYPES_KEY,
+    JobTypeSlots,
+    _claim_pending_jobs,
+    pending_job_counts_by_type,
+)
+
+
+def _user(db_session: Session) -> User:
+    user = User(email=f"worker-{uuid.uuid4().hex[:8]}@example.com")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _pending_jobs(
+    db_session: Session,
+    project: Project,
+    user: User,
+    job_types: list[str],
+) -> list[JobQueue]:
+    jobs = [
+        JobQueue(
+            user_id=user.id,
+            company_id=project.company_id,
+            project_id=project.id,
+            job_type=job_type,
+            status="pending",
+            input_data={},
+        )
+        for job_type in job_types
+    ]
+    db_session.add_all(jobs)
+    db_session.commit()
+    return jobs
+
+
+def test_job_worker_type_limits_parses_pairs_and_skips_malformed() -> None:
+    cfg = Settings(job_worker_type_limits="drawing_render=1, inspection_match = 4,bad,x=y,z=0,*=2")
+
+    assert job_worker_type_limits(cfg) == {
+        "drawing_render": 1,
+        "inspection_match": 4,
+        "*": 2,
+    }
+
+
+def test_job_type_slots_report_free_slots_per_bucket() -> None:
+    slots = JobTypeSlots({"drawing_render": 1, "inspection_match": 2}, max_concurrency=3)
+
+    assert [free for _, free in slots.claim_buckets()] == [1, 2, 1]
+    slots.acquire("drawing_render")
+    slots.acquire("inspection_match")
+    slots.acquire("inspection_match")
+
+    assert slots.total_in_flight == 3
+    assert slots.room == 0
+
+    slots.release("inspection_match")
+    assert slots.room == 1
+    assert [free for _, free in slots.claim_buckets()] == [1, 1]
+
+
+def test_job_type_slots_share_other_bucket_for_unlisted_types() -> None:
+    slots = JobTypeSlots({"drawing_render": 1, OTHER_JOB_TYPES_KEY: 1}, max_concurrency=5)
+
+    slots.acquire("drawing_render")
+    slots.acquire("legacy_type")
+
+    assert slots.claim_buckets() == []
+    slots.release("legacy_type")
+    assert len(slots.claim_buckets()) == 1
+
+
+def test_claim_pending_jobs_claims_oldest_batch_in_one_call(
+    db_session: Session,
+    project: Project,
+) -> None:
+    job_type = f"test_batch_{uuid.uuid4().hex[:8]}"
+    jobs = _pending_jobs(db_session, project, _user(db_session), [job_type] * 3)
+
+    claimed = _claim_pending_jobs(db_session, 2, JobQueue.job_type == job_type)
+
+    assert [cast(int, job.id) for job in claimed] == [cast(int, job.id) for job in jobs[:2]]
+    assert all(cast(str, job.status) == "processing" for job in claimed)
+    assert pending_job_counts_by_type(db_session)[job_type] == 1
+
+
+def test_claim_bucket_skips_job_types_without_free_slot(
+    db_session: Session,
+    project: Project,
+) -> None:
+    render_type = f"test_render_{uuid.uuid4().hex[:8]}"
+    match_type = f"test_match_{uuid.uuid4().hex[:8]}"
+    _pending_jobs(db_session, project, _user(db_session), [render_type, match_type])
+
+    slots = JobTypeSlots({render_type: 1, match_type: 2}, max_concurrency=4)
+    slots.acquire(render_type)
+    # Fill the shared bucket so other tests' pending jobs are not claimable here.
+    slots.acquire("unlisted_type")
+
+    buckets = slots.claim_buckets()
+    assert len(buckets) == 1
+    job_filter, free = buckets[0]
+    claimed = _claim_pending_jobs(db_session, free, job_filter)
+
+    assert [cast(str, job.job_type) for job in claimed] == [match_type]
+
+
+def test_enqueue_notifies_listening_worker(db_session: Session, project: Project) -> None:
+    _user(db_session)
+    listener = JobQueueListener.from_engine(engine, sqlalchemy_connect_args())
+    assert listener.enabled
+
+    async def _run() -> bool:
+        wakeup = asyncio.Event()
+        listen_task = listener.start(wakeup)
+        try:
+            # First set() fires once LISTEN is registered.
+            assert await wait_for_wakeup(wakeup, 5.0)
+            wakeup.clear()
+            await asyncio.to_thread(
+                enqueue_inspection_match_job,
+                db_session,
+                project_id=cast(int, project.id),
+                inspection_id="999999",
+                drawing_id=999999,
+                page=1,
+            )
+            return await wait_for_wakeup(wakeup, 5.0)
+        finally:
+            assert listen_task is not None
+            listen_task.cancel()
+            await asyncio.gather(listen_task, return_exceptions=True)
+
+    try:
+        assert asyncio.run(_run())
+    finally:
+        db_session.query(JobQueue).filter(
+            JobQueue.project_id == project.id,
+            JobQueue.status.in_(["pending", "processing"]),
+        ).delete(synchronize_session=False)
+        db_session.commit()
+
+
+def test_listener_is_disabled_without_postgres() -> None:
+    listener = JobQueueListener(None)
+
+    async def _run() -> bool:
+        wakeup = asyncio.Event()
+        assert listener.start(wakeup) is None
+        return await wait_for_wakeup(wakeup, 0.01)
+
+    assert not listener.enabled
+    assert asyncio.run(_run()) is False
+
+
+def test_job_worker_metrics_snapshot_reports_per_type_throughput() -> None:
+    now = [0.0]
+    metrics = JobWorkerMetrics(clock=lambda: now[0])
+
+    metrics.record_started("inspection_match")
+    metrics.record_started("inspection_match")
+    metrics.record_started("drawing_render")
+    now[0] = 60.0
+    metrics.record_finished("inspection_match", succeeded=True, duration_seconds=2.0)
+    metrics.record_finished("inspection_match", succeeded=False, duration_seconds=4.0)
+
+    snapshot = metrics.snapshot({"inspection_match": 7, "drawing_index": 3})
+
+    assert snapshot["inspection_match"] == {
+        "queue_depth": 7,
+        "in_flight": 0,
+        "started": 2,
+        "completed": 1,
+        "failed": 1,
+        "throughput_per_minute": 2.0,
+        "avg_duration_seconds": 3.0,
+    }
+    assert snapshot["drawing_render"]["in_flight"] == 1
+    assert snapshot["drawing_render"]["avg_duration_seconds"] is None
+    assert snapshot["drawing_index"]["queue_depth"] == 3
+
+
+def test_reserve_pool_workers_shares_one_budget_and_runs_inline_in_job_processes() -> None:
+    budget = job_execution._PoolBudget(6)
+    with patch.object(job_execution, "_pool_budget", budget):
+        with job_execution.reserve_pool_workers(4) as first:
+            with job_execution.reserve_pool_workers(4) as second:
+                with job_execution.reserve_pool_workers(4) as third:
+                    assert (first, second, third) == (4, 2, 1)
+        assert budget.in_use == 0
+
+        with patch.object(job_execution, "_in_cpu_job_process", True):
+            with job_execution.reserve_pool_workers(4) as nested:
+                assert nested == 1
+        assert budget.in_use == 0
@@ -0,0 +1,87 @@
+"""Cached per-project legend index (exact abbreviation + term → code lookup)."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from sqlalchemy.orm import Session
+
+from models.legend_reference import DrawingLegendAbbreviation, DrawingLegendSymbol
+from models.models import Project
+from scripts.seed_legend_reference import seed
+from services.legend_index import LegendIndex, get_legend_index
+from services.term_automaton import TermAutomaton
+
+
+def _naive_codes(named_codes: list[tuple[str, str]], term: str) -> list[str]:
+    """The per-row scan ``legend_lookup.find_codes_for_term`` used to run."""
+    term_lower = term.strip().lower()
+    if not term_lower:
+        return []
+    return sorted(
+        {code for name, code in named_codes if term_lower in name or name in term_lower}
+    )
+
+
+def test_term_automaton_finds_overlapping_terms() -> None:
+    automaton = TermAutomaton(["he", "she", "his", "hers", ""])
+
+    assert automaton.find("ushers") == {0, 1, 3, 4}
+    assert automaton.find("xyz") == {4}
+
+
+def test_find_codes_matches_naive_scan() -> None:
+    named_codes = [
+        ("sanitary sewer", "SS"),
+        ("sanitary sewer manhole", "SSMH"),
+        ("sanitary sewer cleanout", "SSCO"),
+        ("storm drain", "SD"),
+        ("water", "W"),
+        ("fire department connection", "FDC"),
+    ]
+    index = LegendIndex({"SS": "SANITARY SEWER"}, named_codes)
+
+    for term in (
+        "sanitary sewer",
+        "Sanitary Sewer Manhole 4",
+        "sewer",
+        "existing water main",
+        "fire department",
+        "nothing here",
+        "  ",
+    ):
+        assert index.find_codes_for_term(term) == _naive_codes(named_codes, term), term
+
+
+def test_expand_abbreviation_prefers_project_row(
+    db_session: Session, project: Project
+) -> None:
+    seed(db_session, project_id=None)
+    project_id = cast(int, project.id)
+    db_session.add(
+        DrawingLegendAbbreviation(
+            project_id=project_id, abbreviation="SS", expansion="STAINLESS STEEL"
+        )
+    )
+    db_session.commit()
+
+    assert get_legend_index(db_session, None).expand_abbreviation("ss") == "SANITARY SEWER"
+    assert get_legend_index(db_session, project_id).expand_abbreviation("SS") == "STAINLESS STEEL"
+
+
+def test_index_is_cached_and_invalidated_on_write(
+    db_session: Session, project: Project
+) -> None:
+    project_id = cast(int, project.id)
+    first = get_legend_index(db_session, project_id)
+    assert get_legend_index(db_session, project_id) is first
+    assert "ZZV" not in first.find_codes_for_term("zebra valve")
+
+    db_session.add(
+        DrawingLegendSymbol(project_id=project_id, symbol_name="Zebra Valve", abbreviation_code="ZZV")
+    )
+    db_session.commit()
+
+    rebuilt = get_legend_index(db_session, project_id)
+    assert rebuilt is not first
+    assert "ZZV" in rebuilt.find_codes_for_term("zebra valve")
@@ -0,0 +1,152 @@
+"""Tests for the durable llm_responses cache behind ai.llm_client.chat_completion."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai.llm_client import collect_llm_metrics, reset_openai_client
+from ai.pipelines.document_classifier import classify_document
+from ai.schemas.document_extraction_schemas import DocumentType
+from config import settings
+from database import SessionLocal
+from models.llm_response import LlmResponse
+from services.llm_response_store import (
+    llm_response_cache_stats,
+    load_llm_response,
+    prune_llm_responses,
+    reset_llm_response_cache_stats,
+    save_llm_response,
+)
+
+
+@pytest.fixture
+def marker(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Enable the cache; rows whose model or text carries the marker are removed after."""
+    monkeypatch.setattr(settings, "llm_response_cache_enabled", True)
+    reset_llm_response_cache_stats()
+    value = f"test-{uuid.uuid4().hex[:12]}"
+    yield value
+    with SessionLocal() as db:
+        db.query(LlmResponse).filter(
+            (LlmResponse.model == value) | LlmResponse.response_text.contains(value)
+        ).delete(synchronize_session=False)
+        db.commit()
+
+
+@pytest.fixture
+def fake_create(monkeypatch: pytest.MonkeyPatch) -> Iterator[MagicMock]:
+    import openai
+
+    client = MagicMock()
+    monkeypatch.setattr(openai, "OpenAI", MagicMock(return_value=client))
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    reset_openai_client()
+    try:
+        yield client.chat.completions.create
+    finally:
+        reset_openai_client()
+
+
+def _completion(content: str, finish_reason: str = "stop") -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)
+        ],
+        usage=SimpleNamespace(prompt_tokens=300, completion_tokens=20, total_tokens=320),
+    )
+
+
+def test_repeated_classification_is_served_from_cache(
+    marker: str, fake_create: MagicMock
+) -> None:
+    fake_create.return_value = _completion(
+        json.dumps({"document_type": "inspection_report", "confidence": 0.9, "m": marker})
+    )
+    text = f"Underground sanitary sewer inspection {marker}"
+
+    first = classify_document(text)
+    with collect_llm_metrics() as metrics:
+        second = classify_document(text)
+
+    fake_create.assert_called_once()
+    assert first == second
+    assert second.document_type == DocumentType.INSPECTION_REPORT
+    stage = metrics.to_json()["classify"]
+    assert stage["cache_hits"] == 1
+    assert stage["saved_tokens"] == 320
+    assert stage["total_tokens"] == 0
+
+    stats = llm_response_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["saved_tokens"] == 320
+
+
+@pytest.mark.parametrize(
+    ("content", "finish_reason"),
+    [
+        ('{"document_type": "inspection_report", "confid', "length"),
+        ("Sorry, I cannot classify this document.", "stop"),
+    ],
+)
+def test_truncated_or_unparseable_replies_are_not_cached(
+    marker: str, fake_create: MagicMock, content: str, finish_reason: str
+) -> None:
+    fake_create.return_value = _completion(content, finish_reason)
+    text = f"Underground sanitary sewer inspection {marker}"
+
+    classify_document(text)
+    classify_document(text)
+
+    assert fake_create.call_count == 2
+    assert llm_response_cache_stats()["writes"] == 0
+
+
+def test_expired_response_is_a_miss(marker: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "llm_response_cache_ttl_seconds", 3600.0)
+    key = uuid.uuid4().hex * 2
+    save_llm_response(key, model=marker, stage="classify", prompt_version=1, text="{}")
+    assert load_llm_response(key) is not None
+
+    with SessionLocal() as db:
+        db.query(LlmResponse).filter(LlmResponse.cache_key == key).update(
+            {"created_at": datetime.now(timezone.utc) - timedelta(hours=2)}
+        )
+        db.commit()
+
+    assert load_llm_response(key) is None
+
+
+def test_prune_evicts_least_recently_hit_beyond_max_entries(
+    marker: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "llm_response_cache_ttl_seconds", 0.0)
+    keys = [uuid.uuid4().hex * 2 for _ in range(3)]
+    for key in keys:
+        save_llm_response(key, model=marker, stage="scale", prompt_version=1, text="{}")
+
+    long_ago = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    with SessionLocal() as db:
+        for age_days, key in enumerate(keys):
+            db.query(LlmResponse).filter(LlmResponse.cache_key == key).update(
+                {"last_hit_at": long_ago - timedelta(days=age_days)}
+            )
+        total = db.query(LlmResponse).count()
+        db.commit()
+
+    monkeypatch.setattr(settings, "llm_response_cache_max_entries", total - 2)
+    assert prune_llm_responses() == 2
+
+    with SessionLocal() as db:
+        remaining = {
+            key for (key,) in db.query(LlmResponse.cache_key).filter(LlmResponse.model == marker)
+        }
+    assert remaining == {keys[0]}
@@ -18,14 +18,16 @@ from ai.pipelines.document_text_extraction import (
 from ai.pipelines.master_drawing_indexer import (
     IndexResult,
     build_page_meta_json,
+    build_text_element_records,
     extract_drawing_document,
     index_master_drawing,
     normalize_token_text,
-    persist_text_elements,
+    rendered_ocr_pages,
     word_bbox_json,
 )
 from models.drawing_text_element import DrawingTextElement
-from models.models import Drawing
+from models.models import Drawing, DrawingRendition
+from services.text_element_storage import persist_text_element_records
 
 
 def _word(text: str, page_index: int = 0) -> PositionedWord:
@@ -93,16 +95,14 @@ def test_extract_drawing_document_respects_max_pages(tmp_path: Path) -> None:
     assert [word.text for word in extracted.words] == ["A", "B"]
 
 
-def test_persist_text_elements(db_session: Session, seeded_ready_pdf_drawing: Drawing) -> None:
+def test_text_element_records_persist(
+    db_session: Session, seeded_ready_pdf_drawing: Drawing
+) -> None:
     drawing_id = cast(int, seeded_ready_pdf_drawing.id)
-    words = [_word("SS"), _word("COLO")]
+    words = [_word("SS"), _word(" "), _word("COLO")]
 
-    count = persist_text_elements(
-        db_session,
-        drawing_id,
-        words,
-        SourceFormat.NATIVE_PDF,
-    )
+    records = build_text_element_records(words, SourceFormat.NATIVE_PDF)
+    assert persist_text_element_records(db_session, drawing_id, records) == 2
     db_session.commit()
 
     rows = (
@@ -112,7 +112,7 @@ def test_persist_text_elements(db_session: Session, seeded_ready_pdf_drawing: Dr
         .all()
     )
 
-    assert count == 2
+    assert [record.text for record in records] == ["SS", "COLO"]
     assert [row.text for row in rows] == ["COLO", "SS"]
     assert rows[0].text_normalized == "colo"
     assert rows[0].source == "native_pdf"
@@ -165,3 +165,86 @@ def test_build_page_meta_json_uses_pdf_and_renditions(
     rendition = seeded_ready_pdf_drawing.renditions[0]
     assert page_meta[0]["width_px"] == rendition.width_px
     assert page_meta[0]["height_px"] == rendition.height_px
+
+
+def test_rendered_ocr_pages_uses_renders_at_ocr_dpi(
+    db_session: Session, seeded_ready_pdf_drawing: Drawing
+) -> None:
+    drawing_id = cast(int, seeded_ready_pdf_drawing.id)
+
+    pages = rendered_ocr_pages(db_session, drawing_id)
+
+    assert list(pages) == [0]
+    assert pages[0].suffix == ".png" and pages[0].exists()
+
+    rendition = db_session.query(DrawingRendition).filter_by(drawing_id=drawing_id).one()
+    rendition.dpi = 300  # type: ignore[assignment]
+    db_session.commit()
+    assert rendered_ocr_pages(db_session, drawing_id) == {}
+
+
+def test_extract_drawing_document_passes_rendered_pages(tmp_path: Path) -> None:
+    fake_doc = ExtractedDocument(source_format=SourceFormat.SCANNED_PDF, page_count=1, words=[])
+    pdf_path = tmp_path / "master.pdf"
+    pdf_path.write_bytes(b"%PDF")
+    rendered = {0: tmp_path / "page-1.png"}
+
+    with patch(
+        "ai.pipelines.master_drawing_indexer.extract_document",
+        return_value=fake_doc,
+    ) as mock_extract:
+        extract_drawing_document(pdf_path, rendered)
+
+    mock_extract.assert_called_once_with(pdf_path, rendered_pages=rendered)
+
+
+def test_index_master_drawing_writes_tagged_elements_without_reloading(
+    db_session: Session,
+    seeded_ready_pdf_drawing: Drawing,
+) -> None:
+    from models.legend_reference import DrawingLegendAbbreviation
+
+    drawing_id = cast(int, seeded_ready_pdf_drawing.id)
+    db_session.add(
+        DrawingLegendAbbreviation(
+            project_id=seeded_ready_pdf_drawing.project_id,
+            abbreviation="SSMH",
+            expansion="SANITARY SEWER MANHOLE",
+        )
+    )
+    db_session.commit()
+    fake_doc = ExtractedDocument(
+        source_format=SourceFormat.NATIVE_PDF,
+        page_count=1,
+        words=[_word("SSMH"), _word("  "), _word("COLO")],
+    )
+
+    with (
+        patch(
+            "ai.pipelines.master_drawing_indexer.extract_drawing_document",
+            return_value=fake_doc,
+        ),
+        patch(
+            "ai.pipelines.master_drawing_indexer.build_auto_regions_from_text_elements",
+            return_value=0,
+        ) as mock_regions,
+    ):
+        result = index_master_drawing(drawing_id, db_session)
+    db_session.commit()
+
+    # Region building gets the just-written records instead of reloading the rows.
+    records = mock_regions.call_args.args[2]
+    assert [record.text for record in records] == ["SSMH", "COLO"]
+
+    rows = (
+        db_session.query(DrawingTextElement)
+        .filter(DrawingTextElement.master_drawing_id == drawing_id)
+        .order_by(DrawingTextElement.id.asc())
+        .all()
+    )
+    assert result.text_elements == 2
+    assert [row.text for row in rows] == ["SSMH", "COLO"]
+    assert rows[0].legend_expansion == "SANITARY SEWER MANHOLE"
+    assert "SSMH" in rows[0].legend_codes_json
+    assert rows[0].bbox_json["x0"] == pytest.approx(0.1)
+    assert rows[1].legend_codes_json is None
@@ -9,6 +9,7 @@ import fitz
 import pytest
 
 from ai.pipelines.document_text_extraction import BoundingBox, PositionedWord
+from ai.pipelines.ocr_capabilities import OcrCapabilityRegistry, get_ocr_capabilities
 from ai.pipelines.ocr_engine import (
     _plain_text_to_positioned_words,
     _render_pdf_page_bytes,
@@ -16,10 +17,15 @@ from ai.pipelines.ocr_engine import (
     ocr_image_openai_vision,
     ocr_image_tesseract,
     ocr_pdf_page_in_memory,
+    ocr_pdf_pages,
+    ocr_worker_count,
     rasterize_pdf_pages,
+    render_pdf_page_raster,
     tesseract_is_available,
 )
 
+pytestmark = pytest.mark.isolated_caches("ocr_capabilities")
+
 PNG_HEADER = b"\x89PNG\r\n\x1a\n"
 
 
@@ -56,6 +62,64 @@ def test_tesseract_is_available_true_when_binary_runs(_mock_configure: MagicMock
         assert tesseract_is_available() is True
 
 
+def test_tesseract_probe_is_cached_per_process() -> None:
+    mock_pytesseract = MagicMock()
+    mock_pytesseract.get_tesseract_version.return_value = "5.3.0"
+    with patch.dict("sys.modules", {"pytesseract": mock_pytesseract}):
+        assert all(tesseract_is_available() for _ in range(50))
+        stats = get_ocr_capabilities().stats()
+
+    assert mock_pytesseract.get_tesseract_version.call_count == 1
+    assert stats["tesseract_probes"] == 1
+    assert stats["tesseract_available"] is True
+    assert stats["hits"] == 49
+
+
+def test_capability_stats_never_probe() -> None:
+    registry = OcrCapabilityRegistry(ttl_seconds=0)
+    with patch("ai.pipelines.ocr_capabilities.probe_tesseract") as probe:
+        stats = registry.stats()
+
+    probe.assert_not_called()
+    assert stats == {
+        "tesseract_available": None,
+        "openai_vision_available": None,
+        "tesseract_probes": 0,
+        "openai_vision_probes": 0,
+        "hits": 0,
+    }
+
+
+def test_tesseract_probe_reruns_after_ttl() -> None:
+    registry = OcrCapabilityRegistry(ttl_seconds=60)
+    mock_pytesseract = MagicMock()
+    mock_pytesseract.get_tesseract_version.side_effect = [RuntimeError("missing"), "5.3.0"]
+    with (
+        patch.dict("sys.modules", {"pytesseract": mock_pytesseract}),
+        patch("ai.pipelines.ocr_capabilities.shutil.which", return_value=None),
+        patch("ai.pipelines.ocr_capabilities.time.monotonic", side_effect=[0.0, 0.0, 30.0, 61.0, 61.0]),
+    ):
+        assert registry.tesseract_available() is False
+        assert registry.tesseract_available() is False
+        assert registry.tesseract_available() is True
+
+    assert registry.tesseract_probes == 2
+
+
+def test_openai_vision_check_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    from config import settings
+
+    registry = OcrCapabilityRegistry(ttl_seconds=0)
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    assert registry.openai_vision_available() is True
+    monkeypatch.setattr(settings, "openai_api_key", None)
+    assert registry.openai_vision_available() is True
+
+    registry.refresh()
+    assert registry.openai_vision_available() is False
+    assert registry.openai_vision_probes == 2
+
+
 @patch("ai.pipelines.ocr_engine.tesseract_is_available", return_value=True)
 @patch("ai.pipelines.ocr_engine._configure_tesseract_cmd")
 @patch("ai.pipelines.ocr_engine._load_pil_image")
@@ -263,3 +327,108 @@ def test_ocr_pdf_page_in_memory_rasterizes_real_pdf_then_ocrs(
 def test_ocr_image_requires_input() -> None:
     with pytest.raises(ValueError, match="Provide file_path or image_bytes"):
         ocr_image()
+
+
+def test_page_raster_matches_png_round_trip_pixels(tmp_path: Path) -> None:
+    from io import BytesIO
+
+    from PIL import Image
+
+    pdf_path = tmp_path / "text.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=200)
+    page.insert_text((40, 80), "Sanitary sewer manhole 4")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    png_bytes, width, height = _render_pdf_page_bytes(pdf_path, 0, dpi=150)
+    doc = fitz.open(str(pdf_path))
+    try:
+        raster = render_pdf_page_raster(doc, 0, dpi=150)
+    finally:
+        doc.close()
+
+    with Image.open(BytesIO(png_bytes)) as decoded:
+        assert (raster.width, raster.height) == (width, height)
+        assert raster.to_pil().tobytes() == decoded.convert(raster.mode).tobytes()
+
+
+@patch("ai.pipelines.ocr_engine.ocr_image")
+def test_ocr_pdf_pages_keeps_page_order_and_pixmap_size(
+    mock_ocr: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf_path = tmp_path / "three.pdf"
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page(width=612, height=792)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    def _fake_ocr(*, image, page_index, backend):
+        assert backend == "tesseract"
+        return (
+            [
+                PositionedWord(
+                    text=f"p{page_index}",
+                    bbox=BoundingBox(1, 2, 3, 4, 10, 10),
+                    page_index=page_index,
+                    ocr_confidence=0.9,
+                )
+            ],
+            float(image.width),
+            float(image.height),
+        )
+
+    mock_ocr.side_effect = _fake_ocr
+
+    results = ocr_pdf_pages(pdf_path, [2, 0, 1], dpi=72, backend="tesseract")
+
+    assert [words[0].text for words, _, _ in results] == ["p2", "p0", "p1"]
+    assert all(words[0].bbox.page_width == 612.0 for words, _, _ in results)
+    assert all(page_h == 792.0 for _, _, page_h in results)
+
+
+def test_ocr_worker_count_is_serial_for_short_documents(monkeypatch) -> None:
+    from config import settings
+
+    monkeypatch.setattr(settings, "ocr_workers", 8)
+    assert ocr_worker_count(1) == 1
+    assert ocr_worker_count(3) == 1
+    assert ocr_worker_count(5) == 5
+    assert ocr_worker_count(40) == 8
+
+
+@patch("ai.pipelines.ocr_engine.ocr_image")
+def test_ocr_pdf_pages_reads_rendered_pages_instead_of_rasterizing(
+    mock_ocr: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf_path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=200)
+    page.insert_text((40, 80), "SS-3")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    doc = fitz.open(str(pdf_path))
+    pixmap = doc.load_page(0).get_pixmap(dpi=150, alpha=False)
+    png_path = tmp_path / "page-1.png"
+    pixmap.save(str(png_path))
+    doc.close()
+
+    seen: list[bytes] = []
+
+    def _fake_ocr(*, image, page_index, backend):
+        seen.append(image.tobytes())
+        return ([], float(image.width), float(image.height))
+
+    mock_ocr.side_effect = _fake_ocr
+
+    rendered = ocr_pdf_pages(
+        pdf_path, [0], dpi=150, backend="tesseract", rendered_pages={0: png_path}
+    )
+    rasterized = ocr_pdf_pages(pdf_path, [0], dpi=150, backend="tesseract")
+
+    assert rendered == rasterized
+    assert seen[0] == seen[1]
@@ -0,0 +1,131 @@
+"""Tests for the durable ocr_results store read by document_text_extraction."""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai.pipelines.document_text_extraction import (
+    BoundingBox,
+    ExtractedDocument,
+    PositionedWord,
+    SourceFormat,
+    extract_document_via_ocr,
+)
+from ai.pipelines.extracted_document_cache import reset_extracted_document_cache
+from database import SessionLocal
+from models.ocr_result import OcrResult
+from services.ocr_result_store import load_stored_ocr_document, save_ocr_document
+
+
+@pytest.fixture
+def store_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from config import settings
+
+    monkeypatch.setattr(settings, "ocr_result_store_enabled", True)
+
+
+def _word(text: str, page_index: int) -> PositionedWord:
+    return PositionedWord(
+        text=text,
+        bbox=BoundingBox(12.0, 40.0, 80.0, 14.0, 1700.0, 2200.0),
+        page_index=page_index,
+        ocr_confidence=0.91,
+    )
+
+
+def _delete_rows(checksum: str) -> None:
+    with SessionLocal() as db:
+        db.query(OcrResult).filter(OcrResult.checksum == checksum).delete()
+        db.commit()
+
+
+def test_save_and_load_round_trip_respects_max_pages() -> None:
+    checksum = uuid.uuid4().hex
+    document = ExtractedDocument(
+        source_format=SourceFormat.SCANNED_PDF,
+        page_count=3,
+        words=[_word("A-101", 0), _word("Approved", 2)],
+    )
+    try:
+        save_ocr_document(checksum, document, ocr_backend="auto", dpi=200, total_page_count=3)
+        # Re-saving is a no-op rather than a unique-constraint error.
+        save_ocr_document(checksum, document, ocr_backend="auto", dpi=200, total_page_count=3)
+
+        assert load_stored_ocr_document(checksum, ocr_backend="auto", dpi=200) == document
+        first_two = load_stored_ocr_document(checksum, ocr_backend="auto", dpi=200, max_pages=2)
+        assert first_two is not None
+        assert first_two.page_count == 2
+        assert [w.text for w in first_two.words] == ["A-101"]
+        assert load_stored_ocr_document(checksum, ocr_backend="tesseract", dpi=200) is None
+        assert load_stored_ocr_document(checksum, ocr_backend="auto", dpi=300) is None
+    finally:
+        _delete_rows(checksum)
+
+
+def test_partial_store_is_a_miss_for_more_pages() -> None:
+    checksum = uuid.uuid4().hex
+    partial = ExtractedDocument(
+        source_format=SourceFormat.SCANNED_PDF, page_count=1, words=[_word("A", 0)]
+    )
+    try:
+        save_ocr_document(checksum, partial, ocr_backend="auto", dpi=200, total_page_count=3)
+
+        assert load_stored_ocr_document(checksum, ocr_backend="auto", dpi=200) is None
+        assert load_stored_ocr_document(checksum, ocr_backend="auto", dpi=200, max_pages=1) == partial
+    finally:
+        _delete_rows(checksum)
+
+
+def test_extract_document_via_ocr_reads_store_before_ocr(
+    tmp_path: Path, store_enabled: None
+) -> None:
+    from ai.pipelines.extracted_document_cache import file_content_hash
+
+    photo = tmp_path / "photo.png"
+    photo.write_bytes(uuid.uuid4().bytes)
+    checksum = file_content_hash(photo)
+    assert checksum is not None
+    words = [_word("Hydrant", 0)]
+
+    try:
+        with patch(
+            "ai.pipelines.document_text_extraction._ocr_image",
+            return_value=(words, 1700.0, 2200.0),
+        ) as ocr:
+            first = extract_document_via_ocr(photo)
+            # A fresh process (empty memory cache) still skips OCR.
+            reset_extracted_document_cache()
+            second = extract_document_via_ocr(photo)
+
+        assert ocr.call_count == 1
+        assert first == second
+        assert second.words == words
+    finally:
+        _delete_rows(checksum)
+
+
+def test_empty_ocr_pass_is_not_stored(tmp_path: Path, store_enabled: None) -> None:
+    from ai.pipelines.extracted_document_cache import file_content_hash
+
+    photo = tmp_path / "blank.png"
+    photo.write_bytes(uuid.uuid4().bytes)
+    checksum = file_content_hash(photo)
+    assert checksum is not None
+
+    try:
+        with patch(
+            "ai.pipelines.document_text_extraction._ocr_image",
+            return_value=([], 1700.0, 2200.0),
+        ) as ocr:
+            extract_document_via_ocr(photo)
+            reset_extracted_document_cache()
+            extract_document_via_ocr(photo)
+
+        assert ocr.call_count == 2
+        assert load_stored_ocr_document(checksum, ocr_backend="auto", dpi=0) is None
+    finally:
+        _delete_rows(checksum)
@@ -135,7 +135,7 @@ def test_follow_pdf_links_prioritizes_install_drawing_over_submittal(
     submittal_words = " ".join(["submittal"] * 22008)
     install_words = " ".join(["STA", "10+05.00", "manhole"] * 200)
 
-    def fake_fetch(url: str) -> UrlAttachmentFetch:
+    async def fake_fetch(url: str) -> UrlAttachmentFetch:
         if "submittal" in url:
             return UrlAttachmentFetch(
                 text=submittal_words,
@@ -151,7 +151,7 @@ def test_follow_pdf_links_prioritizes_install_drawing_over_submittal(
         )
 
     monkeypatch.setattr(
-        "ai.pipelines.pdf_link_follower.fetch_url_attachment_with_error",
+        "ai.pipelines.pdf_link_follower.fetch_url_attachment_async",
         fake_fetch,
     )
     monkeypatch.setattr(
@@ -168,6 +168,57 @@ def test_follow_pdf_links_prioritizes_install_drawing_over_submittal(
     )
 
 
+def test_follow_pdf_links_fetches_external_links_concurrently(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+
+    from services.safe_url_fetch import UrlAttachmentFetch
+
+    monkeypatch.setattr(
+        "ai.pipelines.pdf_link_follower.settings.pdf_link_follow_max_external",
+        3,
+    )
+    doc = fitz.open()
+    page = doc.new_page()
+    for index in range(4):
+        page.insert_link(
+            {
+                "kind": fitz.LINK_URI,
+                "uri": f"https://storage.procore.com/sheet-{index}.pdf",
+                "from": fitz.Rect(72, 60 + 40 * index, 300, 90 + 40 * index),
+            }
+        )
+    pdf_path = tmp_path / "report.pdf"
+    doc.save(pdf_path)
+    doc.close()
+
+    # Only passes if all three allowed fetches are in flight at the same time.
+    all_started = asyncio.Barrier(3)
+
+    async def fake_fetch(url: str) -> UrlAttachmentFetch:
+        await asyncio.wait_for(all_started.wait(), timeout=5)
+        return UrlAttachmentFetch(
+            text=f"manhole {url}", error=None, filename=url.rsplit("/", 1)[-1], pages=1
+        )
+
+    monkeypatch.setattr(
+        "ai.pipelines.pdf_link_follower.fetch_url_attachment_async",
+        fake_fetch,
+    )
+    monkeypatch.setattr(
+        "ai.pipelines.pdf_link_follower.is_allowed_external_url",
+        lambda _url: True,
+    )
+
+    result = follow_pdf_links(pdf_path)
+
+    assert result.followed_count == 3
+    assert result.skipped_count == 1
+    assert result.errors == []
+
+
 def test_truncate_section_to_fit_preserves_header() -> None:
     section = "\n\n--- Linked content (page 2) ---\n" + ("word " * 500)
     truncated = _truncate_section_to_fit(section, 200)
@@ -0,0 +1,92 @@
+"""Tests for the shared Procore transport: retries, Retry-After pauses and the company token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from config import settings
+from services import procore_http
+from services.procore_http import (
+    ProcoreRateLimiter,
+    procore_http_stats,
+    reset_procore_rate_limiter,
+    send_procore_request,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiter(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(procore_http, "_backoff_seconds", lambda attempt: 0.0)
+    reset_procore_rate_limiter()
+    yield
+    reset_procore_rate_limiter()
+
+
+def _send(handler, method: str = "GET") -> tuple[httpx.Response, list[httpx.Request]]:
+    seen: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return handler(len(seen))
+
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(record)) as client:
+            return await send_procore_request(
+                client, method, "https://api.procore.com/rest/v1.0/rfis", company="42"
+            )
+
+    return asyncio.run(run()), seen
+
+
+def test_rate_limited_get_is_retried_after_retry_after() -> None:
+    response, seen = _send(
+        lambda n: httpx.Response(429, headers={"Retry-After": "0"})
+        if n == 1
+        else httpx.Response(200, json=[], headers={"X-Rate-Limit-Remaining": "3500"})
+    )
+
+    assert response.status_code == 200
+    assert len(seen) == 2
+    company = procore_http_stats()["companies"]["42"]
+    assert company["requests"] == 2
+    assert company["retries"] == 1
+    assert company["rate_limited"] == 1
+    assert company["upstream_remaining"] == 3500
+
+
+def test_retries_stop_at_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "procore_max_retries", 2)
+
+    response, seen = _send(lambda n: httpx.Response(503))
+
+    assert response.status_code == 503
+    assert len(seen) == 3
+
+
+def test_non_idempotent_request_is_not_retried() -> None:
+    response, seen = _send(lambda n: httpx.Response(503), method="POST")
+
+    assert response.status_code == 503
+    assert len(seen) == 1
+
+
+def test_bucket_spaces_requests_beyond_burst() -> None:
+    limiter = ProcoreRateLimiter(per_hour=3600, burst=2)
+
+    assert limiter.reserve("42") == 0.0
+    assert limiter.reserve("42") == 0.0
+    assert limiter.reserve("42") == pytest.approx(1.0, abs=0.05)
+    # Other companies have their own budget.
+    assert limiter.reserve("7") == 0.0
+
+
+def test_retry_after_pauses_the_whole_company() -> None:
+    limiter = ProcoreRateLimiter(per_hour=3600, burst=20)
+    limiter.pause("42", 30)
+
+    assert limiter.reserve("42") == pytest.approx(30.0, abs=0.5)
+    assert limiter.reserve("7") == 0.0
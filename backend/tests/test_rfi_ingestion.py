@@ -0,0 +1,111 @@
+"""Tests for paginated Procore list fetching and incremental, bulk RFI ingestion."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+
+import httpx
+import pytest
+from sqlalchemy.orm import Session
+
+from models.models import EvidenceRecord, Project
+from services import procore_client, procore_http
+from services.procore_client import ProcoreAPIClient
+from services.procore_http import reset_procore_rate_limiter
+from services.rfi_ingestion import ingest_rfis_for_project
+from services.storage import StorageService
+
+
+def _rfi(rfi_id: int, updated_at: str, subject: str | None = None) -> dict[str, Any]:
+    return {
+        "id": rfi_id,
+        "number": rfi_id,
+        "subject": subject or f"RFI {rfi_id}",
+        "status": "open",
+        "question": f"Question {rfi_id}",
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture
+def procore_transport(monkeypatch: pytest.MonkeyPatch):
+    """Route ProcoreAPIClient through a MockTransport; yields the handler slot and request log."""
+    state: dict[str, Any] = {"requests": [], "handler": None}
+
+    def record(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        return state["handler"](request)
+
+    def client_for(base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(record))
+
+    async def token(self: ProcoreAPIClient) -> str:
+        return "token"
+
+    monkeypatch.setattr(procore_client, "procore_http_client", client_for)
+    monkeypatch.setattr(ProcoreAPIClient, "_get_access_token", token)
+    monkeypatch.setattr(ProcoreAPIClient, "_get_company_id", lambda self: "42")
+    monkeypatch.setattr(procore_http, "_backoff_seconds", lambda attempt: 0.0)
+    reset_procore_rate_limiter()
+    yield state
+    reset_procore_rate_limiter()
+
+
+def _paged_rfis(rfis: list[dict[str, Any]], per_page: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        chunk = rfis[(page - 1) * per_page : page * per_page]
+        return httpx.Response(200, json=chunk, headers={"Total": str(len(rfis))})
+
+    return handler
+
+
+def test_get_rfis_reads_every_page(procore_transport, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ProcoreAPIClient, "PAGE_SIZE", 10)
+    rfis = [_rfi(i, "2026-01-01T00:00:00Z") for i in range(1, 36)]
+    procore_transport["handler"] = _paged_rfis(rfis, 10)
+
+    result = asyncio.run(ProcoreAPIClient(cast(Session, None), "u").get_rfis("p1"))
+
+    assert [r["id"] for r in result] == list(range(1, 36))
+    pages = sorted(int(r.url.params["page"]) for r in procore_transport["requests"])
+    assert pages == [1, 2, 3, 4]
+
+
+def test_ingest_rfis_is_incremental_and_skips_unchanged(
+    procore_transport, db_session: Session, project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(ProcoreAPIClient, "PAGE_SIZE", 2)
+    rfis = [
+        _rfi(1, "2026-01-01T00:00:00Z"),
+        _rfi(2, "2026-01-02T00:00:00Z"),
+        _rfi(3, "2026-01-03T00:00:00Z"),
+    ]
+    procore_transport["handler"] = _paged_rfis(rfis, 2)
+
+    first = asyncio.run(ingest_rfis_for_project(db_session, user_id="u", project=project))
+
+    assert sorted(cast(str, r.source_id) for r in first) == ["1", "2", "3"]
+    storage = StorageService(db_session)
+    cursor = storage.get_procore_sync_cursor(cast(int, project.id), "rfis")
+    assert cursor is not None and cursor.isoformat().startswith("2026-01-03T00:00:00")
+
+    # Procore returns the cursor-boundary RFI again plus one edited RFI.
+    procore_transport["requests"].clear()
+    procore_transport["handler"] = _paged_rfis(
+        [rfis[2], _rfi(2, "2026-01-04T00:00:00Z", subject="RFI 2 revised")], 2
+    )
+
+    second = asyncio.run(ingest_rfis_for_project(db_session, user_id="u", project=project))
+
+    assert [cast(str, r.source_id) for r in second] == ["2"]
+    assert second[0].title == "RFI 2 revised"
+    (request,) = procore_transport["requests"]
+    assert request.url.params["filters[updated_at]"].startswith("2026-01-03T00:00:00Z...")
+    assert (
+        db_session.query(EvidenceRecord)
+        .filter(EvidenceRecord.project_id == project.id, EvidenceRecord.type == "rfi")
+        .count()
+        == 3
+    )
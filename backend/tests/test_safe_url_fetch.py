@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import uuid
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
+
 from ai.pipelines.document_text_extraction import ExtractedDocument, PositionedWord, SourceFormat
+from database import SessionLocal
+from models.linked_url_fetch import LinkedUrlFetch
 from services.safe_url_fetch import (
+    fetch_url_attachment_async,
     fetch_url_text_with_error,
     is_allowed_external_url,
     max_response_bytes,
+    run_link_fetch,
     url_fetch_blocked_reason,
 )
 
@@ -148,3 +156,52 @@ def test_fetch_image_uses_ocr() -> None:
     assert error is None
     assert text == "NPC-5"
     ocr_mock.assert_called_once()
+
+
+def test_repeated_link_is_revalidated_without_download_or_ocr(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from config import settings
+
+    monkeypatch.setattr(settings, "pdf_link_follow_cache_enabled", True)
+    url = f"https://storage.procore.com/files/{uuid.uuid4().hex}.pdf"
+    etag = '"v1"'
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/pdf", "etag": etag},
+            content=b"%PDF-1.4 fake",
+        )
+
+    fake_doc = ExtractedDocument(
+        source_format=SourceFormat.SCANNED_PDF,
+        page_count=1,
+        words=[PositionedWord(text="MH-4", bbox=MagicMock(), page_index=0)],
+    )
+
+    async def fetch_twice() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await fetch_url_attachment_async(url, client=client)
+            second = await fetch_url_attachment_async(url, client=client)
+        return [first.text, second.text]
+
+    try:
+        with patch(
+            "services.safe_url_fetch.extract_document_via_ocr",
+            return_value=fake_doc,
+        ) as ocr_mock:
+            texts = run_link_fetch(fetch_twice())
+    finally:
+        with SessionLocal() as db:
+            db.query(LinkedUrlFetch).filter(LinkedUrlFetch.url == url).delete()
+            db.commit()
+
+    assert texts == ["MH-4", "MH-4"]
+    ocr_mock.assert_called_once()
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == etag
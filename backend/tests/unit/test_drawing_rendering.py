@@ -15,3 +15,76 @@ def test_render_pdf_creates_renditions(db_session, sample_pdf_drawing):
     assert sample_pdf_drawing.processing_status == "ready"
     assert sample_pdf_drawing.page_count >= 1
     assert len(sample_pdf_drawing.renditions) >= 1
+
+
+def _write_multi_page_pdf(drawing, page_count: int) -> None:
+    import fitz
+
+    from services.storage import open_storage_path
+
+    doc = fitz.open()
+    for index in range(page_count):
+        page = doc.new_page(width=200, height=150)
+        page.insert_text((20, 40), f"Sheet A-{index + 1}")
+    open_storage_path(drawing.storage_key).write_bytes(doc.tobytes())
+    doc.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_multi_page_pdf_upserts_every_page(
+    db_session, sample_pdf_drawing, monkeypatch, workers
+):
+    from config import settings
+    from services import drawing_rendering
+
+    _write_multi_page_pdf(sample_pdf_drawing, 5)
+    monkeypatch.setattr(settings, "drawing_render_workers", workers)
+    monkeypatch.setattr(drawing_rendering, "RENDER_UPSERT_CHUNK_SIZE", 2)
+
+    DrawingRenderingService(db_session).render_drawing_pages(sample_pdf_drawing.id)
+
+    db_session.refresh(sample_pdf_drawing)
+    assert sample_pdf_drawing.processing_status == "ready"
+    assert sample_pdf_drawing.page_count == 5
+    assert sorted(r.page_number for r in sample_pdf_drawing.renditions) == [1, 2, 3, 4, 5]
+    assert all(r.render_status == "ready" and r.width_px for r in sample_pdf_drawing.renditions)
+
+
+def test_bulk_upsert_drawing_renditions_replaces_existing_rows(db_session, sample_pdf_drawing):
+    from services.storage import StorageService
+
+    storage = StorageService(db_session)
+    row = {
+        "page_number": 1,
+        "image_storage_key": "renders/old.png",
+        "mime_type": "image/png",
+        "width_px": 10,
+        "height_px": 10,
+        "file_size": 1,
+        "render_status": "ready",
+    }
+    storage.bulk_upsert_drawing_renditions(sample_pdf_drawing.id, [row])
+    storage.bulk_upsert_drawing_renditions(
+        sample_pdf_drawing.id,
+        [{**row, "image_storage_key": "renders/new.png"}, {**row, "page_number": 2}],
+    )
+
+    db_session.refresh(sample_pdf_drawing)
+    keys = {r.page_number: r.image_storage_key for r in sample_pdf_drawing.renditions}
+    assert keys == {1: "renders/new.png", 2: "renders/old.png"}
+    assert storage.count_ready_drawing_renditions(sample_pdf_drawing.id) == 2
+
+
+def test_deep_zoom_pyramid_geometry_halves_each_level():
+    from services.drawing_tiles import DeepZoomPyramid
+
+    pyramid = DeepZoomPyramid(width=1000, height=600, tile_size=256, overlap=1)
+
+    assert pyramid.max_level == 10
+    assert pyramid.level_dimensions(10) == (1000, 600)
+    assert pyramid.level_dimensions(9) == (500, 300)
+    assert pyramid.level_dimensions(0) == (1, 1)
+    assert pyramid.tile_grid(10) == (4, 3)
+    assert pyramid.tile_box(10, 0, 0) == (0, 0, 257, 257)
+    assert pyramid.tile_box(10, 3, 2) == (767, 511, 1000, 600)
+    assert not pyramid.has_tile(10, 4, 0)
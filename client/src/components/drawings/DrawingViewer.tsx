@@ -166,6 +166,10 @@ export default function DrawingViewer({
   }
 
   const status = (drawing.processingStatus ?? "pending").toLowerCase();
+  const isRendering = status === "pending" || status === "processing";
+  // fileUrl switches to the page image once the active page's rendition exists,
+  // so page 1 can be shown while later pages are still rendering.
+  const activePageRendered = drawing.fileUrl !== drawing.sourceFileUrl;
 
   if (status === "failed") {
     return (
@@ -186,7 +190,7 @@ export default function DrawingViewer({
     );
   }
 
-  if (status === "pending" || status === "processing") {
+  if (isRendering && !activePageRendered) {
     return (
       <div className="flex min-h-[70vh] w-full flex-1 flex-col overflow-hidden rounded-xl border bg-white">
         <div className="border-b px-5 py-4">
@@ -225,7 +229,12 @@ export default function DrawingViewer({
         <div className="flex items-start justify-between gap-4">
           <div>
             <h2 className="text-lg font-semibold text-slate-900">{drawing.name}</h2>
-            <p className="text-sm text-slate-500">Drawing #{drawing.id}</p>
+            <p className="text-sm text-slate-500">
+              Drawing #{drawing.id}
+              {isRendering
+                ? ` • Rendering ${drawing.renderedPageCount ?? 0} of ${drawing.pageCount} pages…`
+                : null}
+            </p>
           </div>
 
           <div className="text-right text-xs text-slate-500">
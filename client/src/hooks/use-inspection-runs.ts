@@ -84,6 +84,8 @@ export function useInspectionRuns(
 
 /**
  * Legacy LLM inspection mapping pipeline (POST /inspections/runs with evidence_id).
+ * The run comes back `queued`; an `inspection_mapping` job moves it to complete/failed,
+ * so callers poll the runs list (see `pollWhileInspectionRunsActive`).
  */
 export function useRunInspection(projectId: string | null) {
   const queryClient = useQueryClient();
@@ -1,5 +1,6 @@
 import type {
   DrawingIndexStatusResponse,
+  DrawingReindexMode,
   DrawingReindexResponse,
 } from "@/lib/drawing-index/format_index_summary";
 
@@ -45,14 +46,16 @@ export async function fetchDrawingIndexStatus(
   );
 }
 
+/** ``incremental`` re-indexes only pages whose content changed since the last index. */
 export async function reindexDrawing(
   projectId: number | string,
   drawingId: number | string,
+  mode: DrawingReindexMode = "full",
 ): Promise<DrawingReindexResponse> {
   const pid = coerceProjectIdForApi(projectId);
   const did = coerceDrawingIdForApi(drawingId);
   return requestJson<DrawingReindexResponse>(
-    `/api/projects/${pid}/drawings/${did}/reindex`,
+    `/api/projects/${pid}/drawings/${did}/reindex?mode=${mode}`,
     { method: "POST" },
   );
 }
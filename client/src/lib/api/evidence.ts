@@ -1,5 +1,10 @@
 import type { QueryClient } from "@tanstack/react-query";
-import type { EvidenceListResponse, EvidenceRecordResponse } from "@shared/schema";
+import type {
+  EvidenceBatchUploadError,
+  EvidenceBatchUploadResponse,
+  EvidenceListResponse,
+  EvidenceRecordResponse,
+} from "@shared/schema";
 
 import { readApiError, requestJson, resolveFetchUrl } from "@/lib/api/http";
 
@@ -93,3 +98,48 @@ export async function uploadEvidence(
 
   return response.json() as Promise<EvidenceRecordResponse>;
 }
+
+/** One line per rejected batch file, e.g. `"a.pdf: Unsupported file type"`. */
+export function formatEvidenceBatchUploadErrors(errors: EvidenceBatchUploadError[]): string {
+  return errors.map((error) => `${error.filename}: ${error.detail}`).join("\n");
+}
+
+/**
+ * POST /api/projects/{project_id}/evidence/batch — several files in one request.
+ * Inspection docs come back with `extraction_status: "pending"`; extraction runs in jobs.
+ * Files the server rejected are listed in `errors` (show them alongside `items`); when
+ * no file was stored at all, throws with those errors as the message.
+ */
+export async function uploadEvidenceBatch(
+  projectId: number,
+  files: File[],
+  options: Pick<UploadEvidenceOptions, "type" | "trade" | "specSection"> = {}
+): Promise<EvidenceBatchUploadResponse> {
+  const pid = coerceProjectIdForApi(projectId);
+  const formData = new FormData();
+  for (const file of files) {
+    formData.append("files", file);
+  }
+  formData.append("type", options.type ?? "inspection_doc");
+  if (options.trade?.trim()) formData.append("trade", options.trade.trim());
+  if (options.specSection?.trim()) {
+    formData.append("spec_section", options.specSection.trim());
+  }
+
+  const response = await fetch(resolveFetchUrl(`/api/projects/${pid}/evidence/batch`), {
+    method: "POST",
+    credentials: "include",
+    body: formData,
+  });
+
+  if (!response.ok) {
+    await readApiError(response);
+  }
+
+  const data = (await response.json()) as EvidenceBatchUploadResponse;
+  const result = { ...data, errors: data.errors ?? [] };
+  if (result.items.length === 0 && result.errors.length > 0) {
+    throw new Error(formatEvidenceBatchUploadErrors(result.errors));
+  }
+  return result;
+}
@@ -16,9 +16,12 @@ export interface DrawingIndexStatusResponse {
   indexed_at: string | null;
 }
 
+export type DrawingReindexMode = "full" | "incremental";
+
 export interface DrawingReindexResponse {
   job_id: number;
   index_status: string;
+  mode: DrawingReindexMode;
 }
 
 /** Human-readable summary for the Objects drawing header after indexing completes. */
@@ -0,0 +1,57 @@
+import { afterEach, describe, expect, it, vi } from "vitest";
+
+import { uploadEvidenceBatch } from "@/lib/api/evidence";
+
+function stubBatchResponse(body: unknown) {
+  vi.stubGlobal(
+    "fetch",
+    vi.fn().mockResolvedValue({
+      ok: true,
+      json: async () => body,
+    }),
+  );
+}
+
+const storedItem = {
+  id: 7,
+  type: "inspection_doc",
+  title: "a.pdf",
+  extraction_status: "pending",
+  created_at: "2026-01-01T00:00:00Z",
+};
+
+describe("uploadEvidenceBatch", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it("returns rejected files alongside the stored ones", async () => {
+    stubBatchResponse({
+      items: [storedItem],
+      total: 1,
+      errors: [{ filename: "b.exe", detail: "Unsupported file type" }],
+    });
+
+    const result = await uploadEvidenceBatch(2, [new File(["x"], "a.pdf")]);
+
+    expect(result.items).toHaveLength(1);
+    expect(result.errors).toEqual([
+      { filename: "b.exe", detail: "Unsupported file type" },
+    ]);
+  });
+
+  it("throws with every file's error when nothing was stored", async () => {
+    stubBatchResponse({
+      items: [],
+      total: 0,
+      errors: [
+        { filename: "a.exe", detail: "Unsupported file type" },
+        { filename: "b.pdf", detail: "File is empty" },
+      ],
+    });
+
+    await expect(uploadEvidenceBatch(2, [new File(["x"], "a.exe")])).rejects.toThrow(
+      "a.exe: Unsupported file type\nb.pdf: File is empty",
+    );
+  });
+});
@@ -15,7 +15,15 @@ export type DrawingWorkspaceDrawing = {
   fileUrl: string;
   sourceFileUrl: string;
   pageCount: number;
+  /** Pages with a ready rendition; grows while processingStatus is "processing". */
+  renderedPageCount?: number | null;
   activePage: number;
+  /**
+   * Deep Zoom (.dzi) descriptor; tiles live at `.../pages/:n/tiles/:z/:x/:y`.
+   * Carries `?v=<pyramid digest>` once the pyramid has one; append the same query to
+   * tile requests so they are served as immutable.
+   */
+  tileSourceUrl?: string | null;
   widthPx?: number | null;
   heightPx?: number | null;
   processingStatus: string;
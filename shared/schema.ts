@@ -111,9 +111,24 @@ export interface EvidenceRecordResponse {
   title: string;
   file_url?: string | null;
   content_type?: string | null;
+  /** Queued evidence_extract job state: pending | processing | ready | failed. */
+  extraction_status?: "pending" | "processing" | "ready" | "failed" | null;
+  extraction_error?: string | null;
   created_at: string;
 }
 
+/** A batch file the server could not store; the other files in the batch were stored. */
+export interface EvidenceBatchUploadError {
+  filename: string;
+  detail: string;
+}
+
+export interface EvidenceBatchUploadResponse {
+  items: EvidenceRecordResponse[];
+  total: number;
+  errors: EvidenceBatchUploadError[];
+}
+
 export interface EvidenceListResponse {
   items: EvidenceRecordResponse[];
   total: number;